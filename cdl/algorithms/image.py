@@ -69,6 +69,101 @@ def normalize(
     raise ValueError(f"Unsupported parameter {parameter}")
 
 
+# MARK: LUT range ----------------------------------------------------------------------
+
+#: Default maximum number of samples used to estimate the LUT range of an image
+LUT_RANGE_MAX_SAMPLES = 2**20
+
+
+def sample_data(
+    data: np.ndarray, max_samples: int = LUT_RANGE_MAX_SAMPLES, seed: int = 0
+) -> np.ndarray:
+    """Return a flat random sample of array `data` (or a flat copy of the whole
+    array if it has less than `max_samples` elements).
+
+    Samples are drawn with replacement (uniformly over the whole array) with a
+    fixed random seed, so that the result is reproducible for the same array.
+    Input array is never copied as a whole: only the sampled elements are read.
+
+    Args:
+        data: Input data
+        max_samples: Maximum number of samples
+        seed: Random generator seed (default: 0)
+
+    Returns:
+        1D array of samples
+    """
+    if data.size <= max_samples:
+        return np.array(data, copy=True).ravel()
+    rng = np.random.default_rng(seed)
+    indexes = np.sort(rng.integers(0, data.size, max_samples))
+    return data[np.unravel_index(indexes, data.shape)]
+
+
+def get_lut_range_rank_error(nsamples: int, confidence: float = 0.99) -> float:
+    """Return the maximum rank error of a percentile estimated on random samples
+
+    The bound is given by the Dvoretzky-Kiefer-Wolfowitz inequality: with a
+    probability of at least `confidence`, the empirical cumulative distribution
+    function of `nsamples` random samples differs from the true one by at most
+    the returned value, which means that the percentile estimated on the samples
+    is the true percentile of rank p ± error (e.g. with 2**20 samples and a 99%
+    confidence level, the error is 0.16%).
+
+    Args:
+        nsamples: Number of samples
+        confidence: Confidence level (default: 0.99)
+
+    Returns:
+        Rank error (between 0.0 and 1.0)
+    """
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("Confidence level must be between 0. and 1. (excluded)")
+    return float(np.sqrt(np.log(2.0 / (1.0 - confidence)) / (2.0 * nsamples)))
+
+
+def get_lut_range(data: np.ndarray, percent: float = 0.0) -> tuple[float, float]:
+    """Return exact LUT range of image data, ignoring NaNs and eventually
+    eliminating outliers
+
+    Args:
+        data: Input data
+        percent: Percentage of the histogram to eliminate (half of it on each side
+         of the histogram, like the `eliminate_outliers` option of PlotPy images)
+
+    Returns:
+        LUT range (min, max)
+    """
+    if percent <= 0.0:
+        return float(np.nanmin(data)), float(np.nanmax(data))
+    vmin, vmax = np.nanpercentile(data, [0.5 * percent, 100.0 - 0.5 * percent])
+    return float(vmin), float(vmax)
+
+
+def estimate_lut_range(
+    data: np.ndarray, percent: float = 0.0, max_samples: int = LUT_RANGE_MAX_SAMPLES
+) -> tuple[float, float]:
+    """Return LUT range of image data, estimated on a random sample of the data
+
+    If data has less than `max_samples` elements, the exact LUT range is returned.
+    Otherwise, the rank error on the returned percentiles is bounded as described
+    in :py:func:`get_lut_range_rank_error` (note that, when no outlier is
+    eliminated, the returned range is always included in the exact range).
+
+    Args:
+        data: Input data
+        percent: Percentage of the histogram to eliminate (half of it on each side
+         of the histogram, like the `eliminate_outliers` option of PlotPy images)
+        max_samples: Maximum number of samples
+
+    Returns:
+        LUT range (min, max)
+    """
+    if data.size <= max_samples:
+        return get_lut_range(data, percent)
+    return get_lut_range(sample_data(data, max_samples), percent)
+
+
 # MARK: Fourier analysis ---------------------------------------------------------------
 
 
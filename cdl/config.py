@@ -140,6 +140,41 @@ class IOSection(conf.Section, metaclass=conf.SectionMeta):
     # - True: add HDF5 file name in signal or image title
     # - False: do not add HDF5 file name in signal or image title
     h5_fname_in_title = conf.Option()
+    # Compression of arrays when saving HDF5 workspace files:
+    # - "none": no compression
+    # - "gzip": fast gzip compression (level 1, with byte shuffle)
+    # - "lzf": LZF compression (very fast, lower compression ratio)
+    h5_compression = conf.Option()
+    # Incremental save of HDF5 workspace files: when saving to the last saved or
+    # opened file, only new or modified objects are written
+    h5_incremental_save = conf.Option()
+    # Lazy open of HDF5 workspace files: signal and image data arrays are read only
+    # when objects are displayed or processed
+    h5_lazy_open = conf.Option()
+    # Lazy open mode: load deferred data arrays in background
+    h5_lazy_prefetch = conf.Option()
+    # Maximum number of frames kept in image streams created from HDF5 image stacks
+    # being written (SWMR mode): the oldest frames are dropped beyond this number
+    h5_stack_max_frames = conf.Option()
+
+    # Export file formats options
+    # ---------------------------
+    # Compression of TIFF files:
+    # - "none": no compression
+    # - "zlib": Deflate compression (lossless)
+    # - "lzma": LZMA compression (lossless, slower but better compression ratio)
+    tiff_compression = conf.Option()
+    # Compression of MAT-Files (True: compressed, False: uncompressed)
+    mat_compression = conf.Option()
+
+    # Multi-frame image files (e.g. Andor SIF) options
+    # ------------------------------------------------
+    # Lazy import of memory-mapped frames: frame data is read only when objects are
+    # displayed or processed
+    lazy_frame_import = conf.Option()
+    # Frame range selection dialog is shown when importing a file containing more
+    # than this number of frames (0: never show the dialog)
+    frame_range_min_count = conf.Option()
 
     # ImageIO supported file formats:
     imageio_formats = conf.Option()
@@ -297,6 +332,15 @@ def initialize():
     # IO section
     Conf.io.h5_fullpath_in_title.get(False)
     Conf.io.h5_fname_in_title.get(True)
+    Conf.io.h5_compression.get("none")
+    Conf.io.h5_incremental_save.get(True)
+    Conf.io.h5_lazy_open.get(False)
+    Conf.io.h5_lazy_prefetch.get(False)
+    Conf.io.h5_stack_max_frames.get(1000)
+    Conf.io.tiff_compression.get("none")
+    Conf.io.mat_compression.get(False)
+    Conf.io.lazy_frame_import.get(True)
+    Conf.io.frame_range_min_count.get(100)
     Conf.io.imageio_formats.get(())
     # Proc section
     Conf.proc.fft_shift_enabled.get(True)
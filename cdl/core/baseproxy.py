@@ -41,6 +41,28 @@ if TYPE_CHECKING:
     from cdl.core.remote import ServerProxy
 
 
+#: Operations supported by :py:meth:`AbstractCDLControl.run_batch`: control methods
+#: (called with the operation arguments), and "get_results" (results of an object,
+#: see :py:meth:`AbstractCDLControl.run_batch`)
+BATCH_OPERATIONS = (
+    "set_current_panel",
+    "select_objects",
+    "select_groups",
+    "delete_metadata",
+    "calc",
+    "add_signal",
+    "add_image",
+    "append_signal_data",
+    "append_image_frame",
+    "add_label_with_title",
+    "get_current_panel",
+    "get_sel_object_uuids",
+    "get_object_uuids",
+    "get_object_titles",
+    "get_results",
+)
+
+
 class AbstractCDLControl(abc.ABC):
     """Abstract base class for controlling DataLab (main window or remote server)"""
 
@@ -242,6 +264,36 @@ class AbstractCDLControl(abc.ABC):
             ValueError: Invalid ydata dtype
         """
 
+    @abc.abstractmethod
+    def append_signal_data(
+        self,
+        uuid: str,
+        xdata: np.ndarray,
+        ydata: np.ndarray,
+        capacity: int | None = None,
+    ) -> bool:
+        """Append data points to signal (live signal).
+
+        The signal is switched to live mode: its data is stored in a preallocated
+        ring buffer of ``capacity`` points (oldest points are dropped when the buffer
+        is full), and its plot item is updated without being rebuilt.
+
+        Args:
+            uuid (str): Signal uuid
+            xdata (numpy.ndarray): X data to append
+            ydata (numpy.ndarray): Y data to append
+            capacity (int | None): Maximum number of points kept in signal.
+             Defaults to None (current capacity, or 1,000,000 points when switching
+             to live mode).
+
+        Returns:
+            bool: True if data was appended successfully, False otherwise
+
+        Raises:
+            KeyError: if signal not found
+            ValueError: Invalid data
+        """
+
     @abc.abstractmethod
     def add_image(
         self,
@@ -273,6 +325,39 @@ class AbstractCDLControl(abc.ABC):
             ValueError: Invalid data dtype
         """
 
+    @abc.abstractmethod
+    def append_image_frame(
+        self,
+        uuid: str,
+        data: np.ndarray,
+        depth: int | None = None,
+        stats: bool | None = None,
+    ) -> bool:
+        """Append frame to image stream: image data is replaced by the new frame.
+
+        The image is switched to stream mode: frames are stored in a preallocated
+        ring buffer of ``depth`` frames (oldest frames are dropped when the buffer is
+        full), and its plot item is updated without being rebuilt, at a limited
+        refresh rate (frames are not all shown if they are appended faster).
+
+        Args:
+            uuid (str): Image uuid
+            data (numpy.ndarray): Frame data
+            depth (int | None): Number of frames kept in image stream buffer.
+             Defaults to None (current depth, or 10 frames when switching to
+             stream mode).
+            stats (bool | None): If True, maintain running mean and variance
+             images of the frames in buffer. Defaults to None (current setting,
+             or disabled when switching to stream mode).
+
+        Returns:
+            bool: True if frame was appended successfully, False otherwise
+
+        Raises:
+            KeyError: if image not found
+            ValueError: Invalid data
+        """
+
     @abc.abstractmethod
     def get_sel_object_uuids(self, include_groups: bool = False) -> list[str]:
         """Return selected objects uuids.
@@ -466,6 +551,41 @@ class AbstractCDLControl(abc.ABC):
             guidata.dataset.DataSet: Compute function result
         """
 
+    @abc.abstractmethod
+    def run_batch(
+        self,
+        operations: list[tuple],
+        objects: list[int | str] | None = None,
+        panel: str | None = None,
+    ) -> list[list]:
+        """Run a batch of operations at once (e.g. a processing chain), so that a
+        remote client drives DataLab with a single request.
+
+        Each operation is a tuple ``(name, *args)``, where ``name`` is one of
+        :py:data:`BATCH_OPERATIONS`: a control method called with ``args`` (e.g.
+        ``("calc", "compute_fft")`` or ``("select_objects", [uuid])``), or
+        ``"get_results"`` which returns the results of an object (optional
+        arguments: object number, id or title and panel name, as for
+        :py:meth:`get_object`), as a list of ``[title, array]`` pairs. An
+        operation failing does not interrupt the batch, but the next operations
+        of the same chain are skipped.
+
+        Args:
+            operations: Operations
+            objects: If not None, operations are a processing chain applied to
+             each of these objects (object numbers, ids or titles, ids being
+             preferred as numbers change when objects are added): each object is
+             selected before running the chain. Defaults to None.
+            panel: Panel of `objects` (valid values: "signal", "image"). If None,
+             current panel is used. Defaults to None.
+
+        Returns:
+            Per-operation status: ``[True, returned value]`` if operation
+            succeeded, ``[False, error message]`` if it failed, or
+            ``[False, None]`` if it was skipped. If `objects` is not None, one list
+            of statuses is returned per object.
+        """
+
     def __getattr__(self, name: str) -> Callable:
         """Return compute function ``name`` in current panel's processor.
 
@@ -0,0 +1,392 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+DataLab remote data channel
+---------------------------
+
+This module provides the binary data channel of DataLab remote control: numerical
+arrays are transferred through a local TCP socket (on the loopback interface),
+using a framed binary protocol, while XML-RPC only carries control messages
+(see :py:mod:`cdl.core.remote`).
+
+Each frame is made of:
+
+- A magic string (:py:data:`DATA_MAGIC`), followed by the JSON header size
+  (little-endian 32-bit unsigned integer)
+- The JSON header: request or response, arrays descriptions (data type and
+  shape) and payload size (frames whose header or payload size exceeds
+  :py:data:`DATA_CHANNEL_MAX_HEADER_SIZE` or the maximum payload size of the
+  server, :py:data:`DATA_CHANNEL_MAX_SIZE` by default, are rejected)
+- The payload: raw C-ordered arrays, in the order of their descriptions
+
+Arrays are sent from their own memory buffer and received directly in the memory
+buffer of the resulting arrays: data is not copied (nor parsed), so that transfer
+rate is limited by memory (and loopback interface) bandwidth.
+
+Arrays uploaded by the client (``put`` request) are stored on the server side until
+they are retrieved by the XML-RPC method to which their tokens are passed (e.g.
+``add_image``). Conversely, arrays published by the server (e.g. by ``get_object``)
+are downloaded by the client with a ``get`` request. Arrays which are not retrieved
+are discarded after :py:data:`DATA_CHANNEL_TIMEOUT` seconds.
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from __future__ import annotations
+
+import json
+import math
+import socket
+import socketserver
+import struct
+import threading
+import time
+import uuid
+from typing import Any
+
+import numpy as np
+
+#: Magic string at the beginning of data channel frames
+DATA_MAGIC = b"\x93DLDATA"
+
+#: Arrays which are not retrieved after this duration (in seconds) are discarded
+DATA_CHANNEL_TIMEOUT = 300.0
+
+#: Arrays smaller than this size (in bytes) are sent through XML-RPC: for small
+#: arrays, the data channel round trip costs more than XML-RPC encoding
+DATA_CHANNEL_MIN_SIZE = 2**16
+
+#: Maximum size (in bytes) of the JSON header of data channel frames
+DATA_CHANNEL_MAX_HEADER_SIZE = 2**20
+
+#: Default maximum payload size (in bytes) of data channel frames: the payload size
+#: is checked before allocating memory for the received arrays (see
+#: :py:class:`DataChannelServer`)
+DATA_CHANNEL_MAX_SIZE = 2**31
+
+
+def recv_exactly(sock: socket.socket, buffer: memoryview) -> None:
+    """Receive data from socket until buffer is full
+
+    Args:
+        sock: Socket
+        buffer: Buffer to fill (unsigned bytes)
+
+    Raises:
+        ConnectionError: if connection is closed before buffer is full
+    """
+    pos = 0
+    while pos < len(buffer):
+        size = sock.recv_into(buffer[pos:])
+        if size == 0:
+            raise ConnectionError("Data channel connection closed")
+        pos += size
+
+
+def discard_exactly(sock: socket.socket, size: int) -> None:
+    """Receive data from socket and discard it
+
+    Args:
+        sock: Socket
+        size: Number of bytes to discard
+
+    Raises:
+        ConnectionError: if connection is closed before all data is received
+    """
+    buffer = memoryview(bytearray(min(size, 2**20)))
+    while size > 0:
+        chunk = buffer[: min(size, len(buffer))]
+        recv_exactly(sock, chunk)
+        size -= len(chunk)
+
+
+def send_frame(
+    sock: socket.socket, header: dict[str, Any], arrays: list[np.ndarray] = ()
+) -> None:
+    """Send frame: header and arrays (arrays are sent without copying data, unless
+    they are not C-contiguous)
+
+    Args:
+        sock: Socket
+        header: Frame header (JSON-serializable dictionary)
+        arrays: Numerical arrays
+
+    Raises:
+        ValueError: if an array is not numerical, or if arrays are too large (see
+         :py:data:`DATA_CHANNEL_MAX_SIZE`)
+    """
+    arrays = [np.ascontiguousarray(array) for array in arrays]
+    for array in arrays:
+        if array.dtype.kind not in "biufc":
+            raise ValueError(f"Unsupported array data type: {array.dtype}")
+    size = sum(array.nbytes for array in arrays)
+    if size > DATA_CHANNEL_MAX_SIZE:
+        raise ValueError(f"Data channel frame is too large: {size} bytes")
+    header = dict(
+        header, arrays=[[arr.dtype.str, arr.shape] for arr in arrays], size=size
+    )
+    text = json.dumps(header).encode("utf-8")
+    sock.sendall(DATA_MAGIC + struct.pack("<I", len(text)) + text)
+    for array in arrays:
+        if array.nbytes:
+            sock.sendall(memoryview(array.reshape(-1).view(np.uint8)))
+
+
+def recv_frame(
+    sock: socket.socket, max_size: int = DATA_CHANNEL_MAX_SIZE
+) -> tuple[dict[str, Any], list[np.ndarray]]:
+    """Receive frame (arrays are received directly in their memory buffer)
+
+    Arrays descriptions are checked against the payload size before allocating
+    memory for arrays.
+
+    Args:
+        sock: Socket
+        max_size: Maximum payload size (in bytes)
+
+    Returns:
+        Tuple (header, arrays)
+
+    Raises:
+        ConnectionError: if connection is closed or if data is not a valid frame
+        MemoryError: if there is not enough memory to receive arrays (the payload
+         is discarded: the connection may still be used)
+    """
+    prefix = bytearray(len(DATA_MAGIC) + 4)
+    recv_exactly(sock, memoryview(prefix))
+    if not prefix.startswith(DATA_MAGIC):
+        raise ConnectionError("Invalid data channel frame")
+    (size,) = struct.unpack("<I", prefix[len(DATA_MAGIC) :])
+    if size > DATA_CHANNEL_MAX_HEADER_SIZE:
+        raise ConnectionError("Invalid data channel frame header")
+    text = bytearray(size)
+    recv_exactly(sock, memoryview(text))
+    try:
+        header = json.loads(text.decode("utf-8"))
+        descs = [
+            (np.dtype(dtype), tuple(int(length) for length in shape))
+            for dtype, shape in header.pop("arrays")
+        ]
+        size = int(header.pop("size"))
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise ConnectionError("Invalid data channel frame header") from exc
+    nbytes = 0
+    for dtype, shape in descs:
+        if dtype.kind not in "biufc" or any(length < 0 for length in shape):
+            raise ConnectionError("Invalid data channel frame header")
+        nbytes += dtype.itemsize * math.prod(shape)
+    if nbytes != size or size > max_size:
+        raise ConnectionError("Invalid data channel frame size")
+    try:
+        arrays = [np.empty(shape, dtype) for dtype, shape in descs]
+    except MemoryError:
+        discard_exactly(sock, size)
+        raise
+    for array in arrays:
+        if array.nbytes:
+            recv_exactly(sock, memoryview(array.reshape(-1).view(np.uint8)))
+    return header, arrays
+
+
+class DataChannelHandler(socketserver.BaseRequestHandler):
+    """Data channel request handler: processes the frames received on a client
+    connection, until the connection is closed"""
+
+    server: DataChannelServer
+
+    def handle(self) -> None:
+        """Handle client connection"""
+        sock: socket.socket = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            try:
+                header, arrays = recv_frame(sock, self.server.max_size)
+            except MemoryError:
+                send_frame(sock, {"error": "Not enough memory to receive arrays"})
+                continue
+            except (ConnectionError, OSError):
+                return
+            request = header.get("request")
+            try:
+                if request == "put":
+                    send_frame(sock, {"tokens": self.server.put_arrays(arrays)})
+                elif request == "get":
+                    tokens = header.get("tokens")
+                    if not isinstance(tokens, list) or not all(
+                        isinstance(token, str) for token in tokens
+                    ):
+                        raise ValueError("Invalid data channel tokens")
+                    send_frame(sock, {}, self.server.pop_arrays(tokens))
+                else:
+                    raise ValueError(f"Unknown data channel request: {request}")
+            except (KeyError, TypeError, ValueError) as exc:
+                send_frame(sock, {"error": str(exc)})
+
+
+class DataChannelServer(socketserver.ThreadingTCPServer):
+    """Data channel server, listening on the loopback interface (port is
+    automatically attributed, see :py:attr:`port`)
+
+    Arrays are stored (by token) until retrieved with :py:meth:`pop_array` or
+    :py:meth:`pop_arrays`.
+
+    Args:
+        max_size: Maximum payload size (in bytes) of received frames: larger
+         frames are rejected before allocating memory (the connection is closed)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, max_size: int = DATA_CHANNEL_MAX_SIZE) -> None:
+        super().__init__(("127.0.0.1", 0), DataChannelHandler)
+        self.max_size = max_size
+        self.__lock = threading.Lock()
+        self.__arrays: dict[str, tuple[np.ndarray, float]] = {}
+
+    @property
+    def port(self) -> int:
+        """Server port number"""
+        return self.server_address[1]
+
+    def __discard_expired_arrays(self, now: float) -> None:
+        """Discard arrays which have not been retrieved after
+        :py:data:`DATA_CHANNEL_TIMEOUT` seconds (lock must be held by caller)
+
+        Args:
+            now: Current time (see :py:func:`time.monotonic`)
+        """
+        for token, (_array, stamp) in list(self.__arrays.items()):
+            if now - stamp > DATA_CHANNEL_TIMEOUT:
+                self.__arrays.pop(token)
+
+    def put_arrays(self, arrays: list[np.ndarray]) -> list[str]:
+        """Store arrays until retrieved (arrays are not copied)
+
+        Args:
+            arrays: Arrays
+
+        Returns:
+            Tokens of arrays
+        """
+        now = time.monotonic()
+        tokens = [uuid.uuid4().hex for _array in arrays]
+        with self.__lock:
+            self.__discard_expired_arrays(now)
+            self.__arrays.update(
+                (token, (array, now)) for token, array in zip(tokens, arrays)
+            )
+        return tokens
+
+    def pop_array(self, token: str) -> np.ndarray:
+        """Retrieve array stored with :py:meth:`put_arrays` (array is removed from
+        server)
+
+        Args:
+            token: Array token
+
+        Returns:
+            Array
+
+        Raises:
+            KeyError: if token is unknown (or if array has expired)
+        """
+        return self.pop_arrays([token])[0]
+
+    def pop_arrays(self, tokens: list[str]) -> list[np.ndarray]:
+        """Retrieve arrays stored with :py:meth:`put_arrays` (arrays are removed
+        from server): all arrays are retrieved, or none of them
+
+        Args:
+            tokens: Arrays tokens
+
+        Returns:
+            Arrays
+
+        Raises:
+            KeyError: if a token is unknown (or if array has expired), or if a
+             token is repeated: arrays are then kept on server
+        """
+        if len(set(tokens)) != len(tokens):
+            raise KeyError("Repeated data channel token")
+        with self.__lock:
+            self.__discard_expired_arrays(time.monotonic())
+            for token in tokens:
+                if token not in self.__arrays:
+                    raise KeyError(f"Unknown data channel token: {token}")
+            return [self.__arrays.pop(token)[0] for token in tokens]
+
+
+class DataChannelClient:
+    """Data channel client (connection is established on first request)
+
+    Args:
+        port: Data channel server port number
+    """
+
+    def __init__(self, port: int) -> None:
+        self.port = port
+        self.__sock: socket.socket | None = None
+        self.__lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close connection"""
+        with self.__lock:
+            if self.__sock is not None:
+                self.__sock.close()
+                self.__sock = None
+
+    def __request(
+        self, header: dict[str, Any], arrays: list[np.ndarray] = ()
+    ) -> tuple[dict[str, Any], list[np.ndarray]]:
+        """Send request and return response
+
+        Args:
+            header: Request header
+            arrays: Request arrays
+
+        Returns:
+            Tuple (response header, response arrays)
+
+        Raises:
+            ValueError: if server returned an error
+            MemoryError: if there is not enough memory to receive response arrays
+        """
+        with self.__lock:
+            if self.__sock is None:
+                self.__sock = socket.create_connection(("127.0.0.1", self.port))
+                self.__sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            try:
+                send_frame(self.__sock, header, arrays)
+                header, arrays = recv_frame(self.__sock)
+            except OSError:
+                # Connection is reset: it will be established again on next request
+                self.__sock.close()
+                self.__sock = None
+                raise
+        if "error" in header:
+            raise ValueError(header["error"])
+        return header, arrays
+
+    def put(self, arrays: list[np.ndarray]) -> list[str]:
+        """Upload arrays to server
+
+        Args:
+            arrays: Numerical arrays
+
+        Returns:
+            Tokens of arrays, to be passed to XML-RPC methods instead of arrays
+        """
+        header, _arrays = self.__request({"request": "put"}, arrays)
+        return header["tokens"]
+
+    def get(self, tokens: list[str]) -> list[np.ndarray]:
+        """Download arrays published by server
+
+        Args:
+            tokens: Tokens of arrays
+
+        Returns:
+            Arrays
+        """
+        _header, arrays = self.__request({"request": "get", "tokens": tokens})
+        return arrays
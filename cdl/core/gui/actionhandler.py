@@ -418,6 +418,26 @@ class BaseActionHandler(metaclass=abc.ABCMeta):
                 context_menu_pos=-1,
                 toolbar_pos=-1,
             )
+            self.new_action(
+                _("Save to directory..."),
+                icon_name=f"filesave_{self.__class__.__name__[:3].lower()}.svg",
+                tip=_("Save selected %s to files in a directory") % self.OBJECT_STR,
+                triggered=self.panel.save_to_directory,
+                select_condition=SelectCond.at_least_one,
+            )
+            self.new_action(
+                _("Watch folder..."),
+                icon_name=f"fileopen_{self.__class__.__name__[:3].lower()}.svg",
+                tip=_("Import new %s files from a directory as they arrive")
+                % self.OBJECT_STR,
+                triggered=self.panel.watch_folder,
+                select_condition=SelectCond.always,
+            )
+            self.new_action(
+                _("Stop watching folder"),
+                triggered=self.panel.stop_watching_folder,
+                select_condition=SelectCond.always,
+            )
             self.new_action(
                 _("Import text file..."),
                 icon_name="import_text.svg",
@@ -1029,6 +1049,15 @@ class ImageActionHandler(BaseActionHandler):
         """Create actions that are added to the menus in the first place"""
         super().create_first_actions()
 
+        with self.new_category(ActionCategory.FILE):
+            self.new_action(
+                _("Open DICOM series..."),
+                icon_name="fileopen_ima.svg",
+                tip=_("Open a DICOM series (one file per slice) from a directory"),
+                triggered=self.panel.open_dicom_series,
+                select_condition=SelectCond.always,
+            )
+
         with self.new_category(ActionCategory.VIEW):
             showcontrast_action = self.new_action(
                 _("Show contrast panel"),
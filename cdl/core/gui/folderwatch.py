@@ -0,0 +1,360 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Folder watcher
+==============
+
+The :mod:`cdl.core.gui.folderwatch` module provides the watched-folder ingest
+service of signal and image panels: files dropped into a directory (e.g. by an
+acquisition instrument) are read and added to a group of the panel as they arrive
+(see :py:meth:`cdl.core.gui.panel.base.BaseDataPanel.watch_folder`).
+
+.. autoclass:: WatchFolderParam
+
+.. autoclass:: FolderWatcher
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import fnmatch
+import os
+import os.path as osp
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING
+
+import guidata.dataset as gds
+from qtpy import QtCore as QC
+
+from cdl.config import _
+from cdl.core.gui.panel.base import IO_MAX_WORKERS, FileIOWorker
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from cdl.core.gui.panel.base import BaseDataPanel
+    from cdl.core.model.image import ImageObj
+    from cdl.core.model.signal import SignalObj
+
+    ProcessingChain = list[tuple[Callable, gds.DataSet | None]]
+
+#: Interval (in milliseconds) at which objects read in background are added to the
+#: panel: objects read in the meantime are added at once
+BATCH_INTERVAL = 100
+
+#: Maximum number of files submitted to the thread pool but not yet added to the
+#: panel: this bounds the number of objects added at once
+MAX_PENDING_FILES = 512
+
+
+class WatchFolderParam(gds.DataSet):
+    """Watch folder parameters"""
+
+    directory = gds.DirectoryItem(_("Directory"))
+    pattern = gds.StringItem(
+        _("File name pattern"),
+        default="*",
+        help=_(
+            "Only files matching this pattern are imported (e.g. '*.tif'), "
+            "provided that their format is supported"
+        ),
+    )
+    group_title = gds.StringItem(
+        _("Target group"),
+        default="",
+        help=_(
+            "Title of the group in which new objects are added (the group is "
+            "created if it does not exist). If empty, the directory name is used."
+        ),
+    )
+    include_existing = gds.BoolItem(
+        "",
+        _("Import existing files"),
+        default=False,
+        help=_("If not checked, only files created after starting are imported"),
+    )
+    settle_time = gds.FloatItem(
+        _("Settle time"),
+        default=0.5,
+        min=0.0,
+        unit="s",
+        help=_(
+            "Files are imported once their size and modification time have not "
+            "changed for this duration (files still being written are skipped)"
+        ),
+    )
+    poll_interval = gds.FloatItem(
+        _("Polling interval"),
+        default=1.0,
+        min=0.05,
+        unit="s",
+        help=_(
+            "Directory is scanned at this interval, in addition to file system "
+            "notifications (which may not be available, e.g. on network drives)"
+        ),
+    )
+
+
+class FolderWatcher(QC.QObject):
+    """Watched-folder ingest service of a signal or image panel
+
+    New files are detected with file system notifications, and by polling the
+    directory (as a fallback). Files still being written are skipped until their
+    size and modification time are stable, and until they may be opened. Files are
+    then read in a thread pool (using the panel's I/O registry), the optional
+    processing chain being applied in the same thread. Objects are added to the
+    target group by batches, in file name order (see :py:data:`BATCH_INTERVAL`).
+
+    Args:
+        panel: Signal or image panel
+        param: Watch folder parameters
+        processing: Processing chain applied to each new object: list of
+         (function, parameters) tuples, where function is a 1-to-1 computation
+         function (e.g. :py:func:`cdl.computation.signal.compute_normalize`) and
+         parameters is None for functions without parameters. Only the processed
+         objects are added to the panel.
+    """
+
+    def __init__(
+        self,
+        panel: BaseDataPanel,
+        param: WatchFolderParam,
+        processing: ProcessingChain | None = None,
+    ) -> None:
+        super().__init__(panel)
+        self.panel = panel
+        self.param = param
+        self.processing = processing or []
+        #: Number of files read so far (including files which could not be read)
+        self.nb_files = 0
+        #: Files which could not be read, with the corresponding exception
+        self.errors: list[tuple[str, Exception]] = []
+        self.__patterns = panel.IO_REGISTRY.get_read_patterns()
+        # Files already submitted (or ignored), and candidates: files which may
+        # still be written, with their last (size, modification time) and the time
+        # at which it has changed
+        self.__known: set[str] = set()
+        self.__ignored: set[str] = set()
+        self.__candidates: dict[str, tuple[tuple[int, int], float]] = {}
+        # Files ready to be read (waiting for a free slot in the thread pool), and
+        # files being read (in submission order)
+        self.__queue: collections.deque[str] = collections.deque()
+        self.__pending: collections.deque[
+            tuple[str, concurrent.futures.Future[list[SignalObj | ImageObj]]]
+        ] = collections.deque()
+        self.__group_id: str | None = None
+        self.__canceled = threading.Event()
+        self.__worker = FileIOWorker(self.__canceled)
+        self.__executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self.__fswatcher = QC.QFileSystemWatcher(self)
+        self.__fswatcher.directoryChanged.connect(self.__schedule_scan)
+        # Single-shot timer coalescing notifications, and re-scanning the directory
+        # after the settle time when files are still being written:
+        self.__scan_timer = QC.QTimer(self)
+        self.__scan_timer.setSingleShot(True)
+        self.__scan_timer.timeout.connect(self.scan)
+        self.__poll_timer = QC.QTimer(self)
+        self.__poll_timer.timeout.connect(self.scan)
+        self.__batch_timer = QC.QTimer(self)
+        self.__batch_timer.setInterval(BATCH_INTERVAL)
+        self.__batch_timer.timeout.connect(self.add_objects)
+
+    def is_running(self) -> bool:
+        """Return True if directory is being watched"""
+        return self.__executor is not None
+
+    def start(self) -> None:
+        """Start watching directory"""
+        if self.is_running():
+            return
+        directory = self.param.directory
+        if not osp.isdir(directory):
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        self.__canceled.clear()
+        self.__executor = concurrent.futures.ThreadPoolExecutor(
+            IO_MAX_WORKERS, thread_name_prefix="DataLabFolderWatcher"
+        )
+        if not self.param.include_existing:
+            self.__known.update(entry.path for entry in self.__get_new_files())
+        # File system notifications may not be available: polling is the fallback
+        self.__fswatcher.addPath(directory)
+        self.__poll_timer.start(int(self.param.poll_interval * 1000))
+        self.__batch_timer.start()
+        self.scan()
+
+    def stop(self) -> None:
+        """Stop watching directory: files being read are discarded"""
+        if not self.is_running():
+            return
+        self.__canceled.set()
+        for timer in (self.__scan_timer, self.__poll_timer, self.__batch_timer):
+            timer.stop()
+        directories = self.__fswatcher.directories()
+        if directories:
+            self.__fswatcher.removePaths(directories)
+        # Pending tasks are canceled explicitly (`cancel_futures` argument of
+        # `Executor.shutdown` requires Python 3.9)
+        for _filename, future in self.__pending:
+            future.cancel()
+        self.__executor.shutdown(wait=True)
+        self.__executor = None
+        # Files which have not been added to the panel are imported again if
+        # watching is restarted:
+        for filename, _future in self.__pending:
+            self.__known.discard(filename)
+        self.__known.difference_update(self.__queue)
+        self.__pending.clear()
+        self.__queue.clear()
+        self.__candidates.clear()
+
+    def __schedule_scan(self, _path: str | None = None) -> None:
+        """Schedule directory scan (coalescing file system notifications)"""
+        if not self.__scan_timer.isActive() or self.__scan_timer.interval() > 0:
+            self.__scan_timer.start(0)
+
+    def __get_new_files(self) -> list[os.DirEntry]:
+        """Return new files in directory: files not submitted yet, whose format is
+        supported and whose name matches the file name pattern"""
+        new_entries = []
+        with os.scandir(self.param.directory) as entries:
+            for entry in entries:
+                path = entry.path
+                if path in self.__known or path in self.__ignored:
+                    continue
+                name = entry.name
+                lname = name.lower()
+                if (
+                    any(fnmatch.fnmatchcase(lname, pat) for pat in self.__patterns)
+                    and fnmatch.fnmatch(name, self.param.pattern or "*")
+                    and entry.is_file()
+                ):
+                    new_entries.append(entry)
+                else:
+                    self.__ignored.add(path)
+        return new_entries
+
+    @staticmethod
+    def __is_released(filename: str) -> bool:
+        """Return True if file may be opened (i.e. is not locked by the writer)"""
+        try:
+            with open(filename, "rb"):
+                return True
+        except OSError:
+            return False
+
+    def scan(self) -> None:
+        """Scan directory for new files, and submit files which are no longer being
+        written to the thread pool"""
+        if not self.is_running():
+            return
+        try:
+            entries = self.__get_new_files()
+        except OSError:
+            # Directory may be temporarily unavailable (e.g. network drive)
+            return
+        now = time.monotonic()
+        ready = []
+        candidates = {}
+        for entry in entries:
+            filename = entry.path
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            state = (stat.st_size, stat.st_mtime_ns)
+            previous = self.__candidates.get(filename)
+            if previous is None or previous[0] != state:
+                candidates[filename] = (state, now)
+            elif now - previous[1] >= self.param.settle_time and self.__is_released(
+                filename
+            ):
+                ready.append(filename)
+            else:
+                candidates[filename] = previous
+        self.__candidates = candidates
+        self.__known.update(ready)
+        self.__queue.extend(sorted(ready))
+        self.__submit()
+        if candidates:
+            # Checking again candidates once the settle time has elapsed
+            delay = int(self.param.settle_time * 1000) + 1
+            if not self.__scan_timer.isActive():
+                self.__scan_timer.start(delay)
+
+    def __read_file(self, filename: str) -> list[SignalObj | ImageObj]:
+        """Read file and apply processing chain to objects (in I/O thread)"""
+        objs = []
+        for obj in self.panel.IO_REGISTRY.read(filename, self.__worker):
+            for func, param in self.processing:
+                # Objects are not numbered yet: in titles of processed objects, the
+                # short ID of the source object is replaced by its title
+                short_id, title = obj.short_id, obj.title
+                obj = func(obj) if param is None else func(obj, param)
+                obj.title = obj.title.replace(short_id, title)
+            obj.metadata["source"] = filename
+            objs.append(obj)
+        return objs
+
+    def __submit(self) -> None:
+        """Submit files ready to be read to the thread pool"""
+        while self.__queue and len(self.__pending) < MAX_PENDING_FILES:
+            filename = self.__queue.popleft()
+            future = self.__executor.submit(self.__read_file, filename)
+            self.__pending.append((filename, future))
+
+    def __get_group_id(self) -> str:
+        """Return target group id (creating group if necessary)"""
+        groups = self.panel.objmodel.get_groups()
+        if self.__group_id not in [group.uuid for group in groups]:
+            title = self.param.group_title or osp.basename(
+                osp.normpath(self.param.directory)
+            )
+            for group in groups:
+                if group.title == title:
+                    break
+            else:
+                group = self.panel.add_group(title)
+            self.__group_id = group.uuid
+        return self.__group_id
+
+    def add_objects(self) -> list[SignalObj | ImageObj]:
+        """Add objects read so far to the target group (in file name order)
+
+        Returns:
+            Added objects
+        """
+        objs = []
+        nb_files = self.nb_files
+        while self.__pending and self.__pending[0][1].done():
+            filename, future = self.__pending.popleft()
+            self.nb_files += 1
+            try:
+                objs += future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                traceback.print_exc()
+                self.errors.append((filename, exc))
+        if self.is_running():
+            self.__submit()
+        if objs:
+            self.panel.add_objects(objs, self.__get_group_id())
+        if self.nb_files > nb_files:
+            message = _("Watched folder: %d files imported") % self.nb_files
+            if self.errors:
+                message += " " + _("(%d errors)") % len(self.errors)
+            self.panel.SIG_STATUS_MESSAGE.emit(message)
+        return objs
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait until all files submitted so far have been read (this does not add
+        objects to the panel, see :py:meth:`add_objects`)
+
+        Args:
+            timeout: Maximum waiting time (in seconds), None for no limit
+        """
+        futures = [future for _filename, future in self.__pending]
+        concurrent.futures.wait(futures, timeout=timeout)
@@ -13,22 +13,44 @@ DataLab data model/main window.
 from __future__ import annotations
 
 import os.path as osp
+import traceback
+import weakref
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 from guidata.qthelpers import exec_dialog
+from qtpy import QtCore as QC
 from qtpy import QtWidgets as QW
 
-from cdl.config import _
+from cdl.config import Conf, _
 from cdl.core.io.h5 import H5Importer
-from cdl.core.io.native import NativeH5Reader, NativeH5Writer
+from cdl.core.io.h5.common import H5Follower
+from cdl.core.io.native import (
+    NativeH5Reader,
+    NativeH5Writer,
+    compact_h5_file,
+    get_h5_unused_size,
+)
 from cdl.core.model.signal import SignalObj
 from cdl.env import execenv
-from cdl.utils.qthelpers import create_progress_bar, qt_try_loadsave_file
+from cdl.utils.qthelpers import (
+    create_progress_bar,
+    create_progress_reporter,
+    qt_try_loadsave_file,
+)
 from cdl.widgets.h5browser import H5BrowserDialog
 
 if TYPE_CHECKING:
     from cdl.core.gui.main import CDLMainWindow
+    from cdl.core.gui.panel.image import ImagePanel
+    from cdl.core.gui.panel.signal import SignalPanel
     from cdl.core.io.h5.common import BaseNode
+    from cdl.core.model.image import ImageObj
+
+
+def is_same_file(filename1: str, filename2: str) -> bool:
+    """Return True if file names refer to the same file"""
+    return osp.normcase(osp.abspath(filename1)) == osp.normcase(osp.abspath(filename2))
 
 
 class H5InputOutput:
@@ -38,29 +60,136 @@ class H5InputOutput:
         mainwindow: Main window
     """
 
+    #: In incremental save mode, file is compacted when unused space exceeds both
+    #: this size (in bytes) and half of the file size
+    COMPACT_MIN_UNUSED_SIZE = 2**26
+
+    #: Interval (in milliseconds) at which followed HDF5 files are refreshed (see
+    #: :py:meth:`follow_file`)
+    FOLLOW_INTERVAL = 500
+
     def __init__(self, mainwindow: CDLMainWindow) -> None:
         self.mainwindow = mainwindow
         self.uint32_wng: bool = None
+        # Workspace file (last DataLab HDF5 file saved or opened) and object states
+        # recorded at that time, enabling incremental save:
+        self.__filename: str | None = None
+        self.__states: dict[str, tuple[str, str]] = {}
+        # Background prefetch of deferred data (lazy open mode):
+        self.__prefetch_queue: list[weakref.ref[SignalObj | ImageObj]] = []
+        self.__prefetch_timer = QC.QTimer(mainwindow)
+        self.__prefetch_timer.setInterval(0)
+        self.__prefetch_timer.timeout.connect(self.__prefetch_next)
+        # Followed HDF5 files (SWMR follow mode):
+        self.__followers: list[H5Follower] = []
+        self.__follow_timer = QC.QTimer(mainwindow)
+        self.__follow_timer.setInterval(self.FOLLOW_INTERVAL)
+        self.__follow_timer.timeout.connect(self.refresh_followed_files)
+
+    @property
+    def filename(self) -> str | None:
+        """Return workspace file name (last DataLab HDF5 file saved or opened)"""
+        return self.__filename
 
     @staticmethod
     def __progbartitle(fname: str) -> str:
         """Return progress bar title"""
         return _("Loading data from %s...") % osp.basename(fname)
 
-    def save_file(self, filename: str) -> None:
-        """Save all signals and images from DataLab model into a HDF5 file"""
-        writer = NativeH5Writer(filename)
-        for panel in self.mainwindow.panels:
-            panel.serialize_to_hdf5(writer)
+    def __iter_objects(self) -> Iterator[SignalObj | ImageObj]:
+        """Iterate over all signals and images"""
+        for panel in (self.mainwindow.signalpanel, self.mainwindow.imagepanel):
+            yield from panel.objmodel
+
+    def __prefetch_next(self) -> None:
+        """Load deferred data of next object in prefetch queue"""
+        while self.__prefetch_queue:
+            obj = self.__prefetch_queue.pop(0)()
+            if obj is not None and obj.data_loader is not None:
+                obj.load_data()
+                return
+        self.__prefetch_timer.stop()
+
+    def __load_deferred_data(self, filename: str, incremental: bool) -> None:
+        """Load deferred data read from a file which is about to be written
+
+        Args:
+            filename: HDF5 file name
+            incremental: If True, the file will be saved incrementally: only objects
+             which will be written again have to be loaded
+        """
+        for obj in self.__iter_objects():
+            loader = obj.data_loader
+            if loader is not None and is_same_file(loader.filename, filename):
+                if incremental:
+                    state = self.__states.get(obj.uuid, (None, None))[1]
+                    if state is not None and state == obj.get_serialization_state():
+                        continue
+                obj.load_data()
+
+    def save_file(self, filename: str, compact: bool | None = None) -> None:
+        """Save all signals and images from DataLab model into a HDF5 file
+
+        If file is the workspace file and incremental save is enabled, only objects
+        added or modified since the last save (or open) are written.
+
+        Args:
+            filename: HDF5 file name
+            compact: If True, compact file after saving. If False, never compact
+             file. If None (default), compact file only if there is too much
+             unused space in file after an incremental save.
+        """
+        compression = Conf.io.h5_compression.get()
+        incremental = (
+            Conf.io.h5_incremental_save.get()
+            and self.__filename is not None
+            and is_same_file(filename, self.__filename)
+        )
+        if osp.isfile(filename):
+            self.__load_deferred_data(filename, incremental)
+        self.__filename = None
+        writer = NativeH5Writer(
+            filename,
+            compression=None if compression == "none" else compression,
+            states=self.__states if incremental else None,
+        )
+        try:
+            for panel in self.mainwindow.panels:
+                panel.serialize_to_hdf5(writer)
+        except Exception:
+            # Objects which have not been processed yet must not be removed
+            writer.close(cleanup=False)
+            raise
         writer.close()
+        if compact or (
+            compact is None
+            and writer.incremental
+            and get_h5_unused_size(filename)
+            > max(self.COMPACT_MIN_UNUSED_SIZE, osp.getsize(filename) // 2)
+        ):
+            compact_h5_file(filename)
+        self.__filename, self.__states = filename, writer.states
+        # Objects kept in file may have been moved (incremental save):
+        for obj in self.__iter_objects():
+            loader = obj.data_loader
+            if (
+                loader is not None
+                and is_same_file(loader.filename, filename)
+                and obj.uuid in writer.states
+            ):
+                name = loader.path.rsplit("/", 1)[-1]
+                loader.path = f"/{writer.states[obj.uuid][0]}/{name}"
 
     def open_file(self, filename: str, import_all: bool, reset_all: bool) -> None:
         """Open HDF5 file"""
         progress = None
         try:
-            reader = NativeH5Reader(filename)
+            reader = NativeH5Reader(filename, lazy=Conf.io.h5_lazy_open.get())
             if reset_all:
                 self.mainwindow.reset_all()
+            # The opened file becomes the workspace file if it is the only source of
+            # the objects in DataLab model:
+            is_workspace = not self.mainwindow.has_objects()
             with create_progress_bar(
                 self.mainwindow, self.__progbartitle(filename), 2
             ) as progress:
@@ -69,8 +198,18 @@ class H5InputOutput:
                     QW.QApplication.processEvents()
                     panel.deserialize_from_hdf5(reader)
                     if progress.wasCanceled():
+                        is_workspace = False
                         break
             reader.close()
+            if is_workspace:
+                self.__filename, self.__states = filename, reader.states
+            if reader.lazy and Conf.io.h5_lazy_prefetch.get():
+                self.__prefetch_queue.extend(
+                    weakref.ref(obj)
+                    for obj in self.__iter_objects()
+                    if obj.data_loader is not None
+                )
+                self.__prefetch_timer.start()
         except KeyError:
             if progress is not None:
                 # KeyError was encoutered when deserializing datasets (DataLab data
@@ -125,13 +264,14 @@ class H5InputOutput:
                 if reset_all:
                     self.mainwindow.reset_all()
                 with qt_try_loadsave_file(self.mainwindow, "*.h5", "load"):
-                    with create_progress_bar(self.mainwindow, "", len(nodes)) as prog:
+                    with create_progress_reporter(
+                        self.mainwindow, "", len(nodes)
+                    ) as prog:
                         self.uint32_wng = False
                         for idx, node in enumerate(nodes):
-                            prog.setLabelText(self.__progbartitle(node.h5file.filename))
-                            prog.setValue(idx + 1)
-                            QW.QApplication.processEvents()
-                            if prog.wasCanceled():
+                            prog.set_label(self.__progbartitle(node.h5file.filename))
+                            prog.set_value(idx + 1)
+                            if prog.was_canceled():
                                 break
                             self.__add_object_from_node(node)
                 self.__eventually_show_warnings()
@@ -148,3 +288,106 @@ class H5InputOutput:
         except KeyError as exc:
             raise KeyError(f"Dataset not found: {dsetname}") from exc
         h5importer.close()
+
+    def follow_file(
+        self, filename: str, dsetnames: list[str] | None = None
+    ) -> list[SignalObj | ImageObj]:
+        """Follow HDF5 file still being written (SWMR follow mode): objects are
+        created from datasets, and data appended to datasets (new signal points,
+        image rows or frames) is periodically appended to objects (see
+        :py:data:`FOLLOW_INTERVAL`), without reading again data already loaded
+
+        Args:
+            filename: HDF5 file name
+            dsetnames: Names of datasets to follow. If None, datasets are selected
+             in the HDF5 browser (all datasets which may be followed, in unattended
+             mode)
+
+        Returns:
+            Followed objects
+        """
+        if dsetnames is None:
+            h5browser = H5BrowserDialog(self.mainwindow)
+            h5browser.open_file(filename, swmr=True)
+            nodes = None
+            if execenv.unattended:
+                nodes = h5browser.get_all_nodes()
+            elif exec_dialog(h5browser):
+                nodes = h5browser.get_nodes()
+            nodes = nodes or []
+            dsetnames = [
+                node.id for node in nodes if node.get_growth_axis() is not None
+            ]
+            h5browser.cleanup()
+            if len(dsetnames) < len(nodes) and not execenv.unattended:
+                QW.QMessageBox.warning(
+                    self.mainwindow,
+                    _("Warning"),
+                    _(
+                        "Some of the selected datasets may not be followed (only "
+                        "resizable datasets may grow while being written): they "
+                        "are ignored."
+                    ),
+                )
+        follower = H5Follower(filename)
+        objs = []
+        try:
+            for dsetname in dsetnames:
+                try:
+                    obj = follower.follow(dsetname)
+                except KeyError as exc:
+                    raise KeyError(f"Dataset not found: {dsetname}") from exc
+                if obj is not None:
+                    objs.append(obj)
+        except Exception:
+            follower.close()
+            raise
+        if not objs:
+            follower.close()
+            return objs
+        for obj in objs:
+            self.__get_panel(obj).add_object(obj)
+        self.__followers.append(follower)
+        self.__follow_timer.start()
+        return objs
+
+    def get_followed_files(self) -> list[str]:
+        """Return names of followed HDF5 files"""
+        return [follower.filename for follower in self.__followers]
+
+    def refresh_followed_files(self) -> None:
+        """Append data written to followed HDF5 files since the last refresh to
+        followed objects, and update their plot items"""
+        for follower in self.__followers[:]:
+            # Objects removed from DataLab are no longer followed:
+            for obj in follower.get_objects():
+                if obj not in self.__get_panel(obj).objmodel:
+                    follower.unfollow(obj.uuid)
+            try:
+                objs = follower.refresh()
+            except Exception:  # pylint: disable=broad-except
+                # File may have been deleted or truncated: it is no longer followed
+                traceback.print_exc()
+                objs = []
+                for obj in follower.get_objects():
+                    follower.unfollow(obj.uuid)
+            for obj in objs:
+                self.__get_panel(obj).plothandler.update_item_data(obj.uuid)
+            if not follower.get_objects():
+                follower.close()
+                self.__followers.remove(follower)
+        if not self.__followers:
+            self.__follow_timer.stop()
+
+    def stop_following(self) -> None:
+        """Stop following HDF5 files (objects are kept as they are)"""
+        self.__follow_timer.stop()
+        for follower in self.__followers:
+            follower.close()
+        self.__followers.clear()
+
+    def __get_panel(self, obj: SignalObj | ImageObj) -> SignalPanel | ImagePanel:
+        """Return panel associated to object"""
+        if isinstance(obj, SignalObj):
+            return self.mainwindow.signalpanel
+        return self.mainwindow.imagepanel
@@ -36,7 +36,7 @@ from plotpy.constants import PlotType
 from qtpy import QtCore as QC
 from qtpy import QtGui as QG
 from qtpy import QtWidgets as QW
-from qtpy.compat import getopenfilenames, getsavefilename
+from qtpy.compat import getopenfilename, getopenfilenames, getsavefilename
 
 import cdl
 from cdl import __docurl__, __homeurl__, __supporturl__, env
@@ -50,7 +50,7 @@ from cdl.config import (
     Conf,
     _,
 )
-from cdl.core.baseproxy import AbstractCDLControl
+from cdl.core.baseproxy import BATCH_OPERATIONS, AbstractCDLControl
 from cdl.core.gui.actionhandler import ActionCategory
 from cdl.core.gui.docks import DockablePlotWidget
 from cdl.core.gui.h5io import H5InputOutput
@@ -72,6 +72,7 @@ from cdl.utils.qthelpers import (
 from cdl.widgets import instconfviewer, logviewer, status
 
 if TYPE_CHECKING:
+    import threading
     from typing import Literal
 
     from cdl.core.gui.panel.base import AbstractPanel, BaseDataPanel
@@ -162,7 +163,10 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
 
         self.openh5_action: QW.QAction | None = None
         self.saveh5_action: QW.QAction | None = None
+        self.saveh5_current_action: QW.QAction | None = None
         self.browseh5_action: QW.QAction | None = None
+        self.followh5_action: QW.QAction | None = None
+        self.stopfollowh5_action: QW.QAction | None = None
         self.settings_action: QW.QAction | None = None
         self.quit_action: QW.QAction | None = None
         self.autorefresh_action: QW.QAction | None = None
@@ -787,6 +791,19 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
             tip=_("Save to HDF5 file"),
             triggered=self.save_to_h5_file,
         )
+        self.saveh5_current_action = create_action(
+            self,
+            _("Save"),
+            # Standard "Save" shortcut is already used by panels' "Save signal/image"
+            # actions:
+            shortcut=QG.QKeySequence("Ctrl+Shift+S"),
+            icon=get_icon("filesave_h5.svg"),
+            tip=_("Save to current HDF5 workspace file"),
+            triggered=self.save_to_current_h5_file,
+        )
+        # Adding action to main window for the shortcut to be active even before the
+        # "File" menu has been populated:
+        self.addAction(self.saveh5_current_action)
         self.browseh5_action = create_action(
             self,
             _("Browse HDF5 file..."),
@@ -794,6 +811,21 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
             tip=_("Browse an HDF5 file"),
             triggered=lambda checked=False: self.open_h5_files(import_all=None),
         )
+        self.followh5_action = create_action(
+            self,
+            _("Follow HDF5 file..."),
+            icon=get_icon("h5browser.svg"),
+            tip=_(
+                "Follow an HDF5 file still being written (SWMR mode): "
+                "data appended to datasets is added to signals and images"
+            ),
+            triggered=lambda checked=False: self.follow_h5_file(),
+        )
+        self.stopfollowh5_action = create_action(
+            self,
+            _("Stop following HDF5 files"),
+            triggered=self.stop_following_h5_files,
+        )
         self.settings_action = create_action(
             self,
             _("Settings..."),
@@ -1175,6 +1207,121 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
             else:
                 func(param)
 
+    def __get_results(
+        self, nb_id_title: int | str | None = None, panel: str | None = None
+    ) -> list[list]:
+        """Return object results (result properties and shapes)
+
+        Args:
+            nb_id_title: Object number, or object id, or object title.
+             Defaults to None (current object).
+            panel: Panel name. Defaults to None (current panel).
+
+        Returns:
+            List of [title, array] pairs (arrays being converted to lists)
+        """
+        obj = self.get_object(nb_id_title, panel)
+        if obj is None:
+            raise KeyError("No current object")
+        results = list(obj.iterate_resultproperties())
+        results += list(obj.iterate_resultshapes())
+        return [[result.title, result.array.tolist()] for result in results]
+
+    def __run_operations(
+        self, operations: list[tuple], canceled: threading.Event | None = None
+    ) -> list[list]:
+        """Run operations (see :py:meth:`run_batch`): once an operation has
+        failed (or once the batch has been canceled), the next operations are
+        skipped
+
+        Computation errors are raised instead of being shown in a message box (see
+        :py:attr:`cdl.core.gui.processor.base.BaseProcessor.raise_errors`), so that
+        they are reported as failed operations.
+
+        Args:
+            operations: Operations: ``(name, *args)`` tuples
+            canceled: Event set when the batch is canceled (optional)
+
+        Returns:
+            Per-operation status
+        """
+        processors = [self.signalpanel.processor, self.imagepanel.processor]
+        raise_errors = [processor.raise_errors for processor in processors]
+        statuses = []
+        try:
+            for processor in processors:
+                processor.raise_errors = True
+            for name, *args in operations:
+                if (statuses and not statuses[-1][0]) or (
+                    canceled is not None and canceled.is_set()
+                ):
+                    statuses.append([False, None])
+                    continue
+                try:
+                    if name not in BATCH_OPERATIONS:
+                        raise ValueError(f"Unsupported batch operation: {name}")
+                    if name == "get_results":
+                        value = self.__get_results(*args)
+                    else:
+                        value = getattr(self, name)(*args)
+                    statuses.append([True, value])
+                except Exception as exc:  # pylint: disable=broad-except
+                    statuses.append([False, f"{exc.__class__.__name__}: {exc}"])
+        finally:
+            for processor, state in zip(processors, raise_errors):
+                processor.raise_errors = state
+        return statuses
+
+    @remote_controlled
+    def run_batch(
+        self,
+        operations: list[tuple],
+        objects: list[int | str] | None = None,
+        panel: str | None = None,
+        canceled: threading.Event | None = None,
+    ) -> list[list]:
+        """Run a batch of operations at once (see
+        :py:meth:`cdl.core.baseproxy.AbstractCDLControl.run_batch`)
+
+        Args:
+            operations: Operations: ``(name, *args)`` tuples
+            objects: If not None, operations are a processing chain applied to
+             each of these objects (each object is selected before running the
+             chain). Defaults to None.
+            panel: Panel of `objects` (valid values: "signal", "image"). If None,
+             current panel is used. Defaults to None.
+            canceled: Event which may be set from another thread to cancel the
+             batch (e.g. when the remote client has stopped waiting for it): the
+             remaining operations are skipped. Defaults to None.
+
+        Returns:
+            Per-operation status (one list of statuses per object if `objects` is
+            not None)
+        """
+        if objects is None:
+            return self.__run_operations(operations, canceled)
+        if panel is not None:
+            self.set_current_panel(panel)
+        statuses = []
+        for nb_id_title in objects:
+            if canceled is not None and canceled.is_set():
+                statuses.append([[False, None] for _op in operations])
+                continue
+            try:
+                obj = self.get_object(nb_id_title, panel)
+                if obj is None:
+                    raise KeyError("No current object")
+            except (KeyError, TypeError, IndexError) as exc:
+                # Object not found: chain is skipped
+                chain = [[False, None] for _op in operations]
+                if chain:
+                    chain[0] = [False, f"{exc.__class__.__name__}: {exc}"]
+                statuses.append(chain)
+                continue
+            self.select_objects([obj.uuid], panel)
+            statuses.append(self.__run_operations(operations, canceled))
+        return statuses
+
     # ------GUI refresh
     def has_objects(self) -> bool:
         """Return True if sig/ima panels have any object"""
@@ -1240,14 +1387,21 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
     def __update_file_menu(self) -> None:
         """Update file menu before showing up"""
         self.saveh5_action.setEnabled(self.has_objects())
+        self.saveh5_current_action.setEnabled(self.has_objects())
+        self.stopfollowh5_action.setEnabled(
+            bool(self.h5inputoutput.get_followed_files())
+        )
         self.__update_generic_menu(self.file_menu)
         add_actions(
             self.file_menu,
             [
                 None,
                 self.openh5_action,
+                self.saveh5_current_action,
                 self.saveh5_action,
                 self.browseh5_action,
+                self.followh5_action,
+                self.stopfollowh5_action,
                 None,
                 self.settings_action,
             ],
@@ -1334,6 +1488,14 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
             self.h5inputoutput.save_file(filename)
             self.set_modified(False)
 
+    def save_to_current_h5_file(self) -> None:
+        """Save to current DataLab HDF5 workspace file (last saved or opened file),
+        or to a new file if there is no workspace file yet (a file dialog is opened)
+
+        If incremental save is enabled, only new or modified objects are written.
+        """
+        self.save_to_h5_file(self.h5inputoutput.filename)
+
     @remote_controlled
     def open_h5_files(
         self,
@@ -1429,6 +1591,35 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
             filename = self.__check_h5file(filename, "load")
             self.h5inputoutput.import_files([filename], False, reset_all)
 
+    @remote_controlled
+    def follow_h5_file(
+        self, filename: str | None = None, dsetnames: list[str] | None = None
+    ) -> None:
+        """Follow HDF5 file still being written (SWMR follow mode), see
+        :py:meth:`cdl.core.gui.h5io.H5InputOutput.follow_file`
+
+        Args:
+            filename: HDF5 filename. If None, a file dialog is opened.
+            dsetnames: Names of datasets to follow. If None, datasets are selected
+             in the HDF5 browser.
+        """
+        if filename is None:
+            basedir = Conf.main.base_dir.get()
+            with qth.save_restore_stds():
+                filename, _fl = getopenfilename(
+                    self, _("Open"), basedir, _("HDF5 files (*.h5 *.hdf5)")
+                )
+            if not filename:
+                return
+        with qth.qt_try_loadsave_file(self, filename, "load"):
+            filename = self.__check_h5file(filename, "load")
+            self.h5inputoutput.follow_file(filename, dsetnames)
+
+    @remote_controlled
+    def stop_following_h5_files(self) -> None:
+        """Stop following HDF5 files (see :py:meth:`follow_h5_file`)"""
+        self.h5inputoutput.stop_following()
+
     # This method is intentionally *not* remote controlled
     # (see TODO regarding RemoteClient.add_object method)
     #  @remote_controlled
@@ -1511,6 +1702,73 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
         self.add_object(obj)
         return True
 
+    @remote_controlled
+    def append_signal_data(
+        self,
+        uuid: str,
+        xdata: np.ndarray,
+        ydata: np.ndarray,
+        capacity: int | None = None,
+    ) -> bool:
+        """Append data points to signal (live signal).
+
+        The signal is switched to live mode: its data is stored in a preallocated
+        ring buffer of ``capacity`` points (oldest points are dropped when the buffer
+        is full), and its plot item is updated without being rebuilt.
+
+        Args:
+            uuid (str): Signal uuid
+            xdata (numpy.ndarray): X data to append
+            ydata (numpy.ndarray): Y data to append
+            capacity (int | None): Maximum number of points kept in signal.
+             Defaults to None (current capacity, or 1,000,000 points when switching
+             to live mode).
+
+        Returns:
+            bool: True if data was appended successfully, False otherwise
+
+        Raises:
+            KeyError: if signal not found
+            ValueError: Invalid data
+        """
+        self.signalpanel.append_data(uuid, xdata, ydata, capacity)
+        return True
+
+    @remote_controlled
+    def append_image_frame(
+        self,
+        uuid: str,
+        data: np.ndarray,
+        depth: int | None = None,
+        stats: bool | None = None,
+    ) -> bool:
+        """Append frame to image stream: image data is replaced by the new frame.
+
+        The image is switched to stream mode: frames are stored in a preallocated
+        ring buffer of ``depth`` frames (oldest frames are dropped when the buffer is
+        full), and its plot item is updated without being rebuilt, at a limited
+        refresh rate (frames are not all shown if they are appended faster).
+
+        Args:
+            uuid (str): Image uuid
+            data (numpy.ndarray): Frame data
+            depth (int | None): Number of frames kept in image stream buffer.
+             Defaults to None (current depth, or 10 frames when switching to
+             stream mode).
+            stats (bool | None): If True, maintain running mean and variance
+             images of the frames in buffer. Defaults to None (current setting,
+             or disabled when switching to stream mode).
+
+        Returns:
+            bool: True if frame was appended successfully, False otherwise
+
+        Raises:
+            KeyError: if image not found
+            ValueError: Invalid data
+        """
+        self.imagepanel.append_frame(uuid, data, depth, stats)
+        return True
+
     def add_image(
         self,
         title: str,
@@ -1678,6 +1936,7 @@ class CDLMainWindow(QW.QMainWindow, AbstractCDLControl, metaclass=CDLMainWindowM
                 # it would represent too much effort for an error occuring in test
                 # configurations only.
                 pass
+        self.h5inputoutput.stop_following()
         self.reset_all()
         self.__save_pos_size_and_state()
         self.__unregister_plugins()
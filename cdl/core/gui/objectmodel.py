@@ -332,6 +332,30 @@ class ObjectModel:
         self.reset_short_ids()
         self.__replace_uuids_by_short_ids_in_titles()
 
+    def add_objects(self, objs: list[SignalObj | ImageObj], group_id: str) -> None:
+        """Add objects at once to model, at the end of group
+
+        Args:
+            objs: objects
+            group_id: group uuid
+
+        .. note::
+
+            Contrary to calling :py:meth:`add_object` for each object, short IDs in
+            titles are fixed only once, and not at all when adding objects to the
+            last group (object numbers of other objects are then unchanged).
+        """
+        group = self.get_group(group_id)
+        renumbering = group is not self._groups[-1]
+        if renumbering:
+            self.__replace_short_ids_by_uuids_in_titles(objs)
+        for obj in objs:
+            self._objects[obj.uuid] = obj
+            group.append(obj)
+        self.reset_short_ids()
+        if renumbering:
+            self.__replace_uuids_by_short_ids_in_titles()
+
     def remove_object(self, obj: SignalObj | ImageObj) -> None:
         """Remove object from model"""
         for group in self._groups:
@@ -178,10 +178,11 @@ class SimpleObjectTree(QW.QTreeWidget):
 
     def update_tree(self) -> None:
         """Update tree"""
+        items = {item.data(0, QC.Qt.UserRole): item for item in self.iter_items()}
         for group in self.objmodel.get_groups():
-            self.__update_item(self.get_item_from_id(group.uuid), group)
+            self.__update_item(items[group.uuid], group)
             for obj in group:
-                self.__update_item(self.get_item_from_id(obj.uuid), obj)
+                self.__update_item(items[obj.uuid], obj)
 
     def __add_to_group_item(
         self, obj: SignalObj | ImageObj, group_item: QW.QTreeWidgetItem
@@ -212,6 +213,22 @@ class SimpleObjectTree(QW.QTreeWidget):
         if set_current:
             self.set_current_item_id(obj.uuid)
 
+    def add_object_items(
+        self, objs: list[SignalObj | ImageObj], group_id: str, set_current: bool = True
+    ) -> None:
+        """Add items at once (see :py:meth:`add_object_item`)
+
+        Args:
+            objs: objects
+            group_id: group id
+            set_current: if True, set the last object as current
+        """
+        group_item = self.get_item_from_id(group_id)
+        for obj in objs:
+            self.__add_to_group_item(obj, group_item)
+        if set_current and objs:
+            self.setCurrentItem(group_item.child(group_item.childCount() - 1))
+
     def update_item(self, uuid: str) -> None:
         """Update item"""
         obj_or_group = self.objmodel.get_object_or_group(uuid)
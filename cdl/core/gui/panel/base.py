@@ -9,9 +9,15 @@
 from __future__ import annotations
 
 import abc
+import collections
+import concurrent.futures
 import dataclasses
+import os
 import os.path as osp
 import re
+import threading
+import time
+import traceback
 import warnings
 from typing import TYPE_CHECKING
 
@@ -33,26 +39,31 @@ from qtpy.compat import getopenfilename, getopenfilenames, getsavefilename
 import cdl.computation.base
 from cdl.config import APP_NAME, Conf, _
 from cdl.core.gui import actionhandler, objectmodel, objectview, roieditor
+from cdl.core.io.base import IOAction, get_export_filenames
+from cdl.core.io.mat import MatFormatMixin
 from cdl.core.model.base import ResultProperties, ResultShape, items_to_json
 from cdl.core.model.signal import create_signal
 from cdl.env import execenv
 from cdl.utils.qthelpers import (
     CallbackWorker,
-    create_progress_bar,
+    create_progress_reporter,
     qt_long_callback,
+    qt_show_loadsave_errors,
     qt_try_except,
     qt_try_loadsave_file,
     save_restore_stds,
 )
 from cdl.widgets.textimport import TextImportWizard
+from cdl.widgets.warningerror import show_warning_error
 
 if TYPE_CHECKING:
-    from typing import Callable
+    from typing import Any, Callable
 
     from plotpy.items import CurveItem, LabelItem, MaskedImageItem
     from plotpy.tools.base import GuiTool
 
     from cdl.core.gui import ObjItf
+    from cdl.core.gui.folderwatch import FolderWatcher, ProcessingChain
     from cdl.core.gui.main import CDLMainWindow
     from cdl.core.gui.plothandler import ImagePlotHandler, SignalPlotHandler
     from cdl.core.gui.processor.image import ImageProcessor
@@ -64,6 +75,104 @@ if TYPE_CHECKING:
     from cdl.core.model.image import ImageObj, NewImageParam
     from cdl.core.model.signal import NewSignalParam, SignalObj
 
+#: Maximum duration (in seconds) of each batch of lazily created plot items
+LAZY_ITEMS_BATCH_DURATION = 0.05
+
+#: Maximum number of files read or written concurrently (opening or saving several
+#: files)
+IO_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class FileIOWorker:
+    """Worker passed to the I/O registry readers/writers when reading or writing
+    several files concurrently (see :py:meth:`BaseDataPanel.load_from_files` and
+    :py:meth:`BaseDataPanel.save_to_files`): per-file progress is ignored (progress
+    is aggregated over files), and cancellation is shared by all I/O threads
+
+    Args:
+        canceled: Event set when the whole operation is canceled
+    """
+
+    def __init__(self, canceled: threading.Event) -> None:
+        self.__canceled = canceled
+
+    def set_progress(self, value: float) -> None:
+        """Set progress value (ignored)
+
+        Args:
+            value: float between 0.0 and 1.0
+        """
+
+    def set_progress_count(self, count: int, total: int) -> None:
+        """Set progress as a number of processed items (ignored)
+
+        Args:
+            count: number of processed items
+            total: total number of items
+        """
+
+    def was_canceled(self) -> bool:
+        """Return whether the operation was canceled"""
+        return self.__canceled.is_set()
+
+
+class SaveToDirectoryParam(gds.DataSet):
+    """Save to directory parameters
+
+    Args:
+        extensions: Supported file extensions (e.g. ["csv", "npy"])
+        title: Dataset title
+    """
+
+    def __init__(self, extensions: list[str], title: str | None = None) -> None:
+        super().__init__(title)
+        self.extensions = extensions
+
+    def get_extension_choices(
+        self, _item: gds.DataItem | None = None, _value: str | None = None
+    ) -> list[tuple[str, str, None]]:
+        """Return extension choices"""
+        return [(ext, f".{ext}", None) for ext in self.extensions]
+
+    directory = gds.DirectoryItem(_("Directory"))
+    basename = gds.StringItem(
+        _("Basename pattern"),
+        default="{title}",
+        help=_(
+            "Python format string, supporting the following fields: "
+            "{title}, {short_id} and {index} (object index, e.g. {index:03d})"
+        ),
+    )
+    extension = gds.ChoiceItem(_("Extension"), get_extension_choices)
+    overwrite = gds.BoolItem(
+        _("Overwrite"),
+        default=False,
+        help=_("If not checked, a numeric suffix is added to existing file names"),
+    )
+
+
+class MatVariablesParam(gds.DataSet):
+    """MAT-File variables selection parameters
+
+    Args:
+        variables: Variables which may be read, as (name, description) tuples
+        title: Dataset title
+    """
+
+    def __init__(
+        self, variables: list[tuple[str, str]], title: str | None = None
+    ) -> None:
+        super().__init__(title)
+        self.__variables = variables
+
+    def get_variable_choices(
+        self, _item: gds.DataItem | None = None, _value: list[str] | None = None
+    ) -> list[tuple[str, str, None]]:
+        """Return variable choices"""
+        return [(name, descr, None) for name, descr in self.__variables]
+
+    variables = gds.MultipleChoiceItem(_("Variables"), get_variable_choices).vertical(1)
+
 
 def is_plot_item_serializable(item: ShapeTypes) -> bool:
     """Return True if plot item is serializable"""
@@ -252,6 +361,7 @@ class BaseDataPanel(AbstractPanel):
     DIALOGSIZE = (800, 600)
     # Replaced by the right class in child object:
     IO_REGISTRY: SignalIORegistry | ImageIORegistry | None = None
+    EXPORT_EXTENSION = ""  # e.g. "csv" (default extension when saving to directory)
     SIG_STATUS_MESSAGE = QC.Signal(str)  # emitted by "qt_try_except" decorator
     SIG_REFRESH_PLOT = QC.Signal(str, bool)  # Connected to PlotHandler.refresh_plot
     ROIDIALOGOPTIONS = {}
@@ -273,10 +383,13 @@ class BaseDataPanel(AbstractPanel):
         self.__metadata_clipboard = {}
         self.context_menu = QW.QMenu()
         self.__separate_views: dict[QW.QDialog, SignalObj | ImageObj] = {}
+        self.folderwatcher: FolderWatcher | None = None
 
     def closeEvent(self, event):
         """Reimplement QMainWindow method"""
+        self.stop_watching_folder()
         self.processor.close()
+        self.plothandler.close()
         super().closeEvent(event)
 
     # ------AbstractPanel interface-----------------------------------------------------
@@ -324,7 +437,10 @@ class BaseDataPanel(AbstractPanel):
             # Plot item has not been created yet (this happens when auto-refresh has
             # been disabled)
             pass
-        super().serialize_object_to_hdf5(obj, writer)
+        with writer.group(self.get_serializable_name(obj)):
+            # In incremental mode, unchanged objects are kept from the existing file
+            if not writer.reuse_object(obj.uuid, obj.get_serialization_state()):
+                obj.serialize(writer)
 
     def serialize_to_hdf5(self, writer: NativeH5Writer) -> None:
         """Serialize whole panel to a HDF5 file"""
@@ -346,7 +462,13 @@ class BaseDataPanel(AbstractPanel):
                         group.title = reader.read_str()
                     for obj_name in reader.h5.get(f"{self.H5_PREFIX}/{name}", []):
                         obj = self.deserialize_object_from_hdf5(reader, obj_name)
+                        loader = reader.pop_deferred_array()
+                        if loader is not None:
+                            obj.set_data_loader(loader)
                         self.add_object(obj, group.uuid, set_current=False)
+                        with reader.group(obj_name):
+                            state = obj.get_serialization_state()
+                            reader.register_object(obj.uuid, state)
                     self.selection_changed()
 
     def __len__(self) -> int:
@@ -369,6 +491,24 @@ class BaseDataPanel(AbstractPanel):
         """
         return self.PARAMCLASS()  # pylint: disable=not-callable
 
+    def __check_new_object(self, obj: SignalObj | ImageObj) -> None:
+        """Check that object may be added to panel
+
+        Args:
+            obj: SignalObj or ImageObj object
+
+        Raises:
+            ValueError: if object is already in panel, or if its data is not valid
+        """
+        if obj in self.objmodel:
+            # Prevent adding the same object twice
+            raise ValueError(
+                f"Object {hex(id(obj))} already in panel. "
+                f"The same object cannot be added twice: "
+                f"please use a copy of the object."
+            )
+        obj.check_data()
+
     @qt_try_except()
     def add_object(
         self,
@@ -383,13 +523,7 @@ class BaseDataPanel(AbstractPanel):
             group_id: group id
             set_current: if True, set the added object as current
         """
-        if obj in self.objmodel:
-            # Prevent adding the same object twice
-            raise ValueError(
-                f"Object {hex(id(obj))} already in panel. "
-                f"The same object cannot be added twice: "
-                f"please use a copy of the object."
-            )
+        self.__check_new_object(obj)
         if group_id is None:
             group_id = self.objview.get_current_group_id()
             if group_id is None:
@@ -398,7 +532,6 @@ class BaseDataPanel(AbstractPanel):
                     group_id = groups[0].uuid
                 else:
                     group_id = self.add_group("").uuid
-        obj.check_data()
         self.objmodel.add_object(obj, group_id)
 
         # Block signals to avoid updating the plot (unnecessary refresh)
@@ -412,6 +545,32 @@ class BaseDataPanel(AbstractPanel):
 
         self.objview.update_tree()
 
+    @qt_try_except()
+    def add_objects(
+        self,
+        objs: list[SignalObj | ImageObj],
+        group_id: str,
+        set_current: bool = True,
+    ) -> None:
+        """Add objects at once, at the end of a group: data model and object view are
+        updated once for all objects (see :py:meth:`add_object`)
+
+        Args:
+            objs: SignalObj or ImageObj objects
+            group_id: group id
+            set_current: if True, set the last added object as current
+        """
+        for obj in objs:
+            self.__check_new_object(obj)
+        self.objmodel.add_objects(objs, group_id)
+        self.objview.blockSignals(True)
+        self.objview.add_object_items(objs, group_id, set_current=set_current)
+        self.objview.blockSignals(False)
+        self.SIG_OBJECT_ADDED.emit()
+        if group_id != self.objmodel.get_groups()[-1].uuid:
+            # Objects of the next groups have been renumbered
+            self.objview.update_tree()
+
     def remove_all_objects(self) -> None:
         """Remove all objects"""
         # iterate over a copy of self.__separate_views dict keys to avoid RuntimeError:
@@ -691,6 +850,54 @@ class BaseDataPanel(AbstractPanel):
         obj.title = title
         self.objview.update_item(obj.uuid)
 
+    def __add_loaded_objects(
+        self, filename: str, objs: list[SignalObj | ImageObj], set_current: bool
+    ) -> None:
+        """Add objects read from file to DataLab (in a new group if there are
+        several objects)
+
+        Args:
+            filename: file name
+            objs: objects read from file
+            set_current: if True, set the last object as current
+        """
+        group_id = None
+        if len(objs) > 1:
+            group_id = self.add_group(osp.basename(filename)).uuid
+        for obj in objs:
+            obj.metadata["source"] = filename
+            self.add_object(
+                obj, group_id=group_id, set_current=set_current and obj is objs[-1]
+            )
+
+    def get_read_options(self, filename: str) -> dict[str, Any] | None:
+        """Return format-specific reading options for file (see
+        :py:meth:`cdl.core.io.base.BaseIORegistry.read`), eventually asking the user:
+        for MAT-Files containing several variables, user is asked for the variables
+        to be imported (variables are listed without reading any data)
+
+        Args:
+            filename: file name
+
+        Returns:
+            Reading options, or None if user canceled
+        """
+        fmt = self.IO_REGISTRY.get_format(filename, IOAction.LOAD)
+        if execenv.unattended or not isinstance(fmt, MatFormatMixin):
+            return {}
+        variables = fmt.get_variables(filename)
+        if len(variables) <= 1:
+            return {}
+        choices = [
+            (var.name, f"{var.name} ({' x '.join(map(str, var.shape))} {var.mclass})")
+            for var in variables
+        ]
+        param = MatVariablesParam(choices, _("MAT-File variables"))
+        param.variables = [name for name, _descr in choices]
+        if not param.edit(parent=self.parent()) or not param.variables:
+            return None
+        return {"variables": param.variables}
+
     def __load_from_file(self, filename: str) -> list[SignalObj] | list[ImageObj]:
         """Open objects from file (signal/image), add them to DataLab and return them.
 
@@ -700,31 +907,208 @@ class BaseDataPanel(AbstractPanel):
         Returns:
             New object or list of new objects
         """
-        worker = CallbackWorker(lambda worker: self.IO_REGISTRY.read(filename, worker))
+        options = self.get_read_options(filename)
+        if options is None:
+            return []
+        worker = CallbackWorker(
+            lambda worker: self.IO_REGISTRY.read(filename, worker, **options)
+        )
         objs = qt_long_callback(self, _("Adding objects to workspace"), worker, True)
-        group_id = None
-        if len(objs) > 1:
-            group_id = self.add_group(osp.basename(filename)).uuid
-        for obj in objs:
-            obj.metadata["source"] = filename
-            self.add_object(obj, group_id=group_id, set_current=obj is objs[-1])
+        self.__add_loaded_objects(filename, objs, True)
         self.selection_changed()
         return objs
 
-    def __save_to_file(self, obj: SignalObj | ImageObj, filename: str) -> None:
+    def __load_from_files_concurrently(
+        self, filenames: list[str]
+    ) -> list[SignalObj | ImageObj]:
+        """Open objects from several files (signals/images), reading files in a
+        thread pool, add them to DataLab and return them.
+
+        Objects are added in file name order, by batches (all files read so far
+        are added at once), and errors are reported once at the end. Reading options
+        (e.g. frame range or MAT-File variables, see :py:meth:`get_read_options`)
+        are collected for each file before reading files: files for which the user
+        canceled the options dialog are skipped.
+
+        Args:
+            filenames: File names
+
+        Returns:
+            list of new objects
+        """
+        objs = []
+        nbdone = 0
+        errors: list[tuple[str, Exception]] = []
+        # Reading options are collected in the GUI thread (user may be asked)
+        options: dict[str, dict[str, Any]] = {}
+        for filename in filenames:
+            try:
+                fopts = self.get_read_options(filename)
+            except Exception as exc:  # pylint: disable=broad-except
+                traceback.print_exc()
+                errors.append((filename, exc))
+                continue
+            if fopts is not None:
+                options[filename] = fopts
+        filenames = [filename for filename in filenames if filename in options]
+        canceled = threading.Event()
+        worker = FileIOWorker(canceled)
+        max_workers = max(min(len(filenames), IO_MAX_WORKERS), 1)
+        # Bounding the number of files read but not yet added to the workspace
+        max_pending = 2 * max_workers
+        pending: collections.deque[
+            tuple[str, concurrent.futures.Future[list[SignalObj | ImageObj]]]
+        ] = collections.deque()
+        fnames = iter(filenames)
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="DataLabFileReader"
+        )
+
+        def submit_next() -> None:
+            """Submit next file reading task, if any"""
+            filename = next(fnames, None)
+            if filename is not None:
+                future = executor.submit(
+                    self.IO_REGISTRY.read, filename, worker, **options[filename]
+                )
+                pending.append((filename, future))
+
+        label = _("Adding objects to workspace")
+        try:
+            with create_progress_reporter(self, label, len(filenames)) as progress:
+                for _idx in range(max_pending):
+                    submit_next()
+                while pending:
+                    # Waiting for the next file (in file name order) to be read,
+                    # while keeping the GUI responsive
+                    while not pending[0][1].done():
+                        QW.QApplication.processEvents()
+                        if progress.was_canceled():
+                            break
+                        concurrent.futures.wait([pending[0][1]], timeout=0.01)
+                    if progress.was_canceled():
+                        canceled.set()
+                        break
+                    batch = []
+                    while pending and pending[0][1].done():
+                        filename, future = pending.popleft()
+                        submit_next()
+                        try:
+                            batch.append((filename, future.result()))
+                        except Exception as exc:  # pylint: disable=broad-except
+                            traceback.print_exc()
+                            errors.append((filename, exc))
+                            nbdone += 1
+                    for filename, fobjs in batch:
+                        Conf.main.base_dir.set(filename)
+                        self.__add_loaded_objects(
+                            filename, fobjs, not pending and fobjs is batch[-1][1]
+                        )
+                        objs += fobjs
+                    if batch:
+                        self.selection_changed()
+                    nbdone += len(batch)
+                    progress.set_value(nbdone)
+        finally:
+            # Pending tasks are canceled explicitly (`cancel_futures` argument of
+            # `Executor.shutdown` requires Python 3.9)
+            for _filename, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+        qt_show_loadsave_errors(self.parent(), errors, "load")
+        return objs
+
+    def __save_to_file(
+        self,
+        obj: SignalObj | ImageObj,
+        filename: str,
+        worker: CallbackWorker | FileIOWorker | None = None,
+    ) -> None:
         """Save object to file (signal/image).
 
         Args:
             obj: object
             filename: file name
+            worker: Callback worker object
         """
-        self.IO_REGISTRY.write(filename, obj)
+        self.IO_REGISTRY.write(filename, obj, worker)
+
+    def __save_to_files_concurrently(
+        self, objs: list[SignalObj | ImageObj], filenames: list[str]
+    ) -> list[str]:
+        """Save objects to files (signals/images), writing files in a thread pool.
+
+        Errors are reported once at the end.
+
+        Args:
+            objs: objects
+            filenames: file names (one per object)
+
+        Returns:
+            list of written file names
+        """
+        written: list[str] = []
+        errors: list[tuple[str, Exception]] = []
+        canceled = threading.Event()
+        worker = FileIOWorker(canceled)
+        max_workers = max(min(len(filenames), IO_MAX_WORKERS), 1)
+        # Bounding the number of submitted tasks, so that canceling is immediate
+        max_pending = 2 * max_workers
+        pending: dict[concurrent.futures.Future[None], str] = {}
+        tasks = iter(zip(objs, filenames))
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="DataLabFileWriter"
+        )
+        label = _("Saving objects to files")
+        try:
+            with create_progress_reporter(self, label, len(filenames)) as progress:
+                while True:
+                    while len(pending) < max_pending:
+                        obj, filename = next(tasks, (None, None))
+                        if obj is None:
+                            break
+                        future = executor.submit(
+                            self.__save_to_file, obj, filename, worker
+                        )
+                        pending[future] = filename
+                    if not pending:
+                        break
+                    QW.QApplication.processEvents()
+                    if progress.was_canceled():
+                        canceled.set()
+                        break
+                    done, _not_done = concurrent.futures.wait(
+                        pending,
+                        timeout=0.01,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        filename = pending.pop(future)
+                        try:
+                            future.result()
+                            written.append(filename)
+                        except Exception as exc:  # pylint: disable=broad-except
+                            traceback.print_exc()
+                            errors.append((filename, exc))
+                        progress.increment()
+        finally:
+            # Pending tasks are canceled explicitly (`cancel_futures` argument of
+            # `Executor.shutdown` requires Python 3.9)
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+        qt_show_loadsave_errors(self.parent(), errors, "save")
+        written = set(written)
+        return [filename for filename in filenames if filename in written]
 
     def load_from_files(
         self, filenames: list[str] | None = None
     ) -> list[SignalObj | ImageObj]:
         """Open objects from file (signals/images), add them to DataLab and return them.
 
+        When opening several files, files are read concurrently (see
+        :py:data:`IO_MAX_WORKERS`) and objects are added in file name order.
+
         Args:
             filenames: File names
 
@@ -738,6 +1122,8 @@ class BaseDataPanel(AbstractPanel):
             filters = self.IO_REGISTRY.get_read_filters()
             with save_restore_stds():
                 filenames, _filt = getopenfilenames(self, _("Open"), basedir, filters)
+        if len(filenames) > 1:
+            return self.__load_from_files_concurrently(filenames)
         objs = []
         for filename in filenames:
             with qt_try_loadsave_file(self.parent(), filename, "load"):
@@ -748,6 +1134,9 @@ class BaseDataPanel(AbstractPanel):
     def save_to_files(self, filenames: list[str] | str | None = None) -> None:
         """Save selected objects to files (signal/image).
 
+        When saving several objects, files are written concurrently (see
+        :py:data:`IO_MAX_WORKERS`).
+
         Args:
             filenames: File names
         """
@@ -757,6 +1146,7 @@ class BaseDataPanel(AbstractPanel):
         assert len(filenames) == len(
             objs
         ), "Number of filenames must match number of objects"
+        tosave = []
         for index, obj in enumerate(objs):
             filename = filenames[index]
             if filename is None:
@@ -767,9 +1157,95 @@ class BaseDataPanel(AbstractPanel):
                         self, _("Save as"), basedir, filters
                     )
             if filename:
-                with qt_try_loadsave_file(self.parent(), filename, "save"):
-                    Conf.main.base_dir.set(filename)
-                    self.__save_to_file(obj, filename)
+                Conf.main.base_dir.set(filename)
+                tosave.append((obj, filename))
+        if len(tosave) > 1:
+            self.__save_to_files_concurrently(*zip(*tosave))
+            return
+        for obj, filename in tosave:
+            with qt_try_loadsave_file(self.parent(), filename, "save"):
+                worker = CallbackWorker(self.__save_to_file, obj=obj, filename=filename)
+                qt_long_callback(self, _("Saving object to file"), worker, True)
+
+    def save_to_directory(self, param: SaveToDirectoryParam | None = None) -> list[str]:
+        """Save selected objects to files in a directory (signals/images), file names
+        being built from a basename pattern (see :py:class:`SaveToDirectoryParam`).
+
+        Files are written concurrently (see :py:data:`IO_MAX_WORKERS`).
+
+        Args:
+            param: Parameters (if None, a dialog box is shown)
+
+        Returns:
+            list of written file names
+        """
+        objs = self.objview.get_sel_objects(include_groups=True)
+        if param is None:  # pragma: no cover
+            param = SaveToDirectoryParam(
+                self.IO_REGISTRY.get_write_extensions(), _("Save to directory")
+            )
+            param.directory = Conf.main.base_dir.get()
+            param.extension = self.EXPORT_EXTENSION
+            if not param.edit(parent=self.parent()):
+                return []
+        if not objs:
+            return []
+        try:
+            filenames = get_export_filenames(
+                objs, param.directory, param.basename, param.extension, param.overwrite
+            )
+        except ValueError as exc:
+            show_warning_error(self, "error", _("Save to directory"), str(exc))
+            return []
+        os.makedirs(param.directory, exist_ok=True)
+        Conf.main.base_dir.set(filenames[0])
+        return self.__save_to_files_concurrently(objs, filenames)
+
+    def watch_folder(
+        self,
+        directory: str | None = None,
+        processing: ProcessingChain | None = None,
+        **kwargs,
+    ) -> FolderWatcher | None:
+        """Watch a directory: new files are read in background, and objects are
+        added to a group as they arrive (see
+        :py:class:`cdl.core.gui.folderwatch.FolderWatcher`). Only one directory is
+        watched at a time.
+
+        Args:
+            directory: Directory to watch (if None, a dialog box is shown)
+            processing: Processing chain applied to each new object (see
+             :py:class:`cdl.core.gui.folderwatch.FolderWatcher`)
+            kwargs: Other watch folder parameters (see
+             :py:class:`cdl.core.gui.folderwatch.WatchFolderParam`)
+
+        Returns:
+            Folder watcher, or None if user canceled
+        """
+        # pylint: disable=import-outside-toplevel
+        from cdl.core.gui.folderwatch import FolderWatcher, WatchFolderParam
+
+        param = WatchFolderParam(_("Watch folder"))
+        update_dataset(param, kwargs)
+        if directory is None:  # pragma: no cover
+            param.directory = Conf.main.base_dir.get()
+            if not param.edit(parent=self.parent()):
+                return None
+        else:
+            param.directory = directory
+        self.stop_watching_folder()
+        self.folderwatcher = FolderWatcher(self, param, processing)
+        self.folderwatcher.start()
+        return self.folderwatcher
+
+    def stop_watching_folder(self) -> None:
+        """Stop watching directory (see :py:meth:`watch_folder`): objects already
+        read are added to the panel"""
+        if self.folderwatcher is not None:
+            self.folderwatcher.add_objects()
+            self.folderwatcher.stop()
+            self.folderwatcher.deleteLater()
+            self.folderwatcher = None
 
     def handle_dropped_files(self, filenames: list[str] | None = None) -> None:
         """Handle dropped files
@@ -793,12 +1269,12 @@ class BaseDataPanel(AbstractPanel):
         if exec_dialog(wizard):
             objs = wizard.get_objs()
             if objs:
-                with create_progress_bar(
+                with create_progress_reporter(
                     self, _("Adding objects to workspace"), max_=len(objs) - 1
                 ) as progress:
                     for idx, obj in enumerate(objs):
-                        progress.setValue(idx)
-                        if progress.wasCanceled():
+                        progress.set_value(idx)
+                        if progress.was_canceled():
                             break
                         self.add_object(obj)
 
@@ -890,6 +1366,7 @@ class BaseDataPanel(AbstractPanel):
             edit=True,
             name="new_window",
             options={"show_itemlist": edit_annotations},
+            lazy=True,
         )
         if dlg is None:
             return None
@@ -966,9 +1443,13 @@ class BaseDataPanel(AbstractPanel):
         tools: list[GuiTool] | None = None,
         name: str | None = None,
         options: dict | None = None,
+        lazy: bool = False,
     ) -> PlotDialog | None:
         """Create new pop-up signal/image plot dialog.
 
+        Plot items are created from the main plot items, so that viewable data and
+        LUT state are shared with the main plot (no data copy).
+
         Args:
             oids: Object IDs
             edit: Edit mode
@@ -977,6 +1458,9 @@ class BaseDataPanel(AbstractPanel):
             tools: list of tools to add to the toolbar
             name: Dialog name
             options: Plot options
+            lazy: if True, only the active item (last object) is created before
+             returning the dialog, the other items being created in the background
+             (in the event loop) once the dialog is shown
 
         Returns:
             QDialog instance
@@ -1008,14 +1492,16 @@ class BaseDataPanel(AbstractPanel):
 
         objs = self.objmodel.get_objects(oids)
         dlg.setObjectName(f"{objs[0].PREFIX}_{name}")
+        if lazy and len(objs) > 1:
+            self.__add_items_lazily(dlg, objs[:-1])
+            objs = objs[-1:]
 
-        with create_progress_bar(
+        with create_progress_reporter(
             self, _("Creating plot items"), max_=len(objs)
         ) as progress:
             for index, obj in enumerate(objs):
-                progress.setValue(index + 1)
-                QW.QApplication.processEvents()
-                if progress.wasCanceled():
+                progress.set_value(index + 1)
+                if progress.was_canceled():
                     return None
                 item = obj.make_item(update_from=self.plothandler[obj.uuid])
                 item.set_readonly(True)
@@ -1024,6 +1510,46 @@ class BaseDataPanel(AbstractPanel):
         plot.replot()
         return dlg
 
+    def __add_items_lazily(
+        self, dlg: PlotDialog, objs: list[SignalObj | ImageObj]
+    ) -> None:
+        """Create dialog plot items in the event loop, by batches of items limited
+        in time so that the dialog remains responsive.
+
+        Lazy items have the same selectable state as the dialog active item at the
+        time they are added.
+
+        Args:
+            dlg: Plot dialog
+            objs: Objects for which plot items have to be created
+        """
+        plot = dlg.get_plot()
+        pending = list(reversed(objs))
+        timer = QC.QTimer(dlg)
+        timer.setInterval(0)
+
+        def add_items() -> None:
+            """Add next batch of items"""
+            t0 = time.perf_counter()
+            active = plot.get_active_item()
+            while pending and time.perf_counter() - t0 < LAZY_ITEMS_BATCH_DURATION:
+                obj = pending.pop()
+                main_item = self.plothandler.get(obj.uuid)
+                if main_item is None:  # Object has been removed in the meantime
+                    continue
+                item = obj.make_item(update_from=main_item)
+                item.set_readonly(True)
+                if active is not None:
+                    item.set_selectable(active.can_select())
+                plot.add_item(item, z=0)
+            if not pending:
+                timer.stop()
+            plot.replot()
+
+        timer.timeout.connect(add_items)
+        dlg.finished.connect(timer.stop)
+        timer.start()
+
     def create_new_dialog_for_selection(
         self,
         title: str,
@@ -8,8 +8,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os.path as osp
+from typing import TYPE_CHECKING, Any
 
+import guidata.dataset as gds
 from plotpy.tools import (
     AnnotatedCircleTool,
     AnnotatedEllipseTool,
@@ -25,16 +27,21 @@ from cdl.core.gui.actionhandler import ImageActionHandler
 from cdl.core.gui.panel.base import BaseDataPanel
 from cdl.core.gui.plothandler import ImagePlotHandler
 from cdl.core.gui.processor.image import ImageProcessor
+from cdl.core.io.base import IOAction
 from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.image.base import MultipleImagesFormatBase
+from cdl.core.io.image.formats import DICOMImageFormat
 from cdl.core.model.image import (
     ImageDatatypes,
     ImageObj,
     create_image_from_param,
     new_image_param,
 )
+from cdl.env import execenv
+from cdl.utils.qthelpers import CallbackWorker, qt_long_callback, qt_try_except
 
 if TYPE_CHECKING:
-    import guidata.dataset as gds
+    import numpy as np
     from plotpy.plot import BasePlot
     from qtpy import QtWidgets as QW
 
@@ -42,6 +49,29 @@ if TYPE_CHECKING:
     from cdl.core.model.image import NewImageParam
 
 
+class FrameRangeParam(gds.DataSet):
+    """Frame range parameters (multi-frame image files import)"""
+
+    first = gds.IntItem(_("First frame"), default=0, min=0)
+    last = gds.IntItem(_("Last frame"), default=0, min=0)
+    step = gds.IntItem(_("Step"), default=1, min=1)
+
+
+class DICOMSeriesParam(gds.DataSet):
+    """DICOM series import parameters"""
+
+    directory = gds.DirectoryItem(_("Directory"))
+    stack = gds.BoolItem(
+        "",
+        _("Stack slices"),
+        default=False,
+        help=_(
+            "If checked, slices are stacked in a single image stream (volume), "
+            "otherwise one image is created for each slice"
+        ),
+    )
+
+
 class ImagePanel(BaseDataPanel):
     """Object handling the item list, the selected item properties and plot,
     specialized for Image objects"""
@@ -59,6 +89,7 @@ class ImagePanel(BaseDataPanel):
         LabelTool,
     )
     IO_REGISTRY = ImageIORegistry
+    EXPORT_EXTENSION = "tif"
     H5_PREFIX = "DataLab_Ima"
     ROIDIALOGOPTIONS = {"show_itemlist": True, "show_contrast": False}
     ROIDIALOGCLASS = roieditor.ImageROIEditor
@@ -98,6 +129,38 @@ class ImagePanel(BaseDataPanel):
                 self.objprop.update_properties_from(obj)
 
     # ------Creating, adding, removing objects------------------------------------------
+    def get_read_options(self, filename: str) -> dict[str, Any] | None:
+        """Return format-specific reading options for file: for multi-frame image
+        files containing a lot of frames, user is asked for the frame range to be
+        imported (see `frame_range_min_count` I/O option), and for MAT-Files, for
+        the variables to be imported
+
+        Args:
+            filename: file name
+
+        Returns:
+            Reading options, or None if user canceled
+        """
+        min_count = Conf.io.frame_range_min_count.get()
+        fmt = self.IO_REGISTRY.get_format(filename, IOAction.LOAD)
+        if not isinstance(fmt, MultipleImagesFormatBase):
+            return super().get_read_options(filename)
+        if min_count <= 0 or execenv.unattended:
+            return {}
+        count = fmt.get_frame_count(filename)
+        if count <= min_count:
+            return {}
+        param = FrameRangeParam(
+            _("Frame range"), comment=_("The file contains %d frames.") % count
+        )
+        param.last = count - 1
+        if not param.edit(parent=self.parent()):
+            fmt.release_frame_provider()
+            return None
+        return {
+            "frames": range(param.first, min(param.last, count - 1) + 1, param.step)
+        }
+
     def get_newparam_from_current(
         self, newparam: NewImageParam | None = None, title: str | None = None
     ) -> NewImageParam | None:
@@ -150,6 +213,84 @@ class ImagePanel(BaseDataPanel):
             self.add_object(image)
         return image
 
+    def append_frame(
+        self,
+        oid: str,
+        frame: np.ndarray,
+        depth: int | None = None,
+        stats: bool | None = None,
+    ) -> None:
+        """Append frame to image stream (see :py:meth:`cdl.obj.ImageObj.append_frame`),
+        and update its plot item (plot refreshes are rate-limited).
+
+        Args:
+            oid: image uuid
+            frame: frame data
+            depth: number of frames kept in stream buffer. Defaults to None.
+            stats: if True, maintain running mean and variance images.
+             Defaults to None.
+        """
+        obj: ImageObj = self.objmodel[oid]
+        obj.append_frame(frame, depth, stats)
+        self.plothandler.update_item_data(oid)
+
+    @qt_try_except()
+    def open_dicom_series(
+        self, directory: str | None = None, stack: bool | None = None
+    ) -> list[ImageObj]:
+        """Open DICOM series from directory (see
+        :py:meth:`cdl.core.io.image.formats.DICOMImageFormat.read_series`): slices
+        are sorted from their headers, and pixel data is decoded in parallel
+
+        Args:
+            directory: Directory containing series files (if None, a dialog box is
+             shown)
+            stack: If True, slices are stacked in a single image stream (volume),
+             otherwise one image is created for each slice (in a new group)
+
+        Returns:
+            New objects
+        """
+        param = DICOMSeriesParam(_("Open DICOM series"))
+        if stack is not None:
+            param.stack = stack
+        if directory is None:  # pragma: no cover
+            param.directory = Conf.main.base_dir.get()
+            if not param.edit(parent=self.parent()):
+                return []
+        else:
+            param.directory = directory
+        fmt = DICOMImageFormat()
+        worker = CallbackWorker(
+            lambda worker: fmt.read_series(param.directory, worker, param.stack)
+        )
+        objs = qt_long_callback(self, _("Reading DICOM series"), worker, True)
+        if objs:
+            for obj in objs:
+                obj.metadata["source"] = param.directory
+            if len(objs) > 1:
+                title = osp.basename(osp.normpath(param.directory))
+                self.add_objects(objs, self.add_group(title).uuid)
+            else:
+                self.add_object(objs[0])
+        return objs
+
+    def add_frame_as_image(self, oid: str, index: int = -1) -> ImageObj:
+        """Add image stream frame to panel, as a new image object
+
+        Args:
+            oid: image stream uuid
+            index: frame index in stream buffer (see
+             :py:meth:`cdl.obj.ImageObj.get_frame`). Defaults to -1 (latest frame).
+
+        Returns:
+            New image object
+        """
+        obj: ImageObj = self.objmodel[oid]
+        image = obj.frame_to_image(index)
+        self.add_object(image)
+        return image
+
     def delete_metadata(
         self, refresh_plot: bool = True, keep_roi: bool | None = None
     ) -> None:
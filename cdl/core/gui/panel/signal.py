@@ -36,6 +36,7 @@ from cdl.core.model.signal import (
 
 if TYPE_CHECKING:
     import guidata.dataset as gds
+    import numpy as np
     from qtpy import QtWidgets as QW
 
     from cdl.core.gui.docks import DockablePlotWidget
@@ -59,6 +60,7 @@ class SignalPanel(BaseDataPanel):
         HRangeTool,
     )
     IO_REGISTRY = SignalIORegistry
+    EXPORT_EXTENSION = "csv"
     H5_PREFIX = "DataLab_Sig"
     ROIDIALOGCLASS = roieditor.SignalROIEditor
 
@@ -130,6 +132,26 @@ class SignalPanel(BaseDataPanel):
             self.add_object(signal)
         return signal
 
+    def append_data(
+        self,
+        oid: str,
+        x: np.ndarray,
+        y: np.ndarray,
+        capacity: int | None = None,
+    ) -> None:
+        """Append data points to signal (live signal, see
+        :py:meth:`cdl.obj.SignalObj.append_data`), and update its plot item.
+
+        Args:
+            oid: signal uuid
+            x: X data to append
+            y: Y data to append
+            capacity: maximum number of points kept in signal. Defaults to None.
+        """
+        obj: SignalObj = self.objmodel[oid]
+        obj.append_data(x, y, capacity)
+        self.plothandler.update_item_data(oid)
+
     # ------Plotting--------------------------------------------------------------------
     def toggle_anti_aliasing(self, state: bool) -> None:
         """Toggle anti-aliasing on/off
@@ -36,10 +36,14 @@ import numpy as np
 from plotpy.constants import PlotType
 from plotpy.items import GridItem, LegendBoxItem
 from plotpy.plot import PlotOptions
-from qtpy import QtWidgets as QW
+from qtpy import QtCore as QC
 
 from cdl.config import Conf, _
-from cdl.utils.qthelpers import block_signals, create_progress_bar
+from cdl.utils.qthelpers import (
+    CallbackWorker,
+    block_signals,
+    create_progress_reporter,
+)
 
 if TYPE_CHECKING:
     from plotpy.items import CurveItem, LabelItem, MaskedImageItem
@@ -50,6 +54,11 @@ if TYPE_CHECKING:
     from cdl.core.model.signal import SignalObj
 
 
+#: Maximum rate (in Hz) of plot refreshes following live data updates
+#: (see :py:meth:`BasePlotHandler.update_item_data`)
+LIVE_REFRESH_RATE = 25.0
+
+
 def calc_data_hash(obj: SignalObj | ImageObj) -> str:
     """Calculate a hash for a SignalObj | ImageObj object's data"""
     return hashlib.sha1(np.ascontiguousarray(obj.data)).hexdigest()
@@ -81,6 +90,12 @@ class BasePlotHandler:
         self.__result_items_mapping: WeakKeyDictionary[LabelItem, Callable] = (
             WeakKeyDictionary()
         )
+        # Live data updates: plot is refreshed at a limited rate
+        self.__live_oids: set[str] = set()
+        self.__live_timer = QC.QTimer()
+        self.__live_timer.setSingleShot(True)
+        self.__live_timer.setInterval(int(1000 / LIVE_REFRESH_RATE))
+        self.__live_timer.timeout.connect(self.__refresh_live_items)
 
     def __len__(self) -> int:
         """Return number of items"""
@@ -176,16 +191,15 @@ class BasePlotHandler:
                 # all items except the last one, unblock signals, then add the last one
                 # (this avoids some unnecessary refresh process by PlotPy)
                 with block_signals(self.plot, True):
-                    with create_progress_bar(
+                    with create_progress_reporter(
                         self.panel, _("Creating geometric shapes"), max_=len(items) - 1
                     ) as progress:
                         for i_item, item in enumerate(items[:-1]):
-                            progress.setValue(i_item + 1)
-                            if progress.wasCanceled():
+                            progress.set_value(i_item + 1)
+                            if progress.was_canceled():
                                 break
                             self.plot.add_item(item)
                             self.__shapeitems.append(item)
-                            QW.QApplication.processEvents()
                 self.plot.add_item(items[-1])
                 self.__shapeitems.append(items[-1])
 
@@ -234,10 +248,50 @@ class BasePlotHandler:
             cached_hash = self.__cached_hashes.get(obj)
             new_hash = calc_data_hash(obj)
             data_changed = cached_hash is None or cached_hash != new_hash
+            if cached_hash is not None and data_changed:
+                # Data has been modified in place: invalidate cached results
+                obj.set_data_modified()
             self.__cached_hashes[obj] = new_hash
             obj.update_item(self[oid], data_changed=data_changed)
         self.update_item_according_to_ref_item(self[oid], ref_item)
 
+    def update_item_data(self, oid: str) -> None:
+        """Update plot item after its object data has been updated (e.g. points
+        appended to a live signal).
+
+        This is a fast path compared to :py:meth:`refresh_plot`: the existing item is
+        updated with the new data (no item creation, no data hash computation), and
+        the plot is refreshed at a limited rate (see :py:data:`LIVE_REFRESH_RATE`),
+        so that data may be updated at a much higher rate than the plot.
+
+        Args:
+            oid: object uuid
+        """
+        obj = self.panel.objmodel[oid]
+        # Data hash is not updated here (this would require to process the whole
+        # data): the item will be updated anyway on next plot refresh
+        self.__cached_hashes.pop(obj, None)
+        item = self.get(oid)
+        if item is not None and item.isVisible():
+            self.__live_oids.add(oid)
+            if not self.__live_timer.isActive():
+                self.__live_timer.start()
+
+    def __refresh_live_items(self) -> None:
+        """Refresh plot items of live objects (see :py:meth:`update_item_data`)"""
+        autoscale = False
+        for oid in self.__live_oids:
+            item = self.get(oid)
+            if item is None:
+                continue  # Object has been removed in the meantime
+            obj = self.panel.objmodel[oid]
+            obj.update_item(item)
+            autoscale = autoscale or obj.autoscale
+        self.__live_oids.clear()
+        if autoscale:
+            self.plot.do_autoscale(replot=False)
+        self.plot.replot()
+
     @staticmethod
     def update_item_according_to_ref_item(
         item: MaskedImageItem, ref_item: MaskedImageItem
@@ -328,13 +382,13 @@ class BasePlotHandler:
             if self.__show_first_only:
                 oids = oids[:1]
             ref_item = None
-            with create_progress_bar(
+            with create_progress_reporter(
                 self.panel, _("Creating plot items"), max_=len(oids)
             ) as progress:
                 # Iterate over objects
                 for i_obj, oid in enumerate(oids):
-                    progress.setValue(i_obj + 1)
-                    if progress.wasCanceled():
+                    progress.set_value(i_obj + 1)
+                    if progress.was_canceled():
                         break
                     obj = self.panel.objmodel[oid]
 
@@ -424,6 +478,9 @@ class BasePlotHandler:
             ]
         )
 
+    def close(self) -> None:
+        """Close plot handler (this is called when closing the panel)"""
+
     def get_current_plot_options(self) -> PlotOptions:
         """Return standard signal/image plot options"""
         return PlotOptions(
@@ -461,6 +518,84 @@ class ImagePlotHandler(BasePlotHandler):
 
     PLOT_TYPE = PlotType.IMAGE
 
+    def __init__(
+        self,
+        panel: BaseDataPanel,
+        plotwidget: PlotWidget,
+    ) -> None:
+        super().__init__(panel, plotwidget)
+        # LUT range workers: key = object uuid, value = worker computing the exact
+        # LUT range in a separate thread
+        self.__lut_workers: dict[str, CallbackWorker] = {}
+
+    def refine_lut_ranges(self) -> None:
+        """Compute the exact LUT range of shown images in background threads
+
+        When an image plot item is created, its LUT range is estimated on a sample
+        of the data (see :py:meth:`cdl.obj.ImageObj.get_lut_range`): this method
+        starts the computation of the exact LUT range for each shown image for which
+        it has not been computed yet. The plot item is updated as soon as the
+        exact LUT range is available, unless its LUT range has been changed
+        in the meantime.
+        """
+        for oid in self.panel.objmodel.get_object_ids():
+            item = self.get(oid)
+            if item is None or not item.isVisible() or oid in self.__lut_workers:
+                continue
+            obj: ImageObj = self.panel.objmodel[oid]
+            if obj.is_lut_range_exact():
+                continue
+            estimate = obj.get_lut_range()
+            # The exact LUT range is computed in a worker thread, but it is cached
+            # in the object from the GUI thread only (see `__lut_range_refined`)
+            worker = CallbackWorker(obj.compute_exact_lut_range)
+            worker.finished.connect(
+                lambda oid=oid, estimate=estimate: self.__lut_range_refined(
+                    oid, estimate
+                )
+            )
+            self.__lut_workers[oid] = worker
+            worker.start()
+
+    def __lut_range_refined(self, oid: str, estimate: tuple[float, float]) -> None:
+        """Exact LUT range has been computed: update plot item(s)
+
+        Args:
+            oid: object uuid
+            estimate: estimated LUT range, which was used to create the plot item
+        """
+        worker = self.__lut_workers.pop(oid)
+        try:
+            version, percent, lut_range = worker.get_result()
+            obj: ImageObj = self.panel.objmodel[oid]
+        except Exception:  # pylint: disable=broad-except
+            # Object may have been removed in the meantime:
+            # the estimated LUT range is kept
+            return
+        if not obj.set_exact_lut_range(version, percent, lut_range):
+            # Object data has been modified in the meantime: the LUT range is
+            # obsolete
+            return
+        items = [self.get(oid)]
+        if Conf.view.ima_ref_lut_range.get():
+            # Images shown with the reference item LUT range are updated as well
+            items += [item for item in self if item is not None and item.isVisible()]
+        updated = False
+        for item in items:
+            if item is not None and tuple(item.get_lut_range()) == tuple(estimate):
+                item.set_lut_range(lut_range)
+                self.plot.update_colormap_axis(item)
+                updated = True
+        if updated:
+            self.plot.replot()
+
+    def close(self) -> None:
+        """Close plot handler (this is called when closing the panel)"""
+        for worker in self.__lut_workers.values():
+            worker.wait()
+        self.__lut_workers.clear()
+        super().close()
+
     @staticmethod
     def update_item_according_to_ref_item(
         item: MaskedImageItem, ref_item: MaskedImageItem
@@ -492,6 +627,7 @@ class ImagePlotHandler(BasePlotHandler):
         """
         super().refresh_plot(what=what, update_items=update_items, force=force)
         self.plotwidget.contrast.setVisible(Conf.view.show_contrast.get(True))
+        self.refine_lut_ranges()
 
     def cleanup_dataview(self) -> None:
         """Clean up data view"""
@@ -30,7 +30,11 @@ from cdl.computation.base import ROIDataParam
 from cdl.config import Conf, _
 from cdl.core.gui.processor.catcher import CompOut, wng_err_func
 from cdl.core.model.base import ResultProperties, ResultShape
-from cdl.utils.qthelpers import create_progress_bar, qt_try_except
+from cdl.utils.qthelpers import (
+    ProgressReporter,
+    create_progress_reporter,
+    qt_try_except,
+)
 from cdl.widgets.warningerror import show_warning_error
 
 if TYPE_CHECKING:
@@ -80,6 +84,11 @@ COMPUTATION_TIP = _(
 POOL: Pool | None = None
 
 
+class ComputationError(Exception):
+    """Computation error, raised instead of being shown in a message box when
+    computation errors are raised (see :py:attr:`BaseProcessor.raise_errors`)"""
+
+
 class Worker:
     """Multiprocessing worker, to run long-running tasks in a separate process"""
 
@@ -173,6 +182,10 @@ class BaseProcessor(QC.QObject):
         self.panel = panel
         self.plotwidget = plotwidget
         self.worker: Worker | None = None
+        # If True, computation errors are raised as `ComputationError` exceptions
+        # instead of being shown in a message box, and warnings are not shown (this
+        # is used when no user interaction is expected, e.g. batch operations)
+        self.raise_errors = False
         self.set_process_isolation_enabled(Conf.main.process_isolation_enabled.get())
 
     def close(self):
@@ -299,7 +312,7 @@ class BaseProcessor(QC.QObject):
         self._compute_11_subroutine(funcs, params, title)
 
     def handle_output(
-        self, compout: CompOut, context: str, progress: QW.QProgressDialog
+        self, compout: CompOut, context: str, progress: ProgressReporter
     ) -> SignalObj | ImageObj | ResultShape | ResultProperties | None:
         """Handle computation output: if error, display error message,
         if warning, display warning message.
@@ -307,22 +320,30 @@ class BaseProcessor(QC.QObject):
         Args:
             compout: computation output
             context: context (e.g. "Computing: Gaussian filter")
-            progress: progress dialog
+            progress: progress reporter
 
         Returns:
             Output object: a signal or image object, or a result shape object,
              or None if error
+
+        Raises:
+            ComputationError: if error and errors are raised (see
+             :py:attr:`raise_errors`)
         """
+        if self.raise_errors:
+            if compout.error_msg:
+                raise ComputationError(f"{context}: {compout.error_msg}")
+            return compout.result
         if compout.error_msg or compout.warning_msg:
-            mindur = progress.minimumDuration()
-            progress.setMinimumDuration(1000000)
+            mindur = progress.dialog.minimumDuration()
+            progress.dialog.setMinimumDuration(1000000)
             if compout.error_msg:
                 show_warning_error(
                     self.panel, "error", context, compout.error_msg, COMPUTATION_TIP
                 )
             if compout.warning_msg:
                 show_warning_error(self.panel, "warning", context, compout.warning_msg)
-            progress.setMinimumDuration(mindur)
+            progress.dialog.setMinimumDuration(mindur)
             if compout.error_msg:
                 return None
         return compout.result
@@ -331,27 +352,27 @@ class BaseProcessor(QC.QObject):
         self,
         func: Callable,
         args: tuple,
-        progress: QW.QProgressDialog,
+        progress: ProgressReporter,
     ) -> CompOut | None:
         """Execute function, eventually in a separate process.
 
         Args:
             func: function to execute
             args: function arguments
-            progress: progress dialog
+            progress: progress reporter
 
         Returns:
             Computation output object or None if canceled
         """
-        QW.QApplication.processEvents()
-        if not progress.wasCanceled():
+        # Qt events are processed by the progress reporter (at a limited rate)
+        if not progress.was_canceled():
             if self.worker is None:
                 return wng_err_func(func, args)
             self.worker.run(func, args)
             while not self.worker.is_computation_finished():
                 QW.QApplication.processEvents()
                 time.sleep(0.1)
-                if progress.wasCanceled():
+                if progress.was_canceled():
                     self.worker.restart_pool()
                     break
             if self.worker.is_computation_finished():
@@ -372,17 +393,15 @@ class BaseProcessor(QC.QObject):
         objs = self.panel.objview.get_sel_objects(include_groups=True)
         grps = self.panel.objview.get_sel_groups()
         new_gids = {}
-        with create_progress_bar(
+        with create_progress_reporter(
             self.panel, title, max_=len(objs) * len(params)
         ) as progress:
             for i_row, obj in enumerate(objs):
                 for i_param, (param, func) in enumerate(zip(params, funcs)):
                     name = func.__name__.replace("compute_", "")
                     i_title = f"{title} ({i_row + 1}/{len(objs)})"
-                    progress.setLabelText(i_title)
-                    pvalue = (i_row + 1) * (i_param + 1)
-                    pvalue = 0 if pvalue == 1 else pvalue
-                    progress.setValue(pvalue)
+                    progress.set_label(i_title)
+                    progress.set_value(i_row * len(params) + i_param)
                     args = (obj,) if param is None else (obj, param)
                     result = self.__exec_func(func, args, progress)
                     if result is None:
@@ -449,14 +468,12 @@ class BaseProcessor(QC.QObject):
         objs = self.panel.objview.get_sel_objects(include_groups=True)
         current_obj = self.panel.objview.get_current_object()
         title = func.__name__.replace("compute_", "") if title is None else title
-        with create_progress_bar(self.panel, title, max_=len(objs)) as progress:
+        with create_progress_reporter(self.panel, title, max_=len(objs)) as progress:
             results: dict[str, ResultShape | ResultProperties] = {}
             xlabels = None
             ylabels = []
             for idx, obj in enumerate(objs):
-                pvalue = idx + 1
-                pvalue = 0 if pvalue == 1 else pvalue
-                progress.setValue(pvalue)
+                progress.set_value(idx)
                 args = (obj,) if param is None else (obj, param)
 
                 # Execute function
@@ -538,10 +555,9 @@ class BaseProcessor(QC.QObject):
         # [src_objs dictionary] keys: old group id, values: list of old objects
         src_objs: dict[str, list[Obj]] = {}
 
-        with create_progress_bar(self.panel, title, max_=len(objs)) as progress:
+        with create_progress_reporter(self.panel, title, max_=len(objs)) as progress:
             for index, src_obj in enumerate(objs):
-                progress.setValue(index + 1)
-                progress.setLabelText(title)
+                progress.set_value(index)
                 src_gid = self.panel.objmodel.get_object_group_id(src_obj)
                 dst_obj = dst_objs.get(src_gid)
                 if dst_obj is None:
@@ -633,10 +649,9 @@ class BaseProcessor(QC.QObject):
                 return
         objs = self.panel.objview.get_sel_objects(include_groups=True)
         # name = func.__name__.replace("compute_", "")
-        with create_progress_bar(self.panel, title, max_=len(objs)) as progress:
+        with create_progress_reporter(self.panel, title, max_=len(objs)) as progress:
             for index, obj in enumerate(objs):
-                progress.setValue(index + 1)
-                progress.setLabelText(title)
+                progress.set_value(index)
                 args = (obj, obj2) if param is None else (obj, obj2, param)
                 result = self.__exec_func(func, args, progress)
                 if result is None:
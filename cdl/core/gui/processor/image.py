@@ -28,7 +28,7 @@ from cdl.core.gui.processor.base import BaseProcessor
 from cdl.core.gui.profiledialog import ProfileExtractionDialog
 from cdl.core.model.base import ResultProperties, ResultShape
 from cdl.core.model.image import ImageObj, ROI2DParam, RoiDataGeometries
-from cdl.utils.qthelpers import create_progress_bar, qt_try_except
+from cdl.utils.qthelpers import create_progress_reporter, qt_try_except
 from cdl.widgets import imagebackground
 
 
@@ -135,11 +135,10 @@ class ImageProcessor(BaseProcessor):
         objs = self.panel.objview.get_sel_objects(include_groups=True)
         g_row, g_col, x0, y0, x0_0, y0_0 = 0, 0, 0.0, 0.0, 0.0, 0.0
         delta_x0, delta_y0 = 0.0, 0.0
-        with create_progress_bar(self.panel, title, max_=len(objs)) as progress:
+        with create_progress_reporter(self.panel, title, max_=len(objs)) as progress:
             for i_row, obj in enumerate(objs):
-                progress.setValue(i_row + 1)
-                QW.QApplication.processEvents()
-                if progress.wasCanceled():
+                progress.set_value(i_row + 1)
+                if progress.was_canceled():
                     break
                 if i_row == 0:
                     x0_0, y0_0 = x0, y0 = obj.x0, obj.y0
@@ -1025,13 +1024,12 @@ class ImageProcessor(BaseProcessor):
             title=_("Peak detection"),
         )
         if results is not None and param.create_rois and len(results.items()) > 1:
-            with create_progress_bar(
+            with create_progress_reporter(
                 self.panel, _("Create regions of interest"), max_=len(results)
             ) as progress:
                 for idx, (oid, result) in enumerate(results.items()):
-                    progress.setValue(idx + 1)
-                    QW.QApplication.processEvents()
-                    if progress.wasCanceled():
+                    progress.set_value(idx + 1)
+                    if progress.was_canceled():
                         break
                     obj = self.panel.objmodel[oid]
                     dist = distance_matrix(result.raw_data)
@@ -83,6 +83,69 @@ class IOSettings(gds.DataSet):
     g0 = gds.BeginGroup(_("Settings for I/O operations"))
     h5_fullpath_in_title = gds.BoolItem("", _("HDF5 full path in title"))
     h5_fname_in_title = gds.BoolItem("", _("HDF5 file name in title"))
+    h5_compression = gds.ChoiceItem(
+        _("HDF5 compression"),
+        (("none", _("None")), ("gzip", _("Fast gzip")), ("lzf", "LZF")),
+        help=_("Compression of signal and image data when saving HDF5 files"),
+    )
+    h5_incremental_save = gds.BoolItem(
+        "",
+        _("Incremental HDF5 save"),
+        help=_(
+            "When saving to the current workspace file, "
+            "only new or modified objects are written"
+        ),
+    )
+    h5_lazy_open = gds.BoolItem(
+        "",
+        _("Lazy HDF5 open"),
+        help=_(
+            "When opening a workspace file, signal and image data are read "
+            "only when objects are displayed or processed"
+        ),
+    )
+    h5_lazy_prefetch = gds.BoolItem(
+        "",
+        _("Load data in background"),
+        help=_("Lazy HDF5 open: load signal and image data in background"),
+    )
+    h5_stack_max_frames = gds.IntItem(
+        _("HDF5 image stack frames"),
+        min=1,
+        unit=_("frames"),
+        help=_(
+            "Maximum number of frames kept when importing an HDF5 image stack "
+            "being written (SWMR mode): the oldest frames are dropped beyond "
+            "this number"
+        ),
+    )
+    tiff_compression = gds.ChoiceItem(
+        _("TIFF compression"),
+        (("none", _("None")), ("zlib", "Deflate"), ("lzma", "LZMA")),
+        help=_("Compression of images saved to TIFF files"),
+    )
+    mat_compression = gds.BoolItem(
+        "",
+        _("MAT-File compression"),
+        help=_("Compression of signals and images saved to MAT-Files"),
+    )
+    lazy_frame_import = gds.BoolItem(
+        "",
+        _("Lazy multi-frame import"),
+        help=_(
+            "When importing multi-frame image files supporting it (e.g. Andor SIF), "
+            "frame data is read only when images are displayed or processed"
+        ),
+    )
+    frame_range_min_count = gds.IntItem(
+        _("Frame range selection"),
+        min=0,
+        unit=_("frames"),
+        help=_(
+            "Frame range selection dialog is shown when importing a file "
+            "containing more than this number of frames (0: never show the dialog)"
+        ),
+    )
     _g0 = gds.EndGroup("")
 
 
@@ -122,6 +122,48 @@ class BaseIORegistry(type):
         """
         return cls.get_filters(IOAction.SAVE)
 
+    @classmethod
+    def get_read_extensions(cls) -> list[str]:
+        """Return file extensions supported for reading
+
+        Returns:
+            List of file extensions (e.g. ["csv", "npy"])
+        """
+        extensions = []
+        for fmt in cls.get_formats():
+            if fmt.info.readable:
+                extensions += [ext for ext in fmt.extlist if ext not in extensions]
+        return extensions
+
+    @classmethod
+    def get_read_patterns(cls) -> list[str]:
+        """Return file name patterns supported for reading: unlike file extensions
+        (see :py:meth:`get_read_extensions`), patterns include multi-part extensions
+
+        Returns:
+            List of lower-case file name patterns (e.g. ["*.csv", "*.csv.gz"])
+        """
+        patterns = []
+        for fmt in cls.get_formats():
+            if fmt.info.readable:
+                for pattern in fmt.info.extensions.lower().split():
+                    if pattern not in patterns:
+                        patterns.append(pattern)
+        return patterns
+
+    @classmethod
+    def get_write_extensions(cls) -> list[str]:
+        """Return file extensions supported for writing
+
+        Returns:
+            List of file extensions (e.g. ["csv", "npy"])
+        """
+        extensions = []
+        for fmt in cls.get_formats():
+            if fmt.info.writeable:
+                extensions += [ext for ext in fmt.extlist if ext not in extensions]
+        return extensions
+
     @classmethod
     def get_format(cls, filename: str, action: IOAction) -> FormatBase:
         """Return format handler for filename
@@ -149,13 +191,18 @@ class BaseIORegistry(type):
         )
 
     @classmethod
-    def read(cls, filename: str, worker: CallbackWorker | None = None) -> list[BaseObj]:
+    def read(
+        cls, filename: str, worker: CallbackWorker | None = None, **kwargs
+    ) -> list[BaseObj]:
         """Read data from file, return native object (signal or image) list.
         For single object, return a list with one object.
 
         Args:
             filename: file name
             worker: Callback worker object
+            kwargs: format-specific reading options (e.g. `frames` for multi-frame
+             image formats, see
+             :py:class:`cdl.core.io.image.base.MultipleImagesFormatBase`)
 
         Raises:
             NotImplementedError: if file data type is not supported
@@ -164,21 +211,72 @@ class BaseIORegistry(type):
             List of native objects (signal or image)
         """
         fmt = cls.get_format(filename, IOAction.LOAD)
-        return fmt.read(filename, worker)
+        return fmt.read(filename, worker, **kwargs)
 
     @classmethod
-    def write(cls, filename: str, obj: BaseObj) -> None:
+    def write(
+        cls, filename: str, obj: BaseObj, worker: CallbackWorker | None = None
+    ) -> None:
         """Write data to file from native object (signal or image).
 
         Args:
             filename: file name
             obj: native object (signal or image)
+            worker: Callback worker object
 
         Raises:
             NotImplementedError: if file data type is not supported
         """
         fmt = cls.get_format(filename, IOAction.SAVE)
-        fmt.write(filename, obj)
+        fmt.write(filename, obj, worker)
+
+
+def get_export_filenames(
+    objs: list[BaseObj],
+    directory: str,
+    basename: str,
+    extension: str,
+    overwrite: bool = False,
+) -> list[str]:
+    """Return file names for exporting objects to a directory
+
+    Args:
+        objs: objects to be exported
+        directory: destination directory
+        basename: basename pattern (Python format string), supporting the following
+         fields: `{title}`, `{short_id}` and `{index}` (object index, starting at 1,
+         e.g. `{index:03d}`)
+        extension: file extension (e.g. ".tif")
+        overwrite: if True, existing files are overwritten, otherwise a numeric
+         suffix is added to the file name (a suffix is always added to avoid
+         duplicate file names among the exported objects)
+
+    Returns:
+        List of file names (one per object)
+
+    Raises:
+        ValueError: if basename pattern is invalid (e.g. unknown field)
+    """
+    if not extension.startswith("."):
+        extension = "." + extension
+    filenames: list[str] = []
+    for index, obj in enumerate(objs, start=1):
+        try:
+            name = basename.format(title=obj.title, short_id=obj.short_id, index=index)
+        except (AttributeError, IndexError, KeyError, ValueError) as exc:
+            raise ValueError(
+                f"Invalid basename pattern {basename!r}: "
+                f"{exc.__class__.__name__}: {exc}"
+            ) from exc
+        # Replacing characters which are not allowed in file names
+        name = re.sub(r'[\x00-\x1f\\/:*?"<>|]', "_", name).strip() or str(index)
+        stem = osp.join(directory, name)
+        filename, suffix = stem + extension, 1
+        while filename in filenames or (not overwrite and osp.exists(filename)):
+            suffix += 1
+            filename = f"{stem}_{suffix}{extension}"
+        filenames.append(filename)
+    return filenames
 
 
 def get_file_extensions(string: str) -> list[str]:
@@ -275,12 +373,15 @@ class FormatBase:
         """
         raise NotImplementedError(f"Reading from {self.info.name} is not supported")
 
-    def write(self, filename: str, obj: BaseObj) -> None:
+    def write(
+        self, filename: str, obj: BaseObj, worker: CallbackWorker | None = None
+    ) -> None:
         """Write data to file
 
         Args:
             filename: file name
             obj: native object (signal or image)
+            worker: Callback worker object
 
         Raises:
             NotImplementedError: if format is not supported
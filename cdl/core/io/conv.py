@@ -8,6 +8,8 @@ DataLab I/O conversion functions
 
 from __future__ import annotations
 
+import re
+
 import numpy as np
 import skimage.util
 
@@ -84,3 +86,36 @@ def convert_array_to_standard_type(array: np.ndarray) -> np.ndarray:
         return array
 
     raise ValueError("Unsupported data type")
+
+
+def format_text_rows(
+    data: np.ndarray,
+    delimiter: str = ",",
+    fmt: str = "%r",
+    na_rep: str | None = None,
+) -> str:
+    """Format data rows as delimited text (e.g. CSV), in a single string formatting
+    operation.
+
+    Args:
+        data: Data array (rows x columns)
+        delimiter: Delimiter
+        fmt: Value format (default: "%r", i.e. shortest representation which
+         round-trips, as Python's `repr`)
+        na_rep: Representation of NaN values of real data (default: None, i.e.
+         NaN values are formatted with `fmt`)
+
+    Returns:
+        Text (one line per row, each line ending with a newline character)
+    """
+    if data.size == 0:
+        return ""
+    line = delimiter.join([fmt] * data.shape[1]) + "\n"
+    text = (line * data.shape[0]) % tuple(data.ravel().tolist())
+    if na_rep is not None and data.dtype.kind == "f" and np.isnan(data).any():
+        # Replacing NaN fields only (i.e. preceded and followed by a delimiter, a
+        # newline character or the start of text)
+        sep = re.escape(delimiter)
+        nan = re.escape(fmt % np.nan)
+        text = re.sub(rf"(?<![^{sep}\n]){nan}(?=[{sep}\n])", na_rep, text)
+    return text
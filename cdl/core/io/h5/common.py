@@ -9,8 +9,10 @@ DataLab Common tools for exogenous HDF5 format support
 from __future__ import annotations
 
 import abc
+import dataclasses
 import os.path as osp
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 import h5py
 import numpy as np
@@ -19,6 +21,10 @@ from cdl.config import Conf
 from cdl.core.io.conv import convert_array_to_standard_type, data_to_xy
 from cdl.utils.strings import to_string
 
+if TYPE_CHECKING:
+    from cdl.core.model.image import ImageObj
+    from cdl.core.model.signal import SignalObj
+
 
 class BaseNode(metaclass=abc.ABCMeta):
     """Object representing a HDF5 node"""
@@ -84,12 +90,42 @@ class BaseNode(metaclass=abc.ABCMeta):
         """Create native object, if supported"""
         return None
 
+    def get_growth_axis(self) -> int | None:
+        """Return axis along which dataset grows when it is still being written (see
+        :py:class:`H5Follower`), or None if node data may not be followed"""
+        return None
+
+    def is_resizable(self, axis: int) -> bool:
+        """Return True if dataset may grow along axis (chunked dataset whose maximum
+        shape is larger than its current shape)"""
+        maxsize = self.dset.maxshape[axis]
+        return maxsize is None or maxsize > self.dset.shape[axis]
+
+    def append_to_object(
+        self, obj: SignalObj | ImageObj, data: np.ndarray, start: int
+    ) -> None:
+        """Append data to object created from node (see :py:class:`H5Follower`).
+        Default implementation does nothing: nodes which may be followed (see
+        :py:meth:`get_growth_axis`) override this method.
+
+        Args:
+            obj: Object created from node
+            data: Data appended to dataset since object creation or last call,
+             along growth axis (see :py:meth:`get_growth_axis`)
+            start: Index of the first appended item, along growth axis
+        """
+
+    def get_preview_object(self):
+        """Return native object for preview, if supported (this may be a decimated
+        version of the native object: by default, this is the native object)"""
+        return self.get_native_object()
+
     def get_native_object(self):
         """Return native object, if supported"""
         if self.__obj is None:
             obj = self.create_native_object()  # pylint: disable=assignment-from-none
             if obj is not None:
-                self.__process_metadata(obj)
+                self.process_metadata(obj)
             self.__obj = obj
         return self.__obj
 
@@ -103,7 +139,7 @@ class BaseNode(metaclass=abc.ABCMeta):
             ):
                 self.metadata[key] = value
 
-    def __process_metadata(self, obj):
+    def process_metadata(self, obj):
         """Process metadata from dataset to obj"""
         obj.reset_metadata_to_defaults()
         obj.metadata["HDF5Path"] = self.h5file.filename
@@ -121,54 +157,119 @@ class BaseNode(metaclass=abc.ABCMeta):
             title += f" ({osp.basename(self.h5file.filename)})"
         return title
 
-    def set_signal_data(self, obj):
-        """Set signal data (handles various issues)"""
-        data = self.data
+    def set_signal_data(self, obj, data=None, step: int = 1):
+        """Set signal data (handles various issues)
+
+        Args:
+            obj: Signal object
+            data: Data (default: node data)
+            step: Decimation step of data (used to compute X coordinates of 1D data)
+        """
+        data = self.data if data is None else data
         if data.dtype not in (float, np.complex128):
             data = np.array(data, dtype=float)
         data = convert_array_to_standard_type(data)
         if len(data.shape) == 1:
-            obj.set_xydata(np.arange(data.size), data)
+            obj.set_xydata(np.arange(data.size) * step, data)
         else:
             x, y, dx, dy = data_to_xy(data)
             obj.set_xydata(x, y, dx, dy)
 
-    def set_image_data(self, obj):
-        """Set image data (handles various issues)"""
-        data = self.data
+    def set_image_data(self, obj, data=None):
+        """Set image data (handles various issues)
+
+        Args:
+            obj: Image object
+            data: Data (default: node data)
+        """
+        data = self.data if data is None else data
+        obj.data = self.convert_image_data(data)
+
+    def convert_image_data(self, data: np.ndarray) -> np.ndarray:
+        """Convert image data to a standard data type (uint32 data is clipped)
+
+        Args:
+            data: Image data
+
+        Returns:
+            Converted image data
+        """
         if data.dtype == np.uint32:
             self.uint32_wng = data.max() > np.iinfo(np.int32).max
             clipped_data = data.clip(0, np.iinfo(np.int32).max)
             data = np.array(clipped_data, dtype=np.int32)
-        obj.data = convert_array_to_standard_type(data)
+        return convert_array_to_standard_type(data)
 
 
 class H5Importer:
-    """DataLab HDF5 importer class"""
-
-    def __init__(self, filename):
-        self.h5file = h5py.File(filename)
+    """DataLab HDF5 importer class
+
+    Nodes are discovered lazily: only the root group children are collected when
+    opening the file, and other groups are collected when expanded (see
+    :py:meth:`expand`) or when one of their descendants is requested (see
+    :py:meth:`get`). Post-collect triggers are run on newly collected nodes only.
+
+    Args:
+        filename: HDF5 file name
+        swmr: If True, open file in SWMR (single-writer multiple-reader) read mode,
+         so that a file still being written by another process may be read (see
+         :py:class:`H5Follower`)
+    """
+
+    def __init__(self, filename, swmr: bool = False):
+        self.h5file = h5py.File(filename, "r", swmr=swmr)
         self.__nodes = {}
         self.root = RootNode(self.h5file)
         self.__nodes[self.root.id] = self.root
-        self.root.collect_children(self.__nodes)
-        NODE_FACTORY.run_post_triggers(self)
+        self.expand(self.root)
 
     @property
     def nodes(self):
-        """Return all nodes"""
+        """Return all nodes collected so far"""
         return self.__nodes.values()
 
+    def expand(self, node: BaseNode, recursive: bool = False) -> list[BaseNode]:
+        """Collect group node children, if not already done
+
+        Args:
+            node: Node to expand (nothing is done if node is not a group)
+            recursive: If True, expand children recursively
+
+        Returns:
+            List of newly collected nodes
+        """
+        new_nodes = []
+        if isinstance(node, GroupNode) and not node.is_collected:
+            new_nodes = node.collect_children(self.__nodes)
+            NODE_FACTORY.run_post_triggers(self, new_nodes)
+        if recursive:
+            for child in node.children:
+                new_nodes.extend(self.expand(child, recursive=True))
+        return new_nodes
+
+    def get_all_nodes(self) -> list[BaseNode]:
+        """Return all nodes (the whole file is walked through)"""
+        self.expand(self.root, recursive=True)
+        return list(self.nodes)
+
     def get(self, node_id: str):
         """Return node associated to id"""
-        return self.__nodes[node_id]
+        node = self.__nodes.get(node_id)
+        if node is None:
+            # Collecting ancestor groups, from the root group:
+            path = ""
+            for name in node_id.strip("/").split("/")[:-1]:
+                path += "/" + name
+                self.expand(self.__nodes[path])
+            node = self.__nodes[node_id]
+        return node
 
     def get_relative(self, node: BaseNode, relpath: str, ancestor: int = 0):
         """Return node using relative path to another node"""
         path = "/" + (
             "/".join(node.id.split("/")[:-ancestor]) + "/" + relpath.strip("/")
         ).strip("/")
-        return self.__nodes[path]
+        return self.get(path)
 
     def close(self):
         """Close HDF5 file"""
@@ -176,6 +277,110 @@ class H5Importer:
         self.h5file.close()
 
 
+@dataclasses.dataclass
+class FollowedNode:
+    """Node followed by :py:class:`H5Follower`
+
+    Args:
+        node: HDF5 node
+        obj: Object created from node
+        axis: Growth axis (see :py:meth:`BaseNode.get_growth_axis`)
+        size: Number of items already loaded, along growth axis
+    """
+
+    node: BaseNode
+    obj: SignalObj | ImageObj
+    axis: int
+    size: int
+
+
+class H5Follower:
+    """HDF5 file follower (SWMR follow mode)
+
+    The file is opened in SWMR read mode (see :py:class:`H5Importer`), so that it may
+    be read while it is still being written (e.g. by an acquisition system). Objects
+    created from followed datasets are updated with the data appended to the datasets
+    (new rows or frames) since the last refresh: data already loaded is never read
+    again.
+
+    Args:
+        filename: HDF5 file name
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.importer = H5Importer(filename, swmr=True)
+        self.__followed: dict[str, FollowedNode] = {}
+
+    @property
+    def filename(self) -> str:
+        """Return HDF5 file name"""
+        return self.importer.h5file.filename
+
+    def get_objects(self) -> list[SignalObj | ImageObj]:
+        """Return followed objects"""
+        return [followed.obj for followed in self.__followed.values()]
+
+    def follow(self, node_id: str) -> SignalObj | ImageObj | None:
+        """Create object from dataset, and follow dataset
+
+        Args:
+            node_id: Node id (dataset path)
+
+        Returns:
+            New object, or None if dataset is not supported
+
+        Raises:
+            ValueError: if dataset may not be followed (e.g. dataset is not chunked)
+        """
+        node = self.importer.get(node_id)
+        axis = node.get_growth_axis()
+        if axis is None:
+            raise ValueError(f"Dataset {node_id} may not be followed")
+        node.dset.refresh()
+        size = node.dset.shape[axis]
+        # Not using the object cached by the node, which may have been created from
+        # a previous state of the dataset:
+        obj = node.create_native_object()
+        if obj is not None:
+            node.process_metadata(obj)
+            self.__followed[obj.uuid] = FollowedNode(node, obj, axis, size)
+        return obj
+
+    def unfollow(self, uuid: str) -> None:
+        """Stop following dataset associated to object
+
+        Args:
+            uuid: Object uuid
+        """
+        self.__followed.pop(uuid, None)
+
+    def refresh(self) -> list[SignalObj | ImageObj]:
+        """Refresh followed datasets, and append new data to objects
+
+        Returns:
+            Updated objects
+        """
+        updated = []
+        for followed in self.__followed.values():
+            dset = followed.node.dset
+            dset.refresh()
+            size = dset.shape[followed.axis]
+            if size <= followed.size:
+                continue
+            selection = [slice(None)] * dset.ndim
+            selection[followed.axis] = slice(followed.size, size)
+            data = dset[tuple(selection)]
+            followed.node.append_to_object(followed.obj, data, followed.size)
+            followed.size = size
+            updated.append(followed.obj)
+        return updated
+
+    def close(self) -> None:
+        """Close HDF5 file"""
+        self.__followed.clear()
+        self.importer.close()
+
+
 class NodeFactory:
     """Factory for node classes"""
 
@@ -190,11 +395,18 @@ class NodeFactory:
         self.__ignored_datasets.extend(names)
 
     def add_post_trigger(self, nodecls: BaseNode, callback: Callable):
-        """Add post trigger function, to be called at the end of the collect process.
-        Callbacks take only one argument: H5Importer instance."""
+        """Add post trigger function, to be called at the end of the collect process
+        for each collected node of class `nodecls` (nodes are collected lazily, group
+        by group). Callbacks take two arguments: node and H5Importer instance."""
         triggers = self.__post_triggers.setdefault(nodecls, [])
         triggers.append(callback)
 
+    def remove_post_trigger(self, nodecls: BaseNode, callback: Callable):
+        """Remove post trigger function (see :py:meth:`add_post_trigger`)"""
+        triggers = self.__post_triggers.get(nodecls, [])
+        if callback in triggers:
+            triggers.remove(callback)
+
     def register(self, cls, is_generic=False):
         """Register node class.
         Generic classes are processed after specific classes (as a fallback solution)"""
@@ -215,9 +427,16 @@ class NodeFactory:
             return GroupNode
         return None
 
-    def run_post_triggers(self, importer: H5Importer):
-        """Run post-collect callbacks"""
-        for node in importer.nodes:
+    def run_post_triggers(
+        self, importer: H5Importer, nodes: list[BaseNode] | None = None
+    ):
+        """Run post-collect callbacks
+
+        Args:
+            importer: HDF5 importer
+            nodes: Nodes to process (default: all nodes collected so far)
+        """
+        for node in importer.nodes if nodes is None else nodes:
             for nodecls, triggers in self.__post_triggers.items():
                 if isinstance(node, nodecls):
                     for func in triggers:
@@ -235,17 +454,36 @@ class GroupNode(BaseNode):
         """Icon name associated to node"""
         return "h5group.svg"
 
-    def collect_children(self, node_dict: dict[str, BaseNode]):
-        """Construct tree"""
-        for dset in self.dset.values():
-            child_cls = NODE_FACTORY.get(dset)
-            if child_cls is not None:
-                child = child_cls(self.h5file, dset.name)
-                node_dict[child.id] = child
-                self.children.append(child)
-                if isinstance(child, GroupNode):
-                    child.collect_children(node_dict)
-                child.collect_attributes()
+    def __init__(self, h5file, dname):
+        super().__init__(h5file, dname)
+        self.is_collected = False
+
+    def collect_children(self, node_dict: dict[str, BaseNode]) -> list[BaseNode]:
+        """Collect group children (not recursively: children groups are collected
+        when expanded, see :py:meth:`H5Importer.expand`)
+
+        Args:
+            node_dict: Dictionary of nodes, indexed by node id (updated in place)
+
+        Returns:
+            List of new nodes
+        """
+        new_nodes = []
+        if not self.is_collected:
+            self.is_collected = True
+            for dset in self.dset.values():
+                child_cls = NODE_FACTORY.get(dset)
+                if child_cls is not None:
+                    child = child_cls(self.h5file, dset.name)
+                    node_dict[child.id] = child
+                    self.children.append(child)
+                    child.collect_attributes()
+                    new_nodes.append(child)
+        return new_nodes
+
+    def has_children(self) -> bool:
+        """Return True if group may have children (without collecting them)"""
+        return len(self.dset) > 0 if not self.is_collected else bool(self.children)
 
 
 class RootNode(GroupNode):
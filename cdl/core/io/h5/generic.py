@@ -6,11 +6,14 @@ DataLab Generic HDF5 format support
 
 # pylint: disable=invalid-name  # Allows short reference names like x, y, ...
 
+from __future__ import annotations
+
 import h5py
 import numpy as np
 
+from cdl.config import Conf
 from cdl.core.io.h5 import common, utils
-from cdl.core.model.image import create_image
+from cdl.core.model.image import IMAGE_STREAM_DEPTH, create_image
 from cdl.core.model.signal import create_signal
 from cdl.utils.strings import to_string
 
@@ -52,8 +55,8 @@ class GenericScalarNode(BaseGenericNode):
         """Return True if h5 dataset match node pattern"""
         if not super().match(dset):
             return False
-        data = dset[()]
-        return isinstance(data, np.generic) and utils.is_supported_num_dtype(data)
+        # Checking shape and data type without reading data:
+        return dset.shape == () and utils.is_supported_num_dtype(dset)
 
 
 common.NODE_FACTORY.register(GenericScalarNode, is_generic=True)
@@ -67,6 +70,10 @@ class GenericTextNode(BaseGenericNode):
         """Return True if h5 dataset match node pattern"""
         if not super().match(dset):
             return False
+        if dset.shape not in ((), (1,)):
+            # Only scalar or single-item strings are supported (this avoids reading
+            # large datasets just to check their type)
+            return False
         data = dset[()]
         return isinstance(data, bytes) or utils.is_supported_str_dtype(data)
 
@@ -91,26 +98,37 @@ class GenericArrayNode(BaseGenericNode):
 
     IS_ARRAY = True
 
+    #: Maximum number of items (along each dimension) shown in node text
+    TEXT_MAX_ITEMS = 10
+
+    #: Maximum number of points of signal previews
+    PREVIEW_SIGNAL_SIZE = 10000
+
+    #: Maximum number of pixels along each axis of image previews
+    PREVIEW_IMAGE_SIZE = 512
+
+    def __init__(self, h5file, dname):
+        super().__init__(h5file, dname)
+        # Row buffers of followed images (see `append_to_object`), by object uuid:
+        # (buffer, image data, i.e. view of the filled part of the buffer)
+        self.__row_buffers: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
     @classmethod
     def match(cls, dset):
         """Return True if h5 dataset match node pattern"""
         if not super().match(dset):
             return False
-        data = dset[()]
-        return (
-            utils.is_supported_num_dtype(data)
-            and isinstance(data, np.ndarray)
-            and len(data.shape) in (1, 2)
-        )
+        # Checking shape and data type without reading data:
+        return utils.is_supported_num_dtype(dset) and len(dset.shape) in (1, 2)
 
     def is_supported(self) -> bool:
         """Return True if node is associated to supported data"""
-        return self.data.size > 1
+        return self.dset.size > 1
 
     @property
     def __is_signal(self):
         """Return True if array represents a signal"""
-        shape = self.data.shape
+        shape = self.dset.shape
         return len(shape) == 1 or shape[0] in (1, 2) or shape[1] in (1, 2)
 
     @property
@@ -123,33 +141,178 @@ class GenericArrayNode(BaseGenericNode):
     @property
     def shape_str(self):
         """Return string representation of node shape, if any"""
-        return " x ".join([str(size) for size in self.data.shape])
+        return " x ".join([str(size) for size in self.dset.shape])
 
     @property
     def dtype_str(self):
         """Return string representation of node data type, if any"""
-        return str(self.data.dtype)
+        return str(self.dset.dtype)
 
     @property
     def text(self):
-        """Return node textual representation"""
-        return str(self.data)
-
-    def create_native_object(self):
-        """Create native object, if supported"""
+        """Return node textual representation (only the first items are read)"""
+        size = self.TEXT_MAX_ITEMS
+        text = str(self.dset[tuple(slice(0, size) for _dim in self.dset.shape)])
+        if any(dim > size for dim in self.dset.shape):
+            text += "..."
+        return text
+
+    def __create_object(self, data=None, step: int = 1):
+        """Create native object from data (default: node data)"""
         if self.__is_signal:
             obj = create_signal(self.object_title)
             try:
-                self.set_signal_data(obj)
+                self.set_signal_data(obj, data, step)
             except ValueError:
                 obj = None
         else:
             obj = create_image(self.object_title)
             try:
-                self.set_image_data(obj)
+                self.set_image_data(obj, data)
             except ValueError:
                 obj = None
         return obj
 
+    def create_native_object(self):
+        """Create native object, if supported"""
+        return self.__create_object()
+
+    def get_growth_axis(self):
+        """Return axis along which dataset grows when it is still being written:
+        signal points or image rows, or None if node data may not be followed"""
+        shape = self.dset.shape
+        if not self.__is_signal:
+            return 0 if self.is_resizable(0) else None
+        if len(shape) == 1:
+            return 0 if self.is_resizable(0) else None
+        # Signal data: Y column, X and Y columns, or X and Y rows (see `data_to_xy`)
+        for axis, other_axis in ((0, 1), (1, 0)):
+            other_size = shape[other_axis]
+            if (
+                other_size in (1, 2)
+                and self.dset.maxshape[other_axis] == other_size
+                and self.is_resizable(axis)
+            ):
+                return axis
+        return None
+
+    def append_to_object(self, obj, data, start):
+        """Append data to object created from node: signal points (signal is
+        switched to live mode, see :py:meth:`cdl.obj.SignalObj.append_data`) or
+        image rows (image data is a view of a row buffer whose capacity grows
+        geometrically, so that appending rows has an amortized linear cost)"""
+        axis = self.get_growth_axis()
+        if self.__is_signal:
+            if data.ndim == 1 or data.shape[1 - axis] == 1:
+                y = data.ravel()
+                x = np.arange(start, start + y.size)
+            else:
+                x, y = data if axis == 1 else data.T
+            obj.append_data(x, y)
+            return
+        rows = self.convert_image_data(data)
+        buffer, view = self.__row_buffers.get(obj.uuid, (None, None))
+        nrows = obj.data.shape[0]
+        size = nrows + rows.shape[0]
+        if (
+            obj.data is not view  # Image data has been replaced since last call
+            or size > buffer.shape[0]
+            or obj.data.shape[1:] != rows.shape[1:]
+        ):
+            buffer = np.empty((2 * size,) + obj.data.shape[1:], obj.data.dtype)
+            buffer[:nrows] = obj.data
+        buffer[nrows:size] = rows
+        obj.data = view = buffer[:size]
+        self.__row_buffers[obj.uuid] = (buffer, view)
+
+    def get_preview_object(self):
+        """Return native object for preview, if supported: only every Nth row and
+        column of data is read (hyperslab selection with strides)"""
+        if self.__is_signal:
+            max_size = self.PREVIEW_SIGNAL_SIZE
+        else:
+            max_size = self.PREVIEW_IMAGE_SIZE
+        selection = utils.get_preview_selection(self.dset.shape, max_size)
+        if all(slc.step == 1 for slc in selection):
+            return self.get_native_object()
+        obj = self.__create_object(self.dset[selection], selection[-1].step)
+        if obj is not None:
+            self.process_metadata(obj)
+        return obj
+
 
 common.NODE_FACTORY.register(GenericArrayNode, is_generic=True)
+
+
+class GenericImageStackNode(BaseGenericNode):
+    """Object representing a generic image stack HDF5 data node (3-D array, frames
+    being stacked along the first axis), for HDF5 files opened in SWMR read mode only
+    (see :py:class:`cdl.core.io.h5.common.H5Follower`): the native object is an
+    image stream (see :py:meth:`cdl.obj.ImageObj.append_frame`) whose data is the
+    last frame, holding all frames up to `h5_stack_max_frames` I/O option (the
+    oldest frames are then dropped)"""
+
+    IS_ARRAY = True
+
+    @classmethod
+    def match(cls, dset):
+        """Return True if h5 dataset match node pattern"""
+        if not super().match(dset) or not dset.file.swmr_mode:
+            return False
+        # Checking shape and data type without reading data:
+        return utils.is_supported_num_dtype(dset) and len(dset.shape) == 3
+
+    def is_supported(self) -> bool:
+        """Return True if node is associated to supported data"""
+        nframes, height, width = self.dset.shape
+        return nframes > 0 and height * width > 1
+
+    @property
+    def icon_name(self):
+        """Icon name associated to node"""
+        return "image.svg" if self.is_supported() else "h5array.svg"
+
+    @property
+    def shape_str(self):
+        """Return string representation of node shape, if any"""
+        return " x ".join([str(size) for size in self.dset.shape])
+
+    @property
+    def dtype_str(self):
+        """Return string representation of node data type, if any"""
+        return str(self.dset.dtype)
+
+    @property
+    def text(self):
+        """Return node textual representation"""
+        return ""
+
+    def create_native_object(self):
+        """Create native object, if supported"""
+        obj = create_image(self.object_title)
+        # Only the frames which would be kept in the image stream are read:
+        start = max(self.dset.shape[0] - Conf.io.h5_stack_max_frames.get(), 0)
+        try:
+            self.append_to_object(obj, self.dset[start:], start)
+        except ValueError:
+            obj = None
+        return obj
+
+    def get_growth_axis(self):
+        """Return axis along which dataset grows when it is still being written
+        (frames), or None if node data may not be followed"""
+        return 0 if self.is_resizable(0) else None
+
+    def append_to_object(self, obj, data, start):
+        """Append frames to image stream created from node: the stream depth grows
+        geometrically with the number of frames, up to `h5_stack_max_frames` I/O
+        option (the oldest frames are then dropped)"""
+        maxdepth = Conf.io.h5_stack_max_frames.get()
+        count = start + len(data)
+        depth = min(max(IMAGE_STREAM_DEPTH, 1 << (count - 1).bit_length()), maxdepth)
+        data = data[-maxdepth:]
+        for frame in data:
+            obj.append_frame(self.convert_image_data(frame), depth=depth)
+
+
+common.NODE_FACTORY.register(GenericImageStackNode, is_generic=True)
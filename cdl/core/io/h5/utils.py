@@ -94,3 +94,17 @@ def is_single_str_array(data):
 def is_supported_str_dtype(data):
     """Return True if data type is a string type supported by preview"""
     return data.dtype.name.startswith("string") or is_single_str_array(data)
+
+
+def get_preview_selection(shape: tuple[int, ...], max_size: int) -> tuple[slice, ...]:
+    """Return strided selection (e.g. for h5py hyperslab reads) limiting array
+    size along each dimension to `max_size` items
+
+    Args:
+        shape: Array shape
+        max_size: Maximum number of items along each dimension
+
+    Returns:
+        Selection (tuple of slices)
+    """
+    return tuple(slice(None, None, max(1, -(-size // max_size))) for size in shape)
@@ -7,10 +7,13 @@ DataLab image I/O registry
 from __future__ import annotations
 
 import abc
+import os
+import os.path as osp
+from collections.abc import Iterator
 
 import numpy as np
 
-from cdl.config import _
+from cdl.config import Conf, _
 from cdl.core.io.base import BaseIORegistry, FormatBase
 from cdl.core.model.image import ImageObj, create_image
 from cdl.utils.qthelpers import CallbackWorker
@@ -69,6 +72,41 @@ class ImageFormatBase(abc.ABC, FormatBase, metaclass=ImageFormatBaseMeta):
             obj.zscalemin, obj.zscalemax = unique_values.tolist()
         return [obj]
 
+    def read_frames(
+        self,
+        provider: FrameProvider,
+        worker: CallbackWorker | None = None,
+        frames: range | None = None,
+    ) -> list[ImageObj]:
+        """Read list of image objects from frame provider, one object per frame
+        (see :py:meth:`MultipleImagesFormatBase.read`)
+
+        Args:
+            provider: Frame provider
+            worker: Callback worker object
+            frames: Indexes of frames to be read (default: all frames)
+
+        Returns:
+            List of image objects
+        """
+        if frames is None:
+            frames = range(provider.n_frames)
+        lazy = provider.RANDOM_ACCESS and Conf.io.lazy_frame_import.get()
+        iterator = None if lazy else provider.iter_frames(frames)
+        objlist = []
+        for count, idx in enumerate(frames, start=1):
+            obj = self.create_object(provider.filename, index=idx)
+            if lazy:
+                obj.set_data_loader(FrameLoader(provider, idx))
+            else:
+                obj.data = next(iterator)
+            objlist.append(obj)
+            if worker is not None:
+                worker.set_progress_count(count, len(frames))
+                if worker.was_canceled():
+                    break
+        return objlist
+
     @staticmethod
     @abc.abstractmethod
     def read_data(filename: str) -> np.ndarray:
@@ -81,12 +119,15 @@ class ImageFormatBase(abc.ABC, FormatBase, metaclass=ImageFormatBaseMeta):
             Image array data
         """
 
-    def write(self, filename: str, obj: ImageObj) -> None:
+    def write(
+        self, filename: str, obj: ImageObj, worker: CallbackWorker | None = None
+    ) -> None:
         """Write data to file
 
         Args:
             filename: file name
             obj: native object (signal or image)
+            worker: Callback worker object
 
         Raises:
             NotImplementedError: if format is not supported
@@ -105,37 +146,214 @@ class ImageFormatBase(abc.ABC, FormatBase, metaclass=ImageFormatBaseMeta):
         raise NotImplementedError(f"Writing to {filename} is not supported")
 
 
+class FrameProvider(abc.ABC):
+    """Object giving access to the frames of a multi-frame image file, without
+    reading the whole file at once
+
+    Args:
+        filename: File name
+    """
+
+    #: True if any frame may be read at no extra cost (e.g. memory-mapped file):
+    #: frames are then loaded lazily (see :py:class:`FrameLoader`)
+    RANDOM_ACCESS = False
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+
+    @property
+    @abc.abstractmethod
+    def shape(self) -> tuple[int, ...]:
+        """Data shape: (number of frames, height, width) for an image stack,
+        or (height, width) for a single image"""
+
+    @property
+    def dtype(self) -> np.dtype | None:
+        """Data type (None if unknown before reading data)"""
+        return None
+
+    @property
+    def n_frames(self) -> int:
+        """Number of frames"""
+        shape = self.shape
+        return shape[0] if len(shape) == 3 else 1
+
+    @abc.abstractmethod
+    def read_frame(self, index: int) -> np.ndarray:
+        """Read a single frame
+
+        Args:
+            index: Frame index
+
+        Returns:
+            Frame data
+        """
+
+    def iter_frames(self, frames: range) -> Iterator[np.ndarray]:
+        """Iterate over frames
+
+        Args:
+            frames: Frame indexes
+
+        Yields:
+            Frame data
+        """
+        for index in frames:
+            yield self.read_frame(index)
+
+
+class ArrayFrameProvider(FrameProvider):
+    """Frame provider for formats only supporting to read all frames at once
+
+    Args:
+        filename: File name
+        data: Data array (3 dimensions for an image stack)
+    """
+
+    def __init__(self, filename: str, data: np.ndarray) -> None:
+        super().__init__(filename)
+        self.data = data
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Data shape"""
+        return self.data.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type"""
+        return self.data.dtype
+
+    def read_frame(self, index: int) -> np.ndarray:
+        """Read a single frame
+
+        Args:
+            index: Frame index
+
+        Returns:
+            Frame data
+        """
+        return self.data[index, ::] if self.data.ndim == 3 else self.data
+
+
+class FrameLoader:
+    """Deferred loader of a frame (see
+    :py:meth:`cdl.core.model.base.BaseObj.set_data_loader`)
+
+    Args:
+        provider: Frame provider
+        index: Frame index
+    """
+
+    def __init__(self, provider: FrameProvider, index: int) -> None:
+        self.provider = provider
+        self.index = index
+        self.filename = provider.filename
+        self.dtype = provider.dtype
+
+    def __call__(self) -> np.ndarray:
+        """Read frame"""
+        return self.provider.read_frame(self.index)
+
+
 class MultipleImagesFormatBase(ImageFormatBase):
     """Base image format object for multiple images (e.g., SIF or SPE).
 
-    Works with read function that returns a NumPy array of 3 dimensions, where
-    the first dimension is the number of images.
+    Frames are accessed through a frame provider (see :py:meth:`get_frame_provider`):
+    by default, the provider works with read function that returns a NumPy array of 3
+    dimensions, where the first dimension is the number of images.
     """
 
+    # Frame provider kept by `get_frame_count` for the next call to `read`, when
+    # getting the number of frames required to read the whole file (see
+    # `ArrayFrameProvider`): key = (file name, modification time, size)
+    __provider: tuple[tuple[str, float, int], FrameProvider] | None = None
+
+    def get_frame_provider(self, filename: str) -> FrameProvider:
+        """Return frame provider. Default implementation reads all frames at once
+        (see :py:meth:`read_data`): formats supporting per-frame access should
+        override this method.
+
+        Args:
+            filename: File name
+
+        Returns:
+            Frame provider
+        """
+        return ArrayFrameProvider(filename, self.read_data(filename))
+
+    @staticmethod
+    def __get_file_key(filename: str) -> tuple[str, float, int]:
+        """Return key identifying file contents (file name, modification time and
+        size)"""
+        stat = os.stat(filename)
+        return (osp.normcase(osp.abspath(filename)), stat.st_mtime, stat.st_size)
+
+    def release_frame_provider(self) -> None:
+        """Release the frame provider kept by :py:meth:`get_frame_count`, if any
+        (this releases the data read to count frames, e.g. when reading the file
+        has been canceled after counting frames)"""
+        self.__provider = None
+
+    def __pop_frame_provider(self, filename: str) -> FrameProvider:
+        """Return the frame provider kept by :py:meth:`get_frame_count` if it has
+        been created for this file (and if file has not changed since), or a new
+        frame provider
+
+        Args:
+            filename: File name
+
+        Returns:
+            Frame provider
+        """
+        cached, self.__provider = self.__provider, None
+        if cached is not None and cached[0] == self.__get_file_key(filename):
+            return cached[1]
+        return self.get_frame_provider(filename)
+
+    def get_frame_count(self, filename: str) -> int:
+        """Return number of frames in file
+
+        Frames are counted from the file header, through the frame provider (see
+        :py:meth:`get_frame_provider`). If the provider has to read the whole file
+        to do so (see :py:class:`ArrayFrameProvider`), it is kept for the next
+        call to :py:meth:`read`, so that the file is not read twice.
+
+        Args:
+            filename: File name
+
+        Returns:
+            Number of frames
+        """
+        self.release_frame_provider()
+        provider = self.get_frame_provider(filename)
+        if isinstance(provider, ArrayFrameProvider):
+            self.__provider = (self.__get_file_key(filename), provider)
+        return provider.n_frames
+
     def read(
-        self, filename: str, worker: CallbackWorker | None = None
+        self,
+        filename: str,
+        worker: CallbackWorker | None = None,
+        frames: range | None = None,
     ) -> list[ImageObj]:
         """Read list of image objects from file
 
+        Frames are read one by one. If frame provider supports random access and
+        lazy frame import is enabled (see `lazy_frame_import` I/O option), frames
+        are not read here but only when objects data is first accessed.
+
         Args:
             filename: File name
             worker: Callback worker object
+            frames: Indexes of frames to be read (default: all frames)
 
         Returns:
             List of image objects
         """
-        data = self.read_data(filename)
-        if len(data.shape) == 3:
-            objlist = []
-            for idx in range(data.shape[0]):
-                obj = self.create_object(filename, index=idx)
-                obj.data = data[idx, ::]
-                objlist.append(obj)
-                if worker is not None:
-                    worker.set_progress((idx + 1) / data.shape[0])
-                    if worker.was_canceled():
-                        break
-            return objlist
-        obj = self.create_object(filename)
-        obj.data = data
-        return [obj]
+        provider = self.__pop_frame_provider(filename)
+        if len(provider.shape) != 3:
+            obj = self.create_object(filename)
+            obj.data = provider.read_frame(0)
+            return [obj]
+        return self.read_frames(provider, worker, frames)
@@ -6,7 +6,12 @@ DataLab I/O image formats
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import itertools
+import os
 import os.path as osp
+from collections.abc import Iterator
 
 import imageio.v3 as iio
 import numpy as np
@@ -18,8 +23,19 @@ from cdl.config import IMAGEIO_FORMATS, Conf, _
 from cdl.core.io.base import FormatInfo
 from cdl.core.io.conv import convert_array_to_standard_type
 from cdl.core.io.image import funcs
-from cdl.core.io.image.base import ImageFormatBase, MultipleImagesFormatBase
-from cdl.core.model.image import ImageObj
+from cdl.core.io.image.base import (
+    FrameProvider,
+    ImageFormatBase,
+    MultipleImagesFormatBase,
+)
+from cdl.core.io.mat import (
+    Mat73Loader,
+    MatFormatMixin,
+    MatVariable,
+    is_mat73_file,
+)
+from cdl.core.io.native import read_native_object, write_native_object
+from cdl.core.model.image import ImageObj, create_image
 from cdl.utils.qthelpers import CallbackWorker
 
 
@@ -53,7 +69,12 @@ class ClassicsImageFormat(ImageFormatBase):
         if ext in (".jp2",):
             if data.dtype not in (np.uint8, np.uint16):
                 data = data.astype(np.uint16)
-        skimage.io.imsave(filename, data, check_contrast=False)
+        kwargs = {}
+        if ext in (".tif", ".tiff"):
+            compression = Conf.io.tiff_compression.get("none")
+            if compression != "none":
+                kwargs["compression"] = compression
+        skimage.io.imsave(filename, data, check_contrast=False, **kwargs)
 
 
 class NumPyImageFormat(ImageFormatBase):
@@ -95,13 +116,7 @@ class TextImageFormat(ImageFormatBase):
     @staticmethod
     def read_data(filename: str) -> np.ndarray:
         """Read data and return it"""
-        for encoding in ("utf-8", "utf-8-sig", "latin-1"):
-            for delimiter in ("\t", ",", " ", ";"):
-                try:
-                    return np.loadtxt(filename, delimiter=delimiter, encoding=encoding)
-                except ValueError:
-                    continue
-        raise ValueError(f"Could not read image data from file {filename} as text file")
+        return funcs.imread_text(filename)
 
     @staticmethod
     def write_data(filename: str, data: np.ndarray) -> None:
@@ -111,27 +126,16 @@ class TextImageFormat(ImageFormatBase):
             filename: File name
             data: Image array data
         """
-        if data.dtype in (
-            np.int8,
-            np.uint8,
-            np.int16,
-            np.uint16,
-            np.int32,
-            np.uint32,
-        ):
-            fmt = "%d"
-        else:
-            fmt = "%.18e"
         ext = osp.splitext(filename)[1]
         if ext.lower() in (".txt", ".asc", ""):
-            np.savetxt(filename, data, fmt=fmt)
+            funcs.imwrite_text(filename, data, delimiter=" ")
         elif ext.lower() == ".csv":
-            np.savetxt(filename, data, fmt=fmt, delimiter=",")
+            funcs.imwrite_text(filename, data, delimiter=",")
         else:
             raise ValueError(f"Unknown text file extension {ext}")
 
 
-class MatImageFormat(ImageFormatBase):
+class MatImageFormat(MatFormatMixin, ImageFormatBase):
     """Object representing MAT-File image file type"""
 
     FORMAT_INFO = FormatInfo(
@@ -141,20 +145,41 @@ class MatImageFormat(ImageFormatBase):
         writeable=True,
     )  # pylint: disable=duplicate-code
 
+    @staticmethod
+    def is_variable_supported(variable: MatVariable) -> bool:
+        """Return True if variable may be read with this format (2-D arrays)"""
+        return len(variable.shape) == 2
+
     def read(
-        self, filename: str, worker: CallbackWorker | None = None
+        self,
+        filename: str,
+        worker: CallbackWorker | None = None,
+        variables: list[str] | None = None,
     ) -> list[ImageObj]:
         """Read list of image objects from file
 
+        For MAT-Files v7.3, data is not read here but only when objects data is
+        first accessed (see :py:class:`cdl.core.io.mat.Mat73Loader`).
+
         Args:
             filename: File name
             worker: Callback worker object
+            variables: Names of variables to be read (default: all variables)
 
         Returns:
             List of image objects
         """
-        mat = sio.loadmat(filename)
         allimg: list[ImageObj] = []
+        if is_mat73_file(filename):
+            for var in self.get_variables(filename):
+                if variables is None or var.name in variables:
+                    obj = self.create_object(filename)
+                    obj.set_data_loader(Mat73Loader(filename, var.name))
+                    if var.name != "img":
+                        obj.title += f" ({var.name})"
+                    allimg.append(obj)
+            return allimg
+        mat = sio.loadmat(filename, variable_names=variables)
         for dname, data in mat.items():
             if dname.startswith("__") or not isinstance(data, np.ndarray):
                 continue
@@ -169,8 +194,18 @@ class MatImageFormat(ImageFormatBase):
 
     @staticmethod
     def read_data(filename: str) -> np.ndarray:
-        """Read data and return it"""
-        # This method is not used, as read() is overridden
+        """Read data and return it: not supported, as a MAT-File may contain
+        several images (see :py:meth:`read`)
+
+        Args:
+            filename: File name
+
+        Raises:
+            NotImplementedError: always
+        """
+        raise NotImplementedError(
+            f"{filename}: MAT-Files may contain several images (use `read` method)"
+        )
 
     @staticmethod
     def write_data(filename: str, data: np.ndarray) -> None:
@@ -180,7 +215,131 @@ class MatImageFormat(ImageFormatBase):
             filename: File name
             data: Image array data
         """
-        sio.savemat(filename, {"img": data})
+        sio.savemat(
+            filename, {"img": data}, do_compression=Conf.io.mat_compression.get(False)
+        )
+
+
+class NativeImageFormat(ImageFormatBase):
+    """Object representing DataLab object file type (see
+    :py:func:`cdl.core.io.native.write_native_object`)"""
+
+    FORMAT_INFO = FormatInfo(
+        name=_("DataLab object files"),
+        extensions="*.dlobj",
+        readable=True,
+        writeable=True,
+    )
+
+    def read(
+        self, filename: str, worker: CallbackWorker | None = None
+    ) -> list[ImageObj]:
+        """Read list of image objects from file
+
+        Args:
+            filename: File name
+            worker: Callback worker object
+
+        Returns:
+            List of image objects
+        """
+        return [read_native_object(filename, self.create_object(filename))]
+
+    def write(
+        self, filename: str, obj: ImageObj, worker: CallbackWorker | None = None
+    ) -> None:
+        """Write data to file
+
+        Args:
+            filename: file name
+            obj: native object (signal or image)
+            worker: Callback worker object
+        """
+        write_native_object(filename, obj, worker)
+
+    @staticmethod
+    def read_data(filename: str) -> np.ndarray:
+        """Read data and return it (memory-mapped data array of the image object
+        stored in file, see :py:meth:`read`)
+
+        Args:
+            filename: File name
+
+        Returns:
+            Image array data
+        """
+        return read_native_object(filename, create_image("")).data
+
+
+#: Maximum number of threads used to read DICOM series (headers and pixel data)
+DICOM_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class DICOMSeriesFrameProvider(FrameProvider):
+    """DICOM series frame provider: one frame per file
+
+    Headers are read first, without reading pixel data, to select and sort the
+    slices of the series (see :py:func:`funcs.sort_dicom_series`). Pixel data of
+    frames is then decoded in parallel (see :py:meth:`iter_frames`).
+
+    Args:
+        filenames: File names (files which are not DICOM image files are ignored)
+        series_uid: Series instance UID (default: series with the most slices)
+    """
+
+    RANDOM_ACCESS = True
+
+    def __init__(self, filenames: list[str], series_uid: str | None = None) -> None:
+        with concurrent.futures.ThreadPoolExecutor(DICOM_MAX_WORKERS) as executor:
+            headers = list(executor.map(funcs.read_dicom_header, filenames))
+        self.headers = funcs.sort_dicom_series(headers, series_uid)
+        super().__init__(osp.dirname(self.headers[0].filename))
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Data shape"""
+        return (len(self.headers),) + self.headers[0].shape
+
+    def read_frame(self, index: int) -> np.ndarray:
+        """Read a single frame
+
+        Args:
+            index: Frame index
+
+        Returns:
+            Frame data
+        """
+        return funcs.read_dicom_pixels(self.headers[index].filename)
+
+    def iter_frames(self, frames: range) -> Iterator[np.ndarray]:
+        """Iterate over frames: pixel data is decoded in a thread pool, frames being
+        yielded in order (the number of frames decoded in advance is bounded)
+
+        Args:
+            frames: Frame indexes
+
+        Yields:
+            Frame data
+        """
+        executor = concurrent.futures.ThreadPoolExecutor(DICOM_MAX_WORKERS)
+        pending: collections.deque[concurrent.futures.Future] = collections.deque()
+        indexes = iter(frames)
+        try:
+            while True:
+                while len(pending) < 2 * DICOM_MAX_WORKERS:
+                    index = next(indexes, None)
+                    if index is None:
+                        break
+                    pending.append(executor.submit(self.read_frame, index))
+                if not pending:
+                    break
+                yield pending.popleft().result()
+        finally:
+            # Pending tasks are canceled explicitly (`cancel_futures` argument of
+            # `Executor.shutdown` requires Python 3.9)
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
 
 class DICOMImageFormat(ImageFormatBase):
@@ -199,6 +358,89 @@ class DICOMImageFormat(ImageFormatBase):
         """Read data and return it"""
         return plotpy.io.imread(filename)
 
+    def read_series(
+        self,
+        path: str | list[str],
+        worker: CallbackWorker | None = None,
+        stack: bool = False,
+        series_uid: str | None = None,
+    ) -> list[ImageObj]:
+        """Read DICOM series (see :py:class:`DICOMSeriesFrameProvider`)
+
+        Args:
+            path: Directory containing series files, or series file names
+            worker: Callback worker object
+            stack: If True, return a single image stream object holding all slices
+             (see :py:meth:`cdl.obj.ImageObj.append_frame`): the stream depth is
+             the number of slices, and the image data is the last slice. If False,
+             return one image object per slice (slices are read lazily if the
+             `lazy_frame_import` I/O option is enabled).
+            series_uid: Series instance UID (default: series with the most slices)
+
+        Returns:
+            List of image objects
+
+        Raises:
+            ValueError: if no DICOM series slice is found
+        """
+        if isinstance(path, str):
+            with os.scandir(path) as entries:
+                path = sorted(entry.path for entry in entries if entry.is_file())
+        provider = DICOMSeriesFrameProvider(path, series_uid)
+        if stack:
+            obj = self.create_object(provider.filename)
+            nframes = provider.n_frames
+            for count, frame in enumerate(provider.iter_frames(range(nframes)), 1):
+                obj.append_frame(frame, depth=nframes)
+                if worker is not None:
+                    worker.set_progress_count(count, nframes)
+                    if worker.was_canceled():
+                        return []
+            objs = [obj]
+        else:
+            objs = self.read_frames(provider, worker)
+        spacing = provider.headers[0].spacing
+        if spacing is not None:
+            for obj in objs:
+                obj.dy, obj.dx = spacing
+        return objs
+
+
+class SIFFrameProvider(FrameProvider):
+    """Andor SIF frame provider (memory-mapped frames)
+
+    Args:
+        filename: File name
+    """
+
+    RANDOM_ACCESS = True
+
+    def __init__(self, filename: str) -> None:
+        super().__init__(filename)
+        self.siffile = funcs.SIFFile(filename)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Data shape"""
+        sif = self.siffile
+        return (sif.n_frames, sif.height, sif.width)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type"""
+        return np.dtype(np.float32)
+
+    def read_frame(self, index: int) -> np.ndarray:
+        """Read a single frame
+
+        Args:
+            index: Frame index
+
+        Returns:
+            Frame data
+        """
+        return self.siffile.read_frame(index)
+
 
 class AndorSIFImageFormat(MultipleImagesFormatBase):
     """Object representing an Andor SIF image file type"""
@@ -210,12 +452,74 @@ class AndorSIFImageFormat(MultipleImagesFormatBase):
         writeable=False,
     )
 
+    def get_frame_provider(self, filename: str) -> SIFFrameProvider:
+        """Return frame provider
+
+        Args:
+            filename: File name
+
+        Returns:
+            Frame provider
+        """
+        return SIFFrameProvider(filename)
+
     @staticmethod
     def read_data(filename: str) -> np.ndarray:
         """Read data and return it"""
         return funcs.imread_sif(filename)
 
 
+class ImageIOFrameProvider(FrameProvider):
+    """ImageIO frame provider: frames are read one by one (or by index)
+
+    Args:
+        filename: File name
+    """
+
+    def __init__(self, filename: str) -> None:
+        super().__init__(filename)
+        self.__props = iio.improps(filename, index=None)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Data shape"""
+        return self.__props.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type"""
+        return self.__props.dtype
+
+    def read_frame(self, index: int) -> np.ndarray:
+        """Read a single frame
+
+        Args:
+            index: Frame index
+
+        Returns:
+            Frame data
+        """
+        if len(self.shape) != 3:
+            return iio.imread(self.filename)
+        return iio.imread(self.filename, index=index)
+
+    def iter_frames(self, frames: range) -> Iterator[np.ndarray]:
+        """Iterate over frames (file is read sequentially, in a single pass)
+
+        Args:
+            frames: Frame indexes
+
+        Yields:
+            Frame data
+        """
+        if frames.step < 0:
+            yield from super().iter_frames(frames)
+            return
+        yield from itertools.islice(
+            iio.imiter(self.filename), frames.start, frames.stop, frames.step
+        )
+
+
 # Generate classes based on the information above:
 def generate_imageio_format_classes():
     """Generate classes based on the information above"""
@@ -228,6 +532,7 @@ def generate_imageio_format_classes():
             "FORMAT_INFO": FormatInfo(
                 name=name, extensions=extensions, readable=True, writeable=False
             ),
+            "get_frame_provider": lambda self, filename: ImageIOFrameProvider(filename),
             "read_data": staticmethod(
                 lambda filename: iio.imread(filename, index=None)
             ),
@@ -8,12 +8,17 @@ DataLab I/O image functions
 
 from __future__ import annotations
 
+import codecs
+import dataclasses
+import logging
 import os
 import re
 import time
 
 import numpy as np
+import pandas as pd
 
+from cdl.core.io.conv import format_text_rows
 from cdl.utils.strings import to_string
 
 
@@ -217,6 +222,29 @@ class SIFFile:
         self.filesize = os.path.getsize(filepath)
         self.datasize = self.width * self.height * 4 * self.stacksize
 
+    @property
+    def n_frames(self) -> int:
+        """Number of frames"""
+        return self.stacksize
+
+    def get_memmap(self) -> np.memmap:
+        """Return a read-only memory map of all frames, with shape (blocks, y, x)"""
+        shape = (self.stacksize, self.height, self.width)
+        return np.memmap(
+            self.filepath, dtype=np.float32, mode="r", offset=self.m_offset, shape=shape
+        )
+
+    def read_frame(self, index: int) -> np.ndarray:
+        """Read a single frame (only this frame is read from the file)
+
+        Args:
+            index: Frame index
+
+        Returns:
+            Frame data, with shape (y, x)
+        """
+        return np.array(self.get_memmap()[index])
+
     def read_all(self) -> np.ndarray:
         """
         Returns all blocks (i.e. frames) in the .sif file as a numpy array.
@@ -305,13 +333,34 @@ class SCORFile:
         self.datasize = self.width * self.height * 2
         self.m_offset = self.filesize - self.datasize - 8
 
+    @property
+    def n_frames(self) -> int:
+        """Number of frames"""
+        return 1
+
+    def get_memmap(self) -> np.memmap:
+        """Return a read-only memory map of image data"""
+        shape = (self.height, self.width)
+        return np.memmap(
+            self.filepath, dtype=np.int16, mode="r", offset=self.m_offset, shape=shape
+        )
+
+    def read_frame(self, index: int = 0) -> np.ndarray:
+        """Read a single frame
+
+        Args:
+            index: Frame index (SPIRICON files contain a single frame)
+
+        Returns:
+            Frame data
+        """
+        if index != 0:
+            raise IndexError(f"Frame index {index} out of range")
+        return np.array(self.get_memmap())
+
     def read_all(self) -> np.ndarray:
         """Read all data"""
-        with open(self.filepath, "rb") as data_file:
-            data_file.seek(self.m_offset)
-            block = data_file.read(self.datasize)
-            data = np.frombuffer(block, dtype=np.int16)
-        return data.reshape(self.height, self.width)
+        return self.read_frame(0)
 
 
 def imread_scor(filename: str) -> np.ndarray:
@@ -325,3 +374,332 @@ def imread_scor(filename: str) -> np.ndarray:
     """
     scor_file = SCORFile(filename)
     return scor_file.read_all()
+
+
+# ==============================================================================
+# Text image I/O functions
+# ==============================================================================
+
+#: Delimiters supported for text images, in order of precedence (" " stands for
+#: any sequence of whitespace characters)
+TEXT_DELIMITERS = ("\t", ",", ";", " ")
+
+#: Size of the head of the file used to detect the text image format (bytes)
+TEXT_SNIFF_SIZE = 2**16
+
+#: Number of rows formatted at once when writing text images
+TEXT_CHUNK_ROWS = 256
+
+
+def split_text_row(line: str, delimiter: str) -> list[str]:
+    """Split text row into fields (a trailing delimiter is ignored)
+
+    Args:
+        line: Text row
+        delimiter: Delimiter (" " stands for any sequence of whitespace characters)
+
+    Returns:
+        List of fields
+    """
+    if delimiter == " ":
+        return line.split()
+    fields = line.rstrip("\r\n").split(delimiter)
+    if len(fields) > 1 and not fields[-1].strip():
+        fields.pop()
+    return fields
+
+
+def is_numeric_text_row(fields: list[str]) -> bool:
+    """Return True if all fields of a text row are numbers
+
+    Args:
+        fields: Row fields
+
+    Returns:
+        True if all fields are numbers
+    """
+    try:
+        for field in fields:
+            float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def sniff_text_image(filename: str, size: int = TEXT_SNIFF_SIZE) -> tuple[str, str]:
+    """Detect encoding and delimiter of a text image file from the head of the file
+
+    Encoding is "utf-8-sig" if file starts with a byte order mark, "utf-8" if the
+    head of the file may be decoded as such, and "latin-1" otherwise. Delimiter is
+    the first delimiter of :py:data:`TEXT_DELIMITERS` splitting all rows of the head
+    of the file into the same number of numeric fields (comment lines starting
+    with "#" are ignored).
+
+    Args:
+        filename: Text file name
+        size: Size of the head of the file to be analyzed (bytes)
+
+    Returns:
+        Tuple (encoding, delimiter)
+
+    Raises:
+        ValueError: if file format is not supported
+    """
+    with open(filename, "rb") as fdesc:
+        head = fdesc.read(size)
+        truncated = bool(fdesc.read(1))
+    if head.startswith(codecs.BOM_UTF8):
+        encoding = "utf-8-sig"
+    else:
+        encoding = "utf-8"
+        try:
+            # A multi-byte character may be cut at the end of the head of the file
+            codecs.getincrementaldecoder(encoding)().decode(head, final=not truncated)
+        except UnicodeDecodeError:
+            encoding = "latin-1"
+    text = head.decode(encoding, errors="ignore")
+    lines = [
+        line
+        for line in text.splitlines(keepends=True)
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+    partial_line = None
+    if truncated and lines and not lines[-1].endswith(("\n", "\r")):
+        partial_line = lines.pop()
+    for delimiter in TEXT_DELIMITERS:
+        rows = [split_text_row(line, delimiter) for line in lines]
+        if partial_line is not None:
+            # Incomplete last row (rows may even be longer than the head of the
+            # file): ignoring its last field
+            rows.append(split_text_row(partial_line, delimiter)[:-1])
+        ncols = {len(row) for row in rows[: len(lines)]}
+        if (
+            len(ncols) <= 1
+            and max((len(row) for row in rows), default=0) > 1
+            and all(is_numeric_text_row(row) for row in rows)
+        ):
+            return encoding, delimiter
+    if lines and all(is_numeric_text_row(line.split()) for line in lines):
+        # Single column
+        return encoding, " "
+    raise ValueError(f"Could not read image data from file {filename} as text file")
+
+
+def imread_text(filename: str) -> np.ndarray:
+    """Read text image file
+
+    File format is detected from the head of the file (see
+    :py:func:`sniff_text_image`), then data is parsed in a single pass with the
+    pandas C engine.
+
+    Args:
+        filename: Text file name
+
+    Returns:
+        Image data (float64 array)
+
+    Raises:
+        ValueError: if file format is not supported
+    """
+    encoding, delimiter = sniff_text_image(filename)
+    try:
+        df = pd.read_csv(
+            filename,
+            sep=r"\s+" if delimiter == " " else delimiter,
+            header=None,
+            comment="#",
+            encoding=encoding,
+            dtype=np.float64,
+            engine="c",
+        )
+    except ValueError as exc:
+        raise ValueError(
+            f"Could not read image data from file {filename} as text file"
+        ) from exc
+    data = df.to_numpy(np.float64)
+    if data.shape[1] > 1 and np.isnan(data[:, -1]).all():
+        # Trailing delimiter at the end of each row
+        data = data[:, :-1]
+    return data
+
+
+def get_text_format(dtype: np.dtype) -> str:
+    """Return value format for writing data of given type as text
+
+    Floating point formats are the shortest fixed formats which round-trip (they are
+    much faster than the shortest representation of each value, i.e. `repr`).
+
+    Args:
+        dtype: Data type
+
+    Returns:
+        Value format
+    """
+    if dtype.kind in "biu":
+        return "%d"
+    itemsize = dtype.itemsize // 2 if dtype.kind == "c" else dtype.itemsize
+    if itemsize <= 4:
+        return "%.9g"
+    return "%.17g"
+
+
+def imwrite_text(
+    filename: str,
+    data: np.ndarray,
+    delimiter: str = " ",
+    chunksize: int = TEXT_CHUNK_ROWS,
+) -> None:
+    """Write text image file
+
+    Rows are written by chunks (see :py:func:`cdl.core.io.conv.format_text_rows`),
+    with the shortest fixed format which round-trips for the data type (see
+    :py:func:`get_text_format`). Complex data is written with :py:func:`numpy.savetxt`
+    (i.e. one "(real+imagj)" field per value).
+
+    Args:
+        filename: Text file name
+        data: Image data
+        delimiter: Delimiter
+        chunksize: Number of rows per chunk
+    """
+    fmt = get_text_format(data.dtype)
+    if data.dtype.kind == "c":
+        np.savetxt(filename, data, fmt=fmt, delimiter=delimiter)
+        return
+    with open(filename, "w", encoding="utf-8") as fdesc:
+        for start in range(0, data.shape[0], chunksize):
+            chunk = data[start : start + chunksize]
+            fdesc.write(format_text_rows(chunk, delimiter, fmt))
+
+
+# ==============================================================================
+# DICOM series functions
+# ==============================================================================
+
+#: DICOM attributes read when scanning headers of a series (pixel data is not read)
+DICOM_SERIES_TAGS = [
+    "SeriesInstanceUID",
+    "InstanceNumber",
+    "ImagePositionPatient",
+    "ImageOrientationPatient",
+    "Rows",
+    "Columns",
+    "PixelSpacing",
+]
+
+
+@dataclasses.dataclass
+class DICOMSliceHeader:
+    """DICOM series slice header
+
+    Args:
+        filename: File name
+        series_uid: Series instance UID
+        instance: Instance number (None if unknown)
+        position: Position along slice normal (None if unknown)
+        shape: Pixel data shape (rows, columns)
+        spacing: Pixel spacing (row spacing, column spacing), None if unknown
+    """
+
+    filename: str
+    series_uid: str
+    instance: int | None
+    position: float | None
+    shape: tuple[int, int]
+    spacing: tuple[float, float] | None
+
+
+def read_dicom_header(filename: str) -> DICOMSliceHeader | None:
+    """Read DICOM slice header: parsing stops before pixel data, and only the
+    attributes needed to sort slices are read (see :py:data:`DICOM_SERIES_TAGS`)
+
+    Args:
+        filename: File name
+
+    Returns:
+        Slice header, or None if file is not a DICOM image file, or if its header
+        is invalid (the error is logged)
+    """
+    # pylint: disable=import-outside-toplevel
+    import pydicom
+    from pydicom.errors import InvalidDicomError
+
+    try:
+        dcm = pydicom.dcmread(
+            filename, stop_before_pixels=True, specific_tags=DICOM_SERIES_TAGS
+        )
+    except (InvalidDicomError, OSError):
+        return None
+    if "Rows" not in dcm or "Columns" not in dcm:
+        return None
+    try:
+        instance = dcm.get("InstanceNumber")
+        position = None
+        if "ImagePositionPatient" in dcm and "ImageOrientationPatient" in dcm:
+            orientation = np.array(dcm.ImageOrientationPatient, dtype=float)
+            normal = np.cross(orientation[:3], orientation[3:])
+            position = float(
+                np.dot(normal, np.array(dcm.ImagePositionPatient, dtype=float))
+            )
+        spacing = dcm.get("PixelSpacing")
+        return DICOMSliceHeader(
+            filename=filename,
+            series_uid=str(dcm.get("SeriesInstanceUID", "")),
+            instance=None if instance is None else int(instance),
+            position=position,
+            shape=(int(dcm.Rows), int(dcm.Columns)),
+            spacing=None if spacing is None else (float(spacing[0]), float(spacing[1])),
+        )
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError) as exc:
+        # Invalid or malformed attribute values (the file is skipped):
+        logging.getLogger(__name__).warning(
+            "Invalid DICOM header in %s: %s", filename, exc
+        )
+        return None
+
+
+def sort_dicom_series(
+    headers: list[DICOMSliceHeader], series_uid: str | None = None
+) -> list[DICOMSliceHeader]:
+    """Select slices of a DICOM series and sort them: by position along slice
+    normal if known for all slices, by instance number otherwise
+
+    Args:
+        headers: Slice headers (files which are not DICOM image files are ignored)
+        series_uid: Series instance UID (default: series with the most slices)
+
+    Returns:
+        Sorted slice headers
+
+    Raises:
+        ValueError: if there is no slice, or if slices have different shapes
+    """
+    series: dict[str, list[DICOMSliceHeader]] = {}
+    for header in headers:
+        if header is not None:
+            series.setdefault(header.series_uid, []).append(header)
+    if series_uid is None and series:
+        series_uid = max(series, key=lambda uid: len(series[uid]))
+    slices = series.get(series_uid, [])
+    if not slices:
+        raise ValueError("No DICOM series slice found")
+    if len({header.shape for header in slices}) > 1:
+        raise ValueError("DICOM series slices have different shapes")
+    if all(header.position is not None for header in slices):
+        return sorted(slices, key=lambda h: (h.position, h.instance or 0, h.filename))
+    return sorted(slices, key=lambda h: (h.instance or 0, h.filename))
+
+
+def read_dicom_pixels(filename: str) -> np.ndarray:
+    """Read and decode DICOM slice pixel data (stored values: no rescaling)
+
+    Args:
+        filename: File name
+
+    Returns:
+        Pixel data
+    """
+    # pylint: disable=import-outside-toplevel
+    import pydicom
+
+    return pydicom.dcmread(filename, force=True).pixel_array
@@ -0,0 +1,186 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+DataLab MAT-File I/O module
+
+MAT-Files up to v7 are read with SciPy. MAT-Files v7.3 are HDF5 files, which
+SciPy does not support: they are read with h5py, variable by variable, so that
+variables may be listed (and selected) before reading any data, and data is read
+only when needed (see :py:class:`Mat73Loader`).
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from __future__ import annotations
+
+import dataclasses
+
+import h5py
+import numpy as np
+import scipy.io as sio
+
+from cdl.utils.strings import to_string
+
+#: MATLAB classes of numeric arrays (other classes, e.g. "char", "cell" or
+#: "struct", are not supported)
+MATLAB_NUMERIC_CLASSES = (
+    "double",
+    "single",
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "int64",
+    "uint64",
+    "logical",
+)
+
+
+@dataclasses.dataclass
+class MatVariable:
+    """MAT-File variable
+
+    Args:
+        name: Variable name
+        shape: Array shape (MATLAB order, e.g. (rows, columns))
+        mclass: MATLAB class (e.g. "double")
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    mclass: str
+
+
+def is_mat73_file(filename: str) -> bool:
+    """Return True if file is a MAT-File v7.3 (HDF5-based)
+
+    Args:
+        filename: File name
+    """
+    return h5py.is_hdf5(filename)
+
+
+def get_mat73_dtype(dset: h5py.Dataset) -> np.dtype:
+    """Return data type of MAT-File v7.3 array: complex arrays are stored as
+    compound datasets with "real" and "imag" fields, which have the same memory
+    layout as NumPy complex arrays
+
+    Args:
+        dset: HDF5 dataset
+
+    Returns:
+        Data type
+    """
+    dtype = dset.dtype
+    if dtype.names == ("real", "imag"):
+        return np.dtype(f"c{2 * dtype['real'].itemsize}")
+    return dtype
+
+
+def list_mat_variables(filename: str) -> list[MatVariable]:
+    """List numeric array variables of MAT-File, without reading any data
+
+    Args:
+        filename: File name
+
+    Returns:
+        Variables
+    """
+    variables = []
+    if is_mat73_file(filename):
+        with h5py.File(filename, "r") as h5:
+            for name, dset in h5.items():
+                if not isinstance(dset, h5py.Dataset) or "MATLAB_empty" in dset.attrs:
+                    continue
+                mclass = to_string(dset.attrs.get("MATLAB_class", b""))
+                if mclass in MATLAB_NUMERIC_CLASSES:
+                    # MATLAB arrays are column-major: dimensions are reversed
+                    variables.append(MatVariable(name, dset.shape[::-1], mclass))
+    else:
+        for name, shape, mclass in sio.whosmat(filename):
+            if mclass in MATLAB_NUMERIC_CLASSES:
+                variables.append(MatVariable(name, tuple(shape), mclass))
+    return variables
+
+
+def read_mat73_variable(filename: str, name: str) -> np.ndarray:
+    """Read MAT-File v7.3 variable
+
+    Contiguous (uncompressed) arrays are memory-mapped (in copy-on-write mode):
+    data is read from file only when accessed. Chunked arrays are read chunk by
+    chunk by HDF5. As MATLAB arrays are column-major, the returned array is the
+    transposed view of the stored array (Fortran-ordered array with MATLAB's
+    shape): data is not copied.
+
+    Args:
+        filename: File name
+        name: Variable name
+
+    Returns:
+        Array data
+    """
+    with h5py.File(filename, "r") as h5:
+        dset = h5[name]
+        dtype = get_mat73_dtype(dset)
+        offset = dset.id.get_offset()
+        if dset.chunks is None and offset is not None and dtype.names is None:
+            data = np.memmap(
+                filename, dtype=dtype, mode="c", offset=offset, shape=dset.shape
+            )
+        else:
+            data = dset[()]
+            if data.dtype != dtype:
+                data = data.view(dtype)
+    return data.T
+
+
+class Mat73Loader:
+    """Deferred loader of a MAT-File v7.3 variable (see
+    :py:meth:`cdl.core.model.base.BaseObj.set_data_loader`)
+
+    Args:
+        filename: File name
+        name: Variable name
+    """
+
+    def __init__(self, filename: str, name: str) -> None:
+        self.filename = filename
+        self.name = name
+        with h5py.File(filename, "r") as h5:
+            self.dtype = get_mat73_dtype(h5[name])
+
+    def __call__(self) -> np.ndarray:
+        """Read variable"""
+        return read_mat73_variable(self.filename, self.name)
+
+
+class MatFormatMixin:
+    """Mixin for MAT-File formats: variables may be selected before reading
+    (see `variables` argument of format's `read` method)"""
+
+    @staticmethod
+    def is_variable_supported(variable: MatVariable) -> bool:
+        """Return True if variable may be read with this format
+
+        Args:
+            variable: Variable
+        """
+        return True
+
+    def get_variables(self, filename: str) -> list[MatVariable]:
+        """Return variables which may be read with this format, without reading any
+        data
+
+        Args:
+            filename: File name
+
+        Returns:
+            Variables
+        """
+        return [
+            var
+            for var in list_mat_variables(filename)
+            if self.is_variable_supported(var)
+        ]
@@ -8,32 +8,721 @@ DataLab Native I/O module (native HDF5/JSON formats)
 
 from __future__ import annotations
 
-from guidata.io import HDF5Reader, HDF5Writer
+import collections
+import concurrent.futures
+import itertools
+import json
+import os
+import os.path as osp
+import struct
+import zlib
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+import h5py
+import numpy as np
+from guidata.io import HDF5Reader, HDF5Writer, JSONReader, JSONWriter
+from guidata.io.h5fmt import DICT_NAME, SEQUENCE_NAME, HDF5Handler
+from guidata.io.jsonfmt import CustomJSONDecoder, CustomJSONEncoder, JSONHandler
 
 import cdl
 
+if TYPE_CHECKING:
+    from cdl.core.model.base import BaseObj
+    from cdl.utils.qthelpers import CallbackWorker
+
 DATALAB_VERSION_NAME = "DataLab_Version"
 
+#: Supported HDF5 compression filters (only filters built into h5py are used, so
+#: that files remain readable without any third-party HDF5 plugin)
+H5_COMPRESSIONS = ("gzip", "lzf")
+
+#: Default HDF5 chunk size (in bytes) for compressed datasets
+H5_CHUNK_SIZE = 2**20
+
+#: Arrays smaller than this size (in bytes) are never chunked nor compressed
+H5_MIN_COMPRESSED_SIZE = 2**16
+
+#: Name of the temporary group used when moving unchanged objects in incremental
+#: save mode (this group is removed before closing the file)
+H5_DETACHED_NAME = "__DataLab_detached"
+
+#: Magic string at the beginning of DataLab object files
+OBJ_MAGIC = b"\x93DATALAB"
+
+#: DataLab object file format version
+OBJ_FORMAT_VERSION = 1
+
+#: Alignment of the arrays stored in DataLab object files (in bytes)
+OBJ_ALIGNMENT = 64
+
+#: Size of the chunks written to DataLab object files (in bytes)
+OBJ_CHUNK_SIZE = 2**26
+
+#: Arrays smaller than this size (in bytes) are read into memory instead of being
+#: memory-mapped when reading DataLab object files (e.g. ROIs, result shapes)
+OBJ_MMAP_MIN_SIZE = 2**12
+
+
+def get_chunk_shape(shape: tuple[int, ...], itemsize: int, size: int) -> tuple:
+    """Return HDF5 chunk shape for an array, splitting the array along its first
+    axes so that each chunk is about `size` bytes
+
+    Args:
+        shape: Array shape
+        itemsize: Array item size (in bytes)
+        size: Target chunk size (in bytes)
+
+    Returns:
+        Chunk shape
+    """
+    chunks = []
+    nitems = max(1, size // itemsize)
+    for axis, length in enumerate(shape):
+        tail = int(np.prod(shape[axis + 1 :], dtype=np.int64))
+        if tail <= nitems:
+            chunks.append(max(1, min(length, nitems // max(tail, 1))))
+            chunks.extend(shape[axis + 1 :])
+            break
+        chunks.append(1)
+    return tuple(chunks)
+
+
+def iter_chunk_slices(
+    shape: tuple[int, ...], chunks: tuple[int, ...]
+) -> Iterator[tuple[tuple[int, ...], tuple[slice, ...]]]:
+    """Iterate over the chunks of an array
+
+    Args:
+        shape: Array shape
+        chunks: Chunk shape
+
+    Yields:
+        Tuples (chunk offset, chunk slices)
+    """
+    ranges = [range(0, length, chunk) for length, chunk in zip(shape, chunks)]
+    for offset in itertools.product(*ranges):
+        slices = tuple(
+            slice(start, min(start + chunk, length))
+            for start, chunk, length in zip(offset, chunks, shape)
+        )
+        yield offset, slices
+
+
+def encode_chunk(
+    data: np.ndarray, chunks: tuple[int, ...], shuffle: bool, level: int
+) -> bytes:
+    """Encode array chunk exactly like the HDF5 "shuffle" and "deflate" filters
+
+    Args:
+        data: Chunk data (edge chunks are smaller than the chunk shape)
+        chunks: Chunk shape
+        shuffle: If True, apply byte shuffle before compression
+        level: Deflate (gzip) compression level
+
+    Returns:
+        Encoded chunk
+    """
+    if data.shape != chunks:
+        # HDF5 always stores full chunks: edge chunks are padded
+        padded = np.zeros(chunks, dtype=data.dtype)
+        padded[tuple(slice(0, length) for length in data.shape)] = data
+        data = padded
+    buffer = np.ascontiguousarray(data).view(np.uint8)
+    if shuffle and data.dtype.itemsize > 1:
+        buffer = buffer.reshape(-1, data.dtype.itemsize).T
+    return zlib.compress(np.ascontiguousarray(buffer), level)
+
 
 class NativeH5Writer(HDF5Writer):
     """DataLab signal/image objects HDF5 guidata Dataset Writer class
 
+    Large numerical arrays may be chunked and compressed: with "gzip" compression,
+    chunks are encoded on a thread pool while h5py writes them sequentially (raw
+    chunk writes). Files are standard HDF5 files and remain readable by
+    :py:class:`NativeH5Reader` (or any HDF5 reader).
+
+    In incremental mode (`states` is not None and file exists), the file is updated
+    in place: objects which are unchanged since the states were recorded are kept
+    (or moved if their name changed) instead of being written again, and objects
+    which are not written anymore are removed when closing the file.
+
     Args:
         filename (str): HDF5 file name
+        compression (str | None): Compression filter ("gzip" or "lzf"), or None
+         to store arrays without compression (default)
+        level (int): Compression level (gzip only, default: 1, i.e. fastest)
+        shuffle (bool): If True, apply byte shuffle filter before compression
+         (this often improves compression ratio of numerical data)
+        chunk_size (int): Chunk size in bytes (default: 1 MiB)
+        max_workers (int | None): Maximum number of threads used for encoding
+         chunks (default: None, i.e. number of CPUs)
+        states (dict | None): Object states recorded when this file was last
+         written or read (see :py:attr:`states`), enabling incremental mode
     """
 
-    def __init__(self, filename: str) -> None:
-        super().__init__(filename)
+    def __init__(
+        self,
+        filename: str,
+        compression: str | None = None,
+        level: int = 1,
+        shuffle: bool = True,
+        chunk_size: int = H5_CHUNK_SIZE,
+        max_workers: int | None = None,
+        states: dict[str, tuple[str, str]] | None = None,
+    ) -> None:
+        if compression is not None and compression not in H5_COMPRESSIONS:
+            raise ValueError(f"Unsupported HDF5 compression: {compression}")
+        self.incremental = states is not None and osp.isfile(filename)
+        if self.incremental:
+            # Not calling `HDF5Writer.__init__` which truncates the file
+            HDF5Handler.__init__(self, filename)  # pylint: disable=non-parent-init-called
+            self.open("a")
+            if DATALAB_VERSION_NAME in self.h5:
+                del self.h5[DATALAB_VERSION_NAME]
+        else:
+            super().__init__(filename)
         self.h5[DATALAB_VERSION_NAME] = cdl.__version__
+        self.compression = compression
+        self.level = level
+        self.shuffle = shuffle
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.__executor: concurrent.futures.ThreadPoolExecutor | None = None
+        #: Object states, mapping object keys to (HDF5 path, state) tuples
+        self.states: dict[str, tuple[str, str]] = {}
+        self.__previous = dict(states) if self.incremental else {}
+        self.__occupants = {path: key for key, (path, _s) in self.__previous.items()}
+        self.__detached: dict[str, str] = {}
+        self.__visited: set[str] = set()
+        self.__reused: set[str] = set()
+
+    def begin(self, section: str) -> None:
+        """Begin a new section
+
+        Args:
+            section: Section name
+        """
+        super().begin(section)
+        self.__visited.add("/".join(self.option))
+
+    def reuse_object(self, key: str, state: str | None) -> bool:
+        """Register object to be written in current group, and return True if
+        object is unchanged and has been kept from the existing file (in that case,
+        the object must not be serialized)
+
+        Args:
+            key: Object key (e.g. object UUID)
+            state: Object state (None if object has to be considered as modified)
+
+        Returns:
+            True if object has been kept from the existing file
+        """
+        path = "/".join(self.option)
+        self.states[key] = (path, state)
+        previous = self.__previous.pop(key, None)
+        if state is not None and previous is not None and previous[1] == state:
+            src = self.__detached.pop(key, previous[0])
+            self.__occupants.pop(src, None)
+            if src in self.h5:
+                if src != path:
+                    if path in self.h5:
+                        self.__detach(path)
+                    self.h5.require_group(path.rsplit("/", 1)[0])
+                    self.h5.move(src, path)
+                self.__reused.add(path)
+                return True
+        if path in self.h5:
+            self.__detach(path)
+        return False
+
+    def __detach(self, path: str) -> None:
+        """Free HDF5 path: the object stored there is moved to a temporary group if
+        it may still be reused, or deleted otherwise
+
+        Args:
+            path: HDF5 path
+        """
+        key = self.__occupants.pop(path, None)
+        if key is not None and key in self.__previous:
+            dest = f"{H5_DETACHED_NAME}/{len(self.__detached)}"
+            self.h5.require_group(H5_DETACHED_NAME)
+            self.h5.move(path, dest)
+            self.__detached[key] = dest
+        else:
+            del self.h5[path]
+
+    def __remove_stale_items(self, group: h5py.Group, prefix: str = "") -> None:
+        """Remove items which have not been written or kept in incremental mode
+
+        Args:
+            group: HDF5 group
+            prefix: Path prefix
+        """
+        for name in list(group):
+            path = prefix + name
+            if path == DATALAB_VERSION_NAME:
+                continue
+            if path not in self.__visited:
+                del group[name]
+            elif path not in self.__reused and isinstance(group[name], h5py.Group):
+                self.__remove_stale_items(group[name], path + "/")
+
+    def __get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return chunk encoding thread pool (created on first use)"""
+        if self.__executor is None:
+            self.__executor = concurrent.futures.ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="NativeH5Writer"
+            )
+        return self.__executor
+
+    def write_array(self, val: np.ndarray) -> None:
+        """Write numpy array, chunked and compressed if compression is enabled
+
+        Args:
+            val: Array to write
+        """
+        val = np.asarray(val)
+        if self.incremental and self.option[-1] in self.get_parent_group():
+            del self.get_parent_group()[self.option[-1]]
+        if (
+            self.compression is None
+            or val.ndim == 0
+            or val.dtype.kind not in "biufc"
+            or val.nbytes < H5_MIN_COMPRESSED_SIZE
+        ):
+            super().write_array(val)
+            return
+        group = self.get_parent_group()
+        chunks = get_chunk_shape(val.shape, val.dtype.itemsize, self.chunk_size)
+        dset = group.create_dataset(
+            self.option[-1],
+            shape=val.shape,
+            dtype=val.dtype,
+            chunks=chunks,
+            compression=self.compression,
+            compression_opts=self.level if self.compression == "gzip" else None,
+            shuffle=self.shuffle,
+        )
+        if self.compression == "gzip":
+            self.__write_chunks(dset, val, chunks)
+        else:
+            dset[...] = val
+
+    def __write_chunks(
+        self, dset: h5py.Dataset, val: np.ndarray, chunks: tuple[int, ...]
+    ) -> None:
+        """Encode chunks on the thread pool and write them sequentially
+
+        Args:
+            dset: HDF5 dataset
+            val: Array to write
+            chunks: Chunk shape
+        """
+        executor = self.__get_executor()
+        pending = collections.deque()
+        # Limiting the number of chunks in flight to bound memory usage
+        max_pending = 2 * self.max_workers
+        for offset, slices in iter_chunk_slices(val.shape, chunks):
+            future = executor.submit(
+                encode_chunk, val[slices], chunks, self.shuffle, self.level
+            )
+            pending.append((offset, future))
+            if len(pending) >= max_pending:
+                offset, future = pending.popleft()
+                dset.id.write_direct_chunk(offset, future.result())
+        while pending:
+            offset, future = pending.popleft()
+            dset.id.write_direct_chunk(offset, future.result())
+
+    def close(self, cleanup: bool = True) -> None:
+        """Close HDF5 file and shut down the chunk encoding thread pool
+
+        Args:
+            cleanup: If True (default), in incremental mode, remove objects which
+             have not been written or kept (this must be False if writing has been
+             interrupted)
+        """
+        if cleanup and self.incremental and self.h5 is not None:
+            self.__remove_stale_items(self.h5)
+        super().close()
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+
+class H5ArrayLoader:
+    """Deferred loader of an array stored in a HDF5 file
+
+    Args:
+        filename: HDF5 file name
+        path: HDF5 dataset path
+        shape: Array shape
+        dtype: Array data type
+    """
+
+    def __init__(
+        self, filename: str, path: str, shape: tuple[int, ...], dtype: np.dtype
+    ) -> None:
+        self.filename = filename
+        self.path = path
+        self.shape = shape
+        self.dtype = dtype
+
+    def __call__(self) -> np.ndarray:
+        """Read array from HDF5 file"""
+        with h5py.File(self.filename, "r") as h5:
+            return h5[self.path][...]
 
 
 class NativeH5Reader(HDF5Reader):
     """DataLab signal/image objects HDF5 guidata dataset Writer class
 
+    In lazy mode, arrays named after one of the `lazy_names` (i.e. signal and image
+    data arrays) are not read, except small ones: None is returned instead, and
+    a :py:class:`H5ArrayLoader` is stored to be retrieved with
+    :py:meth:`pop_deferred_array`.
+
     Args:
         filename (str): HDF5 file name
+        lazy (bool): If True, defer reading of signal and image data arrays
     """
 
-    def __init__(self, filename: str) -> None:
+    #: Names of the arrays which may be deferred in lazy mode
+    LAZY_NAMES = ("data", "xydata")
+
+    #: Arrays smaller than this size (in bytes) are always read
+    LAZY_MIN_SIZE = 2**20
+
+    def __init__(self, filename: str, lazy: bool = False) -> None:
         super().__init__(filename)
         self.version = self.h5[DATALAB_VERSION_NAME]
+        self.lazy = lazy
+        self.__deferred: H5ArrayLoader | None = None
+        #: Object states, mapping object keys to (HDF5 path, state) tuples (this
+        #: may be passed to :py:class:`NativeH5Writer` for incremental save)
+        self.states: dict[str, tuple[str, str]] = {}
+
+    def read_array(self) -> np.ndarray | None:
+        """Read array from current group (or defer reading in lazy mode)
+
+        Returns:
+            Array, or None if reading has been deferred
+        """
+        if self.lazy and self.option[-1] in self.LAZY_NAMES:
+            group = self.get_parent_group()
+            dset = group[self.option[-1]]
+            if (
+                isinstance(dset, h5py.Dataset)
+                and dset.nbytes >= self.LAZY_MIN_SIZE
+                # Arrays stored in dictionaries or sequences (e.g. metadata) are
+                # not signal or image data arrays:
+                and DICT_NAME not in group.attrs
+                and SEQUENCE_NAME not in group.attrs
+            ):
+                self.__deferred = H5ArrayLoader(
+                    self.filename, dset.name, dset.shape, dset.dtype
+                )
+                return None
+        return super().read_array()
+
+    def pop_deferred_array(self) -> H5ArrayLoader | None:
+        """Return loader of the last deferred array (None if no array has been
+        deferred since last call)"""
+        loader, self.__deferred = self.__deferred, None
+        return loader
+
+    def register_object(self, key: str, state: str | None) -> None:
+        """Register object read from current group
+
+        Args:
+            key: Object key (e.g. object UUID)
+            state: Object state
+        """
+        self.states[key] = ("/".join(self.option), state)
+
+
+def get_h5_unused_size(filename: str) -> int:
+    """Return an estimate of the unused space in HDF5 file, i.e. file size minus
+    the storage size of all datasets (space freed by deleted or replaced datasets
+    is not reclaimed by HDF5)
+
+    Args:
+        filename: HDF5 file name
+
+    Returns:
+        Unused size in bytes (approximate: this includes HDF5 metadata)
+    """
+    used = 0
+
+    def add_storage_size(_name: str, item: h5py.Dataset | h5py.Group) -> None:
+        """Add dataset storage size"""
+        nonlocal used
+        if isinstance(item, h5py.Dataset):
+            used += item.id.get_storage_size()
+
+    with h5py.File(filename, "r") as h5:
+        h5.visititems(add_storage_size)
+    return max(0, osp.getsize(filename) - used)
+
+
+def compact_h5_file(filename: str) -> None:
+    """Compact HDF5 file by copying all its contents into a new file (HDF5 does not
+    reclaim space freed by deleted datasets, e.g. after incremental saves)
+
+    Args:
+        filename: HDF5 file name
+    """
+    tmpname = filename + ".tmp"
+    with h5py.File(filename, "r") as src, h5py.File(tmpname, "w") as dst:
+        for name in src:
+            src.copy(src[name], dst, name=name)
+        dst.attrs.update(src.attrs)
+    os.replace(tmpname, filename)
+
+
+def align_offset(offset: int, alignment: int = OBJ_ALIGNMENT) -> int:
+    """Return the smallest aligned offset greater than or equal to `offset`
+
+    Args:
+        offset: Offset (in bytes)
+        alignment: Alignment (in bytes)
+
+    Returns:
+        Aligned offset
+    """
+    return -(-offset // alignment) * alignment
+
+
+class NativeObjWriter(JSONWriter):
+    """DataLab signal/image object writer for DataLab object files (see
+    :py:func:`write_native_object`): numerical arrays written by data items (e.g.
+    signal or image data) are collected to be stored in the raw payload, and all
+    other values (including metadata, ROIs and result shapes) are written in the
+    JSON header"""
+
+    def __init__(self) -> None:
+        super().__init__(None)
+        self.arrays: list[np.ndarray] = []
+
+    def write_array(self, val: np.ndarray) -> None:
+        """Write numpy array (numerical arrays are stored in the payload)
+
+        Args:
+            val: Array to write
+        """
+        if val is None:
+            self.write_none()
+            return
+        val = np.asarray(val)
+        if val.dtype.kind not in "biufc":
+            super().write_array(val)
+            return
+        self.write_any({"__array__": len(self.arrays)})
+        self.arrays.append(val)
+
+
+class NativeObjReader(JSONReader):
+    """DataLab signal/image object reader for DataLab object files (see
+    :py:func:`read_native_object`): arrays stored in the payload are memory-mapped
+    (copy-on-write), so that reading is immediate whatever the data size
+
+    Args:
+        filename: DataLab object file name
+
+    Raises:
+        ValueError: if file is not a DataLab object file
+    """
+
+    def __init__(self, filename: str) -> None:
+        JSONHandler.__init__(self, filename)  # pylint: disable=non-parent-init-called
+        with open(filename, "rb") as fdesc:
+            prefix = fdesc.read(len(OBJ_MAGIC) + 8)
+            if len(prefix) < len(OBJ_MAGIC) + 8 or not prefix.startswith(OBJ_MAGIC):
+                raise ValueError(f"{filename} is not a DataLab object file")
+            version, size = struct.unpack("<II", prefix[len(OBJ_MAGIC) :])
+            if version > OBJ_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported DataLab object file format version: {version}"
+                )
+            header = json.loads(fdesc.read(size).decode("utf-8"), cls=CustomJSONDecoder)
+        self.offset = align_offset(len(prefix) + size)
+        self.version: str = header["version"]
+        self.classname: str = header["class"]
+        self.arrays: list[dict[str, Any]] = header["arrays"]
+        self.set_json_dict(header["object"])
+
+    def get_array(self, index: int) -> np.ndarray:
+        """Return array stored in the payload
+
+        Args:
+            index: Array index
+
+        Returns:
+            Memory-mapped array (copy-on-write), or array read into memory if it is
+            smaller than :py:data:`OBJ_MMAP_MIN_SIZE`
+        """
+        desc = self.arrays[index]
+        dtype, shape = np.dtype(desc["dtype"]), tuple(desc["shape"])
+        size = dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+        if size == 0:
+            return np.empty(shape, dtype)
+        if size < OBJ_MMAP_MIN_SIZE:
+            with open(self.filename, "rb") as fdesc:
+                fdesc.seek(self.offset + desc["offset"])
+                return np.frombuffer(fdesc.read(size), dtype).reshape(shape).copy()
+        return np.memmap(
+            self.filename,
+            dtype=dtype,
+            mode="c",
+            offset=self.offset + desc["offset"],
+            shape=shape,
+        )
+
+    def read_array(self) -> np.ndarray | None:
+        """Read array (arrays stored in the payload are memory-mapped)
+
+        Returns:
+            Array
+        """
+        val = self.read_any()
+        if isinstance(val, dict) and "__array__" in val:
+            return self.get_array(val["__array__"])
+        return val
+
+
+def is_mapped_from(array: np.ndarray, filename: str) -> bool:
+    """Return True if array is (a view of) an array memory-mapped from file
+
+    Args:
+        array: Array
+        filename: File name
+
+    Returns:
+        True if array data is memory-mapped from file
+    """
+    path = osp.normcase(osp.abspath(filename))
+    while isinstance(array, np.ndarray):
+        if isinstance(array, np.memmap) and array.filename is not None:
+            return osp.normcase(array.filename) == path
+        array = array.base
+    return False
+
+
+def release_mapped_data(obj: BaseObj, filename: str) -> None:
+    """Replace data arrays of object which are memory-mapped from file by in-memory
+    copies, so that the file may be replaced or removed (on Windows, a file may not
+    be replaced while it is memory-mapped)
+
+    Args:
+        obj: Signal or image object
+        filename: File name
+    """
+    for name in obj.DATA_ATTRS:
+        data = obj.__dict__.get(name)
+        if isinstance(data, np.ndarray) and is_mapped_from(data, filename):
+            # Data is unchanged: bypassing `__setattr__` (data version is kept)
+            obj.__dict__[name] = np.array(data)
+
+
+def write_native_object(
+    filename: str, obj: BaseObj, worker: CallbackWorker | None = None
+) -> None:
+    """Write signal/image object to a DataLab object file
+
+    A DataLab object file is made of:
+
+    - A magic string (:py:data:`OBJ_MAGIC`), followed by the file format version
+      and the JSON header size (little-endian 32-bit unsigned integers)
+    - The JSON header: DataLab version, object class name, arrays descriptions
+      (offset, data type and shape) and serialized object (all items except
+      numerical data arrays, i.e. including metadata, ROIs and result shapes)
+    - The payload: raw little-endian C-ordered arrays, each array being aligned
+      on :py:data:`OBJ_ALIGNMENT` bytes (offsets are relative to the payload start,
+      which is aligned too)
+
+    Args:
+        filename: File name
+        obj: Signal or image object
+        worker: Callback worker object (if operation is canceled, the file is left
+         untouched)
+
+    Raises:
+        PermissionError: if the file may not be replaced (e.g. on Windows, if it is
+         still memory-mapped by another object read from it)
+    """
+    writer = NativeObjWriter()
+    obj.serialize(writer)
+    arrays = []
+    descs = []
+    offset = 0
+    for array in writer.arrays:
+        array = np.ascontiguousarray(array, array.dtype.newbyteorder("<"))
+        arrays.append(array)
+        descs.append({"offset": offset, "dtype": array.dtype.str, "shape": array.shape})
+        offset = align_offset(offset + array.nbytes)
+    header = {
+        "version": cdl.__version__,
+        "class": obj.__class__.__name__,
+        "arrays": descs,
+        "object": writer.get_json_dict(),
+    }
+    text = json.dumps(header, cls=CustomJSONEncoder).encode("utf-8")
+    prefix = OBJ_MAGIC + struct.pack("<II", OBJ_FORMAT_VERSION, len(text))
+    payload_offset = align_offset(len(prefix) + len(text))
+    total = sum(array.nbytes for array in arrays)
+    written = 0
+    canceled = False
+    # Writing to a temporary file first: the target file may be memory-mapped by
+    # an object read from it (truncating it would invalidate its data)
+    tmpname = filename + ".tmp"
+    with open(tmpname, "wb") as fdesc:
+        fdesc.write(prefix + text)
+        for array, desc in zip(arrays, descs):
+            fdesc.write(b"\0" * (payload_offset + desc["offset"] - fdesc.tell()))
+            buffer = array.reshape(-1).view(np.uint8)
+            for start in range(0, buffer.size, OBJ_CHUNK_SIZE):
+                fdesc.write(buffer[start : start + OBJ_CHUNK_SIZE])
+                written += min(OBJ_CHUNK_SIZE, buffer.size - start)
+                if worker is not None:
+                    worker.set_progress(written / max(total, 1))
+                    if worker.was_canceled():
+                        canceled = True
+                        break
+            if canceled:
+                break
+    if canceled:
+        os.remove(tmpname)
+        return
+    release_mapped_data(obj, filename)
+    try:
+        os.replace(tmpname, filename)
+    except OSError:
+        os.remove(tmpname)
+        raise
+
+
+def read_native_object(filename: str, obj: BaseObj) -> BaseObj:
+    """Read signal/image object from a DataLab object file (see
+    :py:func:`write_native_object`): data arrays are memory-mapped
+
+    Args:
+        filename: File name
+        obj: Signal or image object to be deserialized (a new UUID is generated)
+
+    Returns:
+        Object
+
+    Raises:
+        ValueError: if file is not a DataLab object file, or if it does not contain
+         an object of the same class as `obj`
+    """
+    reader = NativeObjReader(filename)
+    if reader.classname != obj.__class__.__name__:
+        raise ValueError(
+            f"{filename} contains a {reader.classname} "
+            f"(expected {obj.__class__.__name__})"
+        )
+    obj.deserialize(reader)
+    obj.regenerate_uuid()
+    return obj
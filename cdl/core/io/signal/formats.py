@@ -11,9 +11,11 @@ from typing import TYPE_CHECKING
 import numpy as np
 import scipy.io as sio
 
-from cdl.config import _
+from cdl.config import Conf, _
 from cdl.core.io.base import FormatInfo
 from cdl.core.io.conv import convert_array_to_standard_type
+from cdl.core.io.mat import MatFormatMixin, is_mat73_file, read_mat73_variable
+from cdl.core.io.native import read_native_object, write_native_object
 from cdl.core.io.signal import funcs
 from cdl.core.io.signal.base import SignalFormatBase
 
@@ -27,7 +29,7 @@ class CSVSignalFormat(SignalFormatBase):
 
     FORMAT_INFO = FormatInfo(
         name=_("CSV files"),
-        extensions="*.csv *.txt",
+        extensions="*.csv *.txt *.csv.gz",
         readable=True,
         writeable=True,
     )
@@ -64,12 +66,15 @@ class CSVSignalFormat(SignalFormatBase):
             return objs
         return self.create_signals_from(xydata, filename)
 
-    def write(self, filename: str, obj: SignalObj) -> None:
+    def write(
+        self, filename: str, obj: SignalObj, worker: CallbackWorker | None = None
+    ) -> None:
         """Write data to file
 
         Args:
             filename: Name of file to write
             obj: Signal object to read data from
+            worker: Callback worker object
         """
         funcs.write_csv(
             filename,
@@ -79,6 +84,7 @@ class CSVSignalFormat(SignalFormatBase):
             [obj.ylabel],
             [obj.yunit],
             obj.metadata.get(self.HEADER_KEY, ""),
+            worker,
         )
 
 
@@ -103,17 +109,20 @@ class NumPySignalFormat(SignalFormatBase):
         """
         return convert_array_to_standard_type(np.load(filename))
 
-    def write(self, filename: str, obj: SignalObj) -> None:
+    def write(
+        self, filename: str, obj: SignalObj, worker: CallbackWorker | None = None
+    ) -> None:
         """Write data to file
 
         Args:
             filename: Name of file to write
             obj: Signal object to read data from
+            worker: Callback worker object
         """
         np.save(filename, obj.xydata.T)
 
 
-class MatSignalFormat(SignalFormatBase):
+class MatSignalFormat(MatFormatMixin, SignalFormatBase):
     """Object representing a MAT-File .mat signal file type"""
 
     FORMAT_INFO = FormatInfo(
@@ -124,19 +133,36 @@ class MatSignalFormat(SignalFormatBase):
     )  # pylint: disable=duplicate-code
 
     def read(
-        self, filename: str, worker: CallbackWorker | None = None
+        self,
+        filename: str,
+        worker: CallbackWorker | None = None,
+        variables: list[str] | None = None,
     ) -> list[SignalObj]:
         """Read data and metadata from file, write metadata to object, return xydata
 
+        MAT-Files v7.3 are read variable by variable (see
+        :py:func:`cdl.core.io.mat.read_mat73_variable`).
+
         Args:
             filename: Name of file to read
+            worker: Callback worker object
+            variables: Names of variables to be read (default: all variables)
 
         Returns:
             NumPy array xydata
         """
-        mat = sio.loadmat(filename)
+        if is_mat73_file(filename):
+            names = [
+                var.name
+                for var in self.get_variables(filename)
+                if variables is None or var.name in variables
+            ]
+            # Reading variables one at a time:
+            items = ((name, read_mat73_variable(filename, name)) for name in names)
+        else:
+            items = sio.loadmat(filename, variable_names=variables).items()
         allsig: list[SignalObj] = []
-        for dname, data in mat.items():
+        for dname, data in items:
             if dname.startswith("__") or not isinstance(data, np.ndarray):
                 continue
             for sig in self.create_signals_from(data.squeeze(), filename):
@@ -145,13 +171,58 @@ class MatSignalFormat(SignalFormatBase):
                 allsig.append(sig)
         return allsig
 
-    def write(self, filename: str, obj: SignalObj) -> None:
+    def write(
+        self, filename: str, obj: SignalObj, worker: CallbackWorker | None = None
+    ) -> None:
         """Write data to file
 
         Args:
             filename: Name of file to write
             obj: Signal object to read data from
+            worker: Callback worker object
         """
         # metadata cannot be saved as such as their type will be lost and
         # cause problems when reading the file back
-        sio.savemat(filename, {"sig": obj.xydata.T})
+        sio.savemat(
+            filename,
+            {"sig": obj.xydata.T},
+            do_compression=Conf.io.mat_compression.get(False),
+        )
+
+
+class NativeSignalFormat(SignalFormatBase):
+    """Object representing DataLab object file type (see
+    :py:func:`cdl.core.io.native.write_native_object`)"""
+
+    FORMAT_INFO = FormatInfo(
+        name=_("DataLab object files"),
+        extensions="*.dlobj",
+        readable=True,
+        writeable=True,
+    )
+
+    def read(
+        self, filename: str, worker: CallbackWorker | None = None
+    ) -> list[SignalObj]:
+        """Read list of signal objects from file
+
+        Args:
+            filename: File name
+            worker: Callback worker object
+
+        Returns:
+            List of signal objects
+        """
+        return [read_native_object(filename, self.create_object(filename))]
+
+    def write(
+        self, filename: str, obj: SignalObj, worker: CallbackWorker | None = None
+    ) -> None:
+        """Write data to file
+
+        Args:
+            filename: Name of file to write
+            obj: Signal object to read data from
+            worker: Callback worker object
+        """
+        write_native_object(filename, obj, worker)
@@ -8,13 +8,19 @@ DataLab I/O signal functions
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
+import gzip
+import importlib.util
+import io
+import os
 import re
 from typing import TextIO
 
 import numpy as np
 import pandas as pd
 
-from cdl.utils.io import count_lines
+from cdl.core.io.conv import format_text_rows
 from cdl.utils.qthelpers import CallbackWorker
 
 
@@ -48,6 +54,138 @@ def get_labels_units_from_dataframe(
     return xlabel, ylabels, xunit, yunits
 
 
+#: Delimiters tried when detecting the format of CSV files (in order of preference)
+CSV_DELIMITERS = (",", ";", "\t", " ")
+
+#: Size of the head buffer used to detect the format of CSV files (bytes)
+CSV_SNIFF_SIZE = 2**16
+
+#: Maximum number of lines preceding the data (or column names) in CSV files
+CSV_MAX_SKIPROWS = 20
+
+#: Number of rows per chunk when reading CSV files
+CSV_CHUNK_SIZE = 2**17
+
+#: True if pyarrow is installed (pandas "pyarrow" CSV engine is then available)
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+#: Compression level of gzip-compressed CSV files (1: fastest)
+CSV_GZIP_LEVEL = 1
+
+
+def is_gzip_filename(filename: str) -> bool:
+    """Return True if file name has a gzip extension (e.g. "data.csv.gz")
+
+    Args:
+        filename: File name
+
+    Returns:
+        True if file is gzip-compressed
+    """
+    return filename.lower().endswith(".gz")
+
+
+@dataclasses.dataclass
+class CSVFormat:
+    """CSV file format, as detected by :py:func:`sniff_csv`
+
+    Args:
+        delimiter: Delimiter
+        skiprows: Number of lines preceding the data (or the column names)
+        has_names: True if data is preceded by a column names line
+        header: Comment lines preceding the column names (None if there are no
+         column names)
+        comment: Comment character
+        has_comments: True if there are comments in data lines (in head buffer)
+    """
+
+    delimiter: str
+    skiprows: int
+    has_names: bool
+    header: str | None
+    comment: str
+    has_comments: bool
+
+
+def is_numeric_row(fields: list[str]) -> bool:
+    """Return True if all fields of a CSV row are numbers (or empty)
+
+    Args:
+        fields: Row fields
+
+    Returns:
+        True if row is numeric
+    """
+    empty = True
+    for field in fields:
+        field = field.strip()
+        if field:
+            try:
+                float(field)
+            except ValueError:
+                return False
+            empty = False
+    return not empty
+
+
+def sniff_csv(
+    filename: str, comment: str = "#", size: int = CSV_SNIFF_SIZE
+) -> CSVFormat:
+    """Detect the format of a CSV file (delimiter, column names, header and comment
+    lines), in a single pass over the head of the file
+
+    Args:
+        filename: CSV file name
+        comment: Comment character
+        size: Size of the head buffer (bytes)
+
+    Raises:
+        ValueError: if format is not supported (no numeric data was found)
+
+    Returns:
+        CSV file format
+    """
+    opener = gzip.open if is_gzip_filename(filename) else open
+    with opener(filename, "rb") as fdesc:
+        buffer = fdesc.read(size)
+        truncated = bool(fdesc.read(1))
+    lines = buffer.decode("utf-8", errors="replace").splitlines()
+    if truncated and len(lines) > 1:
+        lines = lines[:-1]  # Last line may be incomplete
+    contents = [line.split(comment, 1)[0].strip() for line in lines]
+    for delimiter in CSV_DELIMITERS:
+        last_text, ncols, valid = -1, None, True
+        for index, content in enumerate(contents):
+            if not content:
+                continue
+            fields = content.split(delimiter)
+            if not is_numeric_row(fields):
+                last_text, ncols = index, None
+                if index > CSV_MAX_SKIPROWS:
+                    valid = False
+                    break
+            elif ncols is None:
+                ncols = len(fields)
+            elif len(fields) > ncols:
+                valid = False
+                break
+        if not valid or ncols is None:
+            continue
+        has_names = (
+            last_text >= 0 and len(contents[last_text].split(delimiter)) == ncols
+        )
+        skiprows = last_text if has_names else last_text + 1
+        header = None
+        if has_names:
+            header = "\n".join(
+                line for line in lines[:skiprows] if line.startswith(comment)
+            )
+        has_comments = any(comment in line for line in lines[skiprows:])
+        return CSVFormat(delimiter, skiprows, has_names, header, comment, has_comments)
+    raise ValueError("Unable to read CSV file (format not supported)")
+
+
 def read_csv_by_chunks(
     fname_or_fileobj: str | TextIO,
     nlines: int | None = None,
@@ -57,17 +195,18 @@ def read_csv_by_chunks(
     skiprows: int | None = None,
     nrows: int | None = None,
     comment: str | None = None,
-    chunksize: int = 1000,
+    chunksize: int = CSV_CHUNK_SIZE,
 ) -> pd.DataFrame:
     """Read CSV data with primitive options, using pandas read_csv function defaults,
     and reading data in chunks, using the iterator interface.
 
+    Progress is computed from the position in the file (or text stream), so that
+    the file has not to be read beforehand to count lines.
+
     Args:
         fname_or_fileobj: CSV file name or text stream object
-        nlines: Number of lines contained in file (this argument is mandatory if
-         `fname_or_fileobj` is a text stream object: counting line numbers from a
-         text stream is not efficient, especially if one already has access to the
-         initial text content from which the text stream was made)
+        nlines: Number of lines contained in text stream (optional: if given,
+         progress is computed from the number of lines read so far)
         worker: Callback worker object
         delimiter: Delimiter
         header: Header line
@@ -79,29 +218,40 @@ def read_csv_by_chunks(
     Returns:
         DataFrame
     """
-    if isinstance(fname_or_fileobj, str):
-        nlines = count_lines(fname_or_fileobj)
-    elif nlines is None:
-        raise ValueError("Argument `nlines` must be passed for text streams")
-    # Read data in chunks, and concatenate them at the end, thus allowing to call the
-    # progress callback function at each chunk read and to return an intermediate result
-    # if the operation is canceled.
-    chunks = []
-    for chunk in pd.read_csv(
-        fname_or_fileobj,
-        delimiter=delimiter,
-        header=header,
-        skiprows=skiprows,
-        nrows=nrows,
-        comment=comment,
-        chunksize=chunksize,
-    ):
-        chunks.append(chunk)
-        # Compute the progression based on the number of lines read so far
-        if worker is not None:
-            worker.set_progress(sum(len(chunk) for chunk in chunks) / nlines)
-            if worker.was_canceled():
-                break
+    with contextlib.ExitStack() as stack:
+        if isinstance(fname_or_fileobj, str):
+            # Progress is based on the position in the raw (compressed) file
+            rawfile = fileobj = stack.enter_context(open(fname_or_fileobj, "rb"))
+            if is_gzip_filename(fname_or_fileobj):
+                fileobj = stack.enter_context(gzip.GzipFile(fileobj=rawfile))
+        else:
+            rawfile = fileobj = fname_or_fileobj
+        position = rawfile.tell()
+        size = rawfile.seek(0, io.SEEK_END) - position
+        rawfile.seek(position)
+        # Read data in chunks, and concatenate them at the end, thus allowing to call
+        # the progress callback function at each chunk read and to return an
+        # intermediate result if the operation is canceled.
+        chunks = []
+        nrows_read = 0
+        for chunk in pd.read_csv(
+            fileobj,
+            delimiter=delimiter,
+            header=header,
+            skiprows=skiprows,
+            nrows=nrows,
+            comment=comment,
+            chunksize=chunksize,
+        ):
+            chunks.append(chunk)
+            nrows_read += len(chunk)
+            if worker is not None:
+                if nlines is not None:
+                    worker.set_progress_count(nrows_read, max(nlines, 1))
+                elif size > 0:
+                    worker.set_progress((rawfile.tell() - position) / size)
+                if worker.was_canceled():
+                    break
     return pd.concat(chunks)
 
 
@@ -113,6 +263,12 @@ def read_csv(
 ]:
     """Read CSV data, and return tuple (xydata, xlabel, xunit, ylabels, yunits, header).
 
+    File format is detected from the head of the file (see :py:func:`sniff_csv`),
+    then data is read in a single pass, in chunks: progress is reported and reading
+    may be canceled between chunks (see :py:func:`read_csv_by_chunks`). When no
+    worker is given, data is read at once with the pyarrow engine if it is
+    installed (and if there are no comments in data lines).
+
     Args:
         filename: CSV file name
         worker: Callback worker object
@@ -120,94 +276,24 @@ def read_csv(
     Returns:
         Tuple (xydata, xlabel, xunit, ylabels, yunits, header)
     """
-    xydata, xlabel, xunit, ylabels, yunits, header = None, None, None, None, None, None
-
-    # The first attempt is to read the CSV file assuming it has no header because it
-    # won't raise an error if the first line is data. If it fails, we try to read it
-    # with a header, and if it fails again, we try to skip some lines before reading
-    # the data.
-
-    skiprows = None
-
-    # First attempt: no header (try to read with different delimiters)
-    for delimiter in (",", ";", "\t", " "):
+    fmt = sniff_csv(filename)
+    options = {
+        "delimiter": fmt.delimiter,
+        "header": "infer" if fmt.has_names else None,
+        "skiprows": fmt.skiprows or None,
+    }
+    df = None
+    if worker is None and PYARROW_AVAILABLE and not fmt.has_comments:
+        # The pyarrow engine reads the whole file at once (no progress, no way to
+        # cancel the operation): it is used only when there is no worker
         try:
-            df = pd.read_csv(
-                filename,
-                dtype=float,
-                delimiter=delimiter,
-                header=None,
-                comment="#",
-                nrows=1000,  # Read only the first 1000 lines
-            )
-            read_without_header = True
-            break
-        except (pd.errors.ParserError, ValueError):
+            df = pd.read_csv(filename, engine="pyarrow", **options)
+        except ValueError:
+            # e.g. comment lines after the head of the file: falling back to
+            # the default engine
             df = None
-
-    # Second attempt: with header
     if df is None:
-        for delimiter in (",", ";", "\t", " "):
-            # Headers are generally in the first 10 lines, so we try to skip the
-            # minimum number of lines before reading the data:
-            for skiprows in range(20):
-                try:
-                    df = pd.read_csv(
-                        filename,
-                        dtype=float,
-                        delimiter=delimiter,
-                        skiprows=skiprows,
-                        comment="#",
-                        nrows=1000,  # Read only the first 1000 lines
-                    )
-                    break
-                except (pd.errors.ParserError, ValueError):
-                    df = None
-            if df is not None:
-                break
-
-        if df is None:
-            raise ValueError("Unable to read CSV file (format not supported)")
-
-        # At this stage, we have a DataFrame with column names, but we don't know
-        # if the first line is a header or data. We try to read the first line as
-        # a header, and if it fails, we read it as data.
-        try:
-            df.columns.astype(float)
-            # This means that the first line is data, so we have to read it again, but
-            # without the header:
-            read_without_header = True
-        except ValueError:
-            read_without_header = False
-            # This means that the first line is a header, so we already have the data
-            # without missing values.
-            # However, it also means that there could be text information preceding
-            # the header. Let's try to read it and put it in `header` variable.
-
-            # 1. We read only the first 1000 lines to avoid reading the whole file
-            # 2. We keep only the lines beginning with a comment character
-            # 3. We join the lines to create a single string
-            header = ""
-            with open(filename, "r", encoding="utf-8") as file:
-                for _ in range(1000):
-                    line = file.readline()
-                    if line.startswith("#"):
-                        header += line
-                    else:
-                        break
-            # Remove the last line if it contains the column names:
-            if header and df.columns[0] in header.splitlines()[-1]:
-                header = "\n".join(header.splitlines()[:-1])
-
-    # Now we read the whole file with the correct options
-    df = read_csv_by_chunks(
-        filename,
-        worker=worker,
-        delimiter=delimiter,
-        header=None if read_without_header else "infer",
-        skiprows=skiprows,
-        comment="#",
-    )
+        df = read_csv_by_chunks(filename, worker=worker, comment=fmt.comment, **options)
 
     # Remove rows and columns where all values are NaN in the DataFrame:
     df = df.dropna(axis=0, how="all").dropna(axis=1, how="all")
@@ -218,7 +304,7 @@ def read_csv(
         raise ValueError("Unable to read CSV file (no supported data after cleaning)")
 
     xlabel, ylabels, xunit, yunits = get_labels_units_from_dataframe(df)
-    return xydata, xlabel, xunit, ylabels, yunits, header
+    return xydata, xlabel, xunit, ylabels, yunits, fmt.header
 
 
 def write_csv(
@@ -229,9 +315,20 @@ def write_csv(
     ylabels: list[str] | None,
     yunits: list[str] | None,
     header: str | None,
+    worker: CallbackWorker | None = None,
+    chunksize: int = CSV_CHUNK_SIZE,
 ) -> None:
     """Write CSV data.
 
+    Data is written in a single pass: header and column names first, then data
+    rows by chunks (see :py:func:`cdl.core.io.conv.format_text_rows`), NaN values
+    being written as empty fields. If file name ends with ".gz", file is compressed
+    with gzip.
+
+    Data is written to a temporary file first, which replaces the target file
+    once complete: if an error occurs (or if operation is canceled), the target
+    file is left untouched.
+
     Args:
         filename: CSV file name
         xydata: XY data
@@ -240,6 +337,8 @@ def write_csv(
         ylabels: Y labels
         yunits: Y units
         header: Header
+        worker: Callback worker object
+        chunksize: Number of rows per chunk
     """
     labels = ""
     delimiter = ","
@@ -257,11 +356,35 @@ def write_csv(
         if xunit:
             xlabel += f" ({xunit})"
         labels = delimiter.join([xlabel] + ylabels)
-    df = pd.DataFrame(xydata.T, columns=[xlabel] + ylabels)
-    df.to_csv(filename, index=False, header=labels, sep=delimiter)
-    # Add header if present
-    if header:
-        with open(filename, "r+", encoding="utf-8") as file:
-            content = file.read()
-            file.seek(0, 0)
-            file.write(header + "\n" + content)
+        xydata = xydata[: len(ylabels) + 1]
+    nrows = xydata.shape[1]
+    tmpname = filename + ".tmp"
+    if is_gzip_filename(filename):
+        fileobj = gzip.open(
+            tmpname, "wt", encoding="utf-8", compresslevel=CSV_GZIP_LEVEL
+        )
+    else:
+        fileobj = open(tmpname, "w", encoding="utf-8")
+    canceled = False
+    try:
+        with fileobj:
+            if header:
+                fileobj.write(header + "\n")
+            if labels:
+                fileobj.write(labels + "\n")
+            for start in range(0, nrows, chunksize):
+                stop = min(start + chunksize, nrows)
+                chunk = xydata[:, start:stop].T
+                fileobj.write(format_text_rows(chunk, delimiter, na_rep=""))
+                if worker is not None:
+                    worker.set_progress_count(stop, nrows)
+                    if worker.was_canceled():
+                        canceled = True
+                        break
+    except BaseException:
+        os.remove(tmpname)
+        raise
+    if canceled:
+        os.remove(tmpname)
+    else:
+        os.replace(tmpname, filename)
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import abc
 import enum
+import hashlib
 import json
+import pickle
 import sys
 from collections.abc import Callable, Iterable
 from copy import deepcopy
@@ -921,6 +923,15 @@ class BaseObj(metaclass=BaseObjMeta):
 
     VALID_DTYPES = ()
 
+    # Names of the attributes storing data arrays (see `guidata.dataset.DataItem`):
+    # replacing one of those arrays increments the data version number
+    DATA_ATTRS = ("_data", "_xydata")
+
+    __data_version = 0
+    __data_loader: tuple[str, Callable[[], np.ndarray]] | None = None
+    # True if data array has been modified in place (see `set_data_modified`)
+    __data_modified = False
+
     def __init__(self):
         self.__onb = 0
         self.__roi_changed: bool | None = None
@@ -946,6 +957,108 @@ class BaseObj(metaclass=BaseObjMeta):
         """Short object ID"""
         return f"{self.PREFIX}{self.__onb:03d}"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute, incrementing data version if data array is replaced"""
+        if name in self.DATA_ATTRS:
+            self.__data_version += 1
+        super().__setattr__(name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        """Return attribute (called only when attribute is not found): data array
+        is loaded here if data loading has been deferred"""
+        loader = self.__dict__.get("_BaseObj__data_loader")
+        if loader is not None and name == loader[0]:
+            self.load_data()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling (deferred data is loaded first)"""
+        self.load_data()
+        return self.__dict__
+
+    def set_data_loader(self, loader: Callable[[], np.ndarray]) -> None:
+        """Defer data loading: data array is released and `loader` will be called
+        to load it when it is first accessed (e.g. when object is displayed or
+        processed). Loading data does not change the data version number.
+
+        Args:
+            loader: Callable returning the data array
+        """
+        for name in self.DATA_ATTRS:
+            if name in self.__dict__:
+                del self.__dict__[name]
+                self.__data_loader = (name, loader)
+                return
+        raise ValueError("Object has no data attribute")
+
+    @property
+    def data_loader(self) -> Callable[[], np.ndarray] | None:
+        """Data loader (None if data is loaded, see :py:meth:`set_data_loader`)"""
+        return None if self.__data_loader is None else self.__data_loader[1]
+
+    def load_data(self) -> None:
+        """Load data array if data loading has been deferred"""
+        if self.__data_loader is not None:
+            name, loader = self.__data_loader
+            self.__dict__[name] = loader()
+            self.__data_loader = None
+
+    @property
+    def data_version(self) -> int:
+        """Return data version number, which is incremented each time data array is
+        replaced, or when :py:meth:`increment_data_version` is called (this may be
+        used as a cache key for any result derived from data)"""
+        return self.__data_version
+
+    def increment_data_version(self) -> None:
+        """Increment data version number: this has to be called when data array is
+        modified in place, in order to invalidate results cached for this object"""
+        self.__data_version += 1
+
+    def set_data_modified(self) -> None:
+        """Notify that data array has been modified in place: cached results are
+        invalidated (see :py:meth:`increment_data_version`) and the object is flagged
+        as modified (see :py:attr:`data_modified`), so that it is written again on
+        next incremental save"""
+        self.increment_data_version()
+        self.__data_modified = True
+
+    @property
+    def data_modified(self) -> bool:
+        """Return True if data array has been modified in place (this is set by
+        :py:meth:`set_data_modified`: in-place modifications which are not notified
+        are not detected)"""
+        return self.__data_modified
+
+    def get_serialization_state(self) -> str | None:
+        """Return a key identifying the serialized state of the object: this key
+        changes when data version is incremented (e.g. when data array is replaced
+        or modified in place, see :py:meth:`set_data_modified`) or when any other
+        item (title, metadata, axis labels, etc.) is modified. This is used to skip
+        unchanged objects when saving the workspace incrementally.
+
+        Data contents are not read: evaluating the key does not depend on data size,
+        and deferred data is not loaded (see :py:meth:`set_data_loader`).
+
+        Returns:
+            State key, or None if the object state could not be evaluated (in that
+            case, object has to be considered as modified)
+        """
+        values = [
+            getattr(self, item.get_name())
+            for item in self.get_items()  # pylint: disable=no-member
+            if f"_{item.get_name()}" not in self.DATA_ATTRS
+        ]
+        try:
+            digest = hashlib.blake2b(pickle.dumps(values), digest_size=16)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return None
+        modified = int(self.__data_modified)
+        return f"{self.data_version}:{modified}:{digest.hexdigest()}"
+
     @property
     @abc.abstractmethod
     def data(self):
@@ -970,9 +1083,13 @@ class BaseObj(metaclass=BaseObjMeta):
         Raises:
             TypeError: if data type is not supported
         """
-        if self.data is not None:
-            if self.data.dtype not in self.VALID_DTYPES:
-                raise TypeError(f"Unsupported data type: {self.data.dtype}")
+        if self.data_loader is not None:
+            # Data loading has been deferred: checking data type without loading data
+            dtype = getattr(self.data_loader, "dtype", None)
+        else:
+            dtype = None if self.data is None else self.data.dtype
+        if dtype is not None and dtype not in self.VALID_DTYPES:
+            raise TypeError(f"Unsupported data type: {dtype}")
 
     def iterate_roi_indexes(self):
         """Iterate over object ROI indexes ([0] if there is no ROI)"""
@@ -26,7 +26,12 @@ from plotpy.builder import make
 from plotpy.items import AnnotatedCircle, AnnotatedRectangle, MaskedImageItem
 from skimage import draw
 
-from cdl.algorithms.image import scale_data_to_min_max
+from cdl.algorithms.image import (
+    estimate_lut_range,
+    get_lut_range,
+    sample_data,
+    scale_data_to_min_max,
+)
 from cdl.config import Conf, _
 from cdl.core.model import base
 
@@ -278,6 +283,185 @@ class ROI2DParam(gds.DataSet):
         return obj.data[y0:y1, x0:x1]
 
 
+#: Default number of frames kept in image streams (see :py:meth:`ImageObj.append_frame`)
+IMAGE_STREAM_DEPTH = 10
+
+
+class ImageFrameRingBuffer:
+    """Preallocated ring buffer of image frames (image streams)
+
+    Frames are stored in a preallocated array of ``depth`` frames: when the buffer
+    is full, appending a frame overwrites the oldest one. Running mean and variance
+    images of the frames in the buffer may be maintained incrementally from the
+    appended and dropped frames (see :py:meth:`get_stats`).
+
+    Args:
+        depth: number of frames
+        shape: frame shape
+        dtype: frame data type
+        stats: if True, maintain running mean and variance images
+    """
+
+    def __init__(
+        self,
+        depth: int,
+        shape: tuple[int, int],
+        dtype: np.dtype,
+        stats: bool = False,
+    ) -> None:
+        if depth < 1:
+            raise ValueError("Frame buffer depth must be strictly positive")
+        if stats and np.issubdtype(dtype, np.complexfloating):
+            raise ValueError("Running statistics are not supported for complex data")
+        self.depth = depth
+        self.__frames = np.zeros((depth,) + tuple(shape), dtype=dtype)
+        self.__count = 0
+        self.__sum: np.ndarray | None = None
+        self.__sumsq: np.ndarray | None = None
+        if stats:
+            self.__sum = np.zeros(shape, dtype=np.float64)
+            self.__sumsq = np.zeros(shape, dtype=np.float64)
+        self.__nb_dropped = 0
+
+    def __len__(self) -> int:
+        """Return number of frames in buffer"""
+        return min(self.__count, self.depth)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Frame shape"""
+        return self.__frames.shape[1:]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Frame data type"""
+        return self.__frames.dtype
+
+    @property
+    def frame_count(self) -> int:
+        """Total number of frames appended to buffer"""
+        return self.__count
+
+    @property
+    def has_stats(self) -> bool:
+        """True if running mean and variance images are maintained"""
+        return self.__sum is not None
+
+    def __get_slot(self, index: int) -> int:
+        """Return buffer slot of frame index (see :py:meth:`get_frame`)"""
+        size = len(self)
+        if not -size <= index < size:
+            raise IndexError(f"Frame index out of range: {index}")
+        return (self.__count - size + index % size) % self.depth
+
+    def astype(self, dtype: np.dtype) -> ImageFrameRingBuffer:
+        """Return a copy of the buffer with another frame data type (stored frames,
+        frame count and running statistics are kept)
+
+        Args:
+            dtype: frame data type
+
+        Returns:
+            New frame buffer
+        """
+        buffer = ImageFrameRingBuffer(self.depth, self.shape, dtype, self.has_stats)
+        buffer.__frames[:] = self.__frames
+        buffer.__count = self.__count
+        buffer.__nb_dropped = self.__nb_dropped
+        if self.has_stats:
+            buffer.__sum[:] = self.__sum
+            buffer.__sumsq[:] = self.__sumsq
+        return buffer
+
+    def resize(self, depth: int) -> ImageFrameRingBuffer:
+        """Return a copy of the buffer with another depth: the latest frames which
+        fit in the new buffer are kept (the frame count is the number of kept
+        frames)
+
+        Args:
+            depth: number of frames
+
+        Returns:
+            New frame buffer
+        """
+        buffer = ImageFrameRingBuffer(depth, self.shape, self.dtype, self.has_stats)
+        for index in range(-min(len(self), depth), 0):
+            buffer.append(self.get_frame(index))
+        return buffer
+
+    def get_frame(self, index: int = -1) -> np.ndarray:
+        """Return frame
+
+        Args:
+            index: frame index in buffer, from 0 (oldest frame) to ``len(buffer)-1``
+             (latest frame). Negative indexes are counted from the latest frame.
+             Defaults to -1 (latest frame).
+
+        Returns:
+            Frame data (view of the buffer: frame data will be overwritten when
+            the buffer wraps around)
+
+        Raises:
+            IndexError: if index is out of range
+        """
+        return self.__frames[self.__get_slot(index)]
+
+    def append(self, frame: np.ndarray) -> None:
+        """Append frame to buffer
+
+        Args:
+            frame: frame data
+
+        Raises:
+            ValueError: if frame shape does not match buffer frame shape, or if frame
+             data type may not be converted to buffer data type without loss of
+             information (see :py:meth:`astype`)
+        """
+        frame = np.asarray(frame)
+        if frame.shape != self.shape:
+            raise ValueError(
+                f"Frame shape {frame.shape} does not match stream shape {self.shape}"
+            )
+        if not np.can_cast(frame.dtype, self.dtype, casting="safe"):
+            raise ValueError(
+                f"Frame data type {frame.dtype} does not match stream data type "
+                f"{self.dtype}"
+            )
+        slot = self.__count % self.depth
+        if self.__sum is not None:
+            if self.__count >= self.depth:
+                dropped = self.__frames[slot]
+                self.__sum -= dropped
+                self.__sumsq -= np.square(dropped, dtype=np.float64)
+                self.__nb_dropped += 1
+            self.__sum += frame
+            self.__sumsq += np.square(frame, dtype=np.float64)
+        self.__frames[slot] = frame
+        self.__count += 1
+        if self.__nb_dropped >= self.depth:
+            # Running sums are recomputed from time to time (amortized cost) to
+            # avoid accumulating rounding errors
+            self.__sum[:] = self.__sumsq[:] = 0.0
+            for stored in self.__frames:
+                self.__sum += stored
+                self.__sumsq += np.square(stored, dtype=np.float64)
+            self.__nb_dropped = 0
+
+    def get_stats(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return running mean and variance images of the frames in buffer
+
+        Returns:
+            Tuple (mean, variance) of float64 images, or None if running statistics
+            are not maintained or if buffer is empty
+        """
+        if self.__sum is None or self.__count == 0:
+            return None
+        size = len(self)
+        mean = self.__sum / size
+        variance = np.maximum(self.__sumsq / size - mean**2, 0.0)
+        return mean, variance
+
+
 class ImageObj(gds.DataSet, base.BaseObj):
     """Image object"""
 
@@ -307,6 +491,14 @@ class ImageObj(gds.DataSet, base.BaseObj):
         self.regenerate_uuid()
         self._dicom_template = None
         self._maskdata_cache = None
+        # LUT range cache: key = (data version, outliers percentage, exact)
+        self._lut_range_cache: dict[tuple[int, float, bool], tuple[float, float]] = {}
+        # Viewable data cache: (data version, viewable data or None if data is
+        # viewable as is)
+        self._viewable_cache: tuple[int, np.ndarray] | None = None
+        # Image stream frame buffer and associated data view (see `append_frame`)
+        self._stream_buffer: ImageFrameRingBuffer | None = None
+        self._stream_data: np.ndarray | None = None
 
     def regenerate_uuid(self):
         """Regenerate UUID
@@ -501,13 +693,240 @@ class ImageObj(gds.DataSet, base.BaseObj):
         """
         self.data = np.array(self.data, dtype=dtype)
 
-    def __viewable_data(self) -> np.ndarray:
-        """Return viewable data"""
-        data = self.data.real
+    def is_stream(self) -> bool:
+        """Return True if image is an image stream (see :py:meth:`append_frame`)"""
+        return self._stream_buffer is not None and self.data is self._stream_data
+
+    def append_frame(
+        self,
+        frame: np.ndarray,
+        depth: int | None = None,
+        stats: bool | None = None,
+    ) -> None:
+        """Append frame to image stream: image data is replaced by the new frame.
+
+        The first call switches the image to stream mode: frames are stored in a
+        preallocated ring buffer of ``depth`` frames (see
+        :py:class:`ImageFrameRingBuffer`), the current image data being the first
+        frame if it has the same shape as the new frame. Frames stored in the buffer
+        may be retrieved with :py:meth:`get_frame` or :py:meth:`frame_to_image`.
+
+        If image data is replaced (e.g. by a processing feature), the image leaves
+        stream mode until next call to this method.
+
+        Args:
+            frame: frame data
+            depth: number of frames kept in buffer. If None, the current depth is
+             kept, or :py:data:`IMAGE_STREAM_DEPTH` is used when switching to
+             stream mode. Changing the depth reallocates the buffer (the latest
+             frames are kept, see :py:meth:`ImageFrameRingBuffer.resize`).
+            stats: if True, maintain running mean and variance images of the frames
+             in buffer (see :py:meth:`get_running_stats`). If None, the current
+             setting is kept (disabled when switching to stream mode). Changing
+             this setting reallocates the buffer.
+
+        If the frame data type may not be stored in the buffer without loss of
+        information (e.g. floating point frame appended to an integer image stream),
+        the buffer is converted to a common data type (frames are never truncated).
+
+        Raises:
+            ValueError: if frame is not a 2D array
+        """
+        frame = np.asarray(frame)
+        if frame.ndim != 2:
+            raise ValueError("Frame must be a 2D array")
+        buffer = self._stream_buffer
+        if (
+            self.is_stream()
+            and depth not in (None, buffer.depth)
+            and stats in (None, buffer.has_stats)
+            and frame.shape == buffer.shape
+        ):
+            buffer = self._stream_buffer = buffer.resize(depth)
+        if (
+            not self.is_stream()
+            or depth not in (None, buffer.depth)
+            or stats not in (None, buffer.has_stats)
+            or frame.shape != buffer.shape
+        ):
+            if depth is None:
+                depth = IMAGE_STREAM_DEPTH if buffer is None else buffer.depth
+            if stats is None:
+                stats = buffer is not None and buffer.has_stats
+            dtype = frame.dtype
+            keep_data = self.data is not None and self.data.shape == frame.shape
+            if keep_data:
+                dtype = np.result_type(dtype, self.data.dtype)
+            buffer = ImageFrameRingBuffer(depth, frame.shape, dtype, stats)
+            if keep_data:
+                buffer.append(self.data)
+            self._stream_buffer = buffer
+        elif not np.can_cast(frame.dtype, buffer.dtype, casting="safe"):
+            dtype = np.result_type(buffer.dtype, frame.dtype)
+            buffer = self._stream_buffer = buffer.astype(dtype)
+        buffer.append(frame)
+        self.data = self._stream_data = buffer.get_frame()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling: the frame buffer of an image stream is not
+        pickled (e.g. when the image is passed to the computation process pool),
+        only the current frame is (see :py:meth:`append_frame`)"""
+        state = super().__getstate__()
+        if state.get("_stream_buffer") is not None:
+            state = dict(state, _stream_buffer=None, _stream_data=None)
+        return state
+
+    def get_frame(self, index: int = -1) -> np.ndarray:
+        """Return image stream frame (see :py:meth:`ImageFrameRingBuffer.get_frame`)
+
+        Args:
+            index: frame index in buffer, from 0 (oldest frame) to N-1 (latest
+             frame, which is the current image data). Negative indexes are counted
+             from the latest frame. Defaults to -1.
+
+        Returns:
+            Frame data (view of the frame buffer)
+
+        Raises:
+            ValueError: if image is not an image stream
+            IndexError: if index is out of range
+        """
+        if not self.is_stream():
+            raise ValueError("Image is not an image stream")
+        return self._stream_buffer.get_frame(index)
+
+    def get_frame_count(self) -> int:
+        """Return number of frames in image stream buffer (0 if image is not an
+        image stream)"""
+        return len(self._stream_buffer) if self.is_stream() else 0
+
+    def frame_to_image(self, index: int = -1) -> ImageObj:
+        """Create a new image object from an image stream frame
+
+        Args:
+            index: frame index (see :py:meth:`get_frame`). Defaults to -1.
+
+        Returns:
+            Image object (independent from the image stream)
+
+        Raises:
+            ValueError: if image is not an image stream
+            IndexError: if index is out of range
+        """
+        frame = self.get_frame(index)
+        number = self._stream_buffer.frame_count - self.get_frame_count()
+        number += index % self.get_frame_count() + 1
+        obj = self.copy(title=f"{self.title} [{_('frame')} {number}]")
+        obj.data = np.array(frame, copy=True)
+        return obj
+
+    def get_running_stats(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return running mean and variance images of image stream frames
+        (updated incrementally when appending frames, see :py:meth:`append_frame`)
+
+        Returns:
+            Tuple (mean, variance), or None if image is not an image stream or if
+            running statistics are not enabled
+        """
+        if not self.is_stream():
+            return None
+        return self._stream_buffer.get_stats()
+
+    @staticmethod
+    def __to_viewable(data: np.ndarray) -> np.ndarray:
+        """Return viewable data from data array"""
+        data = data.real
         if np.any(np.isnan(data)):
             data = np.nan_to_num(data, posinf=0, neginf=0)
         return data
 
+    def __viewable_data(self) -> np.ndarray:
+        """Return viewable data (cached per data version, so that the main plot
+        item and the separate views share the same array)"""
+        version = self.data_version
+        if self._viewable_cache is None or self._viewable_cache[0] != version:
+            data = self.__to_viewable(self.data)
+            self._viewable_cache = (version, None if data is self.data else data)
+        data = self._viewable_cache[1]
+        return self.data if data is None else data
+
+    def get_lut_range(self, exact: bool = False) -> tuple[float, float]:
+        """Return default LUT range of viewable data, taking into account the
+        "Eliminate outliers" visualization setting.
+
+        The result is cached per data version (see :py:attr:`data_version`): once
+        the exact LUT range has been computed, it is always returned, even when
+        `exact` is False.
+
+        Args:
+            exact: if True, compute the exact LUT range from the whole data
+             (this may take some time for huge images). Otherwise, the LUT range
+             is estimated on a random sample of the data (see
+             :py:func:`cdl.algorithms.image.estimate_lut_range`).
+
+        Returns:
+            LUT range (min, max)
+        """
+        percent = Conf.view.ima_eliminate_outliers.get() or 0.0
+        version = self.data_version
+        lut_range = self._lut_range_cache.get((version, percent, True))
+        if lut_range is None and exact:
+            lut_range = get_lut_range(self.__viewable_data(), percent)
+            self._lut_range_cache = {(version, percent, True): lut_range}
+        elif lut_range is None:
+            lut_range = self._lut_range_cache.get((version, percent, False))
+            if lut_range is None:
+                samples = self.__to_viewable(sample_data(self.data))
+                lut_range = estimate_lut_range(samples, percent)
+                exact = samples.size == self.data.size
+                self._lut_range_cache = {(version, percent, exact): lut_range}
+        return lut_range
+
+    def compute_exact_lut_range(self) -> tuple[int, float, tuple[float, float]]:
+        """Compute the exact LUT range of viewable data, without caching it
+
+        This method does not modify the object, so that it may be called from a
+        worker thread: the result is then cached by calling
+        :py:meth:`set_exact_lut_range` from the GUI thread.
+
+        Returns:
+            Tuple (data version, "Eliminate outliers" percentage, LUT range)
+        """
+        percent = Conf.view.ima_eliminate_outliers.get() or 0.0
+        version = self.data_version
+        cache = self._viewable_cache
+        if cache is not None and cache[0] == version and cache[1] is not None:
+            data = cache[1]
+        else:
+            data = self.__to_viewable(self.data)
+        return version, percent, get_lut_range(data, percent)
+
+    def set_exact_lut_range(
+        self, version: int, percent: float, lut_range: tuple[float, float]
+    ) -> bool:
+        """Cache the exact LUT range computed by :py:meth:`compute_exact_lut_range`
+
+        Args:
+            version: data version for which the LUT range was computed
+            percent: "Eliminate outliers" percentage used for the computation
+            lut_range: LUT range (min, max)
+
+        Returns:
+            True if the LUT range has been cached, False if data version or
+            "Eliminate outliers" setting has changed in the meantime
+        """
+        current = Conf.view.ima_eliminate_outliers.get() or 0.0
+        if version != self.data_version or percent != current:
+            return False
+        self._lut_range_cache = {(version, percent, True): lut_range}
+        return True
+
+    def is_lut_range_exact(self) -> bool:
+        """Return True if the exact LUT range has already been computed for the
+        current data version (see :py:meth:`get_lut_range`)"""
+        percent = Conf.view.ima_eliminate_outliers.get() or 0.0
+        return (self.data_version, percent, True) in self._lut_range_cache
+
     def update_plot_item_parameters(self, item: MaskedImageItem) -> None:
         """Update plot item parameters from object data/metadata
 
@@ -579,13 +998,17 @@ class ImageObj(gds.DataSet, base.BaseObj):
         Returns:
             Plot item
         """
-        data = self.__viewable_data()
+        if update_from is None:
+            lut_range = self.get_lut_range()
+        else:
+            # Reusing LUT state of the original item (e.g. user-defined contrast)
+            lut_range = update_from.get_lut_range()
         item = make.maskedimage(
-            data,
+            self.__viewable_data(),
             self.maskdata,
             title=self.title,
             colormap="viridis",
-            eliminate_outliers=Conf.view.ima_eliminate_outliers.get(),
+            lut_range=lut_range,
             interpolation="nearest",
             show_mask=True,
         )
@@ -12,7 +12,7 @@ Signal object and related classes
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Any, Generator
 from uuid import uuid4
 
 import guidata.dataset as gds
@@ -141,6 +141,114 @@ def apply_downsampling(item: CurveItem, do_not_update: bool = False) -> None:
         item.update_data()
 
 
+#: Default number of points kept in live signals (see :py:meth:`SignalObj.append_data`)
+LIVE_SIGNAL_CAPACITY = 1_000_000
+
+
+class SignalRingBuffer:
+    """Preallocated ring buffer for live signal data (append-only signals)
+
+    Data is written twice in a buffer of twice the capacity (mirrored ring buffer),
+    so that the chronologically ordered data is always available as a contiguous
+    view of the buffer (no copy, see :py:attr:`data`). When the buffer is full,
+    appending new points drops the oldest points.
+
+    Rolling statistics of Y data (see :py:meth:`get_stats`) are updated
+    incrementally from the appended and dropped points.
+
+    Args:
+        capacity: maximum number of points
+        nrows: number of data rows (2 for X, Y data)
+        dtype: data type
+    """
+
+    def __init__(
+        self, capacity: int, nrows: int = 2, dtype: np.dtype = np.float64
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be strictly positive")
+        self.capacity = capacity
+        self.__buffer = np.zeros((nrows, 2 * capacity), dtype=dtype)
+        self.__start = 0
+        self.__size = 0
+        self.__sum = 0.0
+        self.__sumsq = 0.0
+        self.__nb_dropped = 0
+
+    def __len__(self) -> int:
+        """Return number of points in buffer"""
+        return self.__size
+
+    @property
+    def data(self) -> np.ndarray:
+        """Chronologically ordered data (view of the buffer, no copy)"""
+        return self.__buffer[:, self.__start : self.__start + self.__size]
+
+    def __update_sums(self, y: np.ndarray, sign: float) -> None:
+        """Update running sums used for rolling statistics"""
+        y = y.real
+        self.__sum += sign * float(np.sum(y))
+        self.__sumsq += sign * float(np.sum(y * y))
+
+    def append(self, data: np.ndarray) -> None:
+        """Append points to buffer
+
+        Args:
+            data: 2D array of shape (nrows, npoints)
+        """
+        data = np.asarray(data)
+        nrows = self.__buffer.shape[0]
+        if data.ndim != 2 or data.shape[0] != nrows:
+            raise ValueError(f"Appended data must be a 2D array with {nrows} rows")
+        cap = self.capacity
+        if data.shape[1] >= cap:
+            # New data fills the whole buffer: resetting it
+            data = data[:, -cap:]
+            self.__buffer[:, :cap] = self.__buffer[:, cap:] = data
+            self.__start, self.__size = 0, cap
+            self.__sum = self.__sumsq = 0.0
+            self.__update_sums(data[1], 1.0)
+            self.__nb_dropped = 0
+            return
+        npts = data.shape[1]
+        nb_drop = max(0, self.__size + npts - cap)
+        if nb_drop:
+            self.__update_sums(
+                self.__buffer[1, self.__start : self.__start + nb_drop], -1.0
+            )
+        indexes = (self.__start + self.__size + np.arange(npts)) % cap
+        self.__buffer[:, indexes] = self.__buffer[:, indexes + cap] = data
+        self.__start = (self.__start + nb_drop) % cap
+        self.__size = min(cap, self.__size + npts)
+        self.__update_sums(data[1], 1.0)
+        self.__nb_dropped += nb_drop
+        if self.__nb_dropped >= cap:
+            # Running sums are recomputed from time to time (amortized cost) to
+            # avoid accumulating rounding errors
+            self.__sum = self.__sumsq = 0.0
+            self.__update_sums(self.data[1], 1.0)
+            self.__nb_dropped = 0
+
+    def get_stats(self) -> dict[str, float]:
+        """Return rolling statistics of Y data
+
+        Returns:
+            Dictionary with keys "count", "mean", "std" and "rms" (NaN values are
+            returned if the buffer is empty)
+        """
+        count = self.__size
+        if count == 0:
+            return {"count": 0, "mean": np.nan, "std": np.nan, "rms": np.nan}
+        mean = self.__sum / count
+        meansq = self.__sumsq / count
+        return {
+            "count": count,
+            "mean": mean,
+            "std": np.sqrt(max(0.0, meansq - mean * mean)),
+            "rms": np.sqrt(max(0.0, meansq)),
+        }
+
+
 class SignalObj(gds.DataSet, base.BaseObj):
     """Signal object"""
 
@@ -213,6 +321,9 @@ class SignalObj(gds.DataSet, base.BaseObj):
         gds.DataSet.__init__(self, title, comment, icon)
         base.BaseObj.__init__(self)
         self.regenerate_uuid()
+        # Live signal ring buffer and associated data view (see `append_data`)
+        self._live_buffer: SignalRingBuffer | None = None
+        self._live_xydata: np.ndarray | None = None
 
     def regenerate_uuid(self):
         """Regenerate UUID
@@ -296,6 +407,7 @@ class SignalObj(gds.DataSet, base.BaseObj):
     def __set_x(self, data) -> None:
         """Set x data"""
         self.xydata[0] = np.array(data)
+        self.set_data_modified()
 
     def __get_y(self) -> np.ndarray | None:
         """Get y data"""
@@ -306,6 +418,7 @@ class SignalObj(gds.DataSet, base.BaseObj):
     def __set_y(self, data) -> None:
         """Set y data"""
         self.xydata[1] = np.array(data)
+        self.set_data_modified()
 
     def __get_dx(self) -> np.ndarray | None:
         """Get dx data"""
@@ -317,6 +430,7 @@ class SignalObj(gds.DataSet, base.BaseObj):
         """Set dx data"""
         if self.xydata is not None and len(self.xydata) > 2:
             self.xydata[2] = np.array(data)
+            self.set_data_modified()
         else:
             raise ValueError("dx data not available")
 
@@ -330,6 +444,7 @@ class SignalObj(gds.DataSet, base.BaseObj):
         """Set dy data"""
         if self.xydata is not None and len(self.xydata) > 3:
             self.xydata[3] = np.array(data)
+            self.set_data_modified()
         else:
             raise ValueError("dy data not available")
 
@@ -338,6 +453,75 @@ class SignalObj(gds.DataSet, base.BaseObj):
     dx = property(__get_dx, __set_dx)
     dy = property(__get_dy, __set_dy)
 
+    def is_live(self) -> bool:
+        """Return True if signal is a live signal (see :py:meth:`append_data`)"""
+        return self._live_buffer is not None and self.xydata is self._live_xydata
+
+    def append_data(
+        self,
+        x: np.ndarray | list,
+        y: np.ndarray | list,
+        capacity: int | None = None,
+    ) -> None:
+        """Append data points to signal (live signal).
+
+        The first call switches the signal to live mode: signal data is copied to a
+        preallocated ring buffer (see :py:class:`SignalRingBuffer`), then appended
+        points are written into this buffer without reallocating signal data. When
+        the buffer is full, the oldest points are dropped.
+
+        If signal data is replaced (e.g. by a processing feature), the signal leaves
+        live mode until next call to this method.
+
+        Args:
+            x: X data to append
+            y: Y data to append
+            capacity: maximum number of points kept in signal (ring buffer
+             capacity). If None, the current capacity is kept, or
+             :py:data:`LIVE_SIGNAL_CAPACITY` is used when switching to live mode.
+             Changing the capacity reallocates the buffer.
+
+        Raises:
+            ValueError: if signal has error bars, or if x and y sizes are different
+        """
+        x, y = np.ravel(x), np.ravel(y)
+        if x.size != y.size:
+            raise ValueError("X and Y data must have the same size")
+        if self.xydata is not None and len(self.xydata) != 2:
+            raise ValueError("Live mode is not supported for signals with error bars")
+        buffer = self._live_buffer
+        if not self.is_live() or capacity not in (None, buffer.capacity):
+            if capacity is None:
+                capacity = LIVE_SIGNAL_CAPACITY if buffer is None else buffer.capacity
+            dtype = np.result_type(np.float64, y.dtype)
+            if self.xydata is not None:
+                dtype = np.result_type(dtype, self.xydata.dtype)
+            buffer = self._live_buffer = SignalRingBuffer(capacity, dtype=dtype)
+            if self.xydata is not None and self.xydata.size:
+                buffer.append(self.xydata)
+        buffer.append(np.vstack([x, y]))
+        self.xydata = self._live_xydata = buffer.data
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return state for pickling: the ring buffer of a live signal is not pickled
+        (e.g. when the signal is passed to the computation process pool), only the
+        data view of its valid window is (see :py:meth:`append_data`)"""
+        state = super().__getstate__()
+        if state.get("_live_buffer") is not None:
+            state = dict(state, _live_buffer=None, _live_xydata=None)
+        return state
+
+    def get_rolling_stats(self) -> dict[str, float] | None:
+        """Return rolling statistics of live signal Y data (updated incrementally
+        when appending data points, see :py:meth:`SignalRingBuffer.get_stats`)
+
+        Returns:
+            Dictionary of statistics, or None if signal is not a live signal
+        """
+        if not self.is_live():
+            return None
+        return self._live_buffer.get_stats()
+
     def get_data(self, roi_index: int | None = None) -> tuple[np.ndarray, np.ndarray]:
         """
         Return original data (if ROI is not defined or `roi_index` is None),
@@ -8,6 +8,10 @@ This module provides utilities to control DataLab from a Python script (e.g. wit
 Spyder) or from a Jupyter notebook.
 
 The :class:`RemoteClient` class provides the main interface to DataLab XML-RPC server.
+
+Large numerical arrays (e.g. signal or image data) are not transferred through
+XML-RPC but through the binary data channel (see :mod:`cdl.core.datachannel`):
+XML-RPC only carries the tokens of the arrays.
 """
 
 from __future__ import annotations
@@ -20,8 +24,8 @@ import time
 import warnings
 from collections.abc import Callable
 from io import BytesIO
-from typing import TYPE_CHECKING
-from xmlrpc.client import Binary, ServerProxy
+from typing import TYPE_CHECKING, Any
+from xmlrpc.client import Binary, Fault, ServerProxy
 from xmlrpc.server import SimpleXMLRPCServer
 
 import guidata.dataset as gds
@@ -32,6 +36,12 @@ from qtpy import QtCore as QC
 import cdl
 from cdl.config import Conf, initialize
 from cdl.core.baseproxy import AbstractCDLControl, BaseProxy
+from cdl.core.datachannel import (
+    DATA_CHANNEL_MIN_SIZE,
+    DataChannelClient,
+    DataChannelServer,
+)
+from cdl.core.io.native import NativeObjWriter
 from cdl.core.model.base import items_to_json, json_to_items
 from cdl.core.model.image import ImageObj, create_image
 from cdl.core.model.signal import SignalObj, create_signal
@@ -44,6 +54,10 @@ if TYPE_CHECKING:
 # pylint: disable=invalid-name  # Allows short reference names like x, y, ...
 # pylint: disable=duplicate-code
 
+#: Maximum duration (in seconds) of a batch of operations run remotely (see
+#: :py:meth:`RemoteServer.run_batch`)
+BATCH_TIMEOUT = 3600.0
+
 
 def array_to_rpcbinary(data: np.ndarray) -> Binary:
     """Convert NumPy array to XML-RPC Binary object, with shape and dtype.
@@ -115,6 +129,108 @@ def json_to_dataset(param_data: list[str]) -> gds.DataSet:
     return param
 
 
+class BinaryObjReader(JSONReader):
+    """Signal/image object reader for objects serialized with
+    :py:class:`cdl.core.io.native.NativeObjWriter`, whose numerical arrays were
+    transferred separately as raw buffers (through the data channel, or as XML-RPC
+    Binary objects)
+
+    Args:
+        json_data: Serialized object (JSON), numerical arrays being replaced by
+         their index in `arrays`
+        arrays: Arrays referenced by the serialized object
+    """
+
+    def __init__(self, json_data: str, arrays: list[np.ndarray]) -> None:
+        super().__init__(json_data)
+        self.arrays = arrays
+
+    def read_array(self) -> np.ndarray | None:
+        """Read array
+
+        Returns:
+            Array
+        """
+        val = self.read_any()
+        if isinstance(val, dict) and "__array__" in val:
+            return self.arrays[val["__array__"]]
+        return val
+
+
+def get_object_part(
+    obj: SignalObj | ImageObj,
+    data: bool = True,
+    roi: list[int] | None = None,
+    frames: list[int | None] | None = None,
+) -> tuple[SignalObj | ImageObj, list[np.ndarray]]:
+    """Return part of object, for partial object retrieval: the returned object
+    shares its items (metadata, results, etc.) with the original object, and its
+    data is a view of the original data, so that nothing is copied.
+
+    Args:
+        obj: Signal or image object
+        data: If False, data is not included (the returned object has only
+         metadata, results, etc.). Defaults to True.
+        roi: Data slice: [i0, i1] index range for signals, [x0, y0, x1, y1] pixel
+         bounds for images (i1, x1 and y1 being excluded, as in Python slicing).
+         Object regions of interest are not included in that case. For images,
+         the origin is shifted so that coordinates are preserved. Defaults to None
+         (whole data).
+        frames: [start, stop] frame range of image stream (as in Python slicing,
+         None meaning buffer bounds): frames are returned separately (see below),
+         object data being excluded. Defaults to None (no frames).
+
+    Returns:
+        Tuple (object part, image stream frames)
+
+    Raises:
+        ValueError: if `roi` or `frames` is not valid for this object
+    """
+    part = obj.__class__()
+    # Data is accessed only if it is included, so that deferred data is not loaded
+    # (see :py:meth:`cdl.core.model.base.BaseObj.set_data_loader`):
+    skip_data = not data or frames is not None
+    for item in obj.get_items():
+        name = item.get_name()
+        if skip_data and f"_{name}" in obj.DATA_ATTRS:
+            continue
+        setattr(part, name, getattr(obj, name))
+    # Metadata dictionary is copied (shallow copy), so that modifying the metadata
+    # of the returned object does not affect the original object
+    part.metadata = dict(obj.metadata)
+    frame_data = []
+    if frames is not None:
+        if not isinstance(obj, ImageObj) or not obj.is_stream():
+            raise ValueError("Frame range is only supported for image streams")
+        indexes = range(obj.get_frame_count())[slice(*frames)]
+        frame_data = [obj.get_frame(index) for index in indexes]
+    if not data:
+        if isinstance(part, SignalObj):
+            part.xydata = None
+        else:
+            part.data = None
+        return part, []
+    if roi is not None:
+        part.roi = None
+        if isinstance(part, SignalObj):
+            if len(roi) != 2:
+                raise ValueError("Signal ROI must be an [i0, i1] index range")
+            part.xydata = obj.xydata[:, roi[0] : roi[1]]
+        else:
+            if len(roi) != 4:
+                raise ValueError("Image ROI must be [x0, y0, x1, y1] pixel bounds")
+            x0, y0, x1, y1 = roi
+            rows = slice(y0, y1).indices(obj.data.shape[0])
+            cols = slice(x0, x1).indices(obj.data.shape[1])
+            part.data = obj.data[slice(*rows), slice(*cols)]
+            part.x0 += cols[0] * obj.dx
+            part.y0 += rows[0] * obj.dy
+            frame_data = [frame[slice(*rows), slice(*cols)] for frame in frame_data]
+    if frame_data:
+        part.data = None
+    return part, frame_data
+
+
 def remote_call(func: Callable) -> object:
     """Decorator for method calling DataLab main window remotely"""
 
@@ -143,6 +259,8 @@ class RemoteServer(QC.QThread):
     SIG_CLOSE_APP = QC.Signal()
     SIG_RAISE_WINDOW = QC.Signal()
     SIG_ADD_OBJECT = QC.Signal(object)
+    SIG_APPEND_SIGNAL_DATA = QC.Signal(str, object, object, object)
+    SIG_APPEND_IMAGE_FRAME = QC.Signal(str, object, object, object)
     SIG_LOAD_FROM_FILES = QC.Signal(list)
     SIG_SELECT_OBJECTS = QC.Signal(list, str)
     SIG_SELECT_GROUPS = QC.Signal(list, str)
@@ -159,18 +277,22 @@ class RemoteServer(QC.QThread):
     SIG_RUN_MACRO = QC.Signal(str)
     SIG_STOP_MACRO = QC.Signal(str)
     SIG_IMPORT_MACRO_FROM_FILE = QC.Signal(str)
+    SIG_RUN_BATCH = QC.Signal(object, object, object, object)
 
     def __init__(self, win: CDLMainWindow) -> None:
         QC.QThread.__init__(self)
         self.port: int = None
         self.is_ready = True
         self.server: SimpleXMLRPCServer | None = None
+        self.datachannel: DataChannelServer | None = None
         self.win = win
         win.SIG_READY.connect(self.cdl_is_ready)
         win.SIG_CLOSING.connect(self.shutdown_server)
         self.SIG_CLOSE_APP.connect(win.close)
         self.SIG_RAISE_WINDOW.connect(win.raise_window)
         self.SIG_ADD_OBJECT.connect(win.add_object)
+        self.SIG_APPEND_SIGNAL_DATA.connect(win.append_signal_data)
+        self.SIG_APPEND_IMAGE_FRAME.connect(win.append_image_frame)
         self.SIG_LOAD_FROM_FILES.connect(win.load_from_files)
         self.SIG_SELECT_OBJECTS.connect(win.select_objects)
         self.SIG_SELECT_GROUPS.connect(win.select_groups)
@@ -187,6 +309,7 @@ class RemoteServer(QC.QThread):
         self.SIG_RUN_MACRO.connect(win.run_macro)
         self.SIG_STOP_MACRO.connect(win.stop_macro)
         self.SIG_IMPORT_MACRO_FROM_FILE.connect(win.import_macro_from_file)
+        self.SIG_RUN_BATCH.connect(self.__run_batch)
 
     def serve(self) -> None:
         """Start server and serve forever"""
@@ -196,6 +319,12 @@ class RemoteServer(QC.QThread):
             self.server = server
             server.register_introspection_functions()
             self.register_functions(server)
+            self.datachannel = DataChannelServer()
+            threading.Thread(
+                target=self.datachannel.serve_forever,
+                name="DataLabDataChannel",
+                daemon=True,
+            ).start()
             self.port = server.server_address[1]
             self.notify_port(self.port)
             with execenv.context(xmlrpcport=self.port):
@@ -206,6 +335,10 @@ class RemoteServer(QC.QThread):
         if self.server is not None:
             self.server.shutdown()
             self.server = None
+        if self.datachannel is not None:
+            self.datachannel.shutdown()
+            self.datachannel.server_close()
+            self.datachannel = None
 
     def notify_port(self, port: int) -> None:
         """Notify automatically attributed port.
@@ -232,6 +365,7 @@ class RemoteServer(QC.QThread):
         """Register functions"""
         for name in AbstractCDLControl.get_public_methods():
             server.register_function(getattr(self, name))
+        server.register_function(self.get_data_channel_port)
 
     def run(self) -> None:
         """Thread execution method"""
@@ -245,6 +379,30 @@ class RemoteServer(QC.QThread):
         """Called when DataLab is ready to process new requests"""
         self.is_ready = True
 
+    def get_data_channel_port(self) -> int | None:
+        """Return data channel port number (see :mod:`cdl.core.datachannel`)
+
+        Returns:
+            Port number, or None if data channel is not available
+        """
+        if self.datachannel is None:
+            return None
+        return self.datachannel.port
+
+    def rpcdata_to_array(self, data: Binary | str) -> np.ndarray:
+        """Convert XML-RPC data to NumPy array: data is either an XML-RPC Binary
+        object, or the token of an array uploaded through the data channel
+
+        Args:
+            data: XML-RPC Binary object, or data channel token
+
+        Returns:
+            NumPy array
+        """
+        if isinstance(data, str):
+            return self.datachannel.pop_array(data)
+        return rpcbinary_to_array(data)
+
     @staticmethod
     def get_version() -> str:
         """Return DataLab public version"""
@@ -348,8 +506,8 @@ class RemoteServer(QC.QThread):
     def add_signal(
         self,
         title: str,
-        xbinary: Binary,
-        ybinary: Binary,
+        xbinary: Binary | str,
+        ybinary: Binary | str,
         xunit: str | None = None,
         yunit: str | None = None,
         xlabel: str | None = None,
@@ -359,8 +517,8 @@ class RemoteServer(QC.QThread):
 
         Args:
             title (str): Signal title
-            xbinary (Binary): X data
-            ybinary (Binary): Y data
+            xbinary (Binary | str): X data (or data channel token)
+            ybinary (Binary | str): Y data (or data channel token)
             xunit (str | None): X unit. Defaults to None.
             yunit (str | None): Y unit. Defaults to None.
             xlabel (str | None): X label. Defaults to None.
@@ -369,8 +527,8 @@ class RemoteServer(QC.QThread):
         Returns:
             bool: True if successful
         """
-        xdata = rpcbinary_to_array(xbinary)
-        ydata = rpcbinary_to_array(ybinary)
+        xdata = self.rpcdata_to_array(xbinary)
+        ydata = self.rpcdata_to_array(ybinary)
         signal = create_signal(title, xdata, ydata)
         signal.xunit = xunit
         signal.yunit = yunit
@@ -379,11 +537,36 @@ class RemoteServer(QC.QThread):
         self.SIG_ADD_OBJECT.emit(signal)
         return True
 
+    @remote_call
+    def append_signal_data(
+        self,
+        uuid: str,
+        xbinary: Binary | str,
+        ybinary: Binary | str,
+        capacity: int | None = None,
+    ) -> bool:
+        """Append data points to signal (live signal).
+
+        Args:
+            uuid (str): Signal uuid
+            xbinary (Binary | str): X data to append (or data channel token)
+            ybinary (Binary | str): Y data to append (or data channel token)
+            capacity (int | None): Maximum number of points kept in signal.
+             Defaults to None.
+
+        Returns:
+            bool: True if successful
+        """
+        xdata = self.rpcdata_to_array(xbinary)
+        ydata = self.rpcdata_to_array(ybinary)
+        self.SIG_APPEND_SIGNAL_DATA.emit(uuid, xdata, ydata, capacity)
+        return True
+
     @remote_call
     def add_image(
         self,
         title: str,
-        zbinary: Binary,
+        zbinary: Binary | str,
         xunit: str | None = None,
         yunit: str | None = None,
         zunit: str | None = None,
@@ -395,7 +578,7 @@ class RemoteServer(QC.QThread):
 
         Args:
             title (str): Image title
-            zbinary (Binary): Z data
+            zbinary (Binary | str): Z data (or data channel token)
             xunit (str | None): X unit. Defaults to None.
             yunit (str | None): Y unit. Defaults to None.
             zunit (str | None): Z unit. Defaults to None.
@@ -406,7 +589,7 @@ class RemoteServer(QC.QThread):
         Returns:
             bool: True if successful
         """
-        data = rpcbinary_to_array(zbinary)
+        data = self.rpcdata_to_array(zbinary)
         image = create_image(title, data)
         image.xunit = xunit
         image.yunit = yunit
@@ -417,6 +600,31 @@ class RemoteServer(QC.QThread):
         self.SIG_ADD_OBJECT.emit(image)
         return True
 
+    @remote_call
+    def append_image_frame(
+        self,
+        uuid: str,
+        zbinary: Binary | str,
+        depth: int | None = None,
+        stats: bool | None = None,
+    ) -> bool:
+        """Append frame to image stream.
+
+        Args:
+            uuid (str): Image uuid
+            zbinary (Binary | str): Frame data (or data channel token)
+            depth (int | None): Number of frames kept in image stream buffer.
+             Defaults to None.
+            stats (bool | None): If True, maintain running mean and variance
+             images. Defaults to None.
+
+        Returns:
+            bool: True if successful
+        """
+        data = self.rpcdata_to_array(zbinary)
+        self.SIG_APPEND_IMAGE_FRAME.emit(uuid, data, depth, stats)
+        return True
+
     @remote_call
     def get_sel_object_uuids(self, include_groups: bool = False) -> list[str]:
         """Return selected objects uuids.
@@ -492,6 +700,93 @@ class RemoteServer(QC.QThread):
         self.SIG_CALC.emit(name, param)
         return True
 
+    def __run_batch(
+        self,
+        operations: list[list],
+        objects: list[int | str] | None,
+        panel: str | None,
+        result: dict[str, Any],
+    ) -> None:
+        """Run batch of operations in main window (this is executed in the GUI
+        thread, see :py:meth:`run_batch`)
+
+        Args:
+            operations: Operations (decoded arguments)
+            objects: Objects to which operations are applied, or None
+            panel: Panel of objects, or None
+            result: Dictionary in which statuses (or exception) are stored, with a
+             "done" event which is set when batch is finished, and a "canceled"
+             event which is set when batch has to be canceled
+        """
+        try:
+            result["statuses"] = self.win.run_batch(
+                operations, objects, panel, result["canceled"]
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            result["error"] = exc
+        finally:
+            result["done"].set()
+
+    def decode_batch_arg(self, arg: Any) -> Any:
+        """Decode batch operation argument (see :py:meth:`RemoteClient.run_batch`):
+        arrays are XML-RPC Binary objects or data channel tokens, and datasets are
+        JSON data, both being wrapped in a dictionary
+
+        Args:
+            arg: Encoded argument
+
+        Returns:
+            Argument
+        """
+        if isinstance(arg, dict):
+            if "__array__" in arg:
+                return self.rpcdata_to_array(arg["__array__"])
+            if "__dataset__" in arg:
+                return json_to_dataset(arg["__dataset__"])
+        return arg
+
+    @remote_call
+    def run_batch(
+        self,
+        operations: list[list],
+        objects: list[int | str] | None = None,
+        panel: str | None = None,
+    ) -> list[list]:
+        """Run a batch of operations at once (see
+        :py:meth:`cdl.core.baseproxy.AbstractCDLControl.run_batch`): the whole batch
+        is executed in the GUI thread, within a single request.
+
+        Args:
+            operations: Operations: [name, *args] lists, arguments being encoded
+             (see :py:meth:`decode_batch_arg`)
+            objects: If not None, operations are a processing chain applied to
+             each of these objects. Defaults to None.
+            panel: Panel of `objects`. Defaults to None (current panel).
+
+        Returns:
+            Per-operation status (one list of statuses per object if `objects` is
+            not None)
+
+        Raises:
+            TimeoutError: if batch is not finished after :py:data:`BATCH_TIMEOUT`
+             seconds: the batch is then canceled (the operation being executed is
+             completed, but the remaining operations are skipped)
+        """
+        operations = [
+            [name, *[self.decode_batch_arg(arg) for arg in args]]
+            for name, *args in operations
+        ]
+        result = {"done": threading.Event(), "canceled": threading.Event()}
+        self.SIG_RUN_BATCH.emit(operations, objects, panel, result)
+        if not result["done"].wait(BATCH_TIMEOUT):
+            result["canceled"].set()
+            raise TimeoutError(
+                f"Batch operations not finished after {BATCH_TIMEOUT:g} seconds"
+            )
+        if "error" in result:
+            raise result["error"]
+        return result["statuses"]
+
     @remote_call
     def get_group_titles_with_object_infos(
         self,
@@ -522,24 +817,55 @@ class RemoteServer(QC.QThread):
         self,
         nb_id_title: int | str | None = None,
         panel: str | None = None,
-    ) -> list[str]:
+        transfer: str | None = None,
+        part: dict[str, Any] | None = None,
+    ) -> list:
         """Get object (signal/image) from index.
 
         Args:
             nb_id_title: Object number, or object id, or object title.
              Defaults to None (current object).
             panel: Panel name. Defaults to None (current panel).
+            transfer: Numerical arrays transfer mode: "binary" (arrays are sent as
+             XML-RPC Binary objects), "datachannel" (arrays are published on the
+             data channel, and their tokens are sent instead) or None (whole
+             object is serialized in JSON data). Defaults to None.
+            part: Partial retrieval options, only supported with binary transfer
+             modes (see :py:func:`get_object_part` arguments: "data", "roi" and
+             "frames"). Defaults to None (whole object).
 
         Returns:
-            Object
+            Object JSON data (see :py:func:`dataset_to_json`) if `transfer` is
+            None, otherwise [module name, class name, JSON data, arrays, frames],
+            where arrays are the numerical arrays referenced in JSON data and
+            frames are the image stream frames (see :py:func:`get_object_part`),
+            both being lists of XML-RPC Binary objects or data channel tokens
 
         Raises:
             KeyError: if object not found
+            ValueError: if transfer mode or partial retrieval options are invalid
         """
         obj = self.win.get_object(nb_id_title, panel)
         if obj is None:
             return None
-        return dataset_to_json(obj)
+        if transfer is None:
+            return dataset_to_json(obj)
+        if transfer not in ("binary", "datachannel"):
+            raise ValueError(f"Invalid transfer mode: {transfer}")
+        if transfer == "datachannel" and self.datachannel is None:
+            raise ValueError("Data channel is not available")
+        obj, frames = get_object_part(obj, **(part or {}))
+        writer = NativeObjWriter()
+        obj.serialize(writer)
+        arrays = writer.arrays
+        if transfer == "datachannel":
+            tokens = self.datachannel.put_arrays(arrays + frames)
+            arrays, frames = tokens[: len(arrays)], tokens[len(arrays) :]
+        else:
+            arrays = [array_to_rpcbinary(array) for array in arrays]
+            frames = [array_to_rpcbinary(frame) for frame in frames]
+        klass = obj.__class__
+        return [klass.__module__, klass.__name__, writer.get_json(), arrays, frames]
 
     @remote_call
     def get_object_uuids(self, panel: str | None = None) -> list[str]:
@@ -703,6 +1029,8 @@ class RemoteClient(BaseProxy):
         super().__init__()
         self.port: str = None
         self._cdl: ServerProxy
+        self._datachannel: DataChannelClient | None = None
+        self._binary_objects = False
 
     def __connect_to_server(self, port: str | None = None) -> None:
         """Connect to DataLab XML-RPC server.
@@ -733,6 +1061,22 @@ class RemoteClient(BaseProxy):
                 f"this DataLab client version ({cdl.__version__}).\n"
                 f"Please upgrade the server to {minor_version} or higher."
             )
+        self.__connect_to_data_channel()
+
+    def __connect_to_data_channel(self) -> None:
+        """Connect to DataLab data channel, if available (data channel and binary
+        object transfer are not available with DataLab versions prior to 0.17)"""
+        if self._datachannel is not None:
+            self._datachannel.close()
+            self._datachannel = None
+        try:
+            port = self._cdl.get_data_channel_port()
+            self._binary_objects = True
+        except Fault:
+            port = None
+            self._binary_objects = False
+        if port is not None:
+            self._datachannel = DataChannelClient(port)
 
     def connect(
         self,
@@ -776,6 +1120,9 @@ class RemoteClient(BaseProxy):
         # This is not mandatory with XML-RPC, but if we change protocol in the
         # future, it may be useful to have a disconnect method.
         self._cdl = None
+        if self._datachannel is not None:
+            self._datachannel.close()
+            self._datachannel = None
 
     def is_connected(self) -> bool:
         """Return True if connected to DataLab XML-RPC server."""
@@ -791,6 +1138,23 @@ class RemoteClient(BaseProxy):
         """Return list of available methods."""
         return self._cdl.system.listMethods()
 
+    def _arrays_to_rpcdata(self, *arrays: np.ndarray) -> list[Binary | str]:
+        """Convert NumPy arrays to XML-RPC data: arrays are uploaded through the
+        data channel (if available), unless they are small enough to be sent
+        efficiently as XML-RPC Binary objects
+
+        Args:
+            arrays: NumPy arrays
+
+        Returns:
+            XML-RPC Binary objects, or data channel tokens
+        """
+        arrays = [np.asarray(array) for array in arrays]
+        size = sum(array.nbytes for array in arrays)
+        if self._datachannel is None or size < DATA_CHANNEL_MIN_SIZE:
+            return [array_to_rpcbinary(array) for array in arrays]
+        return self._datachannel.put(arrays)
+
     # === Following methods should match the register functions in XML-RPC server
 
     def add_signal(
@@ -824,12 +1188,39 @@ class RemoteClient(BaseProxy):
         obj = SignalObj()
         obj.set_xydata(xdata, ydata)
         obj.check_data()
-        xbinary = array_to_rpcbinary(xdata)
-        ybinary = array_to_rpcbinary(ydata)
+        xbinary, ybinary = self._arrays_to_rpcdata(xdata, ydata)
         return self._cdl.add_signal(
             title, xbinary, ybinary, xunit, yunit, xlabel, ylabel
         )
 
+    def append_signal_data(
+        self,
+        uuid: str,
+        xdata: np.ndarray,
+        ydata: np.ndarray,
+        capacity: int | None = None,
+    ) -> bool:
+        """Append data points to signal (live signal).
+
+        Args:
+            uuid (str): Signal uuid
+            xdata (numpy.ndarray): X data to append
+            ydata (numpy.ndarray): Y data to append
+            capacity (int | None): Maximum number of points kept in signal.
+             Defaults to None.
+
+        Returns:
+            bool: True if data was appended successfully, False otherwise
+
+        Raises:
+            ValueError: Invalid data
+        """
+        xdata, ydata = np.ravel(xdata), np.ravel(ydata)
+        if xdata.size != ydata.size:
+            raise ValueError("X and Y data must have the same size")
+        xbinary, ybinary = self._arrays_to_rpcdata(xdata, ydata)
+        return self._cdl.append_signal_data(uuid, xbinary, ybinary, capacity)
+
     def add_image(
         self,
         title: str,
@@ -862,11 +1253,42 @@ class RemoteClient(BaseProxy):
         obj = ImageObj()
         obj.data = data
         obj.check_data()
-        zbinary = array_to_rpcbinary(data)
+        (zbinary,) = self._arrays_to_rpcdata(data)
         return self._cdl.add_image(
             title, zbinary, xunit, yunit, zunit, xlabel, ylabel, zlabel
         )
 
+    def append_image_frame(
+        self,
+        uuid: str,
+        data: np.ndarray,
+        depth: int | None = None,
+        stats: bool | None = None,
+    ) -> bool:
+        """Append frame to image stream: image data is replaced by the new frame.
+
+        Args:
+            uuid (str): Image uuid
+            data (numpy.ndarray): Frame data
+            depth (int | None): Number of frames kept in image stream buffer.
+             Defaults to None (current depth, or 10 frames when switching to
+             stream mode).
+            stats (bool | None): If True, maintain running mean and variance
+             images of the frames in buffer. Defaults to None (current setting,
+             or disabled when switching to stream mode).
+
+        Returns:
+            bool: True if frame was appended successfully, False otherwise
+
+        Raises:
+            ValueError: Invalid data dtype
+        """
+        obj = ImageObj()
+        obj.data = data
+        obj.check_data()
+        (zbinary,) = self._arrays_to_rpcdata(data)
+        return self._cdl.append_image_frame(uuid, zbinary, depth, stats)
+
     def calc(self, name: str, param: gds.DataSet | None = None) -> gds.DataSet:
         """Call compute function ``name`` in current panel's processor.
 
@@ -882,28 +1304,126 @@ class RemoteClient(BaseProxy):
             return self._cdl.calc(name)
         return self._cdl.calc(name, dataset_to_json(param))
 
+    def run_batch(
+        self,
+        operations: list[tuple],
+        objects: list[int | str] | None = None,
+        panel: str | None = None,
+    ) -> list[list]:
+        """Run a batch of operations at once, within a single request (see
+        :py:meth:`cdl.core.baseproxy.AbstractCDLControl.run_batch`).
+
+        Arrays passed as arguments (e.g. ``add_signal`` data) are transferred as
+        raw buffers, and datasets (e.g. ``calc`` parameters) as JSON data.
+
+        Args:
+            operations: Operations: ``(name, *args)`` tuples
+            objects: If not None, operations are a processing chain applied to
+             each of these objects. Defaults to None.
+            panel: Panel of `objects`. Defaults to None (current panel).
+
+        Returns:
+            Per-operation status (one list of statuses per object if `objects` is
+            not None)
+
+        Examples:
+            Applying a processing chain to all signals, and getting results:
+
+            >>> uuids = proxy.get_object_uuids("signal")
+            >>> param = cdl.param.MovingAverageParam.create(n=5)
+            >>> proxy.run_batch(
+            ...     [
+            ...         ("calc", "compute_moving_average", param),
+            ...         ("calc", "compute_fw1e2"),
+            ...         ("get_results",),
+            ...     ],
+            ...     objects=uuids,
+            ...     panel="signal",
+            ... )
+        """
+        operations = [list(operation) for operation in operations]
+        arrays = [
+            arg
+            for operation in operations
+            for arg in operation[1:]
+            if isinstance(arg, np.ndarray)
+        ]
+        rpcdata = iter(self._arrays_to_rpcdata(*arrays))
+        for operation in operations:
+            for index, arg in enumerate(operation[1:], start=1):
+                if isinstance(arg, np.ndarray):
+                    operation[index] = {"__array__": next(rpcdata)}
+                elif isinstance(arg, gds.DataSet):
+                    operation[index] = {"__dataset__": dataset_to_json(arg)}
+        return self._cdl.run_batch(operations, objects, panel)
+
     def get_object(
         self,
         nb_id_title: int | str | None = None,
         panel: str | None = None,
+        data: bool = True,
+        roi: list[int] | None = None,
+        frames: tuple[int | None, int | None] | None = None,
     ) -> SignalObj | ImageObj:
         """Get object (signal/image) from index.
 
+        Numerical arrays are transferred as raw buffers. Objects may also be
+        retrieved partially (`data`, `roi` and `frames` arguments), so that large
+        objects may be inspected without transferring them entirely.
+
         Args:
             nb_id_title: Object number, or object id, or object title.
              Defaults to None (current object).
             panel: Panel name. Defaults to None (current panel).
+            data: If False, data is not retrieved: only metadata, results, etc.
+             Defaults to True.
+            roi: Data slice: [i0, i1] index range for signals, [x0, y0, x1, y1]
+             pixel bounds for images (i1, x1 and y1 being excluded, as in Python
+             slicing). Object regions of interest are not retrieved in that case.
+             Defaults to None (whole data).
+            frames: (start, stop) frame range of image stream (as in Python slicing,
+             e.g. (-3, None) for the last three frames): the returned image is an
+             image stream holding those frames only (cropped to `roi`, if any).
+             Defaults to None.
 
         Returns:
             Object
 
         Raises:
             KeyError: if object not found
+            ValueError: if `roi` or `frames` is not valid for this object
+            RuntimeError: if partial retrieval is not supported by DataLab server
         """
-        param_data = self._cdl.get_object(nb_id_title, panel)
-        if param_data is None:
+        part = {"data": data}
+        if roi is not None:
+            part["roi"] = [int(value) for value in roi]
+        if frames is not None:
+            part["frames"] = [None if val is None else int(val) for val in frames]
+        if not self._binary_objects:
+            if part != {"data": True}:
+                raise RuntimeError("DataLab server does not support partial retrieval")
+            param_data = self._cdl.get_object(nb_id_title, panel)
+            if param_data is None:
+                return None
+            return json_to_dataset(param_data)
+        transfer = "binary" if self._datachannel is None else "datachannel"
+        result = self._cdl.get_object(nb_id_title, panel, transfer, part)
+        if result is None:
             return None
-        return json_to_dataset(param_data)
+        obj_module, obj_clsname, obj_json, arrays, frames = result
+        if self._datachannel is None:
+            arrays = [rpcbinary_to_array(binary) for binary in arrays]
+            frames = [rpcbinary_to_array(binary) for binary in frames]
+        else:
+            tokens = arrays + frames
+            received = self._datachannel.get(tokens) if tokens else []
+            arrays, frames = received[: len(arrays)], received[len(arrays) :]
+        mod = importlib.__import__(obj_module, fromlist=[obj_clsname])
+        obj = getattr(mod, obj_clsname)()
+        obj.deserialize(BinaryObjReader(obj_json, arrays))
+        for frame in frames:
+            obj.append_frame(frame, depth=len(frames))
+        return obj
 
     def get_object_shapes(
         self,
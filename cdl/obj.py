@@ -44,6 +44,8 @@ Signal model
 .. autodataset:: cdl.obj.SignalObj
     :members:
     :inherited-members:
+.. autoclass:: cdl.obj.SignalRingBuffer
+    :members:
 .. autofunction:: cdl.obj.read_signal
 .. autofunction:: cdl.obj.read_signals
 .. autofunction:: cdl.obj.create_signal
@@ -62,6 +64,8 @@ Image model
 .. autodataset:: cdl.obj.ImageObj
     :members:
     :inherited-members:
+.. autoclass:: cdl.obj.ImageFrameRingBuffer
+    :members:
 .. autofunction:: cdl.obj.read_image
 .. autofunction:: cdl.obj.read_images
 .. autofunction:: cdl.obj.create_image
@@ -91,6 +95,7 @@ from cdl.core.model.base import (
 from cdl.core.model.image import (
     Gauss2DParam,
     ImageDatatypes,
+    ImageFrameRingBuffer,
     ImageObj,
     ImageRoiDataItem,
     ImageTypes,
@@ -106,6 +111,7 @@ from cdl.core.model.signal import (
     NewSignalParam,
     PeriodicParam,
     SignalObj,
+    SignalRingBuffer,
     SignalTypes,
     ROI1DParam,
     StepParam,
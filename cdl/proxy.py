@@ -147,6 +147,31 @@ class LocalProxy(BaseProxy):
         """
         return self._cdl.add_signal(title, xdata, ydata, xunit, yunit, xlabel, ylabel)
 
+    def append_signal_data(
+        self,
+        uuid: str,
+        xdata: np.ndarray,
+        ydata: np.ndarray,
+        capacity: int | None = None,
+    ) -> bool:
+        """Append data points to signal (live signal).
+
+        Args:
+            uuid (str): Signal uuid
+            xdata (numpy.ndarray): X data to append
+            ydata (numpy.ndarray): Y data to append
+            capacity (int | None): Maximum number of points kept in signal.
+             Defaults to None.
+
+        Returns:
+            bool: True if data was appended successfully, False otherwise
+
+        Raises:
+            KeyError: if signal not found
+            ValueError: Invalid data
+        """
+        return self._cdl.append_signal_data(uuid, xdata, ydata, capacity)
+
     def add_image(
         self,
         title: str,
@@ -180,6 +205,34 @@ class LocalProxy(BaseProxy):
             title, data, xunit, yunit, zunit, xlabel, ylabel, zlabel
         )
 
+    def append_image_frame(
+        self,
+        uuid: str,
+        data: np.ndarray,
+        depth: int | None = None,
+        stats: bool | None = None,
+    ) -> bool:
+        """Append frame to image stream: image data is replaced by the new frame.
+
+        Args:
+            uuid (str): Image uuid
+            data (numpy.ndarray): Frame data
+            depth (int | None): Number of frames kept in image stream buffer.
+             Defaults to None (current depth, or 10 frames when switching to
+             stream mode).
+            stats (bool | None): If True, maintain running mean and variance
+             images of the frames in buffer. Defaults to None (current setting,
+             or disabled when switching to stream mode).
+
+        Returns:
+            bool: True if frame was appended successfully, False otherwise
+
+        Raises:
+            KeyError: if image not found
+            ValueError: Invalid data
+        """
+        return self._cdl.append_image_frame(uuid, data, depth, stats)
+
     def calc(self, name: str, param: gds.DataSet | None = None) -> gds.DataSet:
         """Call compute function ``name`` in current panel's processor.
 
@@ -193,6 +246,27 @@ class LocalProxy(BaseProxy):
         """
         return self._cdl.calc(name, param)
 
+    def run_batch(
+        self,
+        operations: list[tuple],
+        objects: list[int | str] | None = None,
+        panel: str | None = None,
+    ) -> list[list]:
+        """Run a batch of operations at once (see
+        :py:meth:`cdl.core.baseproxy.AbstractCDLControl.run_batch`).
+
+        Args:
+            operations: Operations: ``(name, *args)`` tuples
+            objects: If not None, operations are a processing chain applied to
+             each of these objects. Defaults to None.
+            panel: Panel of `objects`. Defaults to None (current panel).
+
+        Returns:
+            Per-operation status (one list of statuses per object if `objects` is
+            not None)
+        """
+        return self._cdl.run_batch(operations, objects, panel)
+
     def get_object(
         self,
         nb_id_title: int | str | None = None,
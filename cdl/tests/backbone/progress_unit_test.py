@@ -0,0 +1,121 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Progress reporter unit test
+
+Checking that progress updates are rate-limited and aggregated, for both progress
+dialogs (GUI loops) and worker callbacks.
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import time
+
+from guidata.qthelpers import qt_app_context
+from qtpy import QtWidgets as QW
+
+from cdl.env import execenv
+from cdl.utils.qthelpers import (
+    CallbackWorker,
+    ProgressReporter,
+    create_progress_reporter,
+    qt_long_callback,
+)
+
+
+def test_progress_reporter() -> None:
+    """Test rate-limited progress reporter (callback mode)"""
+    updates = []
+    nbiter = 10000
+    reporter = ProgressReporter(
+        nbiter, "Test", callback=lambda value, text: updates.append((value, text))
+    )
+    for idx in range(nbiter):
+        reporter.set_value(idx + 1)
+    execenv.print(f"{len(updates)} updates for {nbiter} iterations")
+    # First and last updates are always forwarded:
+    assert updates[0][0] == 1 and updates[-1][0] == nbiter
+    assert len(updates) < 10
+    assert reporter.throughput > 0.0
+    assert reporter.eta == 0.0
+    # Forcing update:
+    assert reporter.set_value(nbiter, force=True)
+    # Throughput and ETA are shown after one second:
+    updates.clear()
+    reporter = ProgressReporter(
+        4, "Test", callback=lambda value, text: updates.append((value, text))
+    )
+    reporter.set_value(0)
+    time.sleep(1.1)
+    reporter.increment()
+    assert updates[-1][0] == 1
+    assert "Test\n1/4" in updates[-1][1]
+    # Timer is reset when the reporter is started:
+    reporter.start()
+    assert reporter.value == 0 and reporter.elapsed < 1.0
+    # Throttled updates are shown when flushing pending updates:
+    updates.clear()
+    reporter = ProgressReporter(
+        10, "Test", callback=lambda value, text: updates.append((value, text))
+    )
+    reporter.set_value(1)
+    reporter.set_value(2)
+    reporter.set_label("Final")
+    assert updates[-1][0] == 1
+    reporter.flush_pending()
+    assert updates[-1] == (2, "Final")
+    reporter.flush_pending()  # Nothing pending anymore
+    assert len(updates) == 2
+    # Percentage progress:
+    reporter = ProgressReporter(100, "Test", percent=True)
+    time.sleep(1.1)
+    reporter.set_value(50)
+    assert "Test\n50% (" in reporter.get_text()
+
+
+def slow_func(worker: CallbackWorker, nbiter: int, count: bool = False) -> int:
+    """Function calling `set_progress` (or `set_progress_count`) very often"""
+    for idx in range(nbiter):
+        if count:
+            worker.set_progress_count(idx + 1, nbiter)
+        else:
+            worker.set_progress(idx / nbiter)
+    return nbiter
+
+
+def test_progress_dialog() -> None:
+    """Test progress reporter in GUI loops and worker callbacks"""
+    with qt_app_context():
+        win = QW.QMainWindow()
+        win.show()
+        nbiter = 10000
+        with create_progress_reporter(win, "Test", nbiter, show_after=0) as progress:
+            for idx in range(nbiter):
+                progress.set_value(idx + 1)
+                assert not progress.was_canceled()
+        assert progress.dialog.value() in (-1, nbiter)
+        # Throttled label is shown when exiting the context:
+        with create_progress_reporter(win, "Test", nbiter, show_after=0) as progress:
+            progress.set_value(1)
+            progress.set_label("Final")
+        assert progress.dialog.labelText() == "Final"
+        updates = []
+        worker = CallbackWorker(slow_func, nbiter=nbiter)
+        worker.SIG_PROGRESS_UPDATE.connect(updates.append)
+        assert qt_long_callback(win, "Test", worker, True) == nbiter
+        execenv.print(f"{len(updates)} worker updates for {nbiter} iterations")
+        assert len(updates) < 10
+        # Progress as a number of items: progress bar is updated in percent
+        updates = []
+        worker = CallbackWorker(slow_func, nbiter=nbiter, count=True)
+        worker.SIG_PROGRESS_UPDATE.connect(updates.append)
+        assert qt_long_callback(win, "Test", worker, True) == nbiter
+        QW.QApplication.processEvents()  # Processing queued progress signals
+        assert updates[-1] == 100
+        win.close()
+
+
+if __name__ == "__main__":
+    test_progress_reporter()
+    test_progress_dialog()
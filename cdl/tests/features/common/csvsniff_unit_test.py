@@ -0,0 +1,83 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+CSV format detection unit test:
+
+  - Detecting delimiter, column names, header and comment lines from the head of
+    CSV files
+  - Reading CSV files in a single pass, with progress based on file position (and
+    cancellation between chunks)
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+import os.path as osp
+
+import numpy as np
+import pytest
+
+from cdl.core.io.signal import funcs
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory, ProgressWorker
+
+CSV_CONTENTS = (
+    # (contents, delimiter, skiprows, has_names, header, has_comments)
+    ("1,2\n3,4\n", ",", 0, False, None, False),
+    ("# Comment\n1;2;3\n4;5;6  # Inline comment\n", ";", 0, False, None, True),
+    ("X (s)\tY (V)\n1\t2\n3\t4\n", "\t", 0, True, "", False),
+    ("1 2\n3 4\n", " ", 0, False, None, False),
+    ("#A=1\n#B=2\nX,Y1,Y2\n1,2,3\n4,5,\n", ",", 2, True, "#A=1\n#B=2", False),
+    ("Title\nDate: today\n\nTime,Value\n0,1.5\n1,nan\n", ",", 3, True, "", False),
+    # Single column: first line is always considered as column names
+    ("Title\n1.5\n2.5\n", ",", 0, True, "", False),
+)
+
+
+def test_sniff_csv() -> None:
+    """Test CSV format detection"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.csv")
+        for contents, delimiter, skiprows, has_names, header, comments in CSV_CONTENTS:
+            with open(fname, "w", encoding="utf-8") as fdesc:
+                fdesc.write(contents)
+            fmt = funcs.sniff_csv(fname)
+            execenv.print(fmt)
+            assert fmt.delimiter == delimiter
+            assert fmt.skiprows == skiprows
+            assert fmt.has_names == has_names
+            assert fmt.header == header
+            assert fmt.has_comments == comments
+            xydata = funcs.read_csv(fname)[0]
+            assert xydata.shape[0] == 2 and xydata[0, 0] in (0.0, 1.0, 1.5)
+        for contents in ("", "a,b\nc,d\n", "1,2\n" + "Text\n" * 30 + "1,2\n"):
+            with open(fname, "w", encoding="utf-8") as fdesc:
+                fdesc.write(contents)
+            with pytest.raises(ValueError):
+                funcs.sniff_csv(fname)
+
+
+def test_read_csv_progress() -> None:
+    """Test reading large CSV file, with progress based on file position"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "large.csv")
+        x = np.linspace(0.0, 1.0, 10 * funcs.CSV_CHUNK_SIZE)
+        with open(fname, "w", encoding="utf-8") as fdesc:
+            fdesc.write("# Header\nX (s),Y (V)\n")
+            np.savetxt(fdesc, np.c_[x, x**2], delimiter=",", fmt="%.12g")
+        worker = ProgressWorker()
+        xydata, xlabel, xunit, ylabels, yunits, header = funcs.read_csv(fname, worker)
+        execenv.print(f"{len(worker.values)} progress updates")
+        assert np.allclose(xydata[:, 0], x) and np.allclose(xydata[:, 1], x**2)
+        assert (xlabel, xunit, ylabels, yunits) == ("X", "s", ["Y"], ["V"])
+        assert header == "# Header"
+        assert len(worker.values) > 2 and worker.values == sorted(worker.values)
+        assert worker.values[-1] == pytest.approx(1.0)
+        # Canceling: reading is interrupted after the first chunk
+        worker = ProgressWorker(cancel_after=1)
+        xydata = funcs.read_csv(fname, worker)[0]
+        assert len(xydata) == funcs.CSV_CHUNK_SIZE
+
+
+if __name__ == "__main__":
+    test_sniff_csv()
+    test_read_csv_progress()
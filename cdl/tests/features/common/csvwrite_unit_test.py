@@ -0,0 +1,95 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+CSV file writing unit test:
+
+  - Writing header, column names and data rows in a single pass
+  - Round-trip of values (shortest representation of floats)
+  - Writing and reading gzip-compressed CSV files, with progress reporting
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+import gzip
+import os.path as osp
+
+import numpy as np
+import pytest
+
+import cdl.obj
+from cdl.core.io.signal import SignalIORegistry, funcs
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory, ProgressWorker
+
+
+def test_write_csv() -> None:
+    """Test CSV file writing and round-trip"""
+    x = np.linspace(0.0, 1.0, 1001)
+    y = np.array([np.sin(x), np.exp(x) / 3.0])
+    xydata = np.vstack([x, y])
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.csv")
+        header = "# Title\n# Date: today"
+        funcs.write_csv(
+            fname, xydata, "T", "s", ["A", ""], ["V", "mV"], header, chunksize=100
+        )
+        with open(fname, "r", encoding="utf-8") as fdesc:
+            lines = fdesc.read().splitlines()
+        execenv.print("\n".join(lines[:4]))
+        assert lines[:3] == ["# Title", "# Date: today", "T (s),A (V),Y2 (mV)"]
+        assert len(lines) == 3 + x.size
+        # Values are written with their shortest round-trip representation:
+        assert np.array_equal(np.loadtxt(fname, delimiter=",", skiprows=3), xydata.T)
+        data, xlabel, xunit, ylabels, yunits, rheader = funcs.read_csv(fname)
+        assert np.allclose(data, xydata.T, rtol=1e-12, atol=0.0)
+        assert (xlabel, xunit, ylabels, yunits) == ("T", "s", ["A", "Y2"], ["V", "mV"])
+        assert rheader == header
+
+
+def test_write_csv_gzip() -> None:
+    """Test gzip-compressed CSV file writing and reading, with progress"""
+    x = np.linspace(0.0, 10.0, 5 * funcs.CSV_CHUNK_SIZE)
+    sig = cdl.obj.create_signal("Test", x, np.cos(x))
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.csv.gz")
+        worker = ProgressWorker()
+        SignalIORegistry.write(fname, sig, worker)
+        execenv.print(f"{len(worker.values)} progress updates (writing)")
+        assert worker.values == sorted(worker.values)
+        assert worker.values[-1] == pytest.approx(1.0)
+        with gzip.open(fname, "rt", encoding="utf-8") as fdesc:
+            assert fdesc.readline() == "X,Y\n"
+        worker = ProgressWorker()
+        data = funcs.read_csv_by_chunks(fname, worker=worker)
+        assert np.allclose(data.to_numpy(), sig.xydata.T, rtol=1e-12, atol=0.0)
+        assert worker.values == sorted(worker.values)
+        assert worker.values[-1] == pytest.approx(1.0)
+        sig2 = SignalIORegistry.read(fname)[0]
+        assert np.allclose(sig2.xydata, sig.xydata, rtol=1e-12, atol=0.0)
+        # Canceling: the incomplete file is removed
+        fname = osp.join(tmpdir, "canceled.csv")
+        SignalIORegistry.write(fname, sig, ProgressWorker(cancel_after=1))
+        assert not osp.exists(fname)
+        assert not osp.exists(fname + ".tmp")
+
+
+def test_write_csv_nan() -> None:
+    """Test that NaN values are written as empty fields"""
+    x = np.arange(4.0)
+    y = np.array([1.0, np.nan, 3.0, np.nan])
+    sig = cdl.obj.create_signal("Test", x, y)
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.csv")
+        SignalIORegistry.write(fname, sig)
+        with open(fname, "r", encoding="utf-8") as fdesc:
+            lines = fdesc.read().splitlines()
+        execenv.print(lines)
+        assert lines[2] == "1.0," and lines[4] == "3.0,"
+        sig2 = SignalIORegistry.read(fname)[0]
+        assert np.array_equal(sig2.xydata, sig.xydata, equal_nan=True)
+
+
+if __name__ == "__main__":
+    test_write_csv()
+    test_write_csv_gzip()
+    test_write_csv_nan()
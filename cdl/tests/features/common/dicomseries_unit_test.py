@@ -0,0 +1,129 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+DICOM series unit test:
+
+  - Scanning headers only to select the slices of a series, and to sort them by
+    position along slice normal (or by instance number)
+  - Decoding pixel data in parallel: one image per slice, or a single image stream
+    holding all slices (volume)
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+import os.path as osp
+import time
+
+import numpy as np
+import pytest
+
+from cdl.core.io.base import IOAction
+from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.image import funcs as image_funcs
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory
+
+pydicom = pytest.importorskip("pydicom")
+
+
+def write_dicom_slice(
+    filename: str, data: np.ndarray, series_uid: str, instance: int, z: float
+) -> None:
+    """Write DICOM slice file (uncompressed, explicit VR little endian)
+
+    Args:
+        filename: File name
+        data: Pixel data (uint16)
+        series_uid: Series instance UID
+        instance: Instance number
+        z: Slice position along Z axis
+    """
+    # pylint: disable=import-outside-toplevel
+    from pydicom.dataset import FileDataset, FileMetaDataset
+    from pydicom.uid import CTImageStorage, ExplicitVRLittleEndian, generate_uid
+
+    meta = FileMetaDataset()
+    meta.MediaStorageSOPClassUID = CTImageStorage
+    meta.MediaStorageSOPInstanceUID = generate_uid()
+    meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds = FileDataset(filename, {}, file_meta=meta, preamble=b"\0" * 128)
+    ds.SOPClassUID = CTImageStorage
+    ds.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+    ds.SeriesInstanceUID = series_uid
+    ds.InstanceNumber = instance
+    ds.ImagePositionPatient = [0.0, 0.0, z]
+    ds.ImageOrientationPatient = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+    ds.PixelSpacing = [0.5, 0.25]
+    ds.Rows, ds.Columns = data.shape
+    ds.SamplesPerPixel = 1
+    ds.PhotometricInterpretation = "MONOCHROME2"
+    ds.BitsAllocated = ds.BitsStored = 16
+    ds.HighBit = 15
+    ds.PixelRepresentation = 0
+    ds.PixelData = data.astype("<u2").tobytes()
+    ds.save_as(filename, enforce_file_format=True)
+
+
+def create_dicom_series(directory: str, nslices: int) -> str:
+    """Create DICOM series in directory: file names and instance numbers are
+    shuffled, slices being ordered by position. Files of another series and
+    non-DICOM files are also created.
+
+    Args:
+        directory: Directory
+        nslices: Number of slices
+
+    Returns:
+        Series instance UID
+    """
+    # pylint: disable=import-outside-toplevel
+    from pydicom.uid import generate_uid
+
+    series_uid = generate_uid()
+    rng = np.random.default_rng(0)
+    for fileidx, index in enumerate(rng.permutation(nslices)):
+        data = np.full((64, 32), index, dtype=np.uint16)
+        fname = osp.join(directory, f"slice{fileidx:04d}.dcm")
+        write_dicom_slice(fname, data, series_uid, nslices - index, -2.0 * index)
+    data = np.zeros((64, 32), dtype=np.uint16)
+    write_dicom_slice(osp.join(directory, "other.dcm"), data, generate_uid(), 1, 0.0)
+    with open(osp.join(directory, "notes.txt"), "w", encoding="utf-8") as fdesc:
+        fdesc.write("Not a DICOM file")
+    return series_uid
+
+
+def test_dicom_series() -> None:
+    """Test DICOM series loading"""
+    nslices = 200
+    fmt = ImageIORegistry.get_format("series.dcm", IOAction.LOAD)
+    with CDLTemporaryDirectory() as tmpdir:
+        create_dicom_series(tmpdir, nslices)
+        header = image_funcs.read_dicom_header(osp.join(tmpdir, "slice0000.dcm"))
+        assert header.shape == (64, 32) and header.spacing == (0.5, 0.25)
+        assert image_funcs.read_dicom_header(osp.join(tmpdir, "notes.txt")) is None
+        # Files with an invalid header are skipped:
+        fname = osp.join(tmpdir, "invalid.dcm")
+        write_dicom_slice(fname, np.zeros((64, 32), np.uint16), "1.2.3", 1, 0.0)
+        dcm = pydicom.dcmread(fname)
+        dcm.ImageOrientationPatient = [1.0, 0.0, 0.0]
+        dcm.save_as(fname)
+        assert image_funcs.read_dicom_header(fname) is None
+        t0 = time.perf_counter()
+        objs = fmt.read_series(tmpdir)
+        execenv.print(f"{nslices} slices read in {time.perf_counter() - t0:.2f} s")
+        assert len(objs) == nslices
+        # Slices are sorted by decreasing index (increasing position along Z):
+        for obj, index in zip(objs, range(nslices - 1, -1, -1)):
+            assert obj.data[0, 0] == index and obj.data.shape == (64, 32)
+            assert obj.dx == 0.25 and obj.dy == 0.5
+        obj = fmt.read_series(tmpdir, stack=True)[0]
+        assert obj.is_stream() and obj.get_frame_count() == nslices
+        assert obj.get_frame(0)[0, 0] == nslices - 1 and obj.data[0, 0] == 0
+        fnames = [osp.join(tmpdir, f"slice{idx:04d}.dcm") for idx in range(3)]
+        assert len(fmt.read_series(fnames)) == 3
+        with pytest.raises(ValueError):
+            fmt.read_series([osp.join(tmpdir, "notes.txt")])
+
+
+if __name__ == "__main__":
+    test_dicom_series()
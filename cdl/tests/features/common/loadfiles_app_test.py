@@ -0,0 +1,82 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Multiple files loading application test:
+
+  - Save signals and images to files
+  - Open them all at once: files are read concurrently, and objects are added
+    in file name order
+  - Open files including unreadable ones: readable files are still loaded, and
+    errors are collected in a single report
+  - Open several MAT-Files: reading options (selected variables) are applied to
+    all files
+"""
+
+# guitest: show
+
+import os.path as osp
+
+import numpy as np
+import scipy.io as sio
+
+import cdl.obj
+from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.signal import SignalIORegistry
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def test_load_from_files() -> None:
+    """Test concurrent loading of multiple files"""
+    nbfiles = 12
+    with CDLTemporaryDirectory() as tmpdir:
+        sfnames, ifnames = [], []
+        for idx in range(nbfiles):
+            x = np.linspace(0.0, 1.0, 100 + idx)
+            sig = cdl.obj.create_signal(f"S{idx}", x, np.sin(x * idx))
+            sfnames.append(osp.join(tmpdir, f"sig{idx:02d}.csv"))
+            SignalIORegistry.write(sfnames[-1], sig)
+            data = np.full((20, 30 + idx), idx, dtype=np.uint16)
+            ima = cdl.obj.create_image(f"I{idx}", data)
+            ifnames.append(osp.join(tmpdir, f"ima{idx:02d}.npy"))
+            ImageIORegistry.write(ifnames[-1], ima)
+        with cdltest_app_context(console=False) as win:
+            execenv.print("Opening signals:")
+            panel = win.signalpanel
+            objs = panel.load_from_files(sfnames)
+            assert len(objs) == len(panel) == nbfiles
+            for idx, obj in enumerate(objs):
+                assert obj.metadata["source"] == sfnames[idx]
+                assert obj.x.size == 100 + idx
+            assert panel.objview.get_current_object() is objs[-1]
+            execenv.print("Opening images (with unreadable files):")
+            panel = win.imagepanel
+            bad_fname = osp.join(tmpdir, "bad.npy")
+            with open(bad_fname, "wb") as fdesc:
+                fdesc.write(b"not a numpy file")
+            missing_fname = osp.join(tmpdir, "missing.npy")
+            fnames = ifnames[:3] + [bad_fname] + ifnames[3:] + [missing_fname]
+            objs = panel.load_from_files(fnames)
+            assert len(objs) == len(panel) == nbfiles
+            for idx, obj in enumerate(objs):
+                assert obj.metadata["source"] == ifnames[idx]
+                assert obj.data.shape == (20, 30 + idx) and obj.data[0, 0] == idx
+            execenv.print("Opening MAT-Files (with reading options):")
+            mfnames = []
+            for idx in range(3):
+                mfnames.append(osp.join(tmpdir, f"ima{idx:02d}.mat"))
+                sio.savemat(mfnames[-1], {"a": np.zeros((5, 6)), "b": np.eye(4) * idx})
+            # (reading options are asked to the user, except in unattended mode)
+            panel.get_read_options = lambda filename: {"variables": ["b"]}
+            try:
+                objs = panel.load_from_files(mfnames)
+            finally:
+                del panel.get_read_options
+            assert len(objs) == len(mfnames)
+            for idx, obj in enumerate(objs):
+                assert obj.title.endswith("(b)") and obj.data[1, 1] == idx
+
+
+if __name__ == "__main__":
+    test_load_from_files()
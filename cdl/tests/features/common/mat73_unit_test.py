@@ -0,0 +1,108 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+MAT-File v7.3 unit test:
+
+  - Listing variables of MAT-Files (v7.3 and earlier) without reading data
+  - Reading selected variables only
+  - Lazy reading of MAT-File v7.3 images: contiguous arrays are memory-mapped,
+    and MATLAB's column-major layout is handled without copying data
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from __future__ import annotations
+
+import os.path as osp
+
+import h5py
+import numpy as np
+import pytest
+import scipy.io as sio
+
+from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.image.formats import MatImageFormat
+from cdl.core.io.mat import list_mat_variables, read_mat73_variable
+from cdl.core.io.signal import SignalIORegistry
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def write_mat73_file(filename: str, variables: dict[str, np.ndarray]) -> None:
+    """Write MAT-File v7.3, as MATLAB does: HDF5 file with a 512-byte user block
+    holding MAT-File header, arrays being stored in column-major order
+
+    Args:
+        filename: File name
+        variables: Variables (numeric arrays)
+    """
+    with h5py.File(filename, "w", userblock_size=512) as h5:
+        for name, data in variables.items():
+            kwargs = {"chunks": True, "compression": "gzip"} if name == "zip" else {}
+            if np.iscomplexobj(data):
+                dtype = np.dtype([("real", "<f8"), ("imag", "<f8")])
+                cdata = np.empty(data.T.shape, dtype)
+                cdata["real"], cdata["imag"] = data.T.real, data.T.imag
+                dset = h5.create_dataset(name, data=cdata, **kwargs)
+                mclass = "double"
+            else:
+                dset = h5.create_dataset(name, data=data.T, **kwargs)
+                mclass = {np.float64: "double", np.uint16: "uint16"}[data.dtype.type]
+            dset.attrs["MATLAB_class"] = np.bytes_(mclass)
+        dset = h5.create_dataset("text", data=np.frombuffer(b"abc", np.uint8))
+        dset.attrs["MATLAB_class"] = np.bytes_("char")
+    with open(filename, "r+b") as fdesc:
+        fdesc.write(b"MATLAB 7.3 MAT-file".ljust(116) + bytes(8) + b"\x00\x02IM")
+
+
+def test_mat73_images() -> None:
+    """Test reading images from MAT-File v7.3"""
+    variables = {
+        "img": np.arange(12.0).reshape(3, 4),
+        "zip": np.arange(20000, dtype=np.uint16).reshape(100, 200),
+        "cplx": (np.arange(6) + 1j * np.arange(6)).reshape(2, 3),
+        "sig": np.linspace(0.0, 1.0, 50)[None, :],
+    }
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test73.mat")
+        write_mat73_file(fname, variables)
+        mvars = list_mat_variables(fname)
+        execenv.print("Variables:", mvars)
+        assert {var.name: var.shape for var in mvars} == {
+            name: data.shape for name, data in variables.items()
+        }
+        data = read_mat73_variable(fname, "img")
+        assert isinstance(data, np.memmap) and data.flags.f_contiguous
+        for name, ref in variables.items():
+            assert np.array_equal(read_mat73_variable(fname, name), ref)
+        objs = ImageIORegistry.read(fname)
+        assert len(objs) == len(variables)
+        assert all(obj.data_loader is not None for obj in objs)
+        objs = ImageIORegistry.read(fname, variables=["zip", "img"])
+        assert objs[0].title.endswith("test73.mat") and objs[1].title.endswith("(zip)")
+        assert np.array_equal(objs[0].data, variables["img"])
+        assert np.array_equal(objs[1].data, variables["zip"])
+        sig = SignalIORegistry.read(fname, variables=["sig"])[0]
+        assert np.array_equal(sig.y, variables["sig"].ravel())
+
+
+def test_mat_variables() -> None:
+    """Test listing and selecting variables of MAT-File (prior to v7.3)"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.mat")
+        sio.savemat(fname, {"img": np.ones((3, 4)), "other": np.eye(2), "s": "str"})
+        mvars = list_mat_variables(fname)
+        assert [(var.name, var.shape) for var in mvars] == [
+            ("img", (3, 4)),
+            ("other", (2, 2)),
+        ]
+        objs = ImageIORegistry.read(fname, variables=["other"])
+        assert len(objs) == 1 and np.array_equal(objs[0].data, np.eye(2))
+        # (MAT-Files may contain several images: data is read with `read` method)
+        with pytest.raises(NotImplementedError):
+            MatImageFormat.read_data(fname)
+
+
+if __name__ == "__main__":
+    test_mat73_images()
+    test_mat_variables()
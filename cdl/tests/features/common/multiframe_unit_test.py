@@ -0,0 +1,126 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Multi-frame image files unit test:
+
+  - Per-frame access to Andor SIF and Spiricon files (memory-mapped frames)
+  - Lazy import of frames, and frame range selection
+  - Formats without per-frame access: file is read once when counting frames
+    before reading them
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+import os.path as osp
+from unittest.mock import patch
+
+import numpy as np
+
+from cdl.config import Conf
+from cdl.core.io.base import IOAction
+from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.image import funcs as image_funcs
+from cdl.core.io.image.base import ArrayFrameProvider
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory, get_test_fnames
+
+
+def create_sif_file(filename: str, nframes: int) -> np.ndarray:
+    """Create a multi-frame SIF file from the single-frame SIF test file
+
+    Args:
+        filename: File name
+        nframes: Number of frames
+
+    Returns:
+        Frames data
+    """
+    src = image_funcs.SIFFile(get_test_fnames("*.sif")[0])
+    with open(src.filepath, "rb") as fdesc:
+        header = fdesc.read(src.m_offset)
+    stack_line = b"Pixel number65541 1 1024 1024 1 1 "
+    assert stack_line in header
+    header = header.replace(stack_line, stack_line[:-2] + b"%d " % nframes)
+    shape = (nframes, src.height, src.width)
+    data = np.empty(shape, dtype=np.float32)
+    data[:] = np.arange(1, nframes + 1)[:, None, None]
+    with open(filename, "wb") as fdesc:
+        fdesc.write(header + data.tobytes() + b"0\n0\n")
+    return data
+
+
+def test_scor_frame() -> None:
+    """Test Spiricon file per-frame access"""
+    fname = get_test_fnames("*.scor-data")[0]
+    scor = image_funcs.SCORFile(fname)
+    assert scor.n_frames == 1
+    with open(fname, "rb") as fdesc:
+        fdesc.seek(scor.m_offset)
+        ref = np.frombuffer(fdesc.read(scor.datasize), dtype=np.int16)
+    assert np.array_equal(scor.read_frame(0), ref.reshape(scor.height, scor.width))
+    assert np.array_equal(ImageIORegistry.read(fname)[0].data, scor.read_frame(0))
+
+
+def test_sif_frames() -> None:
+    """Test Andor SIF file per-frame access, lazy import and frame range"""
+    nframes = 5
+    lazy = Conf.io.lazy_frame_import.get()
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "stack.sif")
+        data = create_sif_file(fname, nframes)
+        sif = image_funcs.SIFFile(fname)
+        assert sif.n_frames == nframes
+        assert np.array_equal(sif.read_frame(3), data[3])
+        assert np.array_equal(sif.read_all(), data)
+        fmt = ImageIORegistry.get_format(fname, IOAction.LOAD)
+        assert fmt.get_frame_count(fname) == nframes
+        try:
+            Conf.io.lazy_frame_import.set(True)
+            objs = ImageIORegistry.read(fname)
+            assert len(objs) == nframes
+            assert all(obj.data_loader is not None for obj in objs)
+            assert np.array_equal(objs[2].data, data[2])
+            assert objs[2].data_loader is None and objs[3].data_loader is not None
+            objs = ImageIORegistry.read(fname, frames=range(1, nframes, 2))
+            execenv.print("Frame range:", ", ".join(obj.title for obj in objs))
+            assert [obj.title[-2:] for obj in objs] == ["01", "03"]
+            assert np.array_equal(objs[1].data, data[3])
+            Conf.io.lazy_frame_import.set(False)
+            objs = ImageIORegistry.read(fname, frames=range(2, 4))
+            assert all(obj.data_loader is None for obj in objs)
+            assert np.array_equal(objs[0].data, data[2])
+        finally:
+            Conf.io.lazy_frame_import.set(lazy)
+
+
+def test_array_frame_provider() -> None:
+    """Test frame count of formats reading all frames at once (the provider used
+    to count frames is reused when reading the file)"""
+    nframes = 4
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "stack.sif")
+        data = create_sif_file(fname, nframes)
+        fmt = ImageIORegistry.get_format(fname, IOAction.LOAD)
+        reads = []
+
+        def get_frame_provider(filename: str) -> ArrayFrameProvider:
+            """Return frame provider reading all frames at once"""
+            reads.append(filename)
+            return ArrayFrameProvider(filename, fmt.read_data(filename))
+
+        with patch.object(fmt, "get_frame_provider", get_frame_provider):
+            assert fmt.get_frame_count(fname) == nframes
+            objs = fmt.read(fname, frames=range(1, 3))
+            assert len(reads) == 1 and np.array_equal(objs[0].data, data[1])
+            # Provider is used once:
+            assert len(fmt.read(fname)) == nframes and len(reads) == 2
+            # Provider may be released (e.g. reading has been canceled):
+            assert fmt.get_frame_count(fname) == nframes
+            fmt.release_frame_provider()
+            assert len(fmt.read(fname)) == nframes and len(reads) == 4
+
+
+if __name__ == "__main__":
+    test_scor_frame()
+    test_sif_frames()
+    test_array_frame_provider()
@@ -0,0 +1,119 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+DataLab object files unit test:
+
+  - Save signal and image objects (with metadata, ROI and result shapes) to
+    DataLab object files, and read them back: data arrays are memory-mapped
+  - Check payload alignment, class checking, progress and cancellation
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from __future__ import annotations
+
+import os.path as osp
+
+import numpy as np
+import pytest
+
+import cdl.obj
+from cdl.core.io import native
+from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.image.formats import NativeImageFormat
+from cdl.core.io.signal import SignalIORegistry
+from cdl.env import execenv
+from cdl.tests import data as test_data
+from cdl.utils.tests import CDLTemporaryDirectory, ProgressWorker, compare_metadata
+
+
+def check_memmap(array: np.ndarray) -> None:
+    """Check that array is memory-mapped and aligned"""
+    assert isinstance(array, np.memmap)
+    assert array.offset % native.OBJ_ALIGNMENT == 0
+
+
+def test_native_signal() -> None:
+    """Test DataLab object files with signals"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "signal.dlobj")
+        sig = test_data.create_paracetamol_signal()
+        sig.metadata["Info"] = "Paracetamol"
+        sig.roi = np.array([[10, 100], [200, 300]], int)
+        SignalIORegistry.write(fname, sig)
+        sig2 = SignalIORegistry.read(fname)[0]
+        check_memmap(sig2.xydata)
+        assert np.array_equal(sig2.xydata, sig.xydata)
+        assert sig2.title == sig.title and sig2.uuid != sig.uuid
+        assert np.array_equal(sig2.roi, sig.roi)
+        assert not isinstance(sig2.roi, np.memmap)  # Small arrays are not mapped
+        assert compare_metadata(sig.metadata, sig2.metadata)
+        # Data is copy-on-write: modifying it does not change the file
+        sig2.xydata[1, 0] = -1.0
+        assert SignalIORegistry.read(fname)[0].xydata[1, 0] == sig.xydata[1, 0]
+        # Overwriting the file from which memory-mapped data has been read:
+        sig2.title = "Modified"
+        version = sig2.data_version
+        SignalIORegistry.write(fname, sig2)
+        # (data mapped from the replaced file has been copied into memory)
+        assert not native.is_mapped_from(sig2.xydata, fname)
+        assert sig2.data_version == version and sig2.xydata[1, 0] == -1.0
+        sig3 = SignalIORegistry.read(fname)[0]
+        assert sig3.title == "Modified" and sig3.xydata[1, 0] == -1.0
+        with pytest.raises(ValueError):
+            ImageIORegistry.read(fname)
+
+
+def test_native_image() -> None:
+    """Test DataLab object files with images"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "image.dlobj")
+        ima = test_data.create_annotated_image()
+        for mshape in test_data.create_resultshapes():
+            mshape.add_to(ima)
+        ima.roi = np.array([[10, 20, 100, 200]], int)
+        ImageIORegistry.write(fname, ima)
+        ima2 = ImageIORegistry.read(fname)[0]
+        check_memmap(ima2.data)
+        assert ima2.data.dtype == ima.data.dtype
+        assert np.array_equal(ima2.data, ima.data)
+        assert np.array_equal(ima2.roi, ima.roi)
+        assert compare_metadata(ima.metadata, ima2.metadata)
+        data = NativeImageFormat.read_data(fname)
+        check_memmap(data)
+        assert np.array_equal(data, ima.data)
+        for dtype in (np.uint8, np.int32, np.float32, np.complex128, ">f8"):
+            data = np.arange(24, dtype=dtype).reshape(4, 6)
+            ImageIORegistry.write(fname, cdl.obj.create_image("Test", data))
+            data2 = ImageIORegistry.read(fname)[0].data
+            execenv.print(f"{np.dtype(dtype)} -> {data2.dtype}")
+            assert np.array_equal(data2, data) and data2.dtype.byteorder != ">"
+        with pytest.raises(ValueError):
+            SignalIORegistry.read(fname)
+
+
+def test_native_progress() -> None:
+    """Test DataLab object files writing progress and cancellation"""
+    chunk_size = native.OBJ_CHUNK_SIZE
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "image.dlobj")
+        ima = cdl.obj.create_image("Test", np.random.rand(500, 400))
+        try:
+            native.OBJ_CHUNK_SIZE = 2**16
+            worker = ProgressWorker()
+            ImageIORegistry.write(fname, ima, worker)
+            assert len(worker.values) > 10 and worker.values == sorted(worker.values)
+            assert worker.values[-1] == pytest.approx(1.0)
+            worker = ProgressWorker(cancel_after=3)
+            ImageIORegistry.write(fname, ima, worker)
+            assert len(worker.values) == 3
+            assert not osp.exists(fname + ".tmp")
+            assert ImageIORegistry.read(fname)[0].data.shape == (500, 400)
+        finally:
+            native.OBJ_CHUNK_SIZE = chunk_size
+
+
+if __name__ == "__main__":
+    test_native_signal()
+    test_native_image()
+    test_native_progress()
@@ -0,0 +1,103 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Multiple files saving application test:
+
+  - Save selected images to a directory, with file names built from a basename
+    pattern: files are written concurrently
+  - Check that existing files are not overwritten (unless requested)
+  - Save images to TIFF files with compression
+  - Save selected signals to explicit file names
+"""
+
+# guitest: show
+
+import os.path as osp
+
+import numpy as np
+import pytest
+import tifffile
+
+import cdl.obj
+from cdl.config import Conf
+from cdl.core.gui.panel.base import SaveToDirectoryParam
+from cdl.core.io.base import get_export_filenames
+from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.signal import SignalIORegistry
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def test_export_filenames() -> None:
+    """Test export file names templating"""
+    objs = [cdl.obj.create_signal(title) for title in ("a/b", "c", "c", "")]
+    for index, obj in enumerate(objs):
+        obj.number = index + 1
+    with CDLTemporaryDirectory() as tmpdir:
+        fnames = get_export_filenames(objs, tmpdir, "{title}", "csv")
+        names = [osp.basename(fname) for fname in fnames]
+        assert names == ["a_b.csv", "c.csv", "c_2.csv", "4.csv"]
+        fnames = get_export_filenames(objs, tmpdir, "{index:02d}-{short_id}", ".npy")
+        assert osp.basename(fnames[-1]) == f"04-{objs[-1].short_id}.npy"
+        for pattern in ("{unknown}", "{title", "{0}", "{index:s}"):
+            with pytest.raises(ValueError):
+                get_export_filenames(objs, tmpdir, pattern, "csv")
+
+
+def test_save_to_directory() -> None:
+    """Test concurrent saving of multiple objects"""
+    nbobj = 10
+    with CDLTemporaryDirectory() as tmpdir:
+        with cdltest_app_context(console=False) as win:
+            panel = win.imagepanel
+            for idx in range(nbobj):
+                data = np.full((50, 60), idx, dtype=np.uint16)
+                panel.add_object(cdl.obj.create_image(f"Image {idx}", data))
+            panel.objview.select_groups([1])
+            extensions = ImageIORegistry.get_write_extensions()
+            param = SaveToDirectoryParam(extensions)
+            param.directory = osp.join(tmpdir, "images")
+            param.basename = "{index:03d}_{title}"
+            param.extension = "npy"
+            fnames = panel.save_to_directory(param)
+            execenv.print(f"{len(fnames)} files written in {param.directory}")
+            assert len(fnames) == nbobj
+            for idx, fname in enumerate(fnames):
+                assert osp.basename(fname) == f"{idx + 1:03d}_Image {idx}.npy"
+                assert np.load(fname)[0, 0] == idx
+            # Existing files are not overwritten, unless requested:
+            fnames2 = panel.save_to_directory(param)
+            assert all(fname.endswith("_2.npy") for fname in fnames2)
+            param.overwrite = True
+            assert panel.save_to_directory(param) == fnames
+            # Invalid basename pattern: error is reported, no file is written
+            param.basename = "{index"
+            assert panel.save_to_directory(param) == []
+            param.basename = "{index:03d}_{title}"
+            # TIFF compression:
+            compression = Conf.io.tiff_compression.get()
+            Conf.io.tiff_compression.set("zlib")
+            try:
+                param.extension = "tif"
+                fnames = panel.save_to_directory(param)
+            finally:
+                Conf.io.tiff_compression.set(compression)
+            with tifffile.TiffFile(fnames[-1]) as tif:
+                assert tif.pages[0].compression != tifffile.COMPRESSION.NONE
+            assert ImageIORegistry.read(fnames[-1])[0].data[0, 0] == nbobj - 1
+            # Saving signals to explicit file names:
+            panel = win.signalpanel
+            for idx in range(3):
+                x = np.arange(idx + 2.0)
+                panel.add_object(cdl.obj.create_signal(f"S{idx}", x, x**2))
+            panel.objview.select_groups([1])
+            fnames = [osp.join(tmpdir, f"sig{idx}.csv") for idx in range(3)]
+            panel.save_to_files(fnames)
+            for idx, fname in enumerate(fnames):
+                assert SignalIORegistry.read(fname)[0].x.size == idx + 2
+
+
+if __name__ == "__main__":
+    test_export_filenames()
+    test_save_to_directory()
@@ -0,0 +1,81 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Text image files unit test:
+
+  - Detecting encoding and delimiter from the head of text image files
+  - Reading text images in a single pass
+  - Writing text images (round-trip of integer, floating point and complex data)
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+import os.path as osp
+
+import numpy as np
+import pytest
+
+import cdl.obj
+from cdl.core.io.image import ImageIORegistry, funcs
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory
+
+TEXT_CONTENTS = (
+    # (contents, encoding, delimiter)
+    (b"1\t2\t3\n4\t5\t6\n", "utf-8", "\t"),
+    (b"\xef\xbb\xbf1,2,3\n4,5,6\n", "utf-8-sig", ","),
+    (b"# \xe9chantillon\n1;2;3\n4;5;6\n", "latin-1", ";"),
+    (b"  1  2   3\n 4 5 6  \n", "utf-8", " "),
+    (b"1.5e-3,2,3,\n4,-5,6,\n", "utf-8", ","),
+)
+
+
+def test_sniff_text_image() -> None:
+    """Test text image format detection and reading"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.txt")
+        for contents, encoding, delimiter in TEXT_CONTENTS:
+            with open(fname, "wb") as fdesc:
+                fdesc.write(contents)
+            assert funcs.sniff_text_image(fname) == (encoding, delimiter)
+            data = funcs.imread_text(fname)
+            execenv.print(f"{encoding!r}, {delimiter!r}: {data.tolist()}")
+            assert data.shape == (2, 3) and data[1, 2] == 6.0
+        # Rows longer than the head of the file:
+        data = np.arange(2000.0).reshape(4, 500)
+        np.savetxt(fname, data, delimiter="\t")
+        assert funcs.sniff_text_image(fname, size=100) == ("utf-8", "\t")
+        for contents in (b"", b"a\tb\n", b"1,2\n3,4,5\n"):
+            with open(fname, "wb") as fdesc:
+                fdesc.write(contents)
+            with pytest.raises(ValueError):
+                funcs.imread_text(fname)
+
+
+def test_write_text_image() -> None:
+    """Test text image writing"""
+    rng = np.random.default_rng(0)
+    with CDLTemporaryDirectory() as tmpdir:
+        for dtype in (np.uint8, np.int32, np.float32, np.float64):
+            data = (rng.normal(size=(300, 40)) * 100).astype(dtype)
+            for ext in ("txt", "csv"):
+                fname = osp.join(tmpdir, f"test.{ext}")
+                ImageIORegistry.write(fname, cdl.obj.create_image("Test", data))
+                delimiter = "," if ext == "csv" else None
+                # Values are written with a format which round-trips for their type:
+                rdata = np.loadtxt(fname, delimiter=delimiter, dtype=data.dtype)
+                assert np.array_equal(rdata, data)
+                obj = ImageIORegistry.read(fname)[0]
+                assert np.allclose(
+                    obj.data.astype(data.dtype), data, rtol=1e-12, atol=0
+                )
+        # Complex data:
+        data = rng.normal(size=(30, 4)) + 1j * rng.normal(size=(30, 4))
+        fname = osp.join(tmpdir, "test.csv")
+        ImageIORegistry.write(fname, cdl.obj.create_image("Test", data))
+        assert np.array_equal(np.loadtxt(fname, delimiter=",", dtype=complex), data)
+
+
+if __name__ == "__main__":
+    test_sniff_text_image()
+    test_write_text_image()
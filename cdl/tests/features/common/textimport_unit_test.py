@@ -6,13 +6,18 @@ Import wizard test
 
 # guitest: show
 
+import os.path as osp
+
+import numpy as np
 from guidata.qthelpers import exec_dialog, qt_app_context
 from qtpy import QtWidgets as QW
 
 from cdl.env import execenv
 from cdl.obj import ImageObj, SignalObj
 from cdl.tests.data import get_test_fnames
-from cdl.widgets.textimport import TextImportWizard
+from cdl.utils.io import TextSource
+from cdl.utils.tests import CDLTemporaryDirectory
+from cdl.widgets.textimport import RawTextViewer, TextImportWizard
 
 
 def file_to_clipboard(filename: str) -> None:
@@ -67,7 +72,78 @@ def test_import_wizard():
             elif exec_dialog(wizard):
                 for obj in wizard.get_objs():
                     execenv.print(obj)
+        if execenv.unattended:
+            import_with_partial_preview()
+
+
+def test_text_source() -> None:
+    """Test reading parts of text sources"""
+    text = "".join(f"{idx},{idx * 2}\n" for idx in range(1000))
+    with CDLTemporaryDirectory() as tmpdir:
+        path = osp.join(tmpdir, "test.csv")
+        with open(path, "w", encoding="utf-8", newline="") as fdesc:
+            fdesc.write(text)
+        for source in (TextSource(path=path), TextSource(text=text)):
+            assert source.size == len(text)
+            head, offset = source.read_lines(0, 10)
+            assert head == text[:offset] and head.count("\n") == 10
+            page, offset = source.read_lines(offset, 10000, maxsize=100)
+            assert page.startswith("10,20\n") and page.endswith("\n")
+            assert 100 <= len(page) < 120
+            assert source.read_lines(source.size, 10) == ("", source.size)
+            with source.open() as stream:
+                stream.seek(offset)
+                assert stream.read(5) in (
+                    text[offset : offset + 5],
+                    text[offset : offset + 5].encode(),
+                )
+
+
+def test_raw_text_viewer() -> None:
+    """Test raw text viewer pages"""
+    text = "".join(f"{idx},{idx * 2}\n" for idx in range(5000))
+    with qt_app_context():
+        viewer = RawTextViewer()
+        viewer.set_source(TextSource(text=text))
+        assert viewer.editor.toPlainText().startswith("0,0\n")
+        assert not viewer.prev_btn.isEnabled() and viewer.next_btn.isEnabled()
+        viewer.show_page(1)
+        assert not viewer.editor.toPlainText().startswith("0,0\n")
+        # Pages out of range are clamped:
+        viewer.show_page(-1)
+        assert viewer.editor.toPlainText().startswith("0,0\n")
+        viewer.show_page(10)
+        assert viewer.page_label.text().endswith("3")
+
+
+def import_with_partial_preview() -> None:
+    """Import data with a preview showing only the head of the file"""
+    nrows = 5000
+    with CDLTemporaryDirectory() as tmpdir:
+        path = osp.join(tmpdir, "large.csv")
+        x = np.linspace(0.0, 1.0, nrows)
+        np.savetxt(path, np.c_[x, x**2], delimiter=",", header="X,Y", comments="")
+        wizard = TextImportWizard(destination="signal")
+        wizard.show()
+        srcpge = wizard.source_page
+        srcpge.param.path = path
+        srcpge.param.preview_max_rows = 100
+        srcpge.param_widget.get()
+        wizard.go_to_next_page()
+        assert srcpge.is_loaded_partially()
+        datapge = wizard.data_page
+        datapge.param.delimiter_choice = ","
+        datapge.param_widget.get()
+        datapge.update_preview()
+        wizard.go_to_next_page()
+        assert len(datapge.get_dataframe()) == nrows
+        wizard.go_to_next_page()
+        wizard.accept()
+        objs = wizard.get_objs()
+        assert len(objs) == 1 and np.allclose(objs[0].x, x, rtol=1e-12, atol=0.0)
 
 
 if __name__ == "__main__":
     test_import_wizard()
+    test_text_source()
+    test_raw_text_viewer()
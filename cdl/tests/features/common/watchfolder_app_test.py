@@ -0,0 +1,128 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Watched-folder ingest application test:
+
+  - Watch a directory: files dropped into it are imported in background and added
+    by batches to a target group, in file name order
+  - Files still being written are imported only once they are complete
+  - Files are matched against the patterns of supported formats (including
+    multi-part extensions, e.g. "*.csv.gz")
+  - Apply a processing chain to each new object
+"""
+
+# guitest: show
+
+import os.path as osp
+import time
+from typing import Callable
+
+import numpy as np
+from qtpy import QtWidgets as QW
+
+import cdl.computation.image as cpi
+import cdl.obj
+import cdl.param
+from cdl.core.io.image import ImageIORegistry
+from cdl.core.io.signal import SignalIORegistry
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 20.0) -> None:
+    """Process events until condition is met
+
+    Args:
+        condition: Condition
+        timeout: Timeout (in seconds)
+    """
+    t0 = time.monotonic()
+    while not condition():
+        assert time.monotonic() - t0 < timeout, "Timeout"
+        QW.QApplication.processEvents()
+        time.sleep(0.01)
+
+
+def test_watch_folder() -> None:
+    """Test watched-folder ingest"""
+    nbfiles = 200
+    with CDLTemporaryDirectory() as tmpdir:
+        with cdltest_app_context(console=False) as win:
+            execenv.print("Watching signals directory:")
+            panel = win.signalpanel
+            x = np.linspace(0.0, 1.0, 100)
+            np.save(osp.join(tmpdir, "existing.npy"), np.vstack((x, x)))
+            watcher = panel.watch_folder(
+                tmpdir, group_title="Acquisition", settle_time=0.2, poll_interval=0.05
+            )
+            t0 = time.monotonic()
+            for idx in range(nbfiles):
+                np.save(osp.join(tmpdir, f"sig{idx:03d}.npy"), np.vstack((x, x * idx)))
+            # Unsupported files and files not matching the pattern are ignored:
+            with open(osp.join(tmpdir, "notes.txt.bak"), "w", encoding="utf-8") as f:
+                f.write("Ignored")
+            wait_until(lambda: len(panel) == nbfiles)
+            dt = time.monotonic() - t0
+            execenv.print(f"  {nbfiles} files imported in {dt:.1f} s")
+            group = panel.objmodel.get_groups()[-1]
+            assert group.title == "Acquisition" and len(group) == nbfiles
+            for idx, obj in enumerate(group):
+                assert obj.metadata["source"].endswith(f"sig{idx:03d}.npy")
+                assert obj.y[-1] == idx
+            assert watcher.nb_files == nbfiles and not watcher.errors
+            # File being written: it is imported only once it is complete
+            fname = osp.join(tmpdir, "sig_late.npy")
+            with open(fname, "wb") as fdesc:
+                fdesc.write(b"\x93NUMPY")
+                fdesc.flush()
+                time.sleep(0.5)
+                watcher.scan()
+                QW.QApplication.processEvents()
+                assert len(panel) == nbfiles and watcher.nb_files == nbfiles
+                fdesc.seek(0)
+                np.save(fdesc, np.vstack((x, -x)))
+            wait_until(lambda: len(panel) == nbfiles + 1)
+            assert not watcher.errors and panel[nbfiles + 1].y[-1] == -1.0
+            # Multi-part extensions: compressed CSV files are imported, other
+            # compressed files are ignored
+            sig = cdl.obj.create_signal("Compressed", x, 2 * x)
+            with open(osp.join(tmpdir, "archive.tar.gz"), "wb") as fdesc:
+                fdesc.write(b"Ignored")
+            SignalIORegistry.write(osp.join(tmpdir, "sig_zip.csv.gz"), sig)
+            wait_until(lambda: len(panel) == nbfiles + 2)
+            watcher.scan()
+            QW.QApplication.processEvents()
+            assert not watcher.errors and watcher.nb_files == nbfiles + 2
+            assert panel[nbfiles + 2].y[-1] == 2.0
+            panel.stop_watching_folder()
+            assert panel.folderwatcher is None
+
+            execenv.print("Watching images directory, with processing chain:")
+            panel = win.imagepanel
+            param = cdl.param.NormalizeParam.create(method="maximum")
+            panel.watch_folder(
+                tmpdir,
+                processing=[(cpi.compute_abs, None), (cpi.compute_normalize, param)],
+                pattern="ima*.npy",
+                include_existing=True,
+                settle_time=0.0,
+                poll_interval=0.05,
+            )
+            for idx in range(3):
+                data = -(idx + 1.0) * np.arange(200.0).reshape(10, 20)
+                ima = cdl.obj.create_image(f"I{idx}", data)
+                ImageIORegistry.write(osp.join(tmpdir, f"ima{idx}.npy"), ima)
+            wait_until(lambda: len(panel) == 3)
+            group = panel.objmodel.get_groups()[-1]
+            assert group.title == osp.basename(tmpdir)
+            for idx, obj in enumerate(group):
+                execenv.print(f"  {obj.title}")
+                assert obj.title.startswith("normalize(absolute(")
+                assert f"ima{idx}.npy" in obj.title
+                assert obj.data.max() == 1.0 and obj.data.min() == 0.0
+            panel.stop_watching_folder()
+
+
+if __name__ == "__main__":
+    test_watch_folder()
@@ -0,0 +1,150 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Remote batch test:
+
+  - Running a batch of operations (adding signals, getting object uuids) within a
+    single remote request
+  - Applying a processing chain (calc with parameters, results) to each of a list
+    of objects, with per-operation status (failing operations skip the rest of the
+    chain, but not the other objects)
+  - Computation errors are reported as failed operations (no message box)
+  - Canceled batches (e.g. when remote batch timeout has expired) skip the
+    remaining operations
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import numpy as np
+import pytest
+from qtpy import QtWidgets as QW
+
+import cdl.param
+from cdl.core import remote as remote_module
+from cdl.core.remote import RemoteClient
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.tests.features.control.datachannel_app_test import exec_remote_commands
+
+#: Number of signals processed by the batch
+NB_SIGNALS = 3
+
+
+def run_batches(remote: RemoteClient) -> dict[str, Any]:
+    """Run batches with remote client
+
+    Args:
+        remote: Remote client
+
+    Returns:
+        Statuses of batches
+    """
+    x = np.linspace(-10.0, 10.0, 20000)
+    operations = [
+        ("add_signal", f"gauss{index}", x, np.exp(-(x**2) / (index + 1.0)))
+        for index in range(NB_SIGNALS)
+    ]
+    operations += [("get_object_uuids", "signal"), ("close_application",)]
+    statuses = {"add": remote.run_batch(operations)}
+    uuids = statuses["add"][NB_SIGNALS][1]
+    param = cdl.param.MovingAverageParam.create(n=5)
+    chain = [
+        ("calc", "compute_moving_average", param),
+        ("calc", "compute_fw1e2"),
+        ("calc", "compute_stats"),
+        ("get_results",),
+        ("calc", "unknown_function"),
+        ("get_current_panel",),
+    ]
+    statuses["chain"] = remote.run_batch(
+        chain, objects=uuids + ["unknown"], panel="signal"
+    )
+    return statuses
+
+
+def test_remote_batch() -> None:
+    """Test remote batch"""
+    with cdltest_app_context(console=False) as win:
+        statuses = exec_remote_commands(win, run_batches)
+        # Batch of operations:
+        add_statuses = statuses["add"]
+        assert all(status == [True, True] for status in add_statuses[:NB_SIGNALS])
+        uuids = add_statuses[NB_SIGNALS][1]
+        assert len(uuids) == NB_SIGNALS
+        status = add_statuses[NB_SIGNALS + 1]
+        assert not status[0] and "close_application" in status[1]
+        # Processing chain applied to each object:
+        chain_statuses = statuses["chain"]
+        assert len(chain_statuses) == NB_SIGNALS + 1
+        for chain in chain_statuses[:NB_SIGNALS]:
+            assert [status[0] for status in chain] == [True] * 4 + [False] * 2
+            titles = [title for title, _array in chain[3][1]]
+            assert sorted(titles) == ["fw1e2", "stats"]
+            assert "unknown_function" in chain[4][1] and chain[5][1] is None
+        assert "unknown" in chain_statuses[-1][0][1]
+        assert all(status == [False, None] for status in chain_statuses[-1][1:])
+        # Each chain has added one signal (moving average), results being added
+        # to the processed signal:
+        assert len(win.signalpanel) == 2 * NB_SIGNALS
+        for obj in win.signalpanel.objmodel:
+            assert len(list(obj.iterate_resultshapes())) == (obj.uuid not in uuids)
+
+
+def test_batch_computation_error() -> None:
+    """Test computation errors in batch"""
+    with cdltest_app_context(console=False) as win:
+        x = np.linspace(-10.0, 10.0, 1000)
+        win.add_signal("zeros", x, np.zeros_like(x))
+        chain = [("calc", "compute_fw1e2"), ("get_current_panel",)]
+        # Computation errors are either raised by the computation function (test
+        # mode), or caught and returned with computation output (normal mode):
+        for catcher_test in (False, True):
+            with execenv.context(catcher_test=catcher_test):
+                statuses = win.run_batch(chain)
+            execenv.print(statuses)
+            assert not statuses[0][0] and "Error" in statuses[0][1]
+            assert statuses[1] == [False, None]
+        assert not win.signalpanel.processor.raise_errors
+        obj = win.signalpanel.objmodel.get_object_from_number(1)
+        assert not list(obj.iterate_resultshapes())
+
+
+def test_batch_canceled() -> None:
+    """Test canceled batch"""
+    with cdltest_app_context(console=False) as win:
+        x = np.linspace(-10.0, 10.0, 1000)
+        operations = [("add_signal", f"sig{index}", x, x) for index in range(3)]
+        canceled = threading.Event()
+        canceled.set()
+        statuses = win.run_batch(operations, canceled=canceled)
+        assert statuses == [[False, None]] * 3 and len(win.signalpanel) == 0
+        win.add_signal("sig", x, x)
+        chain = [("calc", "compute_fw1e2"), ("get_current_panel",)]
+        statuses = win.run_batch(chain, objects=[1], canceled=canceled)
+        assert statuses == [[[False, None]] * 2]
+        # Remote batch timeout: the batch is canceled (the remote server emits the
+        # batch signal, and gives up before the GUI thread has processed it)
+        timeout = remote_module.BATCH_TIMEOUT
+        remote_module.BATCH_TIMEOUT = 0.0
+        try:
+            with pytest.raises(Exception, match="TimeoutError"):
+                exec_remote_commands(win, lambda remote: remote.run_batch(operations))
+        finally:
+            remote_module.BATCH_TIMEOUT = timeout
+        t0 = time.monotonic()
+        while time.monotonic() - t0 < 0.5:
+            QW.QApplication.processEvents()
+        assert len(win.signalpanel) == 1
+
+
+if __name__ == "__main__":
+    test_remote_batch()
+    test_batch_computation_error()
+    test_batch_canceled()
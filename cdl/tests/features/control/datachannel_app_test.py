@@ -0,0 +1,227 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Remote control data channel test:
+
+  - Transferring arrays through the data channel (framed binary protocol over a
+    local TCP socket), in both directions
+  - Adding signals and images, and getting objects, with a remote client: arrays
+    are transferred through the data channel, XML-RPC carrying only their tokens
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+from __future__ import annotations
+
+import json
+import socket
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+import pytest
+from qtpy import QtWidgets as QW
+
+from cdl.core import datachannel
+from cdl.core.datachannel import (
+    DATA_CHANNEL_MIN_SIZE,
+    DataChannelClient,
+    DataChannelServer,
+)
+from cdl.core.io.native import NativeObjWriter
+from cdl.core.model.image import ImageObj
+from cdl.core.remote import BinaryObjReader, RemoteClient
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.tests.data import create_2d_gaussian, create_paracetamol_signal
+
+if TYPE_CHECKING:
+    from cdl.core.gui.main import CDLMainWindow
+
+
+def test_data_channel() -> None:
+    """Test data channel client and server"""
+    server = DataChannelServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = DataChannelClient(server.port)
+    try:
+        data = np.random.default_rng(0).random((4096, 4096))  # 128 MB
+        arrays = [data, data[::2, ::3], np.arange(5, dtype=np.uint8), np.empty(0)]
+        t0 = time.perf_counter()
+        tokens = client.put(arrays)
+        dt = time.perf_counter() - t0
+        execenv.print(f"Upload: {data.nbytes / dt / 2**30:.2f} GB/s")
+        assert len(tokens) == len(arrays)
+        for token, array in zip(tokens, arrays):
+            received = server.pop_array(token)
+            assert received.dtype == array.dtype and np.array_equal(received, array)
+        with pytest.raises(KeyError):
+            server.pop_array(tokens[0])
+        with pytest.raises(ValueError):
+            client.put([np.array(["text"], dtype=object)])
+        tokens = server.put_arrays([data, np.ones((3, 2), dtype=np.complex64)])
+        received = client.get(tokens)
+        assert np.array_equal(received[0], data)
+        assert np.array_equal(received[1], np.ones((3, 2), dtype=np.complex64))
+        with pytest.raises(ValueError):
+            client.get(tokens)
+        # Invalid tokens: the connection may still be used
+        with pytest.raises(ValueError):
+            client.get(3)
+        # Arrays are retrieved all at once, or not at all:
+        tokens = server.put_arrays([np.arange(3), np.arange(4)])
+        for invalid in (tokens + ["unknown"], tokens + tokens[:1]):
+            with pytest.raises(ValueError):
+                client.get(invalid)
+        assert [len(array) for array in client.get(tokens)] == [3, 4]
+        # Serialized objects: arrays are transferred separately
+        obj = ImageObj()
+        obj.data = data
+        obj.metadata["Test"] = np.arange(3)
+        writer = NativeObjWriter()
+        obj.serialize(writer)
+        assert len(writer.arrays) == 1
+        newobj = ImageObj()
+        newobj.deserialize(BinaryObjReader(writer.get_json(), writer.arrays))
+        assert newobj.data is data
+        assert np.array_equal(newobj.metadata["Test"], [0, 1, 2])
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_data_channel_frames() -> None:
+    """Test data channel frames validation (including server maximum payload size),
+    and expiration of arrays"""
+    sock1, sock2 = socket.socketpair()
+    try:
+        for arrays, size in (
+            ([["|O", [2]]], 16),  # Not a numerical data type
+            ([["<f8", [-1, 2]]], 0),  # Invalid shape
+            ([["<f8", [2**20, 2**20]]], 8),  # Payload size mismatch
+            ([["<f8", [2**20, 2**20]]], 2**43),  # Payload too large
+            ([["<f8", [2]]], None),  # No payload size
+        ):
+            text = json.dumps({"arrays": arrays, "size": size}).encode("utf-8")
+            prefix = datachannel.DATA_MAGIC + struct.pack("<I", len(text))
+            sock1.sendall(prefix + text)
+            with pytest.raises(ConnectionError):
+                datachannel.recv_frame(sock2)
+        datachannel.send_frame(sock1, {"request": "test"}, [np.arange(3)])
+        header, arrays = datachannel.recv_frame(sock2)
+        assert header == {"request": "test"} and np.array_equal(arrays[0], [0, 1, 2])
+    finally:
+        sock1.close()
+        sock2.close()
+    # Maximum payload size of server: larger frames are rejected (connection is
+    # closed by server, and established again on next request)
+    server = DataChannelServer(max_size=2**10)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = DataChannelClient(server.port)
+    try:
+        with pytest.raises(ConnectionError):
+            client.put([np.zeros(2**10)])
+        assert len(client.put([np.zeros(2**5)])) == 1
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+    server = DataChannelServer()
+    timeout = datachannel.DATA_CHANNEL_TIMEOUT
+    try:
+        token = server.put_arrays([np.arange(3)])[0]
+        datachannel.DATA_CHANNEL_TIMEOUT = 0.0
+        time.sleep(0.01)
+        with pytest.raises(KeyError):
+            server.pop_array(token)
+    finally:
+        datachannel.DATA_CHANNEL_TIMEOUT = timeout
+        server.server_close()
+
+
+def exec_remote_commands(
+    win: CDLMainWindow, func: Callable[[RemoteClient], Any]
+) -> Any:
+    """Execute remote client commands in a separate thread, main thread executing
+    DataLab's event loop
+
+    Args:
+        win: DataLab main window
+        func: Function executing commands with remote client (connected to
+         DataLab's XML-RPC server)
+
+    Returns:
+        Function output
+    """
+    while win.remote_server.port is None:
+        QW.QApplication.processEvents()
+    results = {}
+
+    def run() -> None:
+        """Connect to DataLab and execute commands"""
+        try:
+            remote = RemoteClient()
+            remote.connect(win.remote_server.port)
+            results["output"] = func(remote)
+            remote.disconnect()
+        except Exception as exc:  # pylint: disable=broad-except
+            results["error"] = exc
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    while thread.is_alive():
+        QW.QApplication.processEvents()
+        time.sleep(0.01)
+    if "error" in results:
+        raise results["error"]
+    return results["output"]
+
+
+def remote_commands(remote: RemoteClient) -> dict[str, Any]:
+    """Add and get objects with remote client
+
+    Args:
+        remote: Remote client
+
+    Returns:
+        Results
+    """
+    # pylint: disable=protected-access
+    results = {"datachannel": remote._datachannel is not None}
+    # Small arrays are sent as XML-RPC Binary objects:
+    x, y = create_paracetamol_signal().get_data()
+    assert x.nbytes + y.nbytes < DATA_CHANNEL_MIN_SIZE
+    remote.add_signal("small", x, y)
+    x = np.linspace(0.0, 1.0, 100000)
+    remote.add_signal("large", x, np.sin(x), xunit="s")
+    data = create_2d_gaussian(2000, np.uint16)
+    remote.add_image("image", data, zunit="lsb")
+    results["signal"] = remote.get_object("large", "signal")
+    results["image"] = remote.get_object("image", "image")
+    return results
+
+
+def test_remote_data_channel() -> None:
+    """Test remote client data channel"""
+    with cdltest_app_context(console=False) as win:
+        results = exec_remote_commands(win, remote_commands)
+        assert results["datachannel"]
+        assert win.signalpanel.objmodel.get_object_titles() == ["small", "large"]
+        sig = results["signal"]
+        x = np.linspace(0.0, 1.0, 100000)
+        assert sig.xunit == "s" and np.array_equal(sig.y, np.sin(x))
+        ima = results["image"]
+        assert ima.zunit == "lsb"
+        assert np.array_equal(ima.data, create_2d_gaussian(2000, np.uint16))
+
+
+if __name__ == "__main__":
+    test_data_channel()
+    test_data_channel_frames()
+    test_remote_data_channel()
@@ -0,0 +1,106 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Remote object retrieval test:
+
+  - Getting objects with a remote client: metadata is transferred as JSON data and
+    arrays as raw buffers (through the data channel, or as XML-RPC Binary objects)
+  - Partial retrieval: metadata and results only, data slice (ROI), and frame
+    range of image streams
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import cdl.obj
+from cdl.core.remote import RemoteClient, get_object_part
+from cdl.tests import cdltest_app_context
+from cdl.tests.features.control.datachannel_app_test import exec_remote_commands
+
+
+def get_objects(remote: RemoteClient) -> dict[str, Any]:
+    """Get objects (entirely or partially) with remote client
+
+    Args:
+        remote: Remote client
+
+    Returns:
+        Retrieved objects
+    """
+    objs = {}
+    x = np.arange(1000.0)
+    remote.add_signal("signal", x, np.exp(-(((x - 500.0) / 50.0) ** 2)), xunit="s")
+    remote.calc("compute_fwhm")
+    data = np.arange(200 * 300, dtype=np.float32).reshape(200, 300)
+    remote.add_image("image", data, zunit="lsb")
+    uuid = remote.get_sel_object_uuids()[0]
+    for index in range(1, 4):
+        remote.append_image_frame(uuid, data + index, depth=5)
+    objs["signal"] = remote.get_object("signal", "signal", roi=[100, 200])
+    objs["info"] = remote.get_object("signal", "signal", data=False)
+    objs["full"] = remote.get_object("signal", "signal")
+    remote.set_current_panel("image")
+    objs["image"] = remote.get_object(uuid, roi=[10, 20, 110, 70])
+    objs["frames"] = remote.get_object(uuid, frames=(-2, None), roi=[0, 0, 4, 3])
+    # Without data channel, arrays are transferred as XML-RPC Binary objects:
+    # pylint: disable=protected-access
+    remote._datachannel.close()
+    remote._datachannel = None
+    objs["binary"] = remote.get_object(uuid)
+    return objs
+
+
+def test_get_object_part() -> None:
+    """Test that deferred data is not loaded if data is not requested"""
+    loaded = []
+
+    def loader() -> np.ndarray:
+        """Data loader"""
+        loaded.append(True)
+        return np.ones((10, 20))
+
+    ima = cdl.obj.create_image("Deferred", np.zeros((10, 20)))
+    ima.set_data_loader(loader)
+    part, frames = get_object_part(ima, data=False)
+    assert part.data is None and not frames and part.title == "Deferred"
+    assert not loaded and ima.data_loader is not None
+    part, _frames = get_object_part(ima, roi=[0, 0, 5, 4])
+    assert loaded and np.array_equal(part.data, np.ones((4, 5)))
+
+
+def test_remote_get_object() -> None:
+    """Test remote object retrieval"""
+    with cdltest_app_context(console=False) as win:
+        objs = exec_remote_commands(win, get_objects)
+        x = np.arange(1000.0)
+        sig = objs["signal"]
+        assert sig.xunit == "s" and np.array_equal(sig.x, x[100:200])
+        sig = objs["info"]
+        assert sig.xydata is None and sig.xunit == "s"
+        full = objs["full"]
+        assert sig.metadata.keys() == full.metadata.keys()
+        assert len(list(sig.iterate_resultshapes())) == len(
+            list(full.iterate_resultshapes())
+        )
+        data = np.arange(200 * 300, dtype=np.float32).reshape(200, 300) + 3
+        ima = objs["image"]
+        assert ima.zunit == "lsb" and ima.x0 == 10.0 and ima.y0 == 20.0
+        assert np.array_equal(ima.data, data[20:70, 10:110])
+        ima = objs["frames"]
+        assert ima.is_stream() and ima.get_frame_count() == 2
+        assert np.array_equal(ima.get_frame(0), data[:3, :4] - 1)
+        assert np.array_equal(ima.data, data[:3, :4])
+        ima = objs["binary"]
+        assert not ima.is_stream() and np.array_equal(ima.data, data)
+        assert ima.uuid == win.imagepanel.objview.get_current_object().uuid
+
+
+if __name__ == "__main__":
+    test_get_object_part()
+    test_remote_get_object()
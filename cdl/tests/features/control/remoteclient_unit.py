@@ -29,6 +29,8 @@ def multiple_commands(remote: RemoteProxy):
     with CDLTemporaryDirectory() as tmpdir:
         x, y = create_paracetamol_signal().get_data()
         remote.add_signal("tutu", x, y)
+        sig_uuid = remote.get_sel_object_uuids()[0]
+        remote.append_signal_data(sig_uuid, x + x[-1] - x[0], y, len(x) + 10)
 
         z = create_2d_gaussian(2000, np.uint16)
         remote.add_image("toto", z)
@@ -39,6 +41,7 @@ def multiple_commands(remote: RemoteProxy):
         items = remote.get_object_shapes()
         assert len(items) == 1 and items[0].get_rect() == area
         remote.add_label_with_title(f"Image uuid: {uuid}")
+        remote.append_image_frame(uuid, z[::-1], depth=2)
         remote.select_groups([1])
         remote.select_objects([uuid])
         remote.delete_metadata()
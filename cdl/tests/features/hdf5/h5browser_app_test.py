@@ -33,6 +33,9 @@ def create_h5browser_dialog(
     execenv.print(f"Opening: {fnames}")
     dlg = H5BrowserDialog(None)
     dlg.open_files(fnames)
+    # Tree is populated lazily, when expanding items:
+    for item in dlg.browser.tree.get_top_level_items():
+        dlg.browser.tree.expand_all_children(item)
     dlg.browser.tree.toggle_all(toggle_all)
     dlg.browser.tree.select_all(select_all)
     return dlg
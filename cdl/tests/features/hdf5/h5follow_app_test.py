@@ -0,0 +1,178 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+HDF5 follow mode (SWMR) application test:
+
+  - Follow datasets of an HDF5 file still being written in SWMR mode: signal
+    points, image rows and image stack frames
+  - Only data appended since the last refresh is read and appended to objects
+  - Image stack frames are kept up to the maximum number of frames setting
+  - Follow an HDF5 file from DataLab main window, and stop following it
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import os.path as osp
+
+import h5py
+import numpy as np
+import pytest
+
+from cdl.config import Conf
+from cdl.core.io.h5.common import H5Follower, H5Importer
+from cdl.core.model.image import IMAGE_STREAM_DEPTH
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def create_swmr_file(fname: str) -> h5py.File:
+    """Create HDF5 file with resizable datasets, and start SWMR write mode
+
+    Args:
+        fname: HDF5 file name
+
+    Returns:
+        HDF5 file, opened for writing
+    """
+    h5 = h5py.File(fname, "w", libver="latest")
+    x = np.arange(5.0)
+    h5.create_dataset("y", data=x, maxshape=(None,), chunks=True)
+    h5.create_dataset("xy", data=np.c_[x, x**2], maxshape=(None, 2), chunks=True)
+    h5.create_dataset("image", data=np.ones((4, 8)), maxshape=(None, 8), chunks=True)
+    frames = np.zeros((IMAGE_STREAM_DEPTH + 2, 4, 8), dtype=np.uint16)
+    frames[:] = np.arange(len(frames))[:, None, None]
+    h5.create_dataset("frames", data=frames, maxshape=(None, 4, 8), chunks=True)
+    h5.create_dataset("fixed", data=x)
+    h5.swmr_mode = True
+    return h5
+
+
+def append_data(h5: h5py.File, nrows: int) -> None:
+    """Append rows (or frames) to resizable datasets, and flush them
+
+    Args:
+        h5: HDF5 file, opened for writing
+        nrows: Number of rows (or frames) to append
+    """
+    for name in ("y", "xy", "image", "frames"):
+        dset = h5[name]
+        size = dset.shape[0]
+        dset.resize(size + nrows, axis=0)
+        if name == "xy":
+            x = np.arange(size, size + nrows, dtype=float)
+            dset[size:] = np.c_[x, x**2]
+        else:
+            dset[size:] = np.arange(size, size + nrows).reshape(
+                (-1,) + (1,) * (dset.ndim - 1)
+            )
+        dset.flush()
+
+
+def check_objects(objs: dict, size: int, nframes: int) -> None:
+    """Check followed objects
+
+    Args:
+        objs: Followed objects, by dataset name
+        size: Expected number of signal points (and image rows, minus one)
+        nframes: Expected number of frames written to image stack
+    """
+    x = np.arange(float(size))
+    sig = objs["y"]
+    assert np.array_equal(sig.x, x) and np.array_equal(sig.y, x)
+    sig = objs["xy"]
+    assert np.array_equal(sig.x, x) and np.array_equal(sig.y, x**2)
+    ima = objs["image"]
+    assert ima.data.shape == (size - 1, 8) and ima.data[-1, 0] == (
+        size - 2 if size > 5 else 1
+    )
+    ima = objs["frames"]
+    assert ima.is_stream() and ima.data[0, 0] == nframes - 1
+    # No frame is dropped:
+    assert ima.get_frame_count() == nframes and ima.get_frame(0)[0, 0] == 0
+
+
+def test_h5_follower() -> None:
+    """Test HDF5 file follower"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "swmr.h5")
+        with create_swmr_file(fname) as h5:
+            follower = H5Follower(fname)
+            try:
+                with pytest.raises(ValueError):
+                    follower.follow("/fixed")
+                names = ("y", "xy", "image", "frames")
+                objs = {name: follower.follow(f"/{name}") for name in names}
+                nframes = IMAGE_STREAM_DEPTH + 2
+                check_objects(objs, 5, nframes)
+                assert not follower.refresh()
+                for nrows in (1, 3):
+                    append_data(h5, nrows)
+                    nframes += nrows
+                    assert len(follower.refresh()) == len(names)
+                    check_objects(objs, h5["y"].shape[0], nframes)
+                    execenv.print(f"Refreshed: {h5['y'].shape[0]} points")
+                follower.unfollow(objs["y"].uuid)
+                append_data(h5, 2)
+                assert objs["y"] not in follower.refresh()
+                assert objs["y"].x.size == 9 and objs["xy"].x.size == 11
+                # Maximum number of frames: the oldest frames are dropped
+                maxframes = Conf.io.h5_stack_max_frames.get()
+                Conf.io.h5_stack_max_frames.set(IMAGE_STREAM_DEPTH // 2)
+                try:
+                    ima = follower.follow("/frames")
+                    nframes = h5["frames"].shape[0]
+                    assert ima.get_frame_count() == IMAGE_STREAM_DEPTH // 2
+                    assert ima.get_frame(0)[0, 0] == nframes - IMAGE_STREAM_DEPTH // 2
+                    append_data(h5, 3)
+                    follower.refresh()
+                    assert ima.get_frame_count() == IMAGE_STREAM_DEPTH // 2
+                    assert ima.data[0, 0] == nframes + 2
+                finally:
+                    Conf.io.h5_stack_max_frames.set(maxframes)
+            finally:
+                follower.close()
+        # Outside SWMR follow mode, 3-D datasets are not imported as image streams:
+        importer = H5Importer(fname)
+        try:
+            with pytest.raises(KeyError):
+                importer.get("/frames")
+        finally:
+            importer.close()
+
+
+def test_h5_follow_mode() -> None:
+    """Test HDF5 follow mode from DataLab main window"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "swmr.h5")
+        with create_swmr_file(fname) as h5:
+            with cdltest_app_context(console=False) as win:
+                # Unattended mode: all datasets which may be followed are followed
+                win.follow_h5_file(fname)
+                assert win.h5inputoutput.get_followed_files() == [fname]
+                spanel, ipanel = win.signalpanel, win.imagepanel
+                assert len(spanel) == 2 and len(ipanel) == 2
+                objs = {
+                    obj.metadata["HDF5Dataset"].strip("/"): obj
+                    for panel in (spanel, ipanel)
+                    for obj in panel.objmodel
+                }
+                append_data(h5, 3)
+                win.h5inputoutput.refresh_followed_files()
+                check_objects(objs, 8, IMAGE_STREAM_DEPTH + 5)
+                # Objects removed from DataLab are no longer followed:
+                spanel.remove_all_objects()
+                ipanel.objview.select_objects([objs["frames"].uuid])
+                ipanel.remove_object()
+                append_data(h5, 1)
+                win.h5inputoutput.refresh_followed_files()
+                assert objs["image"].data.shape == (8, 8)
+                assert objs["frames"].data[0, 0] == IMAGE_STREAM_DEPTH + 4
+                win.stop_following_h5_files()
+                assert not win.h5inputoutput.get_followed_files()
+
+
+if __name__ == "__main__":
+    test_h5_follower()
+    test_h5_follow_mode()
@@ -0,0 +1,93 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+HDF5 importer lazy node discovery unit test
+
+Checking that HDF5 nodes are collected only when their parent group is expanded
+(in the importer and in the HDF5 browser tree).
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import os.path as osp
+import time
+
+import h5py
+import numpy as np
+from guidata.qthelpers import qt_app_context
+
+from cdl.core.io.h5 import H5Importer
+from cdl.core.io.h5.common import NODE_FACTORY, GroupNode
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory
+from cdl.widgets.h5browser import H5BrowserDialog
+
+
+def create_test_file(fname: str, ngroups: int, ndsets: int) -> None:
+    """Create HDF5 file with many groups and datasets"""
+    with h5py.File(fname, "w") as h5:
+        for igroup in range(ngroups):
+            group = h5.create_group(f"group{igroup:03d}")
+            sub = group.create_group("sub")
+            for idset in range(ndsets):
+                sub[f"dset{idset:03d}"] = np.arange(100.0) + idset
+            group["scalar"] = 1.0
+        h5["top"] = np.zeros((20, 30))
+
+
+def test_h5importer_lazy() -> None:
+    """Test lazy node discovery in HDF5 importer"""
+    visited = []
+
+    def trigger(node: GroupNode, _importer: H5Importer) -> None:
+        """Post trigger recording visited group nodes"""
+        visited.append(node)
+
+    NODE_FACTORY.add_post_trigger(GroupNode, trigger)
+    try:
+        with CDLTemporaryDirectory() as tmpdir:
+            fname = osp.join(tmpdir, "test.h5")
+            create_test_file(fname, 100, 100)
+            t0 = time.perf_counter()
+            importer = H5Importer(fname)
+            execenv.print(f"Importer created in {time.perf_counter() - t0:.3f} s")
+            # Only root children are collected
+            assert len(importer.nodes) == 102
+            assert len(visited) == 100
+            node = importer.get("/group005/sub/dset042")
+            assert np.array_equal(node.data, np.arange(100.0) + 42)
+            assert node.shape_str == "100" and node.is_supported()
+            assert len(importer.nodes) == 102 + 2 + 100
+            assert importer.get_relative(node, "scalar", ancestor=2).data == 1.0
+            assert len(visited) == 101
+            assert len(importer.get_all_nodes()) == 1 + 100 * (3 + 100) + 1
+            assert len(visited) == 200
+            importer.close()
+    finally:
+        # The trigger must not be run for other tests
+        NODE_FACTORY.remove_post_trigger(GroupNode, trigger)
+
+
+def test_h5browser_lazy() -> None:
+    """Test lazy population of HDF5 browser tree"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.h5")
+        create_test_file(fname, 10, 50)
+        with qt_app_context():
+            dlg = H5BrowserDialog(None)
+            dlg.open_files([fname])
+            tree = dlg.browser.tree
+            assert len(tree.find_all_items()) == 1 + 11
+            group_item = tree.topLevelItem(0).child(0)
+            assert group_item.childCount() == 0
+            tree.expandItem(group_item)
+            assert group_item.childCount() == 2
+            # All nodes are collected when getting all nodes:
+            assert len(dlg.get_all_nodes()) == 10 * 50 + 1
+            dlg.cleanup()
+
+
+if __name__ == "__main__":
+    test_h5importer_lazy()
+    test_h5browser_lazy()
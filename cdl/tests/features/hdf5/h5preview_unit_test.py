@@ -0,0 +1,61 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+HDF5 browser preview unit test
+
+Checking that HDF5 browser previews are built from decimated data (strided
+hyperslab reads), and that the whole dataset is read only when importing.
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import os.path as osp
+
+import h5py
+import numpy as np
+from guidata.qthelpers import qt_app_context
+
+from cdl.core.io.h5 import H5Importer
+from cdl.utils.tests import CDLTemporaryDirectory
+from cdl.widgets.h5browser import PlotPreview
+
+
+def test_h5_preview() -> None:
+    """Test decimated previews of HDF5 datasets"""
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.h5")
+        image = np.random.default_rng(0).integers(0, 1000, (2000, 1500), np.uint16)
+        signal = np.sin(np.linspace(0.0, 100.0, 100001))
+        with h5py.File(fname, "w") as h5:
+            h5["image"] = image
+            h5["signal"] = signal
+            h5["small"] = np.arange(100.0)
+        importer = H5Importer(fname)
+        node = importer.get("/image")
+        obj = node.get_preview_object()
+        assert obj.data.shape == (500, 500)
+        assert np.array_equal(obj.data, image[::4, ::3])
+        assert obj.metadata["HDF5Dataset"] == "/image"
+        node = importer.get("/signal")
+        obj = node.get_preview_object()
+        assert obj.x.size == 9091
+        assert np.array_equal(obj.x, np.arange(0, signal.size, 11))
+        assert np.array_equal(obj.y, signal[::11])
+        # Small datasets are not decimated (preview is the native object):
+        node = importer.get("/small")
+        assert node.get_preview_object() is node.get_native_object()
+        # Native object is created from the whole dataset:
+        assert importer.get("/image").get_native_object().data.shape == image.shape
+
+        with qt_app_context():
+            preview = PlotPreview(None)
+            for name in ("signal", "image", "signal"):
+                preview.update_plot_preview(importer.get(f"/{name}"))
+            assert preview.currentWidget() is preview.curvewidget
+            preview.cleanup()
+        importer.close()
+
+
+if __name__ == "__main__":
+    test_h5_preview()
@@ -0,0 +1,141 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Incremental workspace save application test:
+
+  - Create signals and images, and save workspace
+  - Modify, add and remove objects, and save workspace again: only new or modified
+    objects are written, removed objects are deleted from file
+  - Reopen workspace and check that objects are the same
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+from __future__ import annotations
+
+import os.path as osp
+from collections.abc import Iterator
+
+import h5py
+import numpy as np
+
+import cdl.obj
+from cdl.core.io.native import get_h5_unused_size
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def iter_object_groups(h5: h5py.File) -> Iterator[tuple[str, h5py.Group]]:
+    """Iterate over signal/image object groups, yielding (title, group) tuples"""
+    for prefix in ("DataLab_Sig", "DataLab_Ima"):
+        for group in h5.get(prefix, {}).values():
+            for name, objgroup in group.items():
+                yield name.split(": ", 1)[1], objgroup
+
+
+def mark_objects(fname: str) -> None:
+    """Add a marker attribute to all object groups of file"""
+    with h5py.File(fname, "a") as h5:
+        for _title, objgroup in iter_object_groups(h5):
+            objgroup.attrs["marker"] = True
+
+
+def get_marked_objects(fname: str) -> dict[str, bool]:
+    """Return marker state of all objects of file, by object title (objects which
+    are not marked have been written since the file was marked)"""
+    with h5py.File(fname, "r") as h5:
+        return {
+            title: "marker" in objgroup.attrs
+            for title, objgroup in iter_object_groups(h5)
+        }
+
+
+def test_incremental_save():
+    """Incremental workspace save application test"""
+    with CDLTemporaryDirectory() as tmpdir:
+        with cdltest_app_context(console=False) as win:
+            fname = osp.join(tmpdir, "test.h5")
+            x = np.linspace(0.0, 10.0, 10000)
+            for idx in range(4):
+                obj = cdl.obj.create_signal(f"sig{idx}", x, np.sin(x + idx))
+                win.signalpanel.add_object(obj)
+            for idx in range(3):
+                data = np.random.default_rng(idx).normal(size=(500, 500))
+                win.imagepanel.add_object(cdl.obj.create_image(f"ima{idx}", data))
+            win.save_to_h5_file(fname)
+            assert win.h5inputoutput.filename == fname
+            mark_objects(fname)
+
+            # Modifying data of an image, title of a signal, removing a signal (the
+            # following signals are renumbered) and adding a new signal:
+            ima1 = win.imagepanel[2]
+            ima1.data = ima1.data * 2.0
+            win.signalpanel[1].title = "sig0 renamed"
+            win.signalpanel.objview.select_objects([2])
+            win.signalpanel.remove_object(force=True)
+            win.signalpanel.add_object(cdl.obj.create_signal("sig4", x, x))
+            win.save_to_current_h5_file()
+            marked = get_marked_objects(fname)
+            execenv.print("Unchanged objects:", marked)
+            assert marked == {
+                "sig0 renamed": False,
+                "sig2": True,
+                "sig3": True,
+                "sig4": False,
+                "ima0": True,
+                "ima1": False,
+                "ima2": True,
+            }
+
+            # Reopening workspace:
+            titles = [obj.title for obj in win.signalpanel.objmodel]
+            data = win.imagepanel[2].data.copy()
+            win.open_h5_files([fname], import_all=True, reset_all=True)
+            assert [obj.title for obj in win.signalpanel.objmodel] == titles
+            assert np.array_equal(win.imagepanel[2].data, data)
+            assert win.h5inputoutput.filename == fname
+
+            # Saving again after reopening: nothing has changed
+            mark_objects(fname)
+            win.save_to_current_h5_file()
+            assert all(get_marked_objects(fname).values())
+
+            # Modifying data in place (with data setters, or by modifying the data
+            # array and notifying the modification), then saving and reopening
+            # workspace: modified objects are written
+            sig_y = win.signalpanel[1]
+            sig_y.y = sig_y.y + 1.0
+            assert sig_y.data_modified
+            sig_xy = win.signalpanel[2]
+            sig_xy.xydata[1, :10] = -1.0
+            sig_xy.set_data_modified()
+            ima = win.imagepanel[1]
+            ima.data[0, 0] += 1.0
+            ima.set_data_modified()
+            ydata, xydata = sig_y.y.copy(), sig_xy.xydata.copy()
+            data0 = ima.data.copy()
+            mark_objects(fname)
+            win.save_to_current_h5_file()
+            marked = get_marked_objects(fname)
+            assert not marked[sig_y.title] and not marked[sig_xy.title]
+            assert not marked[ima.title]
+            assert sum(marked.values()) == len(marked) - 3
+            win.open_h5_files([fname], import_all=True, reset_all=True)
+            assert np.array_equal(win.signalpanel[1].y, ydata)
+            assert np.array_equal(win.signalpanel[2].xydata, xydata)
+            assert np.array_equal(win.imagepanel[1].data, data0)
+            assert np.array_equal(win.imagepanel[2].data, data)
+
+            # Compacting file
+            unused = get_h5_unused_size(fname)
+            win.h5inputoutput.save_file(fname, compact=True)
+            execenv.print(f"Unused size: {unused} -> {get_h5_unused_size(fname)}")
+            assert get_h5_unused_size(fname) < unused
+            win.open_h5_files([fname], import_all=True, reset_all=True)
+            assert np.array_equal(win.imagepanel[2].data, data)
+
+
+if __name__ == "__main__":
+    test_incremental_save()
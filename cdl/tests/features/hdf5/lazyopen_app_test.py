@@ -0,0 +1,95 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Lazy workspace open application test:
+
+  - Create signals and images, and save workspace
+  - Reopen workspace in lazy mode: data arrays are read on demand
+  - Process objects, remove objects and save workspace incrementally while data
+    of some objects has not been read yet
+  - Reopen workspace with background prefetch
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import os.path as osp
+import time
+
+import numpy as np
+from qtpy import QtWidgets as QW
+
+import cdl.obj
+from cdl.config import Conf
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def test_lazy_open():
+    """Lazy workspace open application test"""
+    lazy_open = Conf.io.h5_lazy_open.get()
+    prefetch = Conf.io.h5_lazy_prefetch.get()
+    with CDLTemporaryDirectory() as tmpdir:
+        with cdltest_app_context(console=False) as win:
+            fname = osp.join(tmpdir, "test.h5")
+            x = np.linspace(0.0, 10.0, 100000)
+            for idx in range(3):
+                obj = cdl.obj.create_signal(f"sig{idx}", x, np.sin(x + idx))
+                win.signalpanel.add_object(obj)
+            datalist = []
+            for idx in range(5):
+                data = np.random.default_rng(idx).normal(size=(500, 500))
+                win.imagepanel.add_object(cdl.obj.create_image(f"ima{idx}", data))
+                datalist.append(data)
+            win.save_to_h5_file(fname)
+            try:
+                Conf.io.h5_lazy_open.set(True)
+                Conf.io.h5_lazy_prefetch.set(False)
+                t0 = time.perf_counter()
+                win.open_h5_files([fname], import_all=True, reset_all=True)
+                execenv.print(f"Lazy open: {time.perf_counter() - t0:.3f} s")
+                panel = win.imagepanel
+                objs = list(panel.objmodel)
+                assert [obj.title for obj in objs] == [f"ima{i}" for i in range(5)]
+                assert sum(obj.data_loader is None for obj in objs) <= 1
+                assert objs[2].data_loader.shape == (500, 500)
+                # Data is read on demand (processing):
+                panel.objview.select_objects([2])
+                panel.processor.compute_abs()
+                assert objs[1].data_loader is None
+                assert objs[3].data_loader is not None
+                assert np.array_equal(panel[6].data, np.abs(datalist[1]))
+
+                # Incremental save: data of unchanged objects is not read
+                objs[3].title = "ima3 renamed"
+                panel.objview.select_objects([1])
+                panel.remove_object(force=True)
+                win.save_to_current_h5_file()
+                assert objs[4].data_loader is not None
+                assert np.array_equal(objs[4].data, datalist[4])
+
+                # Background prefetch:
+                Conf.io.h5_lazy_prefetch.set(True)
+                win.open_h5_files([fname], import_all=True, reset_all=True)
+                objs = list(win.imagepanel.objmodel)
+                assert [obj.title for obj in objs[:4]] == [
+                    "ima1",
+                    "ima2",
+                    "ima3 renamed",
+                    "ima4",
+                ]
+                timeout = time.perf_counter() + 10.0
+                while any(obj.data_loader is not None for obj in objs):
+                    QW.QApplication.processEvents()
+                    assert time.perf_counter() < timeout
+                for obj, data in zip(objs, datalist[1:]):
+                    assert np.array_equal(obj.data, data)
+                assert np.array_equal(win.signalpanel[2].y, np.sin(x + 1))
+            finally:
+                Conf.io.h5_lazy_open.set(lazy_open)
+                Conf.io.h5_lazy_prefetch.set(prefetch)
+
+
+if __name__ == "__main__":
+    test_lazy_open()
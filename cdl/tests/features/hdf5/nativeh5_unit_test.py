@@ -0,0 +1,92 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Native HDF5 writer unit test
+
+Checking that signals and images saved with chunked and compressed arrays are
+read back identically by the native HDF5 reader.
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+from __future__ import annotations
+
+import os.path as osp
+import time
+import zlib
+
+import h5py
+import numpy as np
+import pytest
+
+import cdl.obj
+from cdl.core.io.native import (
+    NativeH5Reader,
+    NativeH5Writer,
+    encode_chunk,
+    get_chunk_shape,
+)
+from cdl.env import execenv
+from cdl.utils.tests import CDLTemporaryDirectory
+
+
+def test_chunk_encoding() -> None:
+    """Test chunk shape and chunk encoding helpers"""
+    assert get_chunk_shape((1000, 1000), 8, 2**20) == (131, 1000)
+    assert get_chunk_shape((10, 10**6), 8, 2**20) == (1, 131072)
+    assert get_chunk_shape((100,), 4, 2**20) == (100,)
+    data = np.arange(10, dtype=np.uint16).reshape(2, 5)
+    encoded = encode_chunk(data, (4, 5), shuffle=False, level=1)
+    padded = np.zeros((4, 5), dtype=np.uint16)
+    padded[:2] = data
+    assert zlib.decompress(encoded) == padded.tobytes()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "lzf"])
+def test_native_h5_compression(compression: str | None) -> None:
+    """Test native HDF5 writer with compression"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(0.0, 1.0, 100000)
+    sig = cdl.obj.create_signal("Signal", x, np.sin(x) + rng.normal(size=x.size))
+    data = rng.integers(0, 4096, size=(1200, 1100), dtype=np.uint16)
+    ima = cdl.obj.create_image("Image", data)
+    with CDLTemporaryDirectory() as tmpdir:
+        fname = osp.join(tmpdir, "test.h5")
+        t0 = time.perf_counter()
+        writer = NativeH5Writer(fname, compression=compression, chunk_size=2**16)
+        for name, obj in (("sig", sig), ("ima", ima)):
+            with writer.group(name):
+                obj.serialize(writer)
+        writer.close()
+        dt = time.perf_counter() - t0
+        execenv.print(f"{compression}: {osp.getsize(fname)} bytes in {dt:.3f} s")
+        with h5py.File(fname, "r") as h5:
+            dset = h5["ima/data"]
+            assert dset.compression == compression
+            if compression is not None:
+                assert dset.chunks is not None and dset.shuffle
+        reader = NativeH5Reader(fname)
+        objs = []
+        for name, obj in (("sig", sig), ("ima", ima)):
+            with reader.group(name):
+                newobj = obj.__class__()
+                newobj.deserialize(reader)
+                objs.append(newobj)
+        reader.close()
+    assert np.array_equal(objs[0].xydata, sig.xydata)
+    assert np.array_equal(objs[1].data, ima.data)
+    assert objs[1].data.dtype == ima.data.dtype
+
+
+def test_native_h5_invalid_compression() -> None:
+    """Test native HDF5 writer with unsupported compression"""
+    with CDLTemporaryDirectory() as tmpdir:
+        with pytest.raises(ValueError):
+            NativeH5Writer(osp.join(tmpdir, "test.h5"), compression="lz4")
+
+
+if __name__ == "__main__":
+    test_chunk_encoding()
+    for comp in (None, "gzip", "lzf"):
+        test_native_h5_compression(comp)
+    test_native_h5_invalid_compression()
@@ -0,0 +1,114 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Image stream unit test:
+
+  - Check frame ring buffer and running statistics
+  - Append frames to an image shown in DataLab, and add a past frame as a new image
+  - Check that the frame buffer is not pickled
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import pickle
+
+import numpy as np
+import pytest
+
+import cdl.obj
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+
+
+@pytest.mark.validation
+def test_frame_ring_buffer() -> None:
+    """Validation test for the image stream frame buffer"""
+    depth, shape = 5, (64, 32)
+    buffer = cdl.obj.ImageFrameRingBuffer(depth, shape, np.uint16, stats=True)
+    assert len(buffer) == 0 and buffer.get_stats() is None
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, 4096, size=(23,) + shape, dtype=np.uint16)
+    for index, frame in enumerate(frames):
+        buffer.append(frame)
+        ref = frames[max(0, index + 1 - depth) : index + 1]
+        assert len(buffer) == len(ref) and buffer.frame_count == index + 1
+        assert np.array_equal(buffer.get_frame(), frame)
+        assert np.array_equal(buffer.get_frame(0), ref[0])
+        mean, var = buffer.get_stats()
+        assert np.allclose(mean, ref.mean(axis=0))
+        assert np.allclose(var, ref.var(axis=0))
+    with pytest.raises(IndexError):
+        buffer.get_frame(depth)
+    with pytest.raises(ValueError):
+        buffer.append(np.zeros((3, 3)))
+    # Frames are not truncated: data type must be converted explicitly
+    with pytest.raises(ValueError):
+        buffer.append(np.full(shape, 0.5))
+    converted = buffer.astype(np.float64)
+    converted.append(np.full(shape, 0.5))
+    assert converted.frame_count == buffer.frame_count + 1
+    assert np.array_equal(converted.get_frame(0), buffer.get_frame(1))
+    assert converted.get_frame()[0, 0] == 0.5
+    mean, _var = converted.get_stats()
+    ref = np.concatenate([frames[-depth + 1 :], np.full((1,) + shape, 0.5)])
+    assert np.allclose(mean, ref.mean(axis=0))
+    # Resizing the buffer: the latest frames are kept
+    for new_depth in (3, 8):
+        resized = buffer.resize(new_depth)
+        assert len(resized) == min(depth, new_depth)
+        ref = frames[-len(resized) :]
+        assert all(np.array_equal(resized.get_frame(i), ref[i]) for i in range(-2, 1))
+        assert np.allclose(resized.get_stats()[0], ref.mean(axis=0))
+        resized.append(frames[0])
+        assert np.array_equal(resized.get_frame(), frames[0])
+        assert np.array_equal(resized.get_frame(-2), frames[-1])
+
+
+def test_image_stream() -> None:
+    """Image stream test"""
+    with cdltest_app_context() as win:
+        panel = win.imagepanel
+        shape = (512, 512)
+        obj = cdl.obj.create_image("Stream", np.zeros(shape, dtype=np.uint16))
+        panel.add_object(obj)
+        assert not obj.is_stream() and obj.get_running_stats() is None
+        item = panel.plothandler[obj.uuid]
+        nbobj = len(panel.objmodel)
+        for idx in range(1, 51):
+            frame = np.full(shape, idx, dtype=np.uint16)
+            win.append_image_frame(obj.uuid, frame, depth=10, stats=True)
+        assert obj.is_stream() and obj.get_frame_count() == 10
+        assert len(panel.objmodel) == nbobj  # No new object for each frame
+        assert obj.data[0, 0] == 50 and obj.get_frame(0)[0, 0] == 41
+        mean, _var = obj.get_running_stats()
+        assert mean[0, 0] == np.mean(np.arange(41, 51))
+        panel.plothandler.refresh_plot("selected", True, force=True)
+        assert panel.plothandler[obj.uuid] is item
+        assert item.data[0, 0] == 50
+        # Pickling (e.g. for computations in a separate process): only the current
+        # frame is pickled, not the frame buffer nor the running statistics
+        pickled = pickle.dumps(obj)
+        assert len(pickled) < 1.5 * obj.data.nbytes
+        newobj = pickle.loads(pickled)
+        assert not newobj.is_stream() and np.array_equal(newobj.data, obj.data)
+        assert obj.is_stream() and obj.get_frame_count() == 10
+        # Promoting a past frame to a new image
+        image = panel.add_frame_as_image(obj.uuid, -2)
+        execenv.print(f"Frame added as a new image: {image.title}")
+        assert len(panel.objmodel) == nbobj + 1 and not image.is_stream()
+        # (initial image data is the first frame of the stream)
+        assert image.data[0, 0] == 49 and image.title.endswith("frame 50]")
+        win.append_image_frame(obj.uuid, np.zeros(shape, dtype=np.uint16))
+        assert image.data[0, 0] == 49
+        # Appending a floating point frame to an integer image stream: the frame
+        # buffer is converted (frames are not truncated)
+        win.append_image_frame(obj.uuid, np.full(shape, 0.5, dtype=np.float32))
+        assert obj.is_stream() and obj.data.dtype == np.float32
+        assert obj.data[0, 0] == 0.5 and obj.get_frame(-2)[0, 0] == 0
+        assert obj.get_frame_count() == 10 and obj.get_frame(0)[0, 0] == 43
+
+
+if __name__ == "__main__":
+    test_frame_ring_buffer()
+    test_image_stream()
@@ -0,0 +1,82 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+LUT range estimation unit test
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+
+import numpy as np
+import pytest
+
+import cdl.obj
+from cdl.algorithms.image import (
+    estimate_lut_range,
+    get_lut_range,
+    get_lut_range_rank_error,
+    sample_data,
+)
+from cdl.config import Conf
+from cdl.env import execenv
+
+
+@pytest.mark.validation
+def test_estimate_lut_range() -> None:
+    """Validation test for the sampled LUT range estimation"""
+    data = np.random.default_rng(1).normal(size=(2000, 2000))
+    max_samples = 2**16
+    error = get_lut_range_rank_error(max_samples)
+    for percent in (0.0, 0.1, 1.0, 5.0):
+        vmin, vmax = estimate_lut_range(data, percent, max_samples=max_samples)
+        emin, emax = get_lut_range(data, percent)
+        execenv.print(f"{percent}%: [{vmin}, {vmax}] (exact: [{emin}, {emax}])")
+        # Checking that the estimated percentiles ranks are within the error bound
+        rmin, rmax = np.searchsorted(np.sort(data, axis=None), [vmin, vmax])
+        assert abs(rmin / data.size - 0.005 * percent) <= error
+        assert abs(rmax / data.size - (1.0 - 0.005 * percent)) <= error
+        if percent == 0.0:
+            assert emin <= vmin and vmax <= emax
+    # Small arrays: the LUT range is exact
+    assert estimate_lut_range(data[:100], 1.0) == get_lut_range(data[:100], 1.0)
+    # Non-contiguous arrays are sampled without copy
+    view = data[::3, 1::2]
+    assert sample_data(view, max_samples).size == max_samples
+    assert get_lut_range(data[:10], 0.0) == (data[:10].min(), data[:10].max())
+
+
+def test_image_lut_range_cache() -> None:
+    """Test LUT range cache of image objects (cached per data version)"""
+    percent = Conf.view.ima_eliminate_outliers.get()
+    Conf.view.ima_eliminate_outliers.set(0.0)
+    try:
+        data = np.zeros((2000, 1000), dtype=np.uint16)
+        data[1000, 500] = 1000
+        obj = cdl.obj.create_image("test", data)
+        assert obj.get_lut_range() == (0.0, 0.0)
+        assert not obj.is_lut_range_exact()
+        # Computing the exact LUT range (e.g. in a worker thread) does not modify
+        # the cache, which is updated explicitly (unless data has changed)
+        version, percent, lut_range = obj.compute_exact_lut_range()
+        assert lut_range == (0.0, 1000.0) and not obj.is_lut_range_exact()
+        assert not obj.set_exact_lut_range(version - 1, percent, lut_range)
+        assert obj.set_exact_lut_range(version, percent, lut_range)
+        assert obj.get_lut_range(exact=True) == (0.0, 1000.0)
+        assert obj.is_lut_range_exact()
+        assert obj.get_lut_range() == (0.0, 1000.0)
+        # Replacing data invalidates the cache (small images: LUT range is exact)
+        obj.data = np.array(data[:100, :100])
+        assert not obj.is_lut_range_exact()
+        assert obj.get_lut_range() == (0.0, 0.0)
+        assert obj.is_lut_range_exact()
+        # Modifying data in place requires to increment data version
+        obj.data[50, 50] = 10
+        assert obj.get_lut_range() == (0.0, 0.0)
+        obj.increment_data_version()
+        assert obj.get_lut_range() == (0.0, 10.0)
+    finally:
+        Conf.view.ima_eliminate_outliers.set(percent)
+
+
+if __name__ == "__main__":
+    test_estimate_lut_range()
+    test_image_lut_range_cache()
@@ -0,0 +1,70 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Separate view application test:
+
+  - Create a group of images
+  - Open a separate view over all images: only the active item is created before
+    the dialog is shown, the other items are created lazily
+  - Check that separate view items share viewable data and LUT range with the
+    main plot items
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+from plotpy.items import MaskedImageItem
+from plotpy.plot import BasePlot
+from qtpy import QtWidgets as QW
+
+import cdl.obj
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+
+
+def get_image_items(plot: BasePlot) -> list[MaskedImageItem]:
+    """Return image items of plot"""
+    return [item for item in plot.items if isinstance(item, MaskedImageItem)]
+
+
+def test_separate_view():
+    """Separate view application test"""
+    with cdltest_app_context() as win:
+        panel = win.imagepanel
+        nbobj = 20
+        for idx in range(nbobj):
+            data = np.random.default_rng(idx).normal(size=(1000, 1000))
+            panel.add_object(cdl.obj.create_image(f"Image {idx}", data))
+        panel.objview.select_groups([0])
+        objs = panel.objview.get_sel_objects(include_groups=True)
+        # Changing the contrast of the main plot item of the last object:
+        main_item = panel.plothandler[objs[-1].uuid]
+        main_item.set_lut_range((-1.0, 1.0))
+
+        t0 = time.perf_counter()
+        dlg = panel.open_separate_view()
+        execenv.print(f"Separate view opened in {time.perf_counter() - t0:.3f} s")
+        plot = dlg.get_plot()
+        items = get_image_items(plot)
+        assert len(items) < nbobj
+        item = [it for it in items if it.title().text() == objs[-1].title][0]
+        assert np.shares_memory(item.data, main_item.data)
+        assert item.get_lut_range() == (-1.0, 1.0)
+
+        # Waiting for lazily created items
+        timeout = time.perf_counter() + 10.0
+        while len(get_image_items(plot)) < nbobj:
+            QW.QApplication.processEvents()
+            assert time.perf_counter() < timeout
+        titles = [it.title().text() for it in get_image_items(plot)]
+        assert sorted(titles) == sorted(obj.title for obj in objs)
+        dlg.done(QW.QDialog.DialogCode.Rejected)
+
+
+if __name__ == "__main__":
+    test_separate_view()
@@ -0,0 +1,83 @@
+# Copyright (c) DataLab Platform Developers, BSD 3-Clause license, see LICENSE file.
+
+"""
+Live signal unit test:
+
+  - Check ring buffer storage and rolling statistics
+  - Append data points to a signal shown in DataLab
+"""
+
+# pylint: disable=invalid-name  # Allows short reference names like x, y, ...
+# guitest: show
+
+import pickle
+
+import numpy as np
+import pytest
+
+import cdl.obj
+from cdl.env import execenv
+from cdl.tests import cdltest_app_context
+
+
+@pytest.mark.validation
+def test_signal_ring_buffer() -> None:
+    """Validation test for the live signal ring buffer"""
+    capacity = 1000
+    buffer = cdl.obj.SignalRingBuffer(capacity)
+    assert len(buffer) == 0 and np.isnan(buffer.get_stats()["mean"])
+    rng = np.random.default_rng(0)
+    x = np.arange(40000, dtype=float)
+    y = rng.normal(size=x.size)
+    index = 0
+    for size in rng.integers(1, 300, size=100):
+        buffer.append(np.vstack([x[index : index + size], y[index : index + size]]))
+        index += size
+        ref = y[max(0, index - capacity) : index]
+        assert np.array_equal(buffer.data[1], ref)
+        assert np.array_equal(buffer.data[0], x[max(0, index - capacity) : index])
+        stats = buffer.get_stats()
+        assert stats["count"] == ref.size
+        assert np.isclose(stats["mean"], ref.mean())
+        assert np.isclose(stats["std"], ref.std())
+        assert np.isclose(stats["rms"], np.sqrt(np.mean(ref**2)))
+    # Appending more points than the capacity
+    buffer.append(np.vstack([x, y]))
+    assert np.array_equal(buffer.data[1], y[-capacity:])
+    # Data is a view of the buffer, with contiguous rows
+    assert buffer.data.base is not None and buffer.data[1].flags.c_contiguous
+
+
+def test_live_signal() -> None:
+    """Live signal test"""
+    with cdltest_app_context() as win:
+        panel = win.signalpanel
+        obj = cdl.obj.create_signal("Live", np.arange(10.0), np.zeros(10))
+        panel.add_object(obj)
+        assert not obj.is_live() and obj.get_rolling_stats() is None
+        item = panel.plothandler[obj.uuid]
+        for idx in range(1, 101):
+            x = np.arange(10.0 * idx, 10.0 * (idx + 1))
+            win.append_signal_data(obj.uuid, x, np.full(10, idx), capacity=500)
+        assert obj.is_live() and obj.xydata.shape == (2, 500)
+        assert obj.x[-1] == 1009.0
+        assert obj.get_rolling_stats()["mean"] == np.mean(np.arange(51, 101))
+        panel.plothandler.refresh_plot("selected", True, force=True)
+        assert panel.plothandler[obj.uuid] is item
+        assert np.array_equal(item.get_data()[0], obj.x)
+        execenv.print(f"Rolling statistics: {obj.get_rolling_stats()}")
+        # Pickling (e.g. for computations in a separate process): only the valid
+        # data window is pickled, not the ring buffer
+        pickled = pickle.dumps(obj)
+        assert len(pickled) < 1.5 * obj.xydata.nbytes
+        newobj = pickle.loads(pickled)
+        assert not newobj.is_live() and np.array_equal(newobj.xydata, obj.xydata)
+        assert obj.is_live()
+        # Replacing signal data: signal is no longer a live signal
+        obj.xydata = obj.xydata.copy()
+        assert not obj.is_live()
+
+
+if __name__ == "__main__":
+    test_signal_ring_buffer()
+    test_live_signal()
@@ -6,7 +6,9 @@ DataLab I/O utilities
 
 from __future__ import annotations
 
+import io
 from itertools import islice
+from typing import BinaryIO
 
 
 def count_lines(filename: str) -> int:
@@ -36,3 +38,145 @@ def read_first_n_lines(filename: str, n: int = 100000) -> str:
     with open(filename, "r", encoding="utf-8") as file:
         lines = list(islice(file, n))
     return "".join(lines)
+
+
+class StringReader:
+    """Read-only file-like object over a string
+
+    Data is returned by slices, so that a text parser (e.g. `pandas.read_csv`) may
+    read a huge string by chunks without copying it entirely (as `io.StringIO`
+    would do).
+
+    Args:
+        text: Text
+    """
+
+    def __init__(self, text: str) -> None:
+        self.__text = text
+        self.__pos = 0
+
+    def __enter__(self) -> StringReader:
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def readable(self) -> bool:
+        """Return True (stream is readable)"""
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        """Read at most `size` characters (or until the end if size is negative)
+
+        Args:
+            size: Number of characters to read
+
+        Returns:
+            Text
+        """
+        start = self.__pos
+        if size is None or size < 0:
+            self.__pos = len(self.__text)
+        else:
+            self.__pos = min(start + size, len(self.__text))
+        return self.__text[start : self.__pos]
+
+    def readline(self, size: int | None = -1) -> str:
+        """Read until newline (included), or at most `size` characters
+
+        Args:
+            size: Maximum number of characters to read
+
+        Returns:
+            Line
+        """
+        start = self.__pos
+        end = self.__text.find("\n", start) + 1 or len(self.__text)
+        if size is not None and size >= 0:
+            end = min(end, start + size)
+        self.__pos = end
+        return self.__text[start:end]
+
+    def tell(self) -> int:
+        """Return current position"""
+        return self.__pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change stream position
+
+        Args:
+            offset: Offset (relative to position indicated by `whence`)
+            whence: `io.SEEK_SET`, `io.SEEK_CUR` or `io.SEEK_END`
+
+        Returns:
+            New position
+        """
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.__pos, io.SEEK_END: len(self.__text)}
+        self.__pos = max(0, min(base[whence] + offset, len(self.__text)))
+        return self.__pos
+
+
+class TextSource:
+    """Text data source: file or string (e.g. clipboard contents)
+
+    Parts of the text may be read without loading it entirely (see
+    :py:meth:`read_lines`), and the whole text may be parsed through a stream
+    (see :py:meth:`open`). Offsets are byte offsets for files, and character
+    offsets for strings.
+
+    Args:
+        path: File name (if None, `text` is the source)
+        text: Text
+    """
+
+    def __init__(self, path: str | None = None, text: str = "") -> None:
+        self.path = path
+        self.text = text
+
+    @property
+    def size(self) -> int:
+        """Source size (bytes for files, characters for strings)"""
+        if self.path is None:
+            return len(self.text)
+        with open(self.path, "rb") as fdesc:
+            return fdesc.seek(0, io.SEEK_END)
+
+    def open(self) -> BinaryIO | StringReader:
+        """Open source stream
+
+        Returns:
+            Binary file object (for files) or string reader (for strings)
+        """
+        if self.path is None:
+            return StringReader(self.text)
+        return open(self.path, "rb")
+
+    def read_lines(
+        self, offset: int, nlines: int, maxsize: int | None = None
+    ) -> tuple[str, int]:
+        """Read lines from offset
+
+        Args:
+            offset: Offset of the first line
+            nlines: Maximum number of lines to read
+            maxsize: Maximum size to read (approximate: a line is never truncated)
+
+        Returns:
+            Tuple (text, offset of the next line)
+        """
+        lines = []
+        size = 0
+        with self.open() as fdesc:
+            fdesc.seek(offset)
+            for _idx in range(nlines):
+                line = fdesc.readline()
+                if not line:
+                    break
+                lines.append(line)
+                size += len(line)
+                if maxsize is not None and size >= maxsize:
+                    break
+            offset = fdesc.tell()
+        if self.path is None:
+            return "".join(lines), offset
+        return b"".join(lines).decode("utf-8", errors="replace"), offset
@@ -202,6 +202,194 @@ def create_progress_bar(
         prog.deleteLater()
 
 
+#: Maximum number of progress updates per second (see :py:class:`ProgressReporter`)
+PROGRESS_UPDATE_RATE = 20.0
+
+
+class ProgressReporter:
+    """Progress reporter, aggregating progress counters and rate-limiting the
+    progress updates
+
+    Updating a progress dialog (and processing the Qt events that go with it) for
+    each item of a loop may take more time than processing the item itself. This
+    object keeps track of the progress counters and forwards them (with throughput
+    and estimated time of arrival) to the progress dialog or callback function
+    at most `rate` times per second.
+
+    Args:
+        max_: Maximum progress value
+        label: Progress label
+        progress: Progress dialog to be updated (optional)
+        callback: Function to be called with progress value and text as arguments
+         (optional, this may be used to emit a signal from a worker thread)
+        rate: Maximum number of updates per second
+        show_stats: If True, throughput and ETA are added to the progress label
+         (after one second)
+        percent: If True, progress value is a percentage (throughput is then shown
+         in percent per second), otherwise it is a number of items
+
+    Throughput and ETA are evaluated from the time the reporter is started: this
+    is the creation time, unless :py:meth:`start` is called.
+    """
+
+    def __init__(
+        self,
+        max_: int,
+        label: str = "",
+        progress: QW.QProgressDialog | None = None,
+        callback: Callable[[int, str], None] | None = None,
+        rate: float = PROGRESS_UPDATE_RATE,
+        show_stats: bool = True,
+        percent: bool = False,
+    ) -> None:
+        self.max = max_
+        self.label = label
+        self.dialog = progress
+        self.callback = callback
+        self.show_stats = show_stats
+        self.percent = percent
+        self.value = 0
+        self.__period = 1.0 / rate
+        self.__t0 = time.perf_counter()
+        self.__last_update: float | None = None
+        self.__pending = False
+
+    def start(self) -> None:
+        """Start (or restart) the reporter: reset progress value and timer"""
+        self.value = 0
+        self.__t0 = time.perf_counter()
+        self.__last_update = None
+        self.__pending = False
+
+    @property
+    def elapsed(self) -> float:
+        """Return elapsed time since the reporter was started (seconds)"""
+        return time.perf_counter() - self.__t0
+
+    @property
+    def throughput(self) -> float:
+        """Return throughput (progress value units per second)"""
+        elapsed = self.elapsed
+        return self.value / elapsed if elapsed > 0.0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Return estimated remaining time (seconds), or None if unknown"""
+        throughput = self.throughput
+        if throughput <= 0.0 or self.max <= 0:
+            return None
+        return max(self.max - self.value, 0) / throughput
+
+    def get_text(self) -> str:
+        """Return progress text: label, eventually followed by throughput and ETA"""
+        text = self.label
+        eta = self.eta
+        if self.show_stats and eta is not None and self.elapsed > 1.0:
+            mins, secs = divmod(int(round(eta)), 60)
+            if self.percent:
+                stats = f"{self.value}% ({self.throughput:.1f}%/s) - "
+            else:
+                stats = f"{self.value}/{self.max} ({self.throughput:.1f}/s) - "
+            stats += _("Remaining time:") + f" {mins:02d}:{secs:02d}"
+            text = f"{text}\n{stats}" if text else stats
+        return text
+
+    def set_label(self, label: str) -> None:
+        """Set progress label (shown at next update)
+
+        Args:
+            label: Progress label
+        """
+        self.__pending = self.__pending or label != self.label
+        self.label = label
+
+    def set_value(self, value: int, force: bool = False) -> bool:
+        """Set progress value: the progress dialog or callback is updated only if
+        the last update is older than the update period, or if the maximum value
+        has been reached, or if `force` is True
+
+        Args:
+            value: Progress value
+            force: If True, update progress even if the update period has not
+             elapsed since the last update
+
+        Returns:
+            True if progress has been updated
+        """
+        self.__pending = self.__pending or value != self.value
+        self.value = value
+        now = time.perf_counter()
+        if (
+            force
+            or self.__last_update is None
+            or now - self.__last_update >= self.__period
+            or value >= self.max
+        ):
+            self.__last_update = now
+            self.flush()
+            return True
+        return False
+
+    def increment(self, step: int = 1) -> bool:
+        """Increment progress value (see :py:meth:`set_value`)
+
+        Args:
+            step: Increment
+
+        Returns:
+            True if progress has been updated
+        """
+        return self.set_value(self.value + step)
+
+    def flush(self) -> None:
+        """Update progress dialog or callback with current value and text"""
+        self.__pending = False
+        text = self.get_text()
+        if self.dialog is not None:
+            self.dialog.setLabelText(text)
+            self.dialog.setValue(self.value)
+            QW.QApplication.processEvents()
+        if self.callback is not None:
+            self.callback(self.value, text)
+
+    def flush_pending(self) -> None:
+        """Update progress dialog or callback only if the last value or label has
+        not been shown yet (e.g. throttled final update)"""
+        if self.__pending:
+            self.flush()
+
+    def was_canceled(self) -> bool:
+        """Return True if the progress dialog was canceled by user"""
+        return self.dialog is not None and self.dialog.wasCanceled()
+
+
+@contextmanager
+def create_progress_reporter(
+    parent: QW.QWidget,
+    label: str,
+    max_: int,
+    show_after: int = 1000,
+    rate: float = PROGRESS_UPDATE_RATE,
+) -> Generator[ProgressReporter, None, None]:
+    """Create modal progress bar, updated through a rate-limited progress reporter
+
+    Args:
+        parent: Parent widget
+        label: Progress dialog title
+        max_: Maximum progress value
+        show_after: Delay before showing the progress dialog (ms, default: 1000)
+        rate: Maximum number of progress updates per second
+
+    Pending (throttled) progress updates are flushed when exiting the context.
+    """
+    with create_progress_bar(parent, label, max_, show_after=show_after) as prog:
+        reporter = ProgressReporter(max_, label, progress=prog, rate=rate)
+        try:
+            yield reporter
+        finally:
+            reporter.flush_pending()
+
+
 class CallbackWorker(QC.QThread):
     """Worker for executing long operations in a separate thread (this must not be
     confused with the :py:class:`cdl.core.gui.processor.base.Worker` class, which
@@ -215,6 +403,7 @@ class CallbackWorker(QC.QThread):
     """
 
     SIG_PROGRESS_UPDATE = QC.Signal(int)
+    SIG_PROGRESS_TEXT = QC.Signal(str)
 
     def __init__(self, callback: Callable, **kwargs) -> None:
         super().__init__()
@@ -225,6 +414,22 @@ class CallbackWorker(QC.QThread):
         self.result: Any | None = None
         self.__canceled = False
         self.__exc = None
+        # Progress updates are rate-limited to avoid flooding the GUI event loop
+        # with queued signals (the worker may call `set_progress` very often)
+        self.__reporter = ProgressReporter(
+            100, callback=self.__emit_progress, percent=True
+        )
+
+    def __emit_progress(self, value: int, text: str) -> None:
+        """Emit progress signals
+
+        Args:
+            value: progress value (percentage, or number of processed items)
+            text: progress text (throughput and ETA)
+        """
+        self.SIG_PROGRESS_UPDATE.emit(int(100 * value / max(self.__reporter.max, 1)))
+        if text:
+            self.SIG_PROGRESS_TEXT.emit(text)
 
     def run(self) -> None:
         """Start thread"""
@@ -234,12 +439,17 @@ class CallbackWorker(QC.QThread):
         # If we don't set the progress to 0.0, the progress dialog will be shown only
         # after the first call to `set_progress` method even if the `minimumDuration`
         # time has elapsed.
+        # The reporter is started here (and not when the worker is created), so
+        # that throughput and ETA only take into account the callback execution.
+        self.__reporter.start()
         self.set_progress(0.0)
 
         try:
             self.result = self.callback(**self.kwargs)
         except Exception as exc:  # pylint: disable=broad-except
             self.__exc = exc
+        finally:
+            self.__reporter.flush_pending()
 
     def cancel(self) -> None:
         """Progress bar was canceled"""
@@ -250,12 +460,26 @@ class CallbackWorker(QC.QThread):
         return self.__canceled
 
     def set_progress(self, value: float) -> None:
-        """Set progress bar value
+        """Set progress bar value (updates are rate-limited, see
+        :py:class:`ProgressReporter`)
 
         Args:
             value: float between 0.0 and 1.0
         """
-        self.SIG_PROGRESS_UPDATE.emit(int(100 * value))
+        self.__reporter.max, self.__reporter.percent = 100, True
+        self.__reporter.set_value(int(100 * value))
+
+    def set_progress_count(self, count: int, total: int) -> None:
+        """Set progress as a number of processed items (updates are rate-limited,
+        see :py:class:`ProgressReporter`): unlike :py:meth:`set_progress`,
+        throughput and ETA are shown in items
+
+        Args:
+            count: number of processed items
+            total: total number of items
+        """
+        self.__reporter.max, self.__reporter.percent = total, False
+        self.__reporter.set_value(count)
 
     def get_result(self) -> Any:
         """Return callback result"""
@@ -295,6 +519,9 @@ def qt_long_callback(
         )
         prog.setMinimumDuration(show_after)
         worker.SIG_PROGRESS_UPDATE.connect(prog.setValue)
+        worker.SIG_PROGRESS_TEXT.connect(
+            lambda text: prog.setLabelText(f"{label}\n{text}")
+        )
         prog.canceled.connect(worker.cancel)
     else:
         prog = QW.QProgressDialog(label, None, 0, 0, parent, QC.Qt.SplashScreen)
@@ -336,7 +563,9 @@ def qt_handle_error_message(widget: QW.QWidget, message: str, context: str = Non
 
 
 def qt_try_except(message=None, context=None):
-    """Try...except Qt widget method decorator"""
+    """Try...except Qt widget method decorator: exceptions are shown in a message
+    box, unless `self` has a `raise_errors` attribute set to True (see
+    :py:attr:`cdl.core.gui.processor.base.BaseProcessor.raise_errors`)"""
 
     def qt_try_except_decorator(func):
         """Try...except Qt widget method decorator"""
@@ -355,6 +584,8 @@ def qt_try_except(message=None, context=None):
             try:
                 output = func(*args, **kwargs)
             except Exception as msg:  # pylint: disable=broad-except
+                if getattr(self, "raise_errors", False):
+                    raise
                 qt_handle_error_message(panel.parent(), msg, context)
             finally:
                 panel.SIG_STATUS_MESSAGE.emit("")
@@ -392,6 +623,40 @@ def qt_try_loadsave_file(
         pass
 
 
+def qt_show_loadsave_errors(
+    parent: QW.QWidget, errors: list[tuple[str, Exception]], operation: str
+) -> None:
+    """Show a single report for errors which occurred while reading or writing
+    several files (operation: "load" or "save")
+
+    Args:
+        parent: Parent widget
+        errors: List of (file name, exception) tuples
+        operation: "load" or "save"
+    """
+    if operation not in ("load", "save"):
+        raise ValueError("operation argument must be 'load' or 'save'")
+    if not errors:
+        return
+    if operation == "load":
+        text = _("%d file(s) could not be read:") % len(errors)
+    else:
+        text = _("%d file(s) could not be written:") % len(errors)
+    lines = []
+    for filename, exc in errors:
+        execenv.print(f"{filename}: {exc}")
+        lines.append(
+            f"<span style='font-weight:bold;color:#555555;'>{osp.basename(filename)}"
+            f"</span>: {str(exc)}"
+        )
+    if len(lines) > 20:
+        lines = lines[:20] + ["..."]
+    if not execenv.unattended:
+        QW.QMessageBox.critical(
+            parent, APP_NAME, f"{text}<br><br>" + "<br>".join(lines)
+        )
+
+
 def grab_save_window(widget: QW.QWidget, name: str) -> None:  # pragma: no cover
     """Grab window screenshot and save it"""
     widget.activateWindow()
@@ -146,6 +146,33 @@ class CDLTemporaryDirectory(tempfile.TemporaryDirectory):
             pass
 
 
+class ProgressWorker:
+    """Worker recording progress values (between 0.0 and 1.0), to be passed to I/O
+    functions instead of a :py:class:`cdl.utils.qthelpers.CallbackWorker`
+    instance, and canceling operation after `cancel_after` progress updates
+
+    Args:
+        cancel_after: Number of progress updates after which operation is
+         canceled (default: None, i.e. never canceled)
+    """
+
+    def __init__(self, cancel_after: int | None = None) -> None:
+        self.values: list[float] = []
+        self.cancel_after = cancel_after
+
+    def set_progress(self, value: float) -> None:
+        """Set progress value"""
+        self.values.append(value)
+
+    def set_progress_count(self, count: int, total: int) -> None:
+        """Set progress as a number of processed items"""
+        self.set_progress(count / total)
+
+    def was_canceled(self) -> bool:
+        """Return True if operation has been canceled"""
+        return self.cancel_after is not None and len(self.values) >= self.cancel_after
+
+
 def get_temporary_directory() -> str:
     """Return path to a temporary directory, and clean-up at exit"""
     tmp = CDLTemporaryDirectory()
@@ -9,6 +9,7 @@ DataLab HDF5 browser module
 from __future__ import annotations
 
 import abc
+import collections
 import os
 import os.path as osp
 from typing import TYPE_CHECKING, Any, Callable
@@ -32,6 +33,7 @@ from qtpy.compat import getopenfilename
 
 from cdl.config import _
 from cdl.core.io.h5 import H5Importer
+from cdl.core.io.h5.common import GroupNode
 from cdl.core.model.signal import CURVESTYLES
 from cdl.obj import ImageObj, SignalObj
 from cdl.utils.qthelpers import qt_handle_error_message
@@ -200,6 +202,9 @@ class H5TreeWidget(AbstractTreeWidget):
 
     SIG_SELECTED = QC.Signal(QW.QTreeWidgetItem)
 
+    #: Item data role storing whether item has been populated with node children
+    POPULATED_ROLE = QC.Qt.UserRole + 1
+
     def __init__(self, parent: QW.QWidget) -> None:
         super().__init__(parent)
         title = _("HDF5 Browser")
@@ -210,15 +215,17 @@ class H5TreeWidget(AbstractTreeWidget):
         self.header().setStretchLastSection(False)
         self.fnames: list[str] = []
         self.h5importers: list[H5Importer] = []
+        self.itemExpanded.connect(self.populate_item)
 
-    def add_root(self, fname: str) -> None:
+    def add_root(self, fname: str, swmr: bool = False) -> None:
         """Add HDF5 root (new file)
 
         Args:
             fname: HDF5 file name
+            swmr: If True, open file in SWMR read mode (file still being written)
         """
         self.fnames.append(osp.abspath(fname))
-        importer = H5Importer(fname)
+        importer = H5Importer(fname, swmr=swmr)
         self.h5importers.append(importer)
         self.add_root_to_tree(importer)
         for col in range(1, 4):
@@ -286,6 +293,10 @@ class H5TreeWidget(AbstractTreeWidget):
         Returns:
             List of HDF5 nodes
         """
+        if not only_checked_items:
+            # Tree is populated lazily: collecting all nodes first
+            for item in self.get_top_level_items():
+                self.populate_item(item, recursive=True)
         datasets = []
         for item in self.find_all_items():
             if item.flags() & QC.Qt.ItemIsUserCheckable:
@@ -364,8 +375,9 @@ class H5TreeWidget(AbstractTreeWidget):
         return treeitem
 
     @staticmethod
-    def __recursive_popfunc(parent_item: QW.QTreeWidgetItem, node: BaseNode) -> None:
-        """Recursive HDF5 analysis
+    def __add_node(parent_item: QW.QTreeWidgetItem, node: BaseNode) -> None:
+        """Add HDF5 node to tree (node children are added when expanded, see
+        :py:meth:`populate_item`)
 
         Args:
             parent_item: Parent tree item
@@ -377,9 +389,30 @@ class H5TreeWidget(AbstractTreeWidget):
         else:
             tree_item.setFlags(QC.Qt.ItemIsEnabled)
         tree_item.setIcon(0, get_icon(node.icon_name))
+        if isinstance(node, GroupNode) and node.has_children():
+            tree_item.setChildIndicatorPolicy(QW.QTreeWidgetItem.ShowIndicator)
         parent_item.addChild(tree_item)
-        for child in node.children:
-            H5TreeWidget.__recursive_popfunc(tree_item, child)
+
+    def populate_item(self, item: QW.QTreeWidgetItem, recursive: bool = False) -> None:
+        """Populate tree item with its node children, if not already done
+
+        Args:
+            item: Tree item
+            recursive: If True, populate children items recursively
+        """
+        if not item.data(0, self.POPULATED_ROLE):
+            item.setData(0, self.POPULATED_ROLE, True)
+            toplevel_index = self.indexOfTopLevelItem(self.__get_top_level_item(item))
+            node = self.get_node(item)
+            self.h5importers[toplevel_index].expand(node)
+            for child in node.children:
+                self.__add_node(item, child)
+            item.setChildIndicatorPolicy(
+                QW.QTreeWidgetItem.DontShowIndicatorWhenChildless
+            )
+        if recursive:
+            for index in range(item.childCount()):
+                self.populate_item(item.child(index), recursive=True)
 
     def expand_all_children(self, item: QW.QTreeWidgetItem) -> None:
         """Expand all children (recursively)
@@ -405,9 +438,8 @@ class H5TreeWidget(AbstractTreeWidget):
         rootitem.setFlags(QC.Qt.ItemIsEnabled)
         rootitem.setIcon(0, get_icon(root.icon_name))
         self.addTopLevelItem(rootitem)
-        for node in root.children:
-            self.__recursive_popfunc(rootitem, node)
-        self.expand_all_children(rootitem)
+        self.populate_item(rootitem)
+        self.expandItem(rootitem)
 
     def toggle_show_only_checkable_items(self, state: bool) -> None:
         """Show only checkable items
@@ -449,10 +481,20 @@ class H5TreeWidget(AbstractTreeWidget):
 
 
 class PlotPreview(QW.QStackedWidget):
-    """Plot preview"""
+    """Plot preview
+
+    Previews are built from decimated data (see `BaseNode.get_preview_object`),
+    and the last previews are kept in cache.
+    """
+
+    #: Maximum number of previews kept in cache
+    CACHE_SIZE = 16
 
     def __init__(self, parent: QW.QWidget) -> None:
         super().__init__(parent)
+        self.__cache: collections.OrderedDict[tuple[str, str], Any] = (
+            collections.OrderedDict()
+        )
         self.curvewidget = PlotWidget(
             self, options=PlotOptions(type="curve", curve_antialiasing=True)
         )
@@ -464,13 +506,25 @@ class PlotPreview(QW.QStackedWidget):
 
     def cleanup(self) -> None:
         """Clean up widget"""
+        self.__cache.clear()
         for widget in (self.imagewidget, self.curvewidget):
             widget.get_plot().del_all_items()
 
+    def __get_preview_object(self, node: BaseNode) -> SignalObj | ImageObj | None:
+        """Return preview object associated to node (from cache, if available)"""
+        key = (node.h5file.filename, node.id)
+        if key in self.__cache:
+            self.__cache.move_to_end(key)
+        else:
+            self.__cache[key] = node.get_preview_object()
+            if len(self.__cache) > self.CACHE_SIZE:
+                self.__cache.popitem(last=False)
+        return self.__cache[key]
+
     def update_plot_preview(self, node: BaseNode) -> None:
         """Update plot preview widget"""
         try:
-            obj = node.get_native_object()
+            obj = self.__get_preview_object(node)
         except Exception as msg:  # pylint: disable=broad-except
             qt_handle_error_message(self, msg)
             return
@@ -737,13 +791,14 @@ class H5Browser(QW.QSplitter):
         preview.addWidget(self.groupandattrs)
         preview.setSizes([int(self.size().height() / 2)] * 2)
 
-    def open_file(self, fname: str) -> None:
+    def open_file(self, fname: str, swmr: bool = False) -> None:
         """Open HDF5 file
 
         Args:
             fname: HDF5 file name
+            swmr: If True, open file in SWMR read mode (file still being written)
         """
-        self.tree.add_root(fname)
+        self.tree.add_root(fname, swmr)
         self.selector.add_fname(fname)
 
     def close_file(self, fname: str) -> None:
@@ -898,13 +953,14 @@ class H5BrowserDialog(QW.QDialog):
         tree.toggle_show_only_checkable_items(self.checkbox_show_only.isChecked())
         tree.toggle_show_values(self.checkbox_show_values.isChecked())
 
-    def open_file(self, fname: str) -> None:
+    def open_file(self, fname: str, swmr: bool = False) -> None:
         """Open file
 
         Args:
             fname: HDF5 file name
+            swmr: If True, open file in SWMR read mode (file still being written)
         """
-        self.browser.open_file(fname)
+        self.browser.open_file(fname, swmr)
         self.__finalize_setup()
 
     def open_files(self, fnames: list[str]) -> None:
@@ -16,7 +16,6 @@ pages, each of which is a separate widget.
 
 from __future__ import annotations
 
-import io
 import os.path as osp
 from typing import TYPE_CHECKING, Generator
 
@@ -35,7 +34,7 @@ from cdl.config import _
 from cdl.core.io.signal.funcs import get_labels_units_from_dataframe, read_csv_by_chunks
 from cdl.core.model.signal import CURVESTYLES
 from cdl.obj import ImageObj, SignalObj, create_image, create_signal
-from cdl.utils.io import count_lines, read_first_n_lines
+from cdl.utils.io import TextSource
 from cdl.utils.qthelpers import CallbackWorker, create_progress_bar, qt_long_callback
 from cdl.widgets.wizard import Wizard, WizardPage
 
@@ -44,6 +43,15 @@ if TYPE_CHECKING:
     from plotpy.plot import BasePlot
     from qtpy.QtWidgets import QWidget
 
+#: Maximum size of the head of the source used for the preview (bytes or characters)
+PREVIEW_MAX_SIZE = 2**24
+
+#: Number of lines per page of the raw data viewer
+RAW_PAGE_LINES = 1000
+
+#: Maximum size of a page of the raw data viewer (bytes or characters)
+RAW_PAGE_MAX_SIZE = 2**20
+
 
 class SourceParam(gds.DataSet):
     """Source parameters dataset"""
@@ -93,8 +101,10 @@ class SourceParam(gds.DataSet):
         default=100000,
         min=1,
         check=False,
-        help=_("Maximum number of rows to display"),
-    ).set_prop("display", active=gds.FuncProp(_prop, lambda x: x == "file"))
+        help=_(
+            "Maximum number of rows to display in the preview (all rows are imported)"
+        ),
+    )
     _eg = gds.EndGroup(_("Preview parameters"))
 
 
@@ -103,8 +113,8 @@ class SourcePage(WizardPage):
 
     def __init__(self) -> None:
         super().__init__()
-        self.__text = ""
-        self.__path = ""
+        self.__source: TextSource | None = None
+        self.__head = ""
         self.__loaded_partially = True
         self.set_title(_("Source"))
         self.set_subtitle(_("Select the source of the data:"))
@@ -122,37 +132,39 @@ class SourcePage(WizardPage):
         """Return the selected source path, or None if clipboard is selected"""
         return self.param.path if self.param.source == "file" else None
 
-    def get_source_text(self, preview: bool) -> str:
-        """Return the source text"""
-        if not self.__loaded_partially or preview:
-            return self.__text
-        with open(self.__path, "r", encoding="utf-8") as file:
-            self.__text = file.read()
-        self.__loaded_partially = False
-        return self.__text
+    def get_source(self) -> TextSource | None:
+        """Return the text source (file or clipboard contents)"""
+        return self.__source
+
+    def get_preview_text(self) -> str:
+        """Return the head of the source text (see `preview_max_rows` parameter)"""
+        return self.__head
+
+    def is_loaded_partially(self) -> bool:
+        """Return True if the preview text is only the head of the source text"""
+        return self.__loaded_partially
 
     def validate_page(self) -> bool:
         """Validate the page"""
-        self.__text = ""
+        self.__source = None
+        self.__head = ""
         self.param_widget.set()
         if self.param.source == "file":
-            self.__path = self.get_source_path()
-            if self.__path is not None and osp.isfile(self.__path):
-                try:
-                    self.__text = read_first_n_lines(
-                        self.__path, n=self.param.preview_max_rows
-                    )
-                except Exception:  # pylint:disable=broad-except
-                    return False
-                self.__loaded_partially = (
-                    count_lines(self.__path) > self.param.preview_max_rows
-                )
-            else:
+            path = self.get_source_path()
+            if path is None or not osp.isfile(path):
                 return False
+            source = TextSource(path=path)
         else:
-            self.__text = QW.QApplication.clipboard().text()
-            self.__loaded_partially = False
-        return bool(self.__text)
+            source = TextSource(text=QW.QApplication.clipboard().text())
+        try:
+            self.__head, offset = source.read_lines(
+                0, self.param.preview_max_rows, PREVIEW_MAX_SIZE
+            )
+            self.__loaded_partially = offset < source.size
+        except Exception:  # pylint:disable=broad-except
+            return False
+        self.__source = source
+        return bool(self.__head)
 
 
 class BaseImportParam(gds.DataSet):
@@ -311,6 +323,83 @@ class ArrayView(QW.QTableView):
         self.setModel(model)
 
 
+class RawTextViewer(QW.QWidget):
+    """Raw text viewer, showing the text source by pages of lines: pages are read
+    from the source only when they are shown
+
+    Args:
+        parent: Parent widget
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.__source: TextSource | None = None
+        # Offsets of the first line of the pages shown so far:
+        self.__offsets: list[int] = [0]
+        self.__next_offset = 0
+        self.__page = 0
+        self.editor = editor = CodeEditor()
+        font = editor.font()
+        font.setPointSize(font.pointSize() - 2)
+        editor.setFont(font)
+        editor.setReadOnly(True)
+        editor.setWordWrapMode(QG.QTextOption.NoWrap)
+        self.prev_btn = QW.QToolButton()
+        self.prev_btn.setIcon(get_icon("libre-gui-arrow-left.svg"))
+        self.prev_btn.setToolTip(_("Previous page"))
+        self.prev_btn.clicked.connect(lambda: self.show_page(self.__page - 1))
+        self.next_btn = QW.QToolButton()
+        self.next_btn.setIcon(get_icon("libre-gui-arrow-right.svg"))
+        self.next_btn.setToolTip(_("Next page"))
+        self.next_btn.clicked.connect(lambda: self.show_page(self.__page + 1))
+        self.page_label = QW.QLabel()
+        nav_layout = QW.QHBoxLayout()
+        nav_layout.addWidget(self.prev_btn)
+        nav_layout.addWidget(self.page_label)
+        nav_layout.addWidget(self.next_btn)
+        nav_layout.addStretch()
+        layout = QW.QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(nav_layout)
+        layout.addWidget(editor)
+        self.setLayout(layout)
+
+    def set_source(self, source: TextSource | None) -> None:
+        """Set the text source, and show its first page
+
+        Args:
+            source: Text source
+        """
+        self.__source = source
+        self.__offsets = [0]
+        self.show_page(0)
+
+    def show_page(self, page: int) -> None:
+        """Show page
+
+        Args:
+            page: Page index (pages can only be reached one after the other, i.e.
+             `page` is clamped between 0 and the last page shown plus one)
+        """
+        if self.__source is None:
+            self.editor.setPlainText("")
+            self.page_label.setText("")
+            self.prev_btn.setEnabled(False)
+            self.next_btn.setEnabled(False)
+            return
+        page = min(max(page, 0), len(self.__offsets) - 1)
+        text, self.__next_offset = self.__source.read_lines(
+            self.__offsets[page], RAW_PAGE_LINES, RAW_PAGE_MAX_SIZE
+        )
+        if page == len(self.__offsets) - 1 and self.__next_offset < self.__source.size:
+            self.__offsets.append(self.__next_offset)
+        self.__page = page
+        self.editor.setPlainText(text)
+        self.page_label.setText(_("Page %d") % (page + 1))
+        self.prev_btn.setEnabled(page > 0)
+        self.next_btn.setEnabled(page < len(self.__offsets) - 1)
+
+
 class PreviewWidget(QW.QWidget):
     """Widget showing the raw data, the prefiltered data and a preview of the data"""
 
@@ -321,29 +410,19 @@ class PreviewWidget(QW.QWidget):
         self.setLayout(main_layout)
 
         self.tabwidget = tw = QW.QTabWidget()
-        self._raw_text_edit = self.create_editor()
+        self._raw_text_viewer = RawTextViewer(self)
         tw.addTab(
-            self._raw_text_edit, get_icon("libre-gui-questions.svg"), _("Raw Data")
+            self._raw_text_viewer, get_icon("libre-gui-questions.svg"), _("Raw Data")
         )
         self._preview_table = ArrayView(self)
-        self._preview_table.setFont(self._raw_text_edit.font())
+        self._preview_table.setFont(self._raw_text_viewer.editor.font())
         self._preview_table.setEditTriggers(QW.QAbstractItemView.NoEditTriggers)
         tw.addTab(self._preview_table, get_icon("table.svg"), _("Preview"))
         main_layout.addWidget(tw)
 
-    def create_editor(self) -> CodeEditor:
-        """Create a code editor"""
-        editor = CodeEditor()
-        font = editor.font()
-        font.setPointSize(font.pointSize() - 2)
-        editor.setFont(font)
-        editor.setReadOnly(True)
-        editor.setWordWrapMode(QG.QTextOption.NoWrap)
-        return editor
-
-    def set_raw_data(self, data: str) -> None:
-        """Set the raw data"""
-        self._raw_text_edit.setPlainText(data)
+    def set_raw_source(self, source: TextSource | None) -> None:
+        """Set the raw data source"""
+        self._raw_text_viewer.set_source(source)
 
     def __clear_preview_table(self, enable: bool) -> None:
         """Clear the preview table"""
@@ -372,40 +451,40 @@ class PreviewWidget(QW.QWidget):
             self._preview_table.set_data(data, horizontal_headers=h_headers)
 
 
-def str_to_dataframe(
-    raw_data: str,
+def source_to_dataframe(
+    source: TextSource,
     param: SignalImportParam | ImageImportParam,
     worker: CallbackWorker | None = None,
 ) -> pd.DataFrame | None:
-    """Convert raw data to a DataFrame
+    """Convert text source to a DataFrame
+
+    The source is parsed by chunks through a stream (the text is neither loaded
+    nor copied entirely), and progress is based on the position in the source.
 
     Args:
-        raw_data: Raw data
+        source: Text source
         param: Import parameters
         worker: Callback worker object
-        parent: Parent widget
 
     Returns:
-        The DataFrame, or None if the conversion failed
+        The DataFrame, or None if the conversion failed (or was canceled)
     """
-    if not raw_data:
-        return None
-    textstream = io.StringIO(raw_data)
-    nlines = raw_data.count("\n") + (not raw_data.endswith("\n"))
     try:
-        df = read_csv_by_chunks(
-            textstream,
-            nlines,
-            worker=worker,
-            delimiter=param.delimiter_choice,
-            skiprows=param.skip_rows,
-            nrows=param.max_rows,
-            comment=param.comment_char,
-            header=param.header,
-        )
+        with source.open() as stream:
+            df = read_csv_by_chunks(
+                stream,
+                worker=worker,
+                delimiter=param.delimiter_choice,
+                skiprows=param.skip_rows,
+                nrows=param.max_rows,
+                comment=param.comment_char,
+                header=param.header,
+            )
         df.to_numpy(np.dtype(param.dtype_str))  # To eventually raise ValueError
     except Exception:  # pylint:disable=broad-except
         return None
+    if worker is not None and worker.was_canceled():
+        return None
     # Remove rows and columns where all values are NaN in the DataFrame:
     df = df.dropna(axis=0, how="all").dropna(axis=1, how="all")
     if param.transpose:
@@ -413,6 +492,26 @@ def str_to_dataframe(
     return df
 
 
+def str_to_dataframe(
+    raw_data: str,
+    param: SignalImportParam | ImageImportParam,
+    worker: CallbackWorker | None = None,
+) -> pd.DataFrame | None:
+    """Convert raw data to a DataFrame
+
+    Args:
+        raw_data: Raw data
+        param: Import parameters
+        worker: Callback worker object
+
+    Returns:
+        The DataFrame, or None if the conversion failed
+    """
+    if not raw_data:
+        return None
+    return source_to_dataframe(TextSource(text=raw_data), param, worker)
+
+
 class DataPreviewPage(WizardPage):
     """Data preview page
 
@@ -426,6 +525,7 @@ class DataPreviewPage(WizardPage):
         self.source_page = source_page
         self.destination = destination
         self.__preview_df: pd.DataFrame | None = None
+        self.__df: pd.DataFrame | None = None
         self.set_title(_("Data Preview"))
         self.set_subtitle(_("Preview and modify the import settings:"))
 
@@ -444,36 +544,46 @@ class DataPreviewPage(WizardPage):
         )
         self.add_to_layout(self.preview_widget)
 
-    def read_data_callback(self, worker: CallbackWorker) -> pd.DataFrame:
+    def read_data_callback(self, worker: CallbackWorker) -> pd.DataFrame | None:
         """Read data callback
 
         Args:
             worker: Callback worker object
 
         Returns:
-            The DataFrame
+            The DataFrame, or None if the data could not be converted
         """
-        source_text = self.source_page.get_source_text(preview=False)
-        df = str_to_dataframe(source_text, self.param, worker)
-        return df
+        return source_to_dataframe(self.source_page.get_source(), self.param, worker)
 
     def get_dataframe(self) -> pd.DataFrame | None:
-        """Return the data
+        """Return the data (all rows of the source, read when validating the page)
 
         Returns:
             The data frame, or None if the data could not be converted
         """
+        return self.__df
+
+    def read_dataframe(self) -> pd.DataFrame | None:
+        """Read all rows of the source in a background worker (only if the preview
+        does not already contain all rows)
+
+        Returns:
+            The data frame, or None if the data could not be converted (or if the
+            operation was canceled)
+        """
+        if not self.source_page.is_loaded_partially():
+            return self.__preview_df
         worker = CallbackWorker(self.read_data_callback)
-        df = qt_long_callback(self, _("Reading data"), worker, 100)
+        df = qt_long_callback(self, _("Reading data"), worker, True)
+        if df is None and not worker.was_canceled():
+            QW.QMessageBox.warning(
+                self, _("Warning"), _("Unable to read data with these parameters.")
+            )
         return df
 
     def update_preview(self) -> None:
         """Update the preview"""
-        # Raw data
-        raw_data = self.source_page.get_source_text(preview=True)
-        self.preview_widget.set_raw_data(raw_data)
-        # Preview
-        df = str_to_dataframe(raw_data, self.param)
+        df = str_to_dataframe(self.source_page.get_preview_text(), self.param)
         if not self.__quick_update:
             self.preview_widget.set_preview_data(df, param=self.param)
         self.__preview_df = df
@@ -483,6 +593,7 @@ class DataPreviewPage(WizardPage):
         """Initialize the page"""
         super().initialize_page()
         self.param_widget.get()
+        self.preview_widget.set_raw_source(self.source_page.get_source())
         self.update_preview()
 
     def validate_page(self) -> bool:
@@ -510,6 +621,9 @@ class DataPreviewPage(WizardPage):
                 == QW.QMessageBox.No
             ):
                 return False
+        self.__df = self.read_dataframe()
+        if self.__df is None:
+            return False
         return super().validate_page()
 
 